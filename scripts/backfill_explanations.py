@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Explanation Backfill - prefetch explanations for historical questions.
+
+REQ: REQ-B-B3-Explain-3, REQ-B-B3-Explain-7
+
+Generates the missing correct/incorrect AnswerExplanation variants for
+questions saved before explanation prefetch existed, newest first, using the
+same bounded-concurrency machinery as the on-save prefetch. Fallback and draft
+rows (is_fallback=True) are upgraded in place (REQ-B-B3-Explain-7). Questions
+whose generation falls back to mock text are left for the lazy path.
+
+실행 방법:
+    # 해설이 없는 모든 문항 처리 (동시 LLM 호출 2개)
+    python scripts/backfill_explanations.py
+
+    # 최근 문항 500개만, 동시 호출 5개
+    python scripts/backfill_explanations.py --limit 500 --concurrency 5
+
+    # 대상 문항 수만 확인 (LLM 호출 없음)
+    python scripts/backfill_explanations.py --dry-run
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.backend.database import SessionLocal  # noqa: E402
+from src.backend.services.explanation_prefetch import (  # noqa: E402
+    PREFETCH_BATCH_SIZE,
+    ExplanationPrefetcher,
+    find_questions_missing_explanations,
+)
+
+DRY_RUN_SCAN_LIMIT = 1_000_000
+
+
+def main() -> None:
+    """Parse arguments and run the backfill."""
+    parser = argparse.ArgumentParser(description="Backfill explanations for questions missing them")
+    parser.add_argument("--limit", type=int, default=None, help="Max questions to process (default: all)")
+    parser.add_argument("--concurrency", type=int, default=None, help="Max concurrent LLM calls")
+    parser.add_argument("--batch-size", type=int, default=PREFETCH_BATCH_SIZE, help="Questions per batch")
+    parser.add_argument("--dry-run", action="store_true", help="Only count questions missing explanations")
+    args = parser.parse_args()
+
+    if args.dry_run:
+        db = SessionLocal()
+        try:
+            missing = find_questions_missing_explanations(db, args.limit or DRY_RUN_SCAN_LIMIT)
+        finally:
+            db.close()
+        print(f"Questions missing explanations: {len(missing)}")
+        return
+
+    prefetcher = ExplanationPrefetcher(max_concurrency=args.concurrency)
+    started = time.perf_counter()
+    generated = asyncio.run(prefetcher.backfill(limit=args.limit, batch_size=args.batch_size))
+    elapsed = time.perf_counter() - started
+
+    stats = prefetcher.stats.as_dict()
+    print(f"Generated {generated} explanations in {elapsed:.1f}s (failed batches: {stats['failed_jobs']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Ranking Backfill - rebuild user_scores, grade_histogram and score sketches.
+
+REQ: REQ-B-B4-1, REQ-B-B4-4, REQ-B-B4-6
+
+Ranking reads only the user_scores, grade_histogram and score_sketch_buckets
+tables, which the write paths keep current. Databases with completed sessions
+from before these tables existed start with them empty; the server backfills
+them on startup while user_scores is empty, and this command rebuilds them on
+demand (e.g. after a failed startup backfill or a manual data fix).
+
+실행 방법:
+    # 완료된 세션이 있는 모든 사용자의 user_scores 재계산
+    python scripts/backfill_user_scores.py
+
+    # 대상 사용자 수만 확인 (쓰기 없음)
+    python scripts/backfill_user_scores.py --dry-run
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.backend.database import SessionLocal  # noqa: E402
+from src.backend.models import TestSession, UserScore  # noqa: E402
+from src.backend.services.ranking_service import RankingService  # noqa: E402
+
+
+def main() -> None:
+    """Parse arguments and run the backfill."""
+    parser = argparse.ArgumentParser(description="Rebuild user_scores and the ranking aggregates")
+    parser.add_argument("--dry-run", action="store_true", help="Only count users with completed sessions")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.dry_run:
+            users = db.query(TestSession.user_id).filter(TestSession.status == "completed").distinct().count()
+            print(f"Users with completed sessions: {users} (user_scores rows: {db.query(UserScore).count()})")
+            return
+
+        started = time.perf_counter()
+        refreshed = RankingService(db).rebuild_user_scores()
+        print(f"Rebuilt user_scores for {refreshed} users in {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+JSON Repair Benchmark - legacy multi-strategy retries vs single-pass repair.
+
+REQ: REQ-A-JsonRepair
+
+Compares, per corpus sample, the cost and success rate of:
+    legacy   : the former parse_json_robust / AgentOutputConverter._parse_json_robust
+               loop - json.loads retried over up to five regex-rewritten copies
+    tolerant : parse_json_tolerant - one json.loads fast path, otherwise one
+               token scan that fixes every defect followed by one json.loads
+
+The built-in corpus is deterministic: ReAct-style Final Answer payloads of
+5/20/80 generated questions, each in a clean variant and one variant per
+defect class (python literals, trailing commas, bad escapes, raw control
+characters, markdown fences, and all of them mixed). Captured LLM outputs can
+be added with --corpus (JSON Lines, one raw output string per line).
+
+실행 방법:
+    # 기본 corpus, 샘플당 200회 반복
+    python scripts/benchmark_json_repair.py
+
+    # 캡처된 LLM 출력 추가
+    python scripts/benchmark_json_repair.py --corpus captured_outputs.jsonl --repeat 50
+"""
+
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agent.json_repair import parse_json_tolerant  # noqa: E402
+
+QUESTION_COUNTS = (5, 20, 80)
+
+
+def legacy_parse(json_str: str) -> dict | list:
+    """Former five-strategy retry loop (kept here for comparison only)."""
+    if "```json" in json_str:
+        json_str = json_str.split("```json")[1].split("```")[0].strip()
+    elif "```" in json_str:
+        json_str = json_str.split("```")[1].split("```")[0].strip()
+
+    strategies = [
+        lambda s: s,
+        lambda s: re.sub(r"\b(True|False)\b", lambda m: m.group(1).lower(), re.sub(r"\bNone\b", "null", s)),
+        lambda s: re.sub(r",(\s*[}\]])", r"\1", s),
+        lambda s: re.sub(r"\\(?!\\|/|[btnfr])", "\\\\", s),
+        lambda s: s.encode("utf-8", "ignore").decode("utf-8"),
+    ]
+    last_error: json.JSONDecodeError | None = None
+    for cleanup in strategies:
+        try:
+            return json.loads(cleanup(json_str))
+        except json.JSONDecodeError as e:
+            last_error = e
+    raise last_error
+
+
+def tolerant_parse(json_str: str) -> dict | list:
+    """Single-pass tolerant parser."""
+    return parse_json_tolerant(json_str).value
+
+
+def _question(rng: random.Random, index: int) -> dict:
+    return {
+        "question_id": f"q_{index:04d}",
+        "type": rng.choice(["multiple_choice", "true_false", "short_answer"]),
+        "stem": f"LLM 문항 {index}: 트랜스포머의 self-attention이 하는 역할은 무엇인가? " * 3,
+        "choices": [f"{key}. 선택지 {key}{index}" for key in "ABCD"],
+        "answer_schema": {"type": "exact_match", "correct_answer": rng.choice("ABCD")},
+        "difficulty": rng.randint(1, 10),
+        "category": "LLM",
+        "validation_score": round(rng.uniform(0.7, 1.0), 2),
+        "is_active": True,
+        "reviewer": None,
+    }
+
+
+def _inject(payload: str, defect: str) -> str:
+    """Introduce one defect class into a valid JSON payload."""
+    if defect == "python_literal":
+        return payload.replace("true", "True").replace("null", "None")
+    if defect == "trailing_comma":
+        return payload.replace("}", ",}").replace("]", ",]")
+    if defect == "invalid_escape":
+        return payload.replace("self-attention", "self\\-attention")
+    if defect == "control_character":
+        return payload.replace("? ", "?\n\t")
+    if defect == "markdown_fence":
+        return f"```json\n{payload}\n```"
+    return payload
+
+
+def build_corpus(extra_path: str | None = None) -> list[tuple[str, str]]:
+    """Return (label, raw_text) samples."""
+    rng = random.Random(42)
+    defects = ["clean", "python_literal", "trailing_comma", "invalid_escape", "control_character", "markdown_fence"]
+    corpus: list[tuple[str, str]] = []
+    for count in QUESTION_COUNTS:
+        payload = json.dumps([_question(rng, index) for index in range(count)], ensure_ascii=False)
+        for defect in defects:
+            corpus.append((f"{count}q/{defect}", _inject(payload, defect)))
+        mixed = payload
+        for defect in defects[1:]:
+            mixed = _inject(mixed, defect)
+        corpus.append((f"{count}q/mixed", mixed))
+
+    if extra_path:
+        with open(extra_path, encoding="utf-8") as corpus_file:
+            for line_number, line in enumerate(corpus_file, 1):
+                if line.strip():
+                    corpus.append((f"corpus:{line_number}", json.loads(line)))
+    return corpus
+
+
+def _measure(parse: Callable[[str], dict | list], text: str, repeat: int) -> tuple[float | None, bool]:
+    """Return (median milliseconds, parsed successfully)."""
+    try:
+        parse(text)
+    except (json.JSONDecodeError, ValueError):
+        return None, False
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse(text)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), True
+
+
+def main() -> None:
+    """Run the benchmark and print one row per corpus sample."""
+    parser = argparse.ArgumentParser(description="Benchmark legacy vs single-pass JSON repair")
+    parser.add_argument("--corpus", default=None, help="JSON Lines file of captured raw LLM outputs")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed runs per sample")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.corpus)
+    print(f"{'sample':<26}{'size':>9}{'legacy ms':>12}{'tolerant ms':>13}{'speedup':>9}  repairs")
+    legacy_ok = tolerant_ok = 0
+    for label, text in corpus:
+        legacy_ms, legacy_success = _measure(legacy_parse, text, args.repeat)
+        tolerant_ms, tolerant_success = _measure(tolerant_parse, text, args.repeat)
+        legacy_ok += legacy_success
+        tolerant_ok += tolerant_success
+
+        repairs = ",".join(parse_json_tolerant(text).repairs) if tolerant_success else "FAILED"
+        speedup = f"{legacy_ms / tolerant_ms:.1f}x" if legacy_ms and tolerant_ms else "-"
+        legacy_text = f"{legacy_ms:.3f}" if legacy_ms is not None else "FAILED"
+        tolerant_text = f"{tolerant_ms:.3f}" if tolerant_ms is not None else "FAILED"
+        print(f"{label:<26}{len(text):>9}{legacy_text:>12}{tolerant_text:>13}{speedup:>9}  {repairs or '-'}")
+
+    print(f"\nParsed: legacy {legacy_ok}/{len(corpus)}, tolerant {tolerant_ok}/{len(corpus)}")
+
+
+if __name__ == "__main__":
+    main()
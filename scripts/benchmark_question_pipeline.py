@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Question Generation Benchmark - ReAct agent loop vs deterministic parallel pipeline.
+
+REQ: REQ-A-Mode1-Parallel
+
+Measures end-to-end latency of QuestionGenerationService.generate_questions in
+both QUESTION_GEN_PIPELINE_MODE settings:
+    react    : ItemGenAgent (LangGraph create_react_agent) - one LLM round-trip
+               per tool decision, questions validated and saved one at a time
+    parallel : Mode1Pipeline.agenerate_questions - Tools 1-3 together, one
+               structured-output call per question in parallel, batch
+               validation and one bulk save
+
+Default (simulated): every LLM call is answered by a scripted chat model after
+a fixed --llm-latency, so the difference comes only from the orchestration.
+The ReAct script performs the tool calls the system prompt asks for (Tool 1,
+3, 2, then validate + save per question). Everything else (tools, DB writes,
+parsing) is the real code on a temporary SQLite database.
+
+The ReAct result parser reads the item type from a "item_type" key that Tool 5
+does not return, so short answers saved by the ReAct path come back typed as
+multiple choice; --types therefore defaults to multiple_choice,true_false.
+The scripted stems repeat across runs, so the near-duplicate stage of Tool 4
+is disabled in simulated mode (VALIDATION_DUPLICATE_THRESHOLD above 1).
+
+--live uses the configured LLM provider and DATABASE_URL instead; pass an
+existing --user-id/--survey-id.
+
+실행 방법:
+    # 시뮬레이션 (LLM 호출당 0.5초), 5/10문항
+    python scripts/benchmark_question_pipeline.py
+
+    python scripts/benchmark_question_pipeline.py --counts 5,10,20 --llm-latency 1.0 --repeat 3
+
+    # 실제 LLM / DB
+    python scripts/benchmark_question_pipeline.py --live --user-id 1 --survey-id <survey_id>
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_QUESTION_ARGS = {
+    "multiple_choice": {
+        "choices": ["토큰 단위 확률 예측", "규칙 기반 파싱", "이미지 분할", "음성 합성"],
+        "correct_answer": "토큰 단위 확률 예측",
+    },
+    "true_false": {"choices": ["True", "False"], "correct_answer": "True"},
+    "short_answer": {"choices": None, "correct_answer": None, "correct_keywords": ["다음 토큰", "확률"]},
+}
+_EXPLANATION = "LLM은 앞선 토큰을 조건으로 다음 토큰의 확률 분포를 예측하며 텍스트를 생성합니다."
+
+
+def _simulated_model(latency: float) -> "BaseChatModel":
+    """Build the scripted chat model (imported lazily so DATABASE_URL is set first)."""
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+    from langchain_core.outputs import ChatGeneration, ChatResult
+
+    class SimulatedChatModel(BaseChatModel):
+        """Answers every call after a fixed delay with the reply the caller expects."""
+
+        delay: float = 0.5
+
+        @property
+        def _llm_type(self) -> str:
+            return "simulated"
+
+        def bind_tools(self, tools: list, **kwargs: object) -> "SimulatedChatModel":
+            return self
+
+        def _generate(self, messages: list[BaseMessage], stop: object = None, **kwargs: object) -> ChatResult:
+            time.sleep(self.delay)
+            return ChatResult(generations=[ChatGeneration(message=self._respond(messages))])
+
+        async def _agenerate(self, messages: list[BaseMessage], stop: object = None, **kwargs: object) -> ChatResult:
+            await asyncio.sleep(self.delay)
+            return ChatResult(generations=[ChatGeneration(message=self._respond(messages))])
+
+        def _respond(self, messages: list[BaseMessage]) -> AIMessage:
+            request = next(m for m in messages if isinstance(m, HumanMessage)).content
+            if request.startswith("Evaluate the quality"):
+                return AIMessage(content="0.9")
+            if request.startswith("You are writing question"):
+                item_type = re.search(r"Question type: (\w+)", request).group(1)
+                draft = {
+                    "stem": f"LLM이 텍스트를 생성하는 기본 원리는? ({item_type})",
+                    "category": "LLM",
+                    "explanation": _EXPLANATION,
+                }
+                draft.update(_QUESTION_ARGS[item_type])
+                return AIMessage(content=json.dumps(draft, ensure_ascii=False))
+            return self._react_step(request, sum(isinstance(m, ToolMessage) for m in messages))
+
+        def _react_step(self, request: str, step: int) -> AIMessage:
+            count = int(re.search(r"Question Count: (\d+)", request).group(1))
+            session_id, round_id = re.search(r"session_id=(\S+) and round_id=(\S+)", request).groups()
+            types = re.search(r"Question Types: (.+)", request).group(1).split(", ")
+            calls = [
+                ("get_user_profile", {"user_id": "7c9e6679-7425-40de-944b-e07fc1f90ae7"}),
+                ("get_difficulty_keywords", {"difficulty": 4, "category": "technical"}),
+                ("search_question_templates", {"interests": ["LLM"], "difficulty": 4, "category": "technical"}),
+            ]
+            for index in range(count):
+                item_type = types[index % len(types)]
+                args = _QUESTION_ARGS[item_type]
+                stem = f"LLM이 텍스트를 생성하는 기본 원리는? ({index})"
+                calls.append(
+                    (
+                        "validate_question_quality",
+                        {
+                            "stem": stem,
+                            "question_type": item_type,
+                            "choices": args["choices"],
+                            "correct_answer": args["correct_answer"] or "다음 토큰, 확률",
+                        },
+                    )
+                )
+                calls.append(
+                    (
+                        "save_generated_question",
+                        {
+                            "item_type": item_type,
+                            "stem": stem,
+                            "choices": args["choices"],
+                            "correct_key": args["correct_answer"],
+                            "correct_keywords": args.get("correct_keywords"),
+                            "difficulty": 4,
+                            "categories": ["LLM"],
+                            "round_id": round_id,
+                            "session_id": session_id,
+                            "validation_score": 0.9,
+                            "explanation": _EXPLANATION,
+                        },
+                    )
+                )
+            if step >= len(calls):
+                return AIMessage(content="All questions were validated and saved.")
+            name, args = calls[step]
+            return AIMessage(content="", tool_calls=[{"name": name, "args": args, "id": f"call_{step}"}])
+
+    return SimulatedChatModel(delay=latency)
+
+
+def _setup_simulated_database() -> tuple[int, str]:
+    """Point the app at a temporary SQLite file and create a user with a survey."""
+    from src.backend import database
+    from src.backend.models import User, UserProfileSurvey
+    from src.backend.models.user import Base
+
+    Base.metadata.create_all(bind=database.engine)
+    db = database.SessionLocal()
+    try:
+        user = User(knox_id="bench", name="Benchmark", dept="AI", business_unit="S.LSI", email="bench@example.com")
+        db.add(user)
+        db.flush()
+        survey = UserProfileSurvey(user_id=user.id, self_level="Intermediate", interests=["LLM", "RAG"])
+        db.add(survey)
+        db.commit()
+        return user.id, survey.id
+    finally:
+        db.close()
+
+
+async def _run_once(
+    mode: str, user_id: int, survey_id: str, count: int, question_types: list[str]
+) -> tuple[float, int]:
+    """Generate one round in the given mode; return (seconds, questions returned)."""
+    from src.backend import database
+    from src.backend.config import settings
+    from src.backend.services.question_gen_service import QuestionGenerationService
+
+    settings.QUESTION_GEN_PIPELINE_MODE = mode
+    db = database.SessionLocal()
+    try:
+        started = time.perf_counter()
+        result = await QuestionGenerationService(db).generate_questions(
+            user_id=user_id, survey_id=survey_id, question_count=count, question_types=question_types
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+    if result.get("error"):
+        logging.getLogger(__name__).warning(f"{mode}: {result['error']}")
+    return elapsed, len(result["questions"])
+
+
+async def _benchmark(args: argparse.Namespace, user_id: int, survey_id: str) -> None:
+    print(f"{'questions':>9}{'react s':>10}{'parallel s':>12}{'speedup':>9}  returned (react/parallel)")
+    for count in [int(value) for value in args.counts.split(",")]:
+        timings: dict[str, list[float]] = {"react": [], "parallel": []}
+        returned: dict[str, int] = {}
+        for _ in range(args.repeat):
+            for mode in ("react", "parallel"):
+                seconds, questions = await _run_once(mode, user_id, survey_id, count, args.types.split(","))
+                timings[mode].append(seconds)
+                returned[mode] = questions
+        react, parallel = statistics.median(timings["react"]), statistics.median(timings["parallel"])
+        print(
+            f"{count:>9}{react:>10.2f}{parallel:>12.2f}{react / parallel:>8.1f}x  "
+            f"{returned['react']}/{returned['parallel']}"
+        )
+
+
+def main() -> None:
+    """Run the benchmark and print one row per question count."""
+    parser = argparse.ArgumentParser(description="Benchmark ReAct vs parallel question generation")
+    parser.add_argument("--counts", default="5,10", help="Comma-separated question counts per round")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per mode and count (median reported)")
+    parser.add_argument("--types", default="multiple_choice,true_false", help="Comma-separated question types")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Seconds per simulated LLM call")
+    parser.add_argument("--live", action="store_true", help="Use the configured LLM provider and DATABASE_URL")
+    parser.add_argument("--user-id", type=int, default=None, help="Existing user ID (--live)")
+    parser.add_argument("--survey-id", default=None, help="Existing survey ID of that user (--live)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.live:
+        if args.user_id is None or not args.survey_id:
+            parser.error("--live requires --user-id and --survey-id")
+        asyncio.run(_benchmark(args, args.user_id, args.survey_id))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/bench.db"
+        os.environ["VALIDATION_DUPLICATE_THRESHOLD"] = "1.01"
+        from unittest.mock import patch
+
+        user_id, survey_id = _setup_simulated_database()
+        model = _simulated_model(args.llm_latency)
+        with (
+            patch("src.agent.llm_agent.create_llm", return_value=model),
+            patch("src.agent.pipeline.mode1_pipeline.create_llm", return_value=model),
+            patch("src.agent.tools.validate_question_tool.create_llm", return_value=model),
+        ):
+            asyncio.run(_benchmark(args, user_id, survey_id))
+
+
+if __name__ == "__main__":
+    main()
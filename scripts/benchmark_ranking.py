@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Ranking Benchmark - legacy Python cohort loop vs SQL window-function engine.
+
+REQ: REQ-B-B4-4
+
+Compares, for one caller, the cost of computing rank within the 90-day cohort:
+    legacy  : GROUP BY over test_sessions/test_results, every user's average
+              pulled into Python and counted in a loop (pre user_scores code)
+    window  : RankingService._calculate_rank - RANK() OVER on user_scores with
+              pushed-down filters, only the caller's row crosses the wire
+
+실행 방법:
+    # 기본값: 10k, 100k, 1M sessions on a temporary SQLite file
+    python scripts/benchmark_ranking.py
+
+    # Custom sizes / PostgreSQL
+    python scripts/benchmark_ranking.py --sizes 10000,100000
+    python scripts/benchmark_ranking.py --database-url postgresql://user:pw@localhost/bench
+
+Each user gets two completed sessions (one result each), so N sessions means
+N/2 users. The target database is dropped and recreated for every size.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import Engine, and_, create_engine, func, insert, select, text
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.backend.models import TestResult, TestSession, User, UserProfileSurvey, UserScore  # noqa: E402
+from src.backend.models.user import Base  # noqa: E402
+from src.backend.services.ranking_service import RankingService  # noqa: E402
+
+BATCH_SIZE = 10_000
+SESSIONS_PER_USER = 2
+
+
+def _populate(engine: Engine, session_count: int) -> None:
+    """Create schema and bulk insert users, surveys, sessions, results and user_scores."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(42)
+    user_count = max(1, session_count // SESSIONS_PER_USER)
+    now = datetime.now(UTC)
+
+    with engine.begin() as conn:
+        for start in range(0, user_count, BATCH_SIZE):
+            ids = range(start + 1, min(start + BATCH_SIZE, user_count) + 1)
+            conn.execute(
+                insert(User),
+                [
+                    {
+                        "id": i,
+                        "knox_id": f"bench_{i}",
+                        "name": f"Bench {i}",
+                        "dept": "Bench",
+                        "business_unit": "Bench",
+                        "email": f"bench{i}@example.com",
+                    }
+                    for i in ids
+                ],
+            )
+            conn.execute(insert(UserProfileSurvey), [{"id": f"survey-{i}", "user_id": i} for i in ids])
+
+        for start in range(0, session_count, BATCH_SIZE):
+            sessions = []
+            results = []
+            for n in range(start, min(start + BATCH_SIZE, session_count)):
+                user_id = n % user_count + 1
+                session_id = f"session-{n}"
+                created_at = now - timedelta(days=rng.randint(0, 180))
+                sessions.append(
+                    {
+                        "id": session_id,
+                        "user_id": user_id,
+                        "survey_id": f"survey-{user_id}",
+                        "round": 1,
+                        "status": "completed",
+                        "created_at": created_at,
+                    }
+                )
+                score = round(rng.uniform(0, 100), 2)
+                results.append(
+                    {
+                        "id": f"result-{n}",
+                        "session_id": session_id,
+                        "round": 1,
+                        "score": score,
+                        "total_points": int(score),
+                        "correct_count": int(score / 20),
+                        "total_count": 5,
+                        "created_at": created_at,
+                    }
+                )
+            conn.execute(insert(TestSession), sessions)
+            conn.execute(insert(TestResult), results)
+
+        # Materialize user_scores in one statement (benchmark shortcut for refresh_user_score)
+        aggregate = (
+            select(
+                TestSession.user_id,
+                func.avg(TestResult.score),
+                text("'Beginner'"),
+                func.count(TestResult.id),
+                func.max(TestSession.created_at),
+            )
+            .join(TestResult, TestResult.session_id == TestSession.id)
+            .where(TestSession.status == "completed")
+            .group_by(TestSession.user_id)
+        )
+        conn.execute(
+            insert(UserScore).from_select(
+                ["user_id", "composite_score", "grade", "result_count", "last_completed_at"], aggregate
+            )
+        )
+
+
+def _legacy_rank(session: Session, user_score: float) -> tuple[int, int]:
+    """Original _calculate_rank: fetch the cohort aggregate and count in Python."""
+    cutoff_date = datetime.now(UTC) - timedelta(days=90)
+    cohort_query = (
+        session.query(TestSession.user_id, func.avg(TestResult.score).label("avg_score"))
+        .join(TestResult, TestResult.session_id == TestSession.id)
+        .filter(and_(TestSession.status == "completed", TestSession.created_at >= cutoff_date))
+        .group_by(TestSession.user_id)
+        .all()
+    )
+
+    rank = 1
+    for _cohort_user_id, avg_score in cohort_query:
+        if avg_score > user_score:
+            rank += 1
+    return rank, len(cohort_query)
+
+
+def _time_ms(func_: callable, repeat: int) -> float:
+    """Return median wall time in milliseconds over repeat calls."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func_()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Run the benchmark for each requested size and print a summary table."""
+    parser = argparse.ArgumentParser(description="Benchmark cohort ranking strategies")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated session counts")
+    parser.add_argument("--database-url", default=None, help="Target database (default: temporary SQLite file)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per strategy")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = args.database_url or f"sqlite:///{tmp_dir}/ranking_bench.db"
+        engine = create_engine(database_url)
+
+        print(f"{'sessions':>10} {'users':>8} {'legacy ms':>11} {'window ms':>11} {'speedup':>8}")
+        for size in sizes:
+            _populate(engine, size)
+
+            with Session(engine) as session:
+                # Median-scoring user inside the cohort
+                target = session.execute(
+                    select(UserScore.user_id, UserScore.composite_score)
+                    .where(UserScore.last_completed_at >= datetime.now(UTC) - timedelta(days=90))
+                    .order_by(UserScore.composite_score)
+                    .offset(size // (SESSIONS_PER_USER * 4))
+                    .limit(1)
+                ).first()
+                if target is None:
+                    print(f"{size:>10} (empty cohort, skipped)")
+                    continue
+
+                service = RankingService(session)
+                legacy_ms = _time_ms(lambda s=session, t=target: _legacy_rank(s, t.composite_score), args.repeat)
+                window_ms = _time_ms(
+                    lambda svc=service, t=target: svc._calculate_rank(t.user_id, t.composite_score), args.repeat
+                )
+                user_count = session.query(func.count(UserScore.user_id)).scalar()
+
+            speedup = legacy_ms / window_ms if window_ms else float("inf")
+            print(f"{size:>10} {user_count:>8} {legacy_ms:>11.2f} {window_ms:>11.2f} {speedup:>7.1f}x")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
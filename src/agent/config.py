@@ -8,19 +8,61 @@ Design Patterns:
 - Strategy Pattern: Different LLM providers (GoogleGenerativeAI, LiteLLM)
 - Factory Pattern: LLMFactory selects provider based on environment
 - Single Responsibility: Each provider handles its own configuration
+- Registry: One pooled client per provider/model/settings and event loop (LLMClientRegistry)
 """
 
+import asyncio
+import hashlib
 import logging
+import threading
 from abc import ABC, abstractmethod
 from os import getenv
 from typing import Any
 
+import httpx
 from langchain_core.messages import AIMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive HTTP pool per pooled LLM client (LiteLLM/OpenAI-compatible clients)
+LLM_HTTP_MAX_CONNECTIONS = int(getenv("LLM_HTTP_MAX_CONNECTIONS", "20"))
+LLM_HTTP_MAX_KEEPALIVE = int(getenv("LLM_HTTP_MAX_KEEPALIVE", "10"))
+
+
+def running_loop() -> asyncio.AbstractEventLoop | None:
+    """
+    Return the event loop running in this thread, or None outside of one.
+
+    Async HTTP connections (httpx.AsyncClient, gRPC aio channels) belong to the
+    loop that opened them, so pooled objects holding them are scoped per loop.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def drop_closed_loop_entries(pool: dict[tuple, Any]) -> int:
+    """
+    Remove pool entries whose event loop (last key element) is closed.
+
+    Each asyncio.run() creates a new loop (e.g. one per CLI command); entries
+    of finished loops can never be used again.
+
+    Args:
+        pool: Pool keyed by (..., loop or None)
+
+    Returns:
+        Number of removed entries
+
+    """
+    closed = [key for key in pool if key[-1] is not None and key[-1].is_closed()]
+    for key in closed:
+        del pool[key]
+    return len(closed)
+
 
 # ============================================================================
 # Helper: LiteLLM Message Wrapper (OpenAI 호환성)
@@ -81,6 +123,37 @@ class LLMProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def settings(self) -> dict[str, Any]:
+        """
+        Return the settings the LLM instance is constructed with.
+
+        Used as the client registry key, so two providers with identical
+        settings share one pooled client.
+
+        Returns:
+            dict[str, Any]: Constructor keyword arguments.
+
+        Raises:
+            ValueError: If required environment variables are not set.
+
+        """
+        pass
+
+    def client_key(self) -> tuple:
+        """
+        Return the registry key: provider plus settings (API key fingerprinted).
+
+        Raises:
+            ValueError: If required environment variables are not set.
+
+        """
+        items = tuple(
+            (name, hashlib.sha256(str(value).encode()).hexdigest()[:16] if name == "api_key" else repr(value))
+            for name, value in sorted(self.settings().items())
+        )
+        return (type(self).__name__, items)
+
 
 class GoogleGenerativeAIProvider(LLMProvider):
     """
@@ -103,19 +176,29 @@ class GoogleGenerativeAIProvider(LLMProvider):
         Environment Variables:
             GEMINI_API_KEY: Google Gemini API Key (required).
 
+        """
+        return ChatGoogleGenerativeAI(**self.settings())
+
+    def settings(self) -> dict[str, Any]:
+        """
+        Return constructor settings for ChatGoogleGenerativeAI.
+
+        Raises:
+            ValueError: If GEMINI_API_KEY is not set.
+
         """
         api_key = getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
 
-        return ChatGoogleGenerativeAI(
-            api_key=api_key,
-            model="gemini-2.0-flash",
-            temperature=0.3,  # 결정적 도구 호출 (0.7 → 0.3으로 감소: ReAct 형식 일관성 향상)
-            max_output_tokens=8192,  # 응답 최대 길이 (2024년 증가: 1024 → 4096 → 8192, 전체 ReAct 대화 및 다중 문항 생성 지원)
-            top_p=0.95,  # Nucleus sampling (다양성 제어)
-            timeout=30,  # API 타임아웃 (초)
-        )
+        return {
+            "api_key": api_key,
+            "model": "gemini-2.0-flash",
+            "temperature": 0.3,  # 결정적 도구 호출 (0.7 → 0.3으로 감소: ReAct 형식 일관성 향상)
+            "max_output_tokens": 8192,  # 응답 최대 길이 (2024년 증가: 1024 → 4096 → 8192, 전체 ReAct 대화 및 다중 문항 생성 지원)
+            "top_p": 0.95,  # Nucleus sampling (다양성 제어)
+            "timeout": 30,  # API 타임아웃 (초)
+        }
 
 
 class LiteLLMProvider(LLMProvider):
@@ -143,25 +226,43 @@ class LiteLLMProvider(LLMProvider):
             LITELLM_MODEL: Model name to use (default: "gpt-4").
                 Example: "gemini-2.5-pro", "gpt-4o", "claude-3-sonnet"
 
+        """
+        settings = self.settings()
+
+        # Keep-alive connection pools shared by every call on this client
+        limits = httpx.Limits(
+            max_connections=LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+        )
+        return LiteLLMCompatibleOpenAI(
+            **settings,
+            http_client=httpx.Client(limits=limits, timeout=settings["timeout"]),
+            http_async_client=httpx.AsyncClient(limits=limits, timeout=settings["timeout"]),
+        )
+
+    def settings(self) -> dict[str, Any]:
+        """
+        Return constructor settings for the LiteLLM ChatOpenAI client.
+
+        Raises:
+            ValueError: If LITELLM_BASE_URL is not set.
+
         """
         base_url = getenv("LITELLM_BASE_URL")
         if not base_url:
             raise ValueError("LITELLM_BASE_URL 환경 변수가 설정되지 않았습니다.")
 
-        api_key = getenv("LITELLM_API_KEY", "sk-dummy-key")
-        model = getenv("LITELLM_MODEL", "gpt-4")
-
-        return LiteLLMCompatibleOpenAI(
-            model=model,
-            api_key=api_key,
-            base_url=base_url,
-            temperature=0.3,  # 결정적 도구 호출 (0.7 → 0.3으로 감소: ReAct 형식 일관성 향상)
-            max_tokens=8192,  # LiteLLM 프록시 호환성 (보수적 설정)
-            timeout=30,  # API 타임아웃 (초)
-            default_headers={
+        return {
+            "model": getenv("LITELLM_MODEL", "gpt-4"),
+            "api_key": getenv("LITELLM_API_KEY", "sk-dummy-key"),
+            "base_url": base_url,
+            "temperature": 0.3,  # 결정적 도구 호출 (0.7 → 0.3으로 감소: ReAct 형식 일관성 향상)
+            "max_tokens": 8192,  # LiteLLM 프록시 호환성 (보수적 설정)
+            "timeout": 30,  # API 타임아웃 (초)
+            "default_headers": {
                 "Accept": "application/json",
             },
-        )
+        }
 
 
 class LLMFactory:
@@ -193,13 +294,98 @@ class LLMFactory:
         return GoogleGenerativeAIProvider()
 
 
+class LLMClientRegistry:
+    """
+    Process-wide registry of pooled LLM clients.
+
+    Building a chat model constructs its SDK client and HTTP stack, so a
+    fresh instance per question pays object construction and a TLS
+    handshake every time. The registry keeps one client per
+    provider/model/settings key and event loop and hands the same instance
+    to every caller.
+
+    Design principle:
+    - Keyed by LLMProvider.client_key() (provider, model, settings; API key
+      fingerprinted), so an environment change yields a new client
+    - Also keyed by the running event loop (None for sync callers): the async
+      HTTP pool's connections belong to the loop that opened them, so a client
+      used under one asyncio.run() must not be reused under the next one.
+      Entries of closed loops are dropped on the next lookup
+    - LangChain chat models are stateless between calls, so one instance is
+      safe to share across threads and asyncio tasks of the same loop
+    - Creation is serialized under a lock; lookups never block on the network
+    - Counts creations vs reuses for monitoring
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._clients: dict[tuple, ChatGoogleGenerativeAI | ChatOpenAI] = {}
+        self._lock = threading.Lock()
+        self._creations = 0
+        self._reuses = 0
+
+    def get(self, provider: LLMProvider) -> ChatGoogleGenerativeAI | ChatOpenAI:
+        """
+        Return the pooled client for the provider's settings, creating it once.
+
+        Args:
+            provider: LLM provider selected by LLMFactory.
+
+        Returns:
+            Union[ChatGoogleGenerativeAI, ChatOpenAI]: Shared LLM instance.
+
+        Raises:
+            ValueError: If required environment variables are not set.
+
+        """
+        key = (provider.client_key(), running_loop())
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._reuses += 1
+                return client
+
+            drop_closed_loop_entries(self._clients)
+            client = provider.create()
+            self._clients[key] = client
+            self._creations += 1
+            logger.info(f"LLM client created for {key[0][0]} (clients={len(self._clients)})")
+            return client
+
+    def stats(self) -> dict[str, int]:
+        """Return client creation/reuse counters."""
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "creations": self._creations,
+                "reuses": self._reuses,
+            }
+
+    def clear(self) -> None:
+        """Drop all pooled clients and reset counters (tests, credential rotation)."""
+        with self._lock:
+            self._clients.clear()
+            self._creations = 0
+            self._reuses = 0
+
+
+_llm_registry = LLMClientRegistry()
+
+
+def get_llm_registry() -> LLMClientRegistry:
+    """Return the process-wide LLM client registry."""
+    return _llm_registry
+
+
 def create_llm() -> ChatGoogleGenerativeAI | ChatOpenAI:
     """
-    Create LLM instance based on environment configuration.
+    Return the pooled LLM instance for the current environment configuration.
 
     This is the main public API for LLM creation. It delegates to
-    LLMFactory to select the appropriate provider and creates the
-    LLM instance with optimized default settings.
+    LLMFactory to select the appropriate provider and returns the shared
+    client for that provider's settings from the process-wide registry,
+    creating it on first use (see LLMClientRegistry).
 
     Returns:
         Union[ChatGoogleGenerativeAI, ChatOpenAI]: Configured LLM instance.
@@ -226,7 +412,7 @@ def create_llm() -> ChatGoogleGenerativeAI | ChatOpenAI:
 
     """
     provider = LLMFactory.get_provider()
-    return provider.create()
+    return _llm_registry.get(provider)
 
 
 # Agent 설정
@@ -246,6 +432,7 @@ TOOL_CONFIG = {
     "validate_question_quality": 8,  # 15초 → 8초 (LLM 호출 최적화)
     "save_generated_question": 5,  # 10초 → 5초 (DB 저장)
     "score_and_explain": 8,  # 15초 → 8초 (LLM 호출 최적화)
+    "save_generated_questions_batch": 5,  # 1회 INSERT + commit (DB 저장)
 }
 
 # REQ-AGENT-0-0: Structured Output 위험 관리 설정
@@ -5,7 +5,7 @@ REQ: REQ-A-FastMCP
 
 Provides:
 - FastMCP server setup and tool registration
-- 6 real tool implementations for agent pipeline (Tool 1-6)
+- 6 real tool implementations for agent pipeline (Tool 1-6) plus the Tool 5 batch save
 - Error handling and timeout management
 - Integration with LangChain agent
 """
@@ -14,7 +14,7 @@ import logging
 
 # Import real tool implementations from src/agent/tools/
 from src.agent.tools.difficulty_keywords_tool import get_difficulty_keywords
-from src.agent.tools.save_question_tool import save_generated_question
+from src.agent.tools.save_question_tool import save_generated_question, save_generated_questions_batch
 from src.agent.tools.score_and_explain_tool import score_and_explain
 from src.agent.tools.search_templates_tool import search_question_templates
 from src.agent.tools.user_profile_tool import get_user_profile
@@ -32,6 +32,7 @@ logger = logging.getLogger(__name__)
 # - Tool 4: validate_question_quality (validate_question_tool.py)
 # - Tool 5: save_generated_question (save_question_tool.py)
 # - Tool 6: score_and_explain (score_and_explain_tool.py)
+# - Tool 5 (batch): save_generated_questions_batch (save_question_tool.py)
 #
 # These are PRODUCTION-READY implementations with:
 # - Real database connections
@@ -52,4 +53,5 @@ TOOLS = [
     validate_question_quality,
     save_generated_question,
     score_and_explain,
+    save_generated_questions_batch,
 ]
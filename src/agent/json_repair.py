@@ -0,0 +1,194 @@
+r"""
+Tolerant JSON parsing for LLM outputs: repair in a single scan.
+
+REQ: REQ-A-JsonRepair
+
+개요:
+    LLM 응답(ReAct Final Answer, 해설 JSON 등)은 거의 유효한 JSON이지만
+    Python literal, trailing comma, 잘못된 escape, 문자열 내 제어 문자,
+    마크다운 코드블록 같은 결함을 자주 포함합니다. 이전에는 호출부마다
+    정규식으로 문자열 전체를 다시 쓰며 json.loads를 최대 5회 재시도했습니다.
+
+설계 원칙:
+    - Fast path: 유효한 JSON은 json.loads 1회로 끝남 (복사/정규식 없음)
+    - Repair path: 하나의 토큰 정규식으로 텍스트를 한 번만 스캔하며 모든
+      결함을 동시에 수정한 뒤 json.loads 1회. 결함 없는 구간(정상 문자열 포함)은
+      정규식 엔진이 그대로 소비하므로 Python callback은 결함마다 1회
+    - 문자열을 토큰 단위로 소비하므로 문자열 내부의 True/None/쉼표는 보존
+    - 적용된 수리 목록을 ParseResult.repairs로 보고 (로그/메트릭용)
+
+Repairs:
+    markdown_fence     : ```json ... ``` 코드블록 제거
+    surrounding_text   : JSON 앞뒤의 설명 문장 제거
+    python_literal     : True/False/None → true/false/null
+    trailing_comma     : ,} / ,] 의 쉼표 제거
+    invalid_escape     : JSON에 없는 escape (\d, \' 등)의 backslash 이스케이프
+    control_character  : 문자열 내 개행/탭 등 제어 문자 escape, 문자열 밖 제어 문자 제거
+"""
+
+import json
+import logging
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MARKDOWN_FENCE = "markdown_fence"
+SURROUNDING_TEXT = "surrounding_text"
+PYTHON_LITERAL = "python_literal"
+TRAILING_COMMA = "trailing_comma"
+INVALID_ESCAPE = "invalid_escape"
+CONTROL_CHARACTER = "control_character"
+
+# One scan: each match is a run of clean JSON (consumed in C, including clean
+# strings) followed by at most one defect, so callbacks only run per defect.
+_CLEAN_STRING = r'"(?:[^"\\\x00-\x1f]|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})*+"'
+_TOKEN_RE = re.compile(
+    r"(?P<clean>(?:" + _CLEAN_STRING + r"|[^\"\x00-\x08\x0b\x0c\x0e-\x1f,TFN]++"
+    r"|,(?!\s*[}\]])"
+    r"|(?!\b(?:True|False|None)\b)[TFN]"
+    r")*+)"
+    r'(?:(?P<string>"(?:[^"\\]|\\.)*+")'
+    r"|(?P<literal>\b(?:True|False|None)\b)"
+    r"|(?P<comma>,)"
+    r"|(?P<control>[\x00-\x08\x0b\x0c\x0e-\x1f])"
+    r"|(?P<other>.)"
+    r"|\Z)",
+    re.DOTALL,
+)
+# Inside a string token: a valid escape, or a defect (stray backslash / raw control character)
+_STRING_FIX_RE = re.compile(r'\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})|\\|[\x00-\x1f]')
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+
+
+@dataclass
+class ParseResult:
+    """
+    Parsed JSON value and the repairs needed to parse it.
+
+    Attributes:
+        value: Parsed JSON (dict, list or scalar)
+        repairs: Repair names applied, in first-seen order (empty for valid JSON)
+
+    """
+
+    value: Any
+    repairs: list[str] = field(default_factory=list)
+
+    @property
+    def repaired(self) -> bool:
+        """Whether any repair was needed."""
+        return bool(self.repairs)
+
+
+def parse_json_tolerant(text: str) -> ParseResult:
+    """
+    Parse possibly malformed LLM JSON output.
+
+    Args:
+        text: Raw LLM output (may be fenced, surrounded by prose or slightly invalid)
+
+    Returns:
+        ParseResult with the parsed value and applied repairs
+
+    Raises:
+        ValueError: If text is empty or not a string
+        json.JSONDecodeError: If the text cannot be parsed even after repair
+
+    """
+    if not text or not isinstance(text, str):
+        raise ValueError("text must be a non-empty string")
+
+    repairs: list[str] = []
+    json_text = _strip_wrapping(text, repairs)
+
+    try:
+        return ParseResult(json.loads(json_text), repairs)
+    except json.JSONDecodeError as e:
+        first_error = e
+
+    repaired_text = repair_json(json_text, repairs)
+    try:
+        value = json.loads(repaired_text)
+    except json.JSONDecodeError as e:
+        logger.debug(f"JSON repair failed ({', '.join(repairs) or 'no repairs'}): {e.msg} at char {e.pos}")
+        raise e from first_error
+
+    logger.debug(f"JSON parsed after repairs: {', '.join(repairs)}")
+    return ParseResult(value, repairs)
+
+
+def repair_json(json_text: str, repairs: list[str] | None = None) -> str:
+    """
+    Fix common LLM JSON defects in a single scan.
+
+    Args:
+        json_text: JSON text without markdown fences
+        repairs: Optional list that receives the names of applied repairs
+
+    Returns:
+        Repaired JSON text (unchanged if nothing needed fixing)
+
+    """
+    applied = repairs if repairs is not None else []
+
+    def note(repair: str) -> None:
+        if repair not in applied:
+            applied.append(repair)
+
+    def fix_token(match: re.Match) -> str:
+        kind = match.lastgroup
+        clean = match.group("clean")
+        if kind == "clean" or kind == "other":
+            return match.group()
+        token = match.group(kind)
+        if kind == "string":
+            return clean + _repair_string(token, note)
+        if kind == "literal":
+            note(PYTHON_LITERAL)
+            return clean + _LITERALS[token]
+        note(TRAILING_COMMA if kind == "comma" else CONTROL_CHARACTER)
+        return clean
+
+    return _TOKEN_RE.sub(fix_token, json_text)
+
+
+def _repair_string(token: str, note: Callable[[str], None]) -> str:
+    """Escape control characters and invalid backslashes inside one string token."""
+
+    def fix(match: re.Match) -> str:
+        char = match.group()
+        if len(char) > 1:
+            return char  # valid escape sequence
+        if char == "\\":
+            note(INVALID_ESCAPE)
+            return "\\\\"
+        note(CONTROL_CHARACTER)
+        return _CONTROL_ESCAPES.get(char, f"\\u{ord(char):04x}")
+
+    return '"' + _STRING_FIX_RE.sub(fix, token[1:-1]) + '"'
+
+
+def _strip_wrapping(text: str, repairs: list[str]) -> str:
+    """Remove markdown fences and prose around the JSON value."""
+    json_text = text.strip()
+    if json_text[:1] not in ("{", "[") and "```" in json_text:
+        fenced = json_text.split("```json")[1] if "```json" in json_text else json_text.split("```")[1]
+        json_text = fenced.split("```")[0].strip()
+        repairs.append(MARKDOWN_FENCE)
+
+    if json_text[:1] in ("{", "["):
+        return json_text
+
+    starts = [index for index in (json_text.find("{"), json_text.find("[")) if index >= 0]
+    if not starts:
+        return json_text
+    start = min(starts)
+    end = json_text.rfind("}" if json_text[start] == "{" else "]")
+    if end > start:
+        repairs.append(SURROUNDING_TEXT)
+        return json_text[start : end + 1]
+    return json_text
@@ -20,17 +20,29 @@ REQ: REQ-A-ItemGen
 
 import json
 import logging
-import re
+import threading
+import time
 import traceback
 import uuid
 from datetime import UTC, datetime
+from typing import Any
 
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.prebuilt import create_react_agent
 from pydantic import BaseModel, Field
 
-from src.agent.config import AGENT_CONFIG, create_llm, should_use_structured_output
+from src.agent.config import (
+    AGENT_CONFIG,
+    LLMFactory,
+    create_llm,
+    drop_closed_loop_entries,
+    running_loop,
+    should_use_structured_output,
+)
 from src.agent.fastmcp_server import TOOLS
+from src.agent.json_repair import parse_json_tolerant
 from src.agent.output_converter import AgentOutputConverter
 from src.agent.prompts.react_prompt import get_react_prompt
 from src.agent.round_id_generator import RoundIDGenerator
@@ -48,75 +60,30 @@ _round_id_gen = RoundIDGenerator()
 
 def parse_json_robust(json_str: str, max_attempts: int = 5) -> dict | list:
     """
-    Robust JSON parsing with multiple cleanup strategies.
+    Robust JSON parsing for LLM responses (single-pass repair).
 
-    This function attempts to parse JSON using various cleanup strategies when
-    the initial parse fails. This handles edge cases like unescaped newlines,
-    trailing commas, Python True/False, etc.
+    Delegates to parse_json_tolerant, which fixes Python literals, trailing
+    commas, invalid escapes, control characters and markdown fences in one
+    scan instead of retrying json.loads over rewritten copies.
 
     Args:
         json_str: Raw JSON string from LLM response
-        max_attempts: Maximum number of cleanup strategies to try (default 5)
+        max_attempts: Unused; kept for backward compatibility
 
     Returns:
         Parsed JSON object or list
 
     Raises:
-        json.JSONDecodeError: If all cleanup strategies fail
+        json.JSONDecodeError: If the string cannot be repaired
 
     """
     if not json_str or not isinstance(json_str, str):
         raise ValueError("json_str must be a non-empty string")
 
-    # Strategy list: (name, cleanup_function)
-    cleanup_strategies = [
-        # Strategy 1: No cleanup - try as-is
-        ("no_cleanup", lambda s: s),
-        # Strategy 2: Fix Python literals (True/False/None)
-        (
-            "fix_python_literals",
-            lambda s: re.sub(r"\b(True|False)\b", lambda m: m.group(1).lower(), re.sub(r"\bNone\b", "null", s)),
-        ),
-        # Strategy 3: Remove trailing commas
-        ("fix_trailing_commas", lambda s: re.sub(r",(\s*[}\]])", r"\1", s)),
-        # Strategy 4: Fix escaped quotes and backslashes
-        ("fix_escapes", lambda s: re.sub(r"\\(?!\\|/|[btnfr])", "\\\\", s)),
-        # Strategy 5: Remove control characters
-        ("remove_control_chars", lambda s: s.encode("utf-8", "ignore").decode("utf-8")),
-    ]
-
-    last_error = None
-    for attempt_num, (strategy_name, cleanup_fn) in enumerate(cleanup_strategies, 1):
-        try:
-            cleaned_json = cleanup_fn(json_str)
-            result = json.loads(cleaned_json)
-
-            if attempt_num > 1:
-                logger.info(
-                    f"✅ JSON parsing succeeded with strategy '{strategy_name}' "
-                    f"(attempt {attempt_num}/{len(cleanup_strategies)})"
-                )
-
-            return result
-
-        except json.JSONDecodeError as e:
-            last_error = e
-            logger.debug(
-                f"   Attempt {attempt_num}/{len(cleanup_strategies)} "
-                f"(strategy: {strategy_name}) failed at char {e.pos}: {e.msg}"
-            )
-            continue
-
-        except Exception as e:
-            logger.debug(f"   Attempt {attempt_num} ({strategy_name}) error: {e}")
-            continue
-
-    # All strategies failed
-    logger.error(
-        f"❌ JSON parsing failed after {len(cleanup_strategies)} cleanup strategies. "
-        f"Last error: {last_error} at char {last_error.pos if last_error else 'unknown'}"
-    )
-    raise last_error or ValueError("JSON parsing failed with unknown error")
+    result = parse_json_tolerant(json_str)
+    if result.repaired:
+        logger.info(f"✅ JSON parsing succeeded after repairs: {', '.join(result.repairs)}")
+    return result.value
 
 
 def normalize_answer_schema(answer_schema_raw: str | dict | None) -> str:
@@ -153,6 +120,10 @@ class GenerateQuestionsRequest(BaseModel):
         default=None, description="생성할 문항 유형 (multiple_choice | true_false | short_answer), None이면 모두 생성"
     )
     domain: str = Field(default="AI", description="문항 도메인/주제 (예: AI, food, science)")
+    resume: bool = Field(
+        default=False,
+        description="session_id의 체크포인트 thread를 이어서 실행 (실패 step 재개 또는 question_count만큼 추가 생성)",
+    )
 
 
 class AnswerSchema(BaseModel):
@@ -343,6 +314,8 @@ class ItemGenAgent:
             2. 프롬프트 로드
             3. FastMCP 도구 등록
             4. create_react_agent()로 에이전트 생성 (최신 Tool Calling 지원)
+               - checkpointer: 실행 thread(session_id)별로 매 step의 state를 저장해
+                 재시도 시 마지막 성공 step부터 재개 (REQ-A-Mode1-Resume)
 
         에러 처리:
             - GEMINI_API_KEY 없음: ValueError
@@ -368,10 +341,14 @@ class ItemGenAgent:
             # ReAct 패턴: Thought → Action → Observation을 반복하며 복잡한 작업을 수행합니다.
             # AGENT_CONFIG의 max_iterations, early_stopping_method, handle_parsing_errors는
             # create_react_agent의 래퍼로 활용되거나, CompiledStateGraph 실행 시 config로 전달됩니다.
+            # 5. Checkpointer - 실행 thread별 step 결과 저장 (재시도 시 재개용, 프로세스 로컬)
+            self.checkpointer = InMemorySaver()
+
             self.executor = create_react_agent(
                 model=self.llm,
                 tools=self.tools,
                 prompt=self.prompt,
+                checkpointer=self.checkpointer,
                 debug=AGENT_CONFIG.get("verbose", False),
                 version="v2",  # 최신 LangGraph v2 API 사용
             )
@@ -547,11 +524,99 @@ class ItemGenAgent:
         logger.info(f"\nStep 2️⃣ Result: {len(tool_results)} matching tools found\n")
         return tool_results
 
+    @staticmethod
+    def _thread_config(thread_id: str) -> RunnableConfig:
+        """Return the LangGraph run config addressing one checkpointed thread."""
+        return {"configurable": {"thread_id": thread_id}}
+
+    async def discard_checkpoint(self, thread_id: str) -> None:
+        """
+        Drop the checkpoints of a finished generation thread.
+
+        REQ: REQ-A-Mode1-Resume
+
+        Args:
+            thread_id: Thread ID (the request's session_id)
+
+        """
+        await self.checkpointer.adelete_thread(thread_id)
+
+    @staticmethod
+    def _expand_batch_save_results(batch_results: list[tuple[str, Any]]) -> list[tuple[str, Any]]:
+        """
+        Split save_generated_questions_batch outputs into per-question Tool 5 results.
+
+        REQ: REQ-A-Mode1-Tool5-Batch
+
+        Args:
+            batch_results: (tool_name, tool_output) of each batch save call
+
+        Returns:
+            ("save_generated_question", result) per saved question; a failed batch
+            becomes one failed result so it is counted like a failed single save
+
+        """
+        expanded: list[tuple[str, Any]] = []
+        for _, tool_output in batch_results:
+            try:
+                output = json.loads(tool_output) if isinstance(tool_output, str) else tool_output
+            except json.JSONDecodeError:
+                output = None
+            if not isinstance(output, dict):
+                logger.warning(f"Unparseable batch save result: {str(tool_output)[:100]}")
+                expanded.append(("save_generated_question", {"success": False, "error": "Invalid batch save result"}))
+                continue
+            if not output.get("success", False):
+                error = output.get("error", "Batch save failed")
+                expanded.append(("save_generated_question", {"success": False, "error": error}))
+            expanded.extend(("save_generated_question", saved) for saved in output.get("saved", []))
+        return expanded
+
+    async def _resume_input(
+        self, config: RunnableConfig, request: GenerateQuestionsRequest, round_id: str, fresh_input: dict
+    ) -> dict | None:
+        """
+        Build the graph input that continues a checkpointed thread.
+
+        REQ: REQ-A-Mode1-Resume
+
+        Returns:
+            None to re-run the step that failed (LangGraph resumes from the last
+            checkpoint), a top-up message asking for request.question_count more
+            questions when the previous run finished, or fresh_input when the
+            thread has no checkpoint yet
+
+        """
+        snapshot = await self.executor.aget_state(config)
+        if not snapshot.values.get("messages"):
+            return fresh_input
+        if snapshot.next:
+            logger.info(f"🔁 Resuming thread {request.session_id[:8]} at step {list(snapshot.next)}")
+            return None
+
+        question_types_str = ", ".join(request.question_types or ["multiple_choice", "true_false", "short_answer"])
+        logger.info(f"🔁 Topping up thread {request.session_id[:8]}: {request.question_count} more question(s)")
+        return {
+            "messages": [
+                HumanMessage(
+                    content=f"""
+Only part of the requested questions were saved. Generate {request.question_count} more question(s).
+Question Types: {question_types_str}
+
+The user profile, templates and keywords from Tool 1-3 above are still valid: do NOT call Tool 1-3 again.
+- Generate EXACTLY {request.question_count} new questions that differ from the ones already saved
+- Validate each new question (Tool 4)
+- Save the validated questions (Tool 5 or its batch save) with session_id={request.session_id} and round_id={round_id}
+"""
+                )
+            ]
+        }
+
     async def generate_questions(self, request: GenerateQuestionsRequest) -> GenerateQuestionsResponse:
         """
         Mode 1: Generate questions (Tool 1-5 auto-select).
 
-        REQ: REQ-A-Mode1-Pipeline
+        REQ: REQ-A-Mode1-Pipeline, REQ-A-Mode1-Resume
 
         단계:
             1. 사용자 프로필 조회 (Tool 1)
@@ -562,10 +627,13 @@ class ItemGenAgent:
             6. 검증 통과 문항 저장 (Tool 5)
 
         Args:
-            request: GenerateQuestionsRequest
+            request: GenerateQuestionsRequest. With request.resume the checkpointed
+                thread of request.session_id is continued instead of started over:
+                the failed step is re-run, or request.question_count more questions
+                are topped up after a finished run (Tool 1-3 results are kept)
 
         Returns:
-            GenerateQuestionsResponse
+            GenerateQuestionsResponse (with resume, items of the whole thread)
 
         에러 처리:
             - Tool 호출 실패: 자동 재시도 (최대 3회)
@@ -651,7 +719,12 @@ Important:
             # [REQ-AGENT-0-1 Phase 1] 디버깅: Agent 실행 전 로깅
             logger.debug(f"{phase1_prefix} Agent input length: {len(agent_input)}")
 
-            result = await self.executor.ainvoke({"messages": [HumanMessage(content=agent_input)]})
+            config = self._thread_config(session_id)
+            graph_input: dict | None = {"messages": [HumanMessage(content=agent_input)]}
+            if request.resume:
+                graph_input = await self._resume_input(config, request, round_id, graph_input)
+
+            result = await self.executor.ainvoke(graph_input, config=config)
 
             # 성능 측정 종료 및 토큰 정보 추출
             elapsed_ms = int((time.time() - start_time) * 1000)
@@ -830,7 +903,11 @@ Tool 6 will return: is_correct (boolean), score (0-100), explanation, keyword_ma
 """
 
             # 에이전트 실행
-            result = await self.executor.ainvoke({"input": agent_input})
+            thread_id = f"score_{uuid.uuid4().hex}"
+            try:
+                result = await self.executor.ainvoke({"input": agent_input}, config=self._thread_config(thread_id))
+            finally:
+                await self.discard_checkpoint(thread_id)
 
             logger.info("✅ 채점 완료")
 
@@ -1161,6 +1238,9 @@ Tool 6 will return: is_correct (boolean), score (0-100), explanation, keyword_ma
             if not items:
                 logger.info("\n📊 Extracting save_generated_question tool results (LangGraph format)...")
                 tool_results = self._extract_tool_results(result, "save_generated_question")
+                tool_results += self._expand_batch_save_results(
+                    self._extract_tool_results(result, "save_generated_questions_batch")
+                )
                 agent_steps = max(
                     agent_steps, len(result.get("intermediate_steps", [])) or len(result.get("messages", []))
                 )
@@ -1411,9 +1491,132 @@ Tool 6 will return: is_correct (boolean), score (0-100), explanation, keyword_ma
 # ============================================================================
 
 
+class ItemGenAgentPool:
+    """
+    Process-wide pool of compiled ItemGenAgents, one per LLM configuration.
+
+    REQ: REQ-A-AgentPool
+
+    ItemGenAgent construction resolves the LLM client, loads the ReAct prompt
+    and compiles a LangGraph create_react_agent graph. Doing that inside every
+    question-generation attempt put agent setup on the request path.
+
+    Design principle:
+    - Keyed by the LLM provider's client_key() (provider, model, settings), so
+      an environment change compiles a new graph instead of reusing a stale one
+    - Also keyed by the running event loop, like LLMClientRegistry: the graph
+      holds the loop-scoped LLM client, so every asyncio.run() (e.g. each CLI
+      command) gets its own agent. Agents of closed loops, including their
+      InMemorySaver checkpoints, are dropped on the next lookup
+    - ItemGenAgent keeps no per-request state and the compiled graph is
+      re-entrant (each ainvoke gets its own state), so one instance serves
+      concurrent requests
+    - Construction is serialized under a lock; failures are not cached
+    - Counts builds vs reuses and build time, so the setup time saved is observable
+
+    Attributes:
+        builds: Number of agents constructed
+        reuses: Number of requests served by an already built agent
+        build_seconds: Total time spent constructing agents
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._agents: dict[tuple, ItemGenAgent] = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.reuses = 0
+        self.build_seconds = 0.0
+
+    def get(self) -> ItemGenAgent:
+        """
+        Return the compiled agent for the current LLM configuration, building it once.
+
+        Returns:
+            ItemGenAgent: Shared agent instance
+
+        Raises:
+            ValueError: If required environment variables are not set
+
+        """
+        try:
+            key = (LLMFactory.get_provider().client_key(), running_loop())
+        except ValueError:
+            # Misconfigured environment: let ItemGenAgent surface the error
+            return ItemGenAgent()
+
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is not None:
+                self.reuses += 1
+                return agent
+
+            drop_closed_loop_entries(self._agents)
+            started = time.perf_counter()
+            agent = ItemGenAgent()
+            elapsed = time.perf_counter() - started
+            self._agents[key] = agent
+            self.builds += 1
+            self.build_seconds += elapsed
+            logger.info(f"ItemGenAgent compiled for {key[0][0]} in {elapsed * 1000:.0f}ms (agents={len(self._agents)})")
+            return agent
+
+    def warm_up(self) -> bool:
+        """
+        Build the agent for the current configuration ahead of the first request.
+
+        Call it on the loop that will serve requests (e.g. the FastAPI startup
+        event, which Starlette runs on the server loop): agents are pooled per
+        event loop.
+
+        Returns:
+            True if an agent is ready, False if construction failed (logged)
+
+        """
+        try:
+            self.get()
+        except Exception as e:
+            logger.warning(f"ItemGenAgent warm-up failed; agent will be built on first request: {e}")
+            return False
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Return build/reuse counters and the estimated construction time saved."""
+        with self._lock:
+            average = self.build_seconds / self.builds if self.builds else 0.0
+            return {
+                "agents": len(self._agents),
+                "builds": self.builds,
+                "reuses": self.reuses,
+                "build_seconds": round(self.build_seconds, 4),
+                "avg_build_ms": round(average * 1000, 1),
+                "seconds_saved": round(average * self.reuses, 4),
+            }
+
+    def clear(self) -> None:
+        """Drop all pooled agents and reset counters (tests, credential rotation)."""
+        with self._lock:
+            self._agents.clear()
+            self.builds = 0
+            self.reuses = 0
+            self.build_seconds = 0.0
+
+
+_agent_pool = ItemGenAgentPool()
+
+
+def get_agent_pool() -> ItemGenAgentPool:
+    """Return the process-wide ItemGenAgent pool."""
+    return _agent_pool
+
+
 async def create_agent() -> ItemGenAgent:
     """
-    Create ItemGenAgent factory function.
+    Return the pooled ItemGenAgent for the current configuration.
+
+    The agent (LLM client, prompt, compiled graph) is built once per process
+    and configuration (see ItemGenAgentPool) and shared across requests.
 
     Returns:
         ItemGenAgent: 초기화된 에이전트
@@ -1424,4 +1627,4 @@ async def create_agent() -> ItemGenAgent:
         ```
 
     """
-    return ItemGenAgent()
+    return _agent_pool.get()
@@ -25,6 +25,8 @@ import logging
 import re
 import uuid
 
+from src.agent.json_repair import parse_json_tolerant
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,17 +74,17 @@ class AgentOutputConverter:
         1. "Final Answer:" 패턴 탐색
         2. 마크다운 코드블록 제거 (```json ... ```)
         3. Escaped 문자 처리
-        4. Robust JSON 파싱 (5가지 cleanup strategy)
+        4. Tolerant JSON 파싱 (parse_json_tolerant: 1회 스캔으로 결함 수리)
 
         Args:
             content: AI Message의 content (ReAct 텍스트 형식)
-            max_attempts: 최대 cleanup 시도 횟수
+            max_attempts: 사용하지 않음 (하위 호환용)
 
         Returns:
             파싱된 JSON 객체 또는 배열
 
         Raises:
-            json.JSONDecodeError: 모든 cleanup 시도 실패 시
+            json.JSONDecodeError: 수리 후에도 파싱 실패 시
             ValueError: content가 None이거나 Final Answer 패턴 없을 시
 
         """
@@ -102,14 +104,16 @@ class AgentOutputConverter:
         # Step 3: Escaped 문자 처리
         json_str = AgentOutputConverter._unescape_json_string(json_str)
 
-        # Step 4: Robust JSON 파싱
+        # Step 4: Tolerant JSON 파싱 (single-pass repair)
         try:
-            parsed = AgentOutputConverter._parse_json_robust(json_str, max_attempts)
-            logger.info("✅ Successfully parsed Final Answer JSON")
-            return parsed
+            result = parse_json_tolerant(json_str)
         except json.JSONDecodeError:
-            logger.error(f"❌ Failed to parse Final Answer JSON after {max_attempts} attempts")
+            logger.error("❌ Failed to parse Final Answer JSON after repair")
             raise
+        if result.repaired:
+            logger.debug(f"Final Answer JSON repaired: {', '.join(result.repairs)}")
+        logger.info("✅ Successfully parsed Final Answer JSON")
+        return result.value
 
     @staticmethod
     def _remove_markdown_code_blocks(json_str: str) -> str:
@@ -138,57 +142,6 @@ class AgentOutputConverter:
         json_str = re.sub(r"\bNone\b", "null", json_str)
         return json_str
 
-    @staticmethod
-    def _parse_json_robust(json_str: str, max_attempts: int = 5) -> dict | list:
-        """
-        5가지 cleanup strategy를 순차적으로 적용하는 robust JSON 파싱.
-
-        Strategy 1: 현상태로 파싱
-        Strategy 2: Python literals (True/False) 변환
-        Strategy 3: Trailing commas 제거
-        Strategy 4: Escape 문자 처리
-        Strategy 5: Control characters 제거
-
-        Args:
-            json_str: Raw JSON 문자열
-            max_attempts: 최대 시도 횟수
-
-        Returns:
-            파싱된 JSON 객체 또는 배열
-
-        Raises:
-            json.JSONDecodeError: 모든 전략 실패 시
-
-        """
-        cleanup_strategies = [
-            ("no_cleanup", lambda s: s),
-            ("fix_python_literals", lambda s: re.sub(r"\b(True|False)\b", lambda m: m.group(1).lower(), s)),
-            ("fix_trailing_commas", lambda s: re.sub(r",(\s*[}\]])", r"\1", s)),
-            ("fix_escapes", lambda s: re.sub(r"\\(?!\\|/|[btnfr])", "\\\\", s)),
-            ("remove_control_chars", lambda s: s.encode("utf-8", "ignore").decode("utf-8")),
-        ]
-
-        last_error = None
-        for attempt_num, (strategy_name, cleanup_fn) in enumerate(cleanup_strategies, 1):
-            try:
-                cleaned_json = cleanup_fn(json_str)
-                result = json.loads(cleaned_json)
-
-                if attempt_num > 1:
-                    logger.debug(
-                        f"✅ JSON parsing succeeded with strategy '{strategy_name}' "
-                        f"(attempt {attempt_num}/{len(cleanup_strategies)})"
-                    )
-                return result
-
-            except json.JSONDecodeError as e:
-                last_error = e
-                logger.debug(f"⚠️  Strategy '{strategy_name}' failed: {str(e)[:100]}")
-                if attempt_num >= max_attempts:
-                    break
-
-        raise last_error
-
     # ==========================================================================
     # 2. 데이터 변환: 질문 데이터 → GeneratedItem
     # ==========================================================================
@@ -1,20 +1,32 @@
 """
 Mode 1 Question Generation Pipeline - Orchestrate Tools 1-5.
 
-REQ: REQ-A-Mode1-Pipeline
+REQ: REQ-A-Mode1-Pipeline, REQ-A-Mode1-Parallel
 Pipeline orchestrator for generating questions using Tools 1-5 in ReAct pattern.
+
+agenerate_questions() is the deterministic parallel mode: the step order is
+fixed in code instead of being decided by the LLM one tool call at a time.
+Tools 1-3 run concurrently, N questions are generated by N parallel
+structured-output LLM calls (map), then validated as one batch and saved in
+one transaction (reduce).
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from src.agent.tools.difficulty_keywords_tool import get_difficulty_keywords
-from src.agent.tools.save_question_tool import save_generated_question
-from src.agent.tools.search_templates_tool import search_question_templates
-from src.agent.tools.user_profile_tool import get_user_profile
-from src.agent.tools.validate_question_tool import validate_question_quality
+from langchain_core.language_models import BaseChatModel
+from pydantic import BaseModel, Field
+
+from src.agent.config import create_llm, should_use_structured_output
+from src.agent.json_repair import parse_json_tolerant
+from src.agent.tools.difficulty_keywords_tool import _get_difficulty_keywords_impl, get_difficulty_keywords
+from src.agent.tools.save_question_tool import _save_generated_questions_batch_impl, save_generated_question
+from src.agent.tools.search_templates_tool import _search_question_templates_impl, search_question_templates
+from src.agent.tools.user_profile_tool import _get_user_profile_impl, get_user_profile
+from src.agent.tools.validate_question_tool import _validate_question_quality_impl, validate_question_quality
 
 logger = logging.getLogger(__name__)
 
@@ -52,25 +64,49 @@ def get_top_category(domain: str) -> str:
         return "general"
 
 
+ITEM_TYPES = ("multiple_choice", "true_false", "short_answer")
+SELF_LEVEL_DIFFICULTY = {"beginner": 2, "intermediate": 4, "inter-advanced": 6, "advanced": 8, "elite": 9}
+
+
+class QuestionDraft(BaseModel):
+    """Structured LLM output for one question (parallel mode, REQ-A-Mode1-Parallel)."""
+
+    stem: str = Field(..., description="문항 내용")
+    choices: list[str] | None = Field(default=None, description="객관식 선택지 (접두어 없이), OX는 ['True', 'False']")
+    correct_answer: str | None = Field(default=None, description="정답 - 선택지 중 하나와 정확히 일치 (객관식/OX)")
+    correct_keywords: list[str] | None = Field(default=None, description="정답 키워드 (주관식)")
+    category: str = Field(..., description="문항 카테고리 (사용자 관심분야 중 하나)")
+    explanation: str | None = Field(default=None, description="정답 해설")
+
+
 class Mode1Pipeline:
     """
     Mode 1 Question Generation Pipeline.
 
-    REQ: REQ-A-Mode1-Pipeline
+    REQ: REQ-A-Mode1-Pipeline, REQ-A-Mode1-Parallel
 
     Orchestrates Tools 1-5 for generating questions using ReAct pattern.
     Handles conditional tool selection, error recovery, and metadata preservation.
+
+    agenerate_questions() runs the same steps without the ReAct loop:
+    concurrent Tools 1-3, bounded parallel question generation (max_concurrent),
+    one batch validation and one bulk save.
     """
 
-    def __init__(self, session_id: str | None = None) -> None:
+    # Maximum concurrent question-generation LLM calls (parallel mode)
+    MAX_CONCURRENT_GENERATION = 5
+
+    def __init__(self, session_id: str | None = None, max_concurrent: int | None = None) -> None:
         """
         Initialize Mode 1 pipeline.
 
         Args:
             session_id: Optional session ID for tracking
+            max_concurrent: Optional override for max concurrent LLM calls in parallel mode (default: 5)
 
         """
         self.session_id = session_id or str(uuid.uuid4())
+        self.max_concurrent = max_concurrent or self.MAX_CONCURRENT_GENERATION
         logger.info(f"Mode1Pipeline initialized with session_id={self.session_id}")
 
     def _generate_round_id(self, session_id: str, round_number: int) -> str:
@@ -122,15 +158,7 @@ class Mode1Pipeline:
 
         # Fallback to default
         logger.warning("Tool 1: Using default profile after all retries failed")
-        return {
-            "user_id": user_id,
-            "self_level": "beginner",
-            "years_experience": 0,
-            "job_role": "Unknown",
-            "duty": "Not specified",
-            "interests": [],
-            "previous_score": 0,
-        }
+        return self._call_tool1_default(user_id)
 
     def _call_tool2(self, interests: list[str], difficulty: int, category: str) -> list[dict[str, Any]]:
         """
@@ -443,6 +471,295 @@ class Mode1Pipeline:
         # Step 7: Parse Output
         return self._parse_agent_output(saved_questions, len(generated_questions))
 
+    async def agenerate_questions(
+        self,
+        user_id: str,
+        round_number: int,
+        count: int = 5,
+        previous_score: int | None = None,
+        profile_hint: dict[str, Any] | None = None,
+        question_types: list[str] | None = None,
+        domain: str = "AI",
+    ) -> dict[str, Any]:
+        """
+        Generate questions with the deterministic parallel pipeline (no ReAct loop).
+
+        REQ: REQ-A-Mode1-Parallel
+
+        Steps:
+        1. Tools 1-3 concurrently (asyncio.gather). With profile_hint (self_level,
+           interests already known to the caller) all three start at once;
+           otherwise Tool 1 runs first and Tools 2-3 run together
+        2. Map: one structured-output LLM call per question, bounded by max_concurrent;
+           item types are assigned round-robin, so the mix is deterministic
+        3. Reduce: Tool 4 batch validation, then one bulk save of the questions the
+           ReAct agent would keep (final_score >= 0.70 and not "reject")
+
+        Args:
+            user_id: User ID
+            round_number: Round number (1 or 2)
+            count: Number of questions to generate
+            previous_score: Previous round score (for round 2)
+            profile_hint: Optional profile fields (self_level, interests, ...) known before Tool 1 returns
+            question_types: Item types to generate (None = all, round-robin)
+            domain: Question domain/topic
+
+        Returns:
+            dict with status, generated_count, total_attempted, questions list and round_id
+
+        """
+        logger.info(f"Parallel pipeline: {count} questions for user={user_id}, round={round_number}")
+        round_id = self._generate_round_id(self.session_id, round_number)
+
+        # Step 1: Tools 1-3
+        if profile_hint is not None:
+            difficulty, category = self._plan_difficulty(round_number, previous_score, profile_hint)
+            interests = profile_hint.get("interests") or []
+            user_profile, templates, keywords = await asyncio.gather(
+                self._acall_tool1(user_id),
+                self._acall_tool2(interests, difficulty, category),
+                self._acall_tool3(difficulty, category),
+            )
+            # The caller's profile is authoritative (Tool 1 may fall back to defaults)
+            user_profile = {**user_profile, **{key: value for key, value in profile_hint.items() if value is not None}}
+        else:
+            user_profile = await self._acall_tool1(user_id)
+            difficulty, category = self._plan_difficulty(round_number, previous_score, user_profile)
+            interests = user_profile.get("interests") or []
+            templates, keywords = await asyncio.gather(
+                self._acall_tool2(interests, difficulty, category),
+                self._acall_tool3(difficulty, category),
+            )
+
+        # Step 2: Map - N parallel structured-output calls
+        types = question_types or list(ITEM_TYPES)
+        slot_types = [types[index % len(types)] for index in range(count)]
+        categories = interests or [domain]
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        llm = create_llm()
+        prompts = [
+            self._build_question_prompt(
+                user_profile, templates, keywords, item_type, difficulty, categories, index, count
+            )
+            for index, item_type in enumerate(slot_types)
+        ]
+        drafts = await asyncio.gather(
+            *(
+                self._agenerate_one(llm, semaphore, prompt, item_type, difficulty)
+                for prompt, item_type in zip(prompts, slot_types, strict=True)
+            )
+        )
+        generated_questions = [draft for draft in drafts if draft is not None]
+        if not generated_questions:
+            logger.warning("Parallel pipeline: no questions generated")
+            return {**self._parse_agent_output([], count), "round_id": round_id}
+
+        # Step 3: Reduce - batch validation + bulk save
+        validation_results = await asyncio.to_thread(self._validate_batch, generated_questions)
+        accepted = [
+            (question, result)
+            for question, result in zip(generated_questions, validation_results, strict=True)
+            if not result.get("should_discard", True)
+        ]
+        saved_questions = await asyncio.to_thread(self._save_questions_bulk, accepted, round_id, category)
+        logger.info(
+            f"Parallel pipeline: generated {len(generated_questions)}/{count}, "
+            f"accepted {len(accepted)}, saved {len(saved_questions)}"
+        )
+        return {**self._parse_agent_output(saved_questions, count), "round_id": round_id}
+
+    def _plan_difficulty(
+        self, round_number: int, previous_score: int | None, profile: dict[str, Any]
+    ) -> tuple[int, str]:
+        """Return (difficulty, top category) for the parallel pipeline."""
+        if round_number == 1:
+            level = str(profile.get("self_level") or "intermediate").lower()
+            difficulty = SELF_LEVEL_DIFFICULTY.get(level, 5)
+        else:
+            difficulty = self._calculate_difficulty(round_number, previous_score, profile)
+        interests = profile.get("interests") or [""]
+        return difficulty, get_top_category(interests[0])
+
+    async def _acall_tool1(self, user_id: str) -> dict[str, Any]:
+        """Tool 1 off the event loop; falls back to the default profile."""
+        try:
+            return await asyncio.to_thread(_get_user_profile_impl, user_id)
+        except Exception as e:
+            logger.warning(f"Tool 1: Failed ({e}), using default profile")
+            return self._call_tool1_default(user_id)
+
+    async def _acall_tool2(self, interests: list[str], difficulty: int, category: str) -> list[dict[str, Any]]:
+        """Tool 2 off the event loop; skipped without interests, [] on failure."""
+        if not interests:
+            return []
+        try:
+            return await asyncio.to_thread(_search_question_templates_impl, interests, difficulty, category)
+        except Exception as e:
+            logger.warning(f"Tool 2: Search failed: {e}")
+            return []
+
+    async def _acall_tool3(self, difficulty: int, category: str) -> dict[str, Any]:
+        """Tool 3 off the event loop; default keywords on failure."""
+        try:
+            return await asyncio.to_thread(_get_difficulty_keywords_impl, difficulty, category)
+        except Exception as e:
+            logger.error(f"Tool 3: Failed: {e}")
+            return {
+                "difficulty": difficulty,
+                "category": category,
+                "keywords": ["General Knowledge", "Understanding", "Application"],
+                "concepts": [],
+                "example_questions": [],
+            }
+
+    def _call_tool1_default(self, user_id: str) -> dict[str, Any]:
+        """Return the default profile used when Tool 1 fails."""
+        return {
+            "user_id": user_id,
+            "self_level": "beginner",
+            "years_experience": 0,
+            "job_role": "Unknown",
+            "duty": "Not specified",
+            "interests": [],
+            "previous_score": 0,
+        }
+
+    def _build_question_prompt(
+        self,
+        user_profile: dict[str, Any],
+        templates: list[dict[str, Any]],
+        keywords: dict[str, Any],
+        item_type: str,
+        difficulty: int,
+        categories: list[str],
+        index: int,
+        count: int,
+    ) -> str:
+        """
+        Build the prompt for one question of the parallel map step.
+
+        Each call sees the same context plus its own slot (index, focus keyword),
+        so parallel calls cover different keywords instead of repeating each other.
+        """
+        keyword_list = keywords.get("keywords") or []
+        focus = keyword_list[index % len(keyword_list)] if keyword_list else categories[index % len(categories)]
+        template_lines = "\n".join(f"- {t.get('stem')}" for t in templates[:3]) or "- (none)"
+        type_rules = {
+            "multiple_choice": "choices: 4 options without letter prefixes; correct_answer: exactly one of the choices",
+            "true_false": 'choices: ["True", "False"]; correct_answer: "True" or "False"',
+            "short_answer": "choices: null; correct_answer: null; correct_keywords: 2-5 keywords a correct answer contains",
+        }
+        return f"""You are writing question {index + 1} of {count} for an AI-literacy test.
+
+Learner: level={user_profile.get("self_level")}, role={user_profile.get("job_role")}, \
+experience={user_profile.get("years_experience")} years, interests={categories}
+Difficulty: {difficulty} (1-10)
+Question type: {item_type} ({type_rules[item_type]})
+Focus keyword: {focus}
+Related keywords: {", ".join(keyword_list) or "N/A"}
+Similar questions (do not copy):
+{template_lines}
+
+Write ONE question in Korean. category must be one of {categories}.
+Respond with a JSON object with fields: stem, choices, correct_answer, correct_keywords, category, explanation."""
+
+    async def _agenerate_one(
+        self,
+        llm: BaseChatModel,
+        semaphore: asyncio.Semaphore,
+        prompt: str,
+        item_type: str,
+        difficulty: int,
+    ) -> dict[str, Any] | None:
+        """
+        Generate one question with a structured-output call (JSON fallback).
+
+        Returns:
+            Question dict in the Tool 4/Tool 5 format, or None if the call or parsing failed
+
+        """
+        model_name = str(getattr(llm, "model", "unknown")).replace("models/", "")
+        try:
+            async with semaphore:
+                if should_use_structured_output(model_name):
+                    output = await llm.with_structured_output(QuestionDraft).ainvoke(prompt)
+                else:
+                    response = await llm.ainvoke(prompt)
+                    output = parse_json_tolerant(response.content).value
+            draft = output if isinstance(output, QuestionDraft) else QuestionDraft.model_validate(output)
+        except Exception as e:
+            logger.warning(f"Parallel pipeline: question generation failed: {e}")
+            return None
+
+        choices = ["True", "False"] if item_type == "true_false" and not draft.choices else draft.choices
+        correct_key = draft.correct_answer if item_type != "short_answer" else None
+        correct_keywords = draft.correct_keywords if item_type == "short_answer" else None
+        return {
+            "item_type": item_type,
+            "question_type": item_type,
+            "stem": draft.stem,
+            "choices": choices if item_type != "short_answer" else None,
+            "correct_key": correct_key,
+            "correct_answer": correct_key or ", ".join(correct_keywords or []),
+            "correct_keywords": correct_keywords,
+            "difficulty": difficulty,
+            "category": draft.category,
+            "categories": [draft.category],
+            "explanation": draft.explanation,
+        }
+
+    def _validate_batch(self, questions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Tool 4 batch validation; every question is discarded if validation itself fails."""
+        try:
+            return _validate_question_quality_impl(
+                stem=[q["stem"] for q in questions],
+                question_type=[q["question_type"] for q in questions],
+                choices=[q.get("choices") for q in questions],
+                correct_answer=[q["correct_answer"] for q in questions],
+                batch=True,
+            )
+        except Exception as e:
+            logger.error(f"Tool 4: Batch validation failed: {e}")
+            return [{"should_discard": True, "final_score": 0.0, "recommendation": "reject"} for _ in questions]
+
+    def _save_questions_bulk(
+        self,
+        accepted: list[tuple[dict[str, Any], dict[str, Any]]],
+        round_id: str,
+        category: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Save validated questions to the pipeline's session in one transaction.
+
+        Uses Tool 5's batch save (one multi-row INSERT, one commit); questions
+        failing Tool 5's input validation are skipped.
+
+        Returns:
+            Saved question dicts (same shape as generate_questions)
+
+        """
+        batch = [{**question, "validation_score": validation.get("final_score")} for question, validation in accepted]
+        result = _save_generated_questions_batch_impl(batch, round_id, self.session_id)
+        if not result["success"]:
+            logger.error(f"Tool 5: Bulk save failed: {result.get('error')}")
+
+        return [
+            {
+                "question_id": saved["question_id"],
+                "stem": question["stem"],
+                "type": question["item_type"],
+                "choices": question.get("choices"),
+                "correct_answer": question.get("correct_key"),
+                "correct_keywords": question.get("correct_keywords"),
+                "difficulty": question["difficulty"],
+                "category": question.get("category", category),
+                "validation_score": question["validation_score"],
+                "saved_at": saved["saved_at"],
+            }
+            for saved in result["saved"]
+            for question in [batch[saved["index"]]]
+        ]
+
     def _calculate_difficulty(self, round_number: int, previous_score: int | None, user_profile: dict[str, Any]) -> int:
         """
         Calculate appropriate difficulty for this round.
@@ -134,6 +134,15 @@ STEP 4-6: Generate, Validate, Save (REPEAT for each question)
             }
             Observation: Get question_id from save result
 
+            Alternative: keep validated questions and save them together with
+            save_generated_questions_batch (one DB transaction):
+            Action Input: {
+              "questions": [{<STEP 4d fields without round_id/session_id>}, ...],
+              "round_id": "<round_id>",
+              "session_id": "<session_id>"
+            }
+            Observation: "saved" lists question_id per question (same fields as save_generated_question)
+
    CRITICAL RULES for Question Generation Loop:
    ✓ NEVER save without validating first (Steps 4b → 4c → 4d order is MANDATORY)
    ✓ NEVER batch-validate multiple questions (validate ONE at a time)
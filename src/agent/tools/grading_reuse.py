@@ -0,0 +1,318 @@
+"""
+Short-answer grading reuse - exact and near-duplicate answer clustering.
+
+REQ: REQ-A-Mode2-Tool6
+
+Many users submit identical or near-identical short answers to the same
+question. Instead of one LLM grading call per answer, graded answers are
+indexed per question:
+    exact : normalized-text hash → instant hit
+    near  : MinHash signature + LSH banding → candidate cluster members,
+            confirmed by estimated Jaccard similarity >= threshold and the
+            same negation markers (one inserted "not"/"않" barely moves the
+            similarity but flips the meaning)
+
+The first answer of a cluster is graded by the LLM (the representative) and
+its grade fans out to every later answer in the cluster.
+"""
+
+import hashlib
+import logging
+import random
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# MinHash / LSH parameters: 32 bands x 4 rows. Pairs at similarity >= 0.8 are
+# almost surely candidates; candidates are then verified against the threshold.
+NUM_PERMUTATIONS = 128
+LSH_BANDS = 32
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+SHINGLE_SIZE = 3
+
+# Memory bounds
+MAX_QUESTIONS = 2_000
+MAX_GRADES_PER_QUESTION = 1_000
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20240601)
+_PERMUTATIONS: list[tuple[int, int]] = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERMUTATIONS)
+]
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+# Negation words (English after normalize_answer: "isn't" → "isn t") and Korean negation stems
+_NEGATION_WORDS = frozenset({"not", "no", "never", "none", "nothing", "cannot", "without", "t", "안", "못"})
+_NEGATION_STEMS = ("않", "없", "아니", "아닌", "아닙", "못하")
+
+
+def normalize_answer(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace (Korean/word chars kept)."""
+    return " ".join(_PUNCTUATION.sub(" ", text.lower()).split())
+
+
+def _shingles(normalized: str) -> set[str]:
+    """Character shingles of the normalized answer (whole text if shorter)."""
+    if len(normalized) <= SHINGLE_SIZE:
+        return {normalized}
+    return {normalized[i : i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+
+def negation_markers(normalized: str) -> tuple[str, ...]:
+    """
+    Extract the negation markers of a normalized answer.
+
+    Args:
+        normalized: Output of normalize_answer
+
+    Returns:
+        Sorted negation words/stems (with repeats); near-duplicates must match exactly
+
+    """
+    markers = []
+    for word in normalized.split():
+        if word in _NEGATION_WORDS:
+            markers.append(word)
+        markers.extend(stem for stem in _NEGATION_STEMS if stem in word)
+    return tuple(sorted(markers))
+
+
+def minhash_signature(normalized: str) -> tuple[int, ...]:
+    """
+    Compute the MinHash signature of a normalized answer.
+
+    Args:
+        normalized: Output of normalize_answer
+
+    Returns:
+        Tuple of NUM_PERMUTATIONS min-hash values
+
+    """
+    hashed = [
+        int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for shingle in _shingles(normalized)
+    ]
+    return tuple(min((a * value + b) % _MERSENNE_PRIME for value in hashed) for a, b in _PERMUTATIONS)
+
+
+def estimated_similarity(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity as the fraction of agreeing MinHash slots."""
+    return sum(1 for a, b in zip(left, right, strict=True) if a == b) / NUM_PERMUTATIONS
+
+
+@dataclass
+class ReusedGrade:
+    """Grade produced by the LLM for a cluster representative."""
+
+    score: int
+    reasoning: str
+    match: str  # "exact" or "near"
+    similarity: float
+
+
+@dataclass
+class _QuestionIndex:
+    """Graded answers of one question (grading context)."""
+
+    exact: dict[str, int] = field(default_factory=dict)  # text hash → grade slot
+    bands: dict[tuple[int, tuple[int, ...]], list[int]] = field(default_factory=dict)  # LSH bucket → grade slots
+    signatures: list[tuple[int, ...]] = field(default_factory=list)
+    negations: list[tuple[str, ...]] = field(default_factory=list)
+    grades: list[tuple[int, str]] = field(default_factory=list)
+
+
+@dataclass
+class GradingReuseStats:
+    """Lookup counters for tuning the similarity threshold."""
+
+    lookups: int = 0
+    exact_hits: int = 0
+    near_hits: int = 0
+    misses: int = 0
+    stored: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters with derived hit rates."""
+        hits = self.exact_hits + self.near_hits
+        return {
+            "lookups": self.lookups,
+            "exact_hits": self.exact_hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "stored": self.stored,
+            "hit_rate": round(hits / self.lookups, 4) if self.lookups else 0.0,
+            "exact_hit_rate": round(self.exact_hits / self.lookups, 4) if self.lookups else 0.0,
+            "near_hit_rate": round(self.near_hits / self.lookups, 4) if self.lookups else 0.0,
+        }
+
+
+class GradingReuseIndex:
+    """
+    Per-question index of LLM-graded short answers.
+
+    REQ: REQ-A-Mode2-Tool6
+
+    Design principle:
+    - Keyed by a grading context (question id + expected keywords + difficulty),
+      so a changed rubric never reuses stale grades
+    - Exact normalized-text hash first, MinHash/LSH near-duplicate second;
+      near-duplicates must also carry the same negation markers
+    - Only successful LLM grades are stored (callers skip fallback scores)
+    - Bounded: LRU over questions, capped graded answers per question
+    - Thread-safe (single lock; lookups are O(bands) dictionary probes)
+
+    Attributes:
+        threshold: Minimum estimated similarity for a near-duplicate hit
+        stats: Lookup counters (exposed via stats_snapshot)
+
+    """
+
+    def __init__(self, threshold: float | None = None) -> None:
+        """
+        Initialize GradingReuseIndex.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity (0-1) for near-duplicate reuse
+                (default: settings.SHORT_ANSWER_REUSE_THRESHOLD)
+
+        """
+        self.threshold = settings.SHORT_ANSWER_REUSE_THRESHOLD if threshold is None else threshold
+        self.stats = GradingReuseStats()
+        self._questions: OrderedDict[str, _QuestionIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def context_key(question_id: str, correct_keywords: list[str], difficulty: int | None) -> str:
+        """Build the grading context key (question id + rubric)."""
+        rubric = "\x1f".join(str(keyword) for keyword in correct_keywords)
+        return f"{question_id}\x1e{difficulty}\x1e{rubric}"
+
+    def lookup(self, context: str, user_answer: str) -> ReusedGrade | None:
+        """
+        Find a reusable grade for an answer.
+
+        Args:
+            context: Grading context key (context_key)
+            user_answer: Raw user answer
+
+        Returns:
+            ReusedGrade on exact/near hit, None on miss
+
+        """
+        normalized = normalize_answer(user_answer)
+        text_hash = hashlib.sha256(normalized.encode()).hexdigest()
+
+        with self._lock:
+            self.stats.lookups += 1
+            index = self._questions.get(context)
+            if index is None:
+                self.stats.misses += 1
+                return None
+            self._questions.move_to_end(context)
+
+            slot = index.exact.get(text_hash)
+            if slot is not None:
+                self.stats.exact_hits += 1
+                score, reasoning = index.grades[slot]
+                return ReusedGrade(score=score, reasoning=reasoning, match="exact", similarity=1.0)
+
+        # Signature computed outside the lock
+        signature = minhash_signature(normalized)
+        negations = negation_markers(normalized)
+
+        with self._lock:
+            best_slot, best_similarity = None, 0.0
+            candidates: set[int] = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                candidates.update(index.bands.get((band, key), ()))
+            for candidate in candidates:
+                if index.negations[candidate] != negations:
+                    continue
+                similarity = estimated_similarity(signature, index.signatures[candidate])
+                if similarity > best_similarity:
+                    best_slot, best_similarity = candidate, similarity
+
+            if best_slot is not None and best_similarity >= self.threshold:
+                self.stats.near_hits += 1
+                score, reasoning = index.grades[best_slot]
+                return ReusedGrade(score=score, reasoning=reasoning, match="near", similarity=best_similarity)
+
+            self.stats.misses += 1
+            return None
+
+    def store(self, context: str, user_answer: str, score: int, reasoning: str) -> None:
+        """
+        Record an LLM grade as a cluster representative.
+
+        Args:
+            context: Grading context key (context_key)
+            user_answer: Raw user answer that was graded
+            score: LLM score (0-100)
+            reasoning: LLM reasoning
+
+        """
+        normalized = normalize_answer(user_answer)
+        text_hash = hashlib.sha256(normalized.encode()).hexdigest()
+        signature = minhash_signature(normalized)
+        negations = negation_markers(normalized)
+
+        with self._lock:
+            index = self._questions.get(context)
+            if index is None:
+                index = _QuestionIndex()
+                self._questions[context] = index
+                while len(self._questions) > MAX_QUESTIONS:
+                    self._questions.popitem(last=False)
+            self._questions.move_to_end(context)
+
+            if text_hash in index.exact or len(index.grades) >= MAX_GRADES_PER_QUESTION:
+                return
+
+            slot = len(index.grades)
+            index.grades.append((score, reasoning))
+            index.signatures.append(signature)
+            index.negations.append(negations)
+            index.exact[text_hash] = slot
+            for band, key in enumerate(self._band_keys(signature)):
+                index.bands.setdefault((band, key), []).append(slot)
+            self.stats.stored += 1
+
+    def stats_snapshot(self) -> dict[str, Any]:
+        """Return hit/miss counters and hit rates (plus the active threshold)."""
+        with self._lock:
+            snapshot = self.stats.as_dict()
+            snapshot["threshold"] = self.threshold
+            snapshot["questions"] = len(self._questions)
+            return snapshot
+
+    def clear(self) -> None:
+        """Drop all graded answers and reset counters."""
+        with self._lock:
+            self._questions.clear()
+            self.stats = GradingReuseStats()
+
+    @staticmethod
+    def _band_keys(signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        """Split a signature into LSH band keys."""
+        return [signature[band * LSH_ROWS : (band + 1) * LSH_ROWS] for band in range(LSH_BANDS)]
+
+
+# Process-wide index used by score_and_explain_tool
+_grading_reuse_index = GradingReuseIndex()
+
+
+def get_grading_reuse_index() -> GradingReuseIndex:
+    """Return the process-wide short-answer grading reuse index."""
+    return _grading_reuse_index
+
+
+def get_grading_reuse_stats() -> dict[str, Any]:
+    """Return hit rates of the process-wide grading reuse index."""
+    return _grading_reuse_index.stats_snapshot()
@@ -1,8 +1,12 @@
 """
 Save Generated Question Tool - Save validated questions to database.
 
-REQ: REQ-A-Mode1-Tool5
+REQ: REQ-A-Mode1-Tool5, REQ-A-Mode1-Tool5-Batch
 Tool 5 for Mode 1 pipeline: Save validated questions to question_bank with metadata.
+
+save_generated_questions_batch saves a whole round with one multi-row INSERT
+and one commit (QuestionPersistenceService) instead of a session, insert,
+commit and refresh per question.
 """
 
 import logging
@@ -13,6 +17,7 @@ from langchain_core.tools import tool
 
 from src.backend.database import get_db
 from src.backend.models.question import Question
+from src.backend.services.question_persistence import QuestionPersistenceService
 
 logger = logging.getLogger(__name__)
 
@@ -144,6 +149,30 @@ def _build_answer_schema(
     return schema
 
 
+def _flatten_answer_schema(answer_schema: dict[str, Any]) -> dict[str, Any]:
+    """
+    Extract answer fields from answer_schema for the Agent's Final Answer JSON.
+
+    Args:
+        answer_schema: answer_schema built by _build_answer_schema
+
+    Returns:
+        dict with correct_answer, correct_keywords, validation_score, explanation (if present)
+
+    """
+    flattened: dict[str, Any] = {}
+    if isinstance(answer_schema, dict):
+        if "correct_key" in answer_schema:
+            flattened["correct_answer"] = answer_schema["correct_key"]
+        if "correct_keywords" in answer_schema:
+            flattened["correct_keywords"] = answer_schema["correct_keywords"]
+        if "validation_score" in answer_schema:
+            flattened["validation_score"] = answer_schema["validation_score"]
+        if "explanation" in answer_schema:
+            flattened["explanation"] = answer_schema["explanation"]
+    return flattened
+
+
 def _extract_category_string(categories: list[str]) -> str:
     """
     Extract single category string from categories list.
@@ -287,18 +316,7 @@ def _save_generated_question_impl(
         logger.info(f"Question saved successfully: {question.id}")
 
         # Flatten answer_schema for Agent's Final Answer JSON
-        # Extracts fields from answer_schema dict for easy Agent consumption
-        flattened_answer_schema = {}
-        if isinstance(answer_schema, dict):
-            # Extract answer-specific fields
-            if "correct_key" in answer_schema:
-                flattened_answer_schema["correct_answer"] = answer_schema["correct_key"]
-            if "correct_keywords" in answer_schema:
-                flattened_answer_schema["correct_keywords"] = answer_schema["correct_keywords"]
-            if "validation_score" in answer_schema:
-                flattened_answer_schema["validation_score"] = answer_schema["validation_score"]
-            if "explanation" in answer_schema:
-                flattened_answer_schema["explanation"] = answer_schema["explanation"]
+        flattened_answer_schema = _flatten_answer_schema(answer_schema)
 
         return {
             "question_id": question.id,
@@ -429,6 +447,162 @@ def save_generated_question(
     )
 
 
+def _save_generated_questions_batch_impl(
+    questions: list[dict[str, Any]],
+    round_id: str = "",
+    session_id: str = "unknown",
+) -> dict[str, Any]:
+    """
+    Implement save_generated_questions_batch (without @tool decorator).
+
+    REQ: REQ-A-Mode1-Tool5-Batch
+
+    Questions failing input validation are reported in "failed" and skipped;
+    the rest are saved with one multi-row INSERT and one commit. If that
+    transaction fails, every valid question goes to the retry queue.
+
+    Args:
+        questions: Question dicts with the save_generated_question arguments
+            (item_type, stem, choices, correct_key, correct_keywords, difficulty,
+            categories, validation_score, explanation)
+        round_id: Round ID for tracking (shared by the batch)
+        session_id: Test session ID (from Backend Service)
+
+    Returns:
+        dict with:
+            - saved: per-question results (save_generated_question format plus
+              "index" of the input question)
+            - failed: [{"index", "error"}] for questions failing input validation
+            - round_id: Echo of input round_id
+            - saved_at: ISO 8601 timestamp
+            - success: True if the batch was committed
+            - error / queued_for_retry: set if the transaction failed
+
+    Raises:
+        TypeError: If questions is not a list
+
+    """
+    if not isinstance(questions, list):
+        raise TypeError(f"questions must be list, got {type(questions)}")
+    logger.info(f"Tool 5: Saving {len(questions)} generated questions in one batch")
+
+    rows: list[dict[str, Any]] = []
+    pending: list[tuple[int, dict[str, Any]]] = []
+    failed: list[dict[str, Any]] = []
+    round_num = _extract_round_number(round_id)
+    for index, question in enumerate(questions):
+        try:
+            categories = question.get("categories") or ["general"]
+            _validate_save_question_inputs(
+                question.get("item_type"),
+                question.get("stem"),
+                question.get("choices"),
+                question.get("correct_key"),
+                question.get("correct_keywords"),
+                question.get("difficulty", 5),
+                categories,
+                round_id,
+            )
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.info(f"Question {index} not saved: {e}")
+            failed.append({"index": index, "error": str(e)})
+            continue
+        rows.append(
+            {
+                "session_id": session_id,
+                "item_type": question["item_type"],
+                "stem": question["stem"],
+                "choices": question.get("choices"),
+                "answer_schema": _build_answer_schema(
+                    question["item_type"],
+                    question.get("correct_key"),
+                    question.get("correct_keywords"),
+                    question.get("validation_score"),
+                    question.get("explanation"),
+                ),
+                "difficulty": question.get("difficulty", 5),
+                "category": _extract_category_string(categories),
+                "round": round_num,
+            }
+        )
+        pending.append((index, {**question, "categories": categories}))
+
+    saved_at = datetime.now(UTC).isoformat()
+    if not rows:
+        return {"saved": [], "failed": failed, "round_id": round_id, "saved_at": saved_at, "success": True}
+
+    db = next(get_db())
+    try:
+        question_ids = QuestionPersistenceService(db).save_questions_bulk(rows)
+    except Exception as e:
+        logger.error(f"Failed to save question batch: {e}")
+        SAVE_RETRY_QUEUE.extend({**question, "round_id": round_id} for _, question in pending)
+        logger.warning(f"{len(pending)} questions added to retry queue (queue size: {len(SAVE_RETRY_QUEUE)})")
+        return {
+            "saved": [],
+            "failed": failed,
+            "round_id": round_id,
+            "saved_at": saved_at,
+            "success": False,
+            "error": str(e),
+            "queued_for_retry": True,
+        }
+    finally:
+        db.close()
+
+    logger.info(f"Question batch saved successfully: {len(question_ids)} questions")
+    saved = [
+        {
+            "index": index,
+            "question_id": question_id,
+            "type": row["item_type"],
+            "stem": row["stem"],
+            "choices": row["choices"],
+            "difficulty": row["difficulty"],
+            "category": row["category"],
+            "answer_schema": "exact_match",
+            "round_id": round_id,
+            "saved_at": saved_at,
+            "success": True,
+            **_flatten_answer_schema(row["answer_schema"]),
+        }
+        for (index, _), question_id, row in zip(pending, question_ids, rows, strict=True)
+    ]
+    return {"saved": saved, "failed": failed, "round_id": round_id, "saved_at": saved_at, "success": True}
+
+
+@tool
+def save_generated_questions_batch(
+    questions: list[dict[str, Any]],
+    round_id: str = "",
+    session_id: str = "unknown",
+) -> dict[str, Any]:
+    """
+    Save several validated questions to the question_bank in one transaction.
+
+    REQ: REQ-A-Mode1-Tool5-Batch
+
+    Prefer this over calling save_generated_question once per question: the
+    whole round is written with one INSERT and one commit.
+
+    Args:
+        questions: List of question dicts, each with the save_generated_question
+            arguments (item_type, stem, choices, correct_key, correct_keywords,
+            difficulty, categories, validation_score, explanation)
+        round_id: Round ID for tracking (format: "session_id_round_timestamp")
+        session_id: Test session ID (from Backend Service, for DB linking)
+
+    Returns:
+        dict with:
+            - saved: list of saved questions (same fields as save_generated_question,
+              plus "index" of the input question)
+            - failed: list of {"index", "error"} for questions with invalid inputs
+            - success: True if the batch was saved, False if queued for retry
+
+    """
+    return _save_generated_questions_batch_impl(questions, round_id, session_id)
+
+
 def get_retry_queue() -> list[dict[str, Any]]:
     """
     Get the memory queue of failed saves for batch retry.
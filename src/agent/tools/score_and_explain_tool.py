@@ -14,6 +14,8 @@ from typing import Any
 from langchain_core.tools import tool
 
 from src.agent.config import create_llm
+from src.agent.tools.grading_reuse import get_grading_reuse_index
+from src.backend.services.keyword_matcher import get_keyword_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,10 @@ MIN_REFERENCE_LINKS = 3
 
 # LLM scoring defaults
 DEFAULT_LLM_SCORE = 50  # Fallback score if LLM fails
+LLM_PARSE_FAILED_REASON = "Unable to parse LLM response"
+LLM_UNAVAILABLE_REASON = "LLM service temporarily unavailable"
+LLM_ERROR_REASON = "LLM service error"
+LLM_FALLBACK_REASONS = {LLM_PARSE_FAILED_REASON, LLM_UNAVAILABLE_REASON, LLM_ERROR_REASON}
 
 
 def _validate_score_answer_inputs(
@@ -151,26 +157,24 @@ def _score_true_false(
 def _extract_keyword_matches(
     user_answer: str,
     correct_keywords: list[str],
+    question_id: str | None = None,
 ) -> list[str]:
     """
     Extract matched keywords from user answer.
 
+    Uses the shared compiled KeywordMatcher (cached per question id), so all
+    keywords are found in a single pass over the answer.
+
     Args:
         user_answer: User's response text
         correct_keywords: Expected keywords
+        question_id: Question ID for the compiled matcher cache (optional)
 
     Returns:
         List of keywords found in user_answer
 
     """
-    matched = []
-    answer_lower = user_answer.lower()
-
-    for keyword in correct_keywords:
-        keyword_lower = keyword.lower()
-        # Simple substring matching (can be enhanced with regex)
-        if keyword_lower in answer_lower:
-            matched.append(keyword)
+    matched = get_keyword_matcher(question_id, correct_keywords).match(user_answer).matched_keywords
 
     logger.debug(f"Keyword matching: found {len(matched)}/{len(correct_keywords)}")
     return matched
@@ -240,29 +244,35 @@ Do not include markdown or any other text."""
                 return score, reasoning
             except (json.JSONDecodeError, ValueError) as e:
                 logger.warning(f"Could not parse LLM JSON response: {response_text}, {e}")
-                return DEFAULT_LLM_SCORE, "Unable to parse LLM response"
+                return DEFAULT_LLM_SCORE, LLM_PARSE_FAILED_REASON
 
         except Exception as e:
             logger.error(f"LLM invocation failed: {e}")
-            return DEFAULT_LLM_SCORE, "LLM service temporarily unavailable"
+            return DEFAULT_LLM_SCORE, LLM_UNAVAILABLE_REASON
 
     except Exception as e:
         logger.error(f"LLM initialization failed: {e}")
-        return DEFAULT_LLM_SCORE, "LLM service error"
+        return DEFAULT_LLM_SCORE, LLM_ERROR_REASON
 
 
 def _score_short_answer(
     user_answer: str,
     correct_keywords: list[str],
     difficulty: int | None = None,
+    question_id: str | None = None,
 ) -> tuple[bool, int, list[str]]:
     """
     Score short answer using LLM semantic evaluation.
 
+    With a question_id, grades are reused across identical and near-identical
+    answers to the same question (grading_reuse), so the LLM only grades one
+    representative per answer cluster.
+
     Args:
         user_answer: User's response
         correct_keywords: Expected keywords
         difficulty: Question difficulty level (optional)
+        question_id: Question ID for the compiled keyword matcher cache (optional)
 
     Returns:
         Tuple of (is_correct, score, keyword_matches)
@@ -272,10 +282,23 @@ def _score_short_answer(
 
     """
     # Extract keyword matches
-    keyword_matches = _extract_keyword_matches(user_answer, correct_keywords)
+    keyword_matches = _extract_keyword_matches(user_answer, correct_keywords, question_id)
+
+    # Reuse the grade of an identical / near-identical answer to the same question
+    reuse_index = get_grading_reuse_index()
+    context = reuse_index.context_key(question_id, correct_keywords, difficulty) if question_id else None
+    reused = reuse_index.lookup(context, user_answer) if context else None
+
+    if reused is not None:
+        llm_score = reused.score
+        logger.debug(f"Short answer grade reused ({reused.match}, similarity={reused.similarity:.2f})")
+    else:
+        # Get LLM score
+        llm_score, reasoning = _call_llm_score_short_answer(user_answer, correct_keywords, difficulty)
 
-    # Get LLM score
-    llm_score, reasoning = _call_llm_score_short_answer(user_answer, correct_keywords, difficulty)
+        # Only genuine LLM grades become cluster representatives
+        if context and reasoning not in LLM_FALLBACK_REASONS:
+            reuse_index.store(context, user_answer, llm_score, reasoning)
 
     # Determine is_correct based on score threshold
     is_correct = llm_score >= HIGH_SCORE_THRESHOLD
@@ -500,7 +523,7 @@ def _score_and_explain_impl(
     elif question_type == "true_false":
         is_correct, score = _score_true_false(user_answer, correct_answer)
     else:  # short_answer
-        is_correct, score, keyword_matches = _score_short_answer(user_answer, correct_keywords, difficulty)
+        is_correct, score, keyword_matches = _score_short_answer(user_answer, correct_keywords, difficulty, question_id)
 
     # Generate explanation
     explanation_text, reference_links = _generate_explanation(
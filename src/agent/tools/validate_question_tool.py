@@ -1,16 +1,42 @@
 """
 Validate Question Quality Tool - Validate AI-generated question quality.
 
-REQ: REQ-A-Mode1-Tool4
+REQ: REQ-A-Mode1-Tool4, REQ-A-Mode1-Tool4-Batch
 Tool 4 for Mode 1 pipeline: Validate generated question quality using LLM + rule-based checks.
+
+Batch validation (batch=True) does not pay one LLM round-trip per question in series:
+    concurrent    : per-question LLM checks run in parallel, bounded by
+                    VALIDATION_MAX_CONCURRENCY
+    single_prompt : one LLM call scores every question (JSON array), parsed by
+                    ValidationResponseParser; falls back to concurrent on failure
+
+Validation cascade (REQ-A-Mode1-Tool4-Cascade): cheap stages run first and
+short-circuit, so the LLM only scores questions that could still pass:
+    rules     : rule-based checks; rule_score < MIN_VALID_SCORE already fails
+                min(llm_score, rule_score)
+    content   : QuestionContentValidator (profanity, bias, copyright)
+    duplicate : near-duplicate of a recently stored question stem
+    llm       : semantic LLM check (survivors only)
+Per-stage counters: get_validation_cascade_stats()
 """
 
 import logging
-from typing import Any
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from os import getenv
+from typing import Any, NamedTuple
 
 from langchain_core.tools import tool
 
 from src.agent.config import create_llm
+from src.agent.json_repair import parse_json_tolerant
+from src.agent.tools.validation_response_parser import ValidationResponseParser
+from src.backend.database import get_db
+from src.backend.models.question import Question
+from src.backend.validators.question_content_validator import QuestionContentValidator
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +57,106 @@ REVISE_UPPER_THRESHOLD = 0.85
 # Default score for LLM failure
 DEFAULT_LLM_SCORE = 0.5
 
+# Batch validation (REQ-A-Mode1-Tool4-Batch)
+BATCH_MODE_CONCURRENT = "concurrent"
+BATCH_MODE_SINGLE_PROMPT = "single_prompt"
+VALIDATION_BATCH_MODE = getenv("VALIDATION_BATCH_MODE", BATCH_MODE_CONCURRENT)
+VALIDATION_MAX_CONCURRENCY = int(getenv("VALIDATION_MAX_CONCURRENCY", "5"))
+
+QuestionInput = tuple[str, str, list[str] | None, str]
+
+# Validation cascade (REQ-A-Mode1-Tool4-Cascade)
+STAGE_RULES = "rules"
+STAGE_CONTENT = "content"
+STAGE_DUPLICATE = "duplicate"
+STAGE_LLM = "llm"
+CASCADE_STAGES = (STAGE_RULES, STAGE_CONTENT, STAGE_DUPLICATE, STAGE_LLM)
+NEAR_DUPLICATE_THRESHOLD = float(getenv("VALIDATION_DUPLICATE_THRESHOLD", "0.9"))
+NEAR_DUPLICATE_WINDOW = int(getenv("VALIDATION_DUPLICATE_WINDOW", "500"))
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+@dataclass
+class CascadeStageStats:
+    """
+    Counters of one validation cascade stage.
+
+    Attributes:
+        checked: Questions the stage ran on
+        rejected: Questions the stage rejected (short-circuits the later stages)
+        skipped: Questions that never reached the stage or could not be checked
+
+    """
+
+    checked: int = 0
+    rejected: int = 0
+    skipped: int = 0
+
+
+@dataclass
+class ValidationCascadeStats:
+    """
+    Per-stage hit/skip counters of the validation cascade.
+
+    REQ: REQ-A-Mode1-Tool4-Cascade
+
+    "llm".skipped is the number of LLM calls saved by the cheaper stages.
+    """
+
+    stages: dict[str, CascadeStageStats] = field(
+        default_factory=lambda: {stage: CascadeStageStats() for stage in CASCADE_STAGES}
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, rejected_by: str | None, unchecked: tuple[str, ...] = ()) -> None:
+        """
+        Record how one question went through the cascade.
+
+        Args:
+            rejected_by: Stage that rejected the question (None if it passed every stage)
+            unchecked: Stages that were reached but could not run (e.g. DB unavailable)
+
+        """
+        with self._lock:
+            reached = True
+            for stage in CASCADE_STAGES:
+                counters = self.stages[stage]
+                if not reached or stage in unchecked:
+                    counters.skipped += 1
+                    continue
+                counters.checked += 1
+                if stage == rejected_by:
+                    counters.rejected += 1
+                    reached = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters per stage plus the number of LLM calls saved."""
+        with self._lock:
+            snapshot: dict[str, Any] = {
+                stage: {"checked": c.checked, "rejected": c.rejected, "skipped": c.skipped}
+                for stage, c in self.stages.items()
+            }
+            snapshot["llm_calls_saved"] = self.stages[STAGE_LLM].skipped
+            return snapshot
+
+
+# Process-wide counters of the validation cascade
+_cascade_stats = ValidationCascadeStats()
+
+
+def get_validation_cascade_stats() -> dict[str, Any]:
+    """Return per-stage hit/skip counters of the process-wide validation cascade."""
+    return _cascade_stats.as_dict()
+
+
+class _CascadeCheck(NamedTuple):
+    """Outcome of the cheap cascade stages for one question."""
+
+    rule_score: float
+    issues: list[str]
+    rejected_by: str | None = None
+    unchecked: tuple[str, ...] = ()
+
 
 def _validate_question_inputs(
     stem: str | list[str],
@@ -209,6 +335,72 @@ Do not include any explanation, just the score."""
         return DEFAULT_LLM_SCORE
 
 
+def _call_llm_batch_validation(questions: list[QuestionInput]) -> list[float]:
+    """
+    Score several questions with one LLM call.
+
+    REQ: REQ-A-Mode1-Tool4-Batch
+
+    Args:
+        questions: (stem, question_type, choices, correct_answer) per question
+
+    Returns:
+        LLM quality scores (0.0-1.0) in question order; DEFAULT_LLM_SCORE for
+        entries missing from the response
+
+    Raises:
+        Exception: If the LLM call fails or the response is not a JSON array
+
+    """
+    llm = create_llm()
+
+    blocks = []
+    for index, (stem, question_type, choices, correct_answer) in enumerate(questions, start=1):
+        choices_str = "\n".join(f"  - {c}" for c in choices) if choices else "  N/A"
+        blocks.append(
+            f"[{index}]\nQuestion Stem: {stem}\nQuestion Type: {question_type}\n"
+            f"Choices:\n{choices_str}\nCorrect Answer: {correct_answer}"
+        )
+    questions_str = "\n\n".join(blocks)
+
+    prompt = f"""Evaluate the quality of each of the following {len(questions)} questions on a scale of 0.0 to 1.0.
+
+{questions_str}
+
+Consider these criteria for every question:
+1. Clarity: Is the question clear and unambiguous?
+2. Appropriateness: Is the difficulty level appropriate?
+3. Correctness: Is the correct answer objective and verifiable?
+4. Bias: Are there any biases or inappropriate language?
+5. Format: Is the format valid and properly structured?
+
+Respond with ONLY a JSON array with one object per question, in the same order, like:
+[{{"index": 1, "score": 0.85}}, {{"index": 2, "score": 0.6}}]
+
+Do not include any explanation."""
+
+    response = llm.invoke(prompt)
+    entries = parse_json_tolerant(response.content).value
+    if not isinstance(entries, list):
+        raise ValueError(f"Expected a JSON array of scores, got {type(entries).__name__}")
+
+    by_index = {}
+    for position, entry in enumerate(entries, start=1):
+        index, raw_score = (
+            (entry.get("index", position), entry.get("score")) if isinstance(entry, dict) else (position, entry)
+        )
+        try:
+            by_index[int(index)] = max(0.0, min(1.0, float(raw_score)))
+        except (TypeError, ValueError):
+            logger.warning(f"Could not parse batch LLM score for question {index}: {raw_score}")
+
+    missing = [index for index in range(1, len(questions) + 1) if index not in by_index]
+    if missing:
+        logger.warning(f"Batch LLM validation returned no score for questions {missing}")
+    logger.info(f"Batch LLM validation: {len(questions) - len(missing)}/{len(questions)} scores in one call")
+    return [by_index.get(index, DEFAULT_LLM_SCORE) for index in range(1, len(questions) + 1)]
+
+
 def _get_recommendation(final_score: float) -> str:
     """
     Determine recommendation based on final score.
@@ -266,6 +458,7 @@ def _build_feedback(
     rule_score: float,
     issues: list[str],
     recommendation: str,
+    decided_by: str = STAGE_LLM,
 ) -> str:
     """
     Build human-readable feedback.
@@ -275,6 +468,7 @@ def _build_feedback(
         rule_score: Rule-based score
         issues: List of issues found
         recommendation: Recommendation (pass/revise/reject)
+        decided_by: Cascade stage that decided the result
 
     Returns:
         Feedback string
@@ -292,7 +486,10 @@ def _build_feedback(
     if issues:
         feedback_parts.append("\n발견된 문제점:\n" + "\n".join(f"- {issue}" for issue in issues))
 
-    feedback_parts.append(f"\n점수: LLM {score:.2f} / 규칙 {rule_score:.2f}")
+    if decided_by == STAGE_LLM:
+        feedback_parts.append(f"\n점수: LLM {score:.2f} / 규칙 {rule_score:.2f}")
+    else:
+        feedback_parts.append(f"\n점수: 규칙 {rule_score:.2f} (LLM 검증 생략: {decided_by} 단계에서 거부)")
 
     return "".join(feedback_parts)
 
@@ -303,6 +500,7 @@ def _validate_question_quality_impl(
     choices: list[str] | list[list[str]] | None = None,
     correct_answer: str | list[str] = None,
     batch: bool = False,
+    batch_mode: str | None = None,
 ) -> dict[str, Any] | list[dict[str, Any]]:
     """
     Implement validate_question_quality (without @tool decorator).
@@ -316,6 +514,7 @@ def _validate_question_quality_impl(
         choices: Answer choices (for multiple_choice)
         correct_answer: Correct answer(s)
         batch: If True, process multiple questions at once
+        batch_mode: "concurrent" | "single_prompt" (default: VALIDATION_BATCH_MODE env)
 
     Returns:
         dict or list[dict]: Validation result(s) with fields:
@@ -326,6 +525,7 @@ def _validate_question_quality_impl(
             - feedback: str (human-readable feedback)
             - issues: list[str] (detected problems)
             - recommendation: "pass" | "revise" | "reject"
+            - decided_by: cascade stage that decided ("rules"|"content"|"duplicate"|"llm")
 
     Raises:
         ValueError: If inputs are invalid
@@ -351,8 +551,8 @@ def _validate_question_quality_impl(
         # Handle choices - could be list of lists or single list or None
         if choices is None:
             all_choices = [None] * len(stems)
-        elif isinstance(choices, list) and choices and isinstance(choices[0], list):
-            # Already list of lists for batch
+        elif isinstance(choices, list) and choices and all(c is None or isinstance(c, list) for c in choices):
+            # Already per-question (list of lists, None for types without choices)
             all_choices = choices
         elif isinstance(choices, list) and choices and isinstance(choices[0], str):
             # Single list - apply to all
@@ -360,52 +560,274 @@ def _validate_question_quality_impl(
         else:
             all_choices = [None] * len(stems)
 
-        results = []
-        for s, qt, c, ans in zip(stems, types, all_choices, answers, strict=True):
-            result = _validate_single_question(s, qt, c, ans)
-            results.append(result)
+        questions = list(zip(stems, types, all_choices, answers, strict=True))
+        existing_stems = _load_recent_stems()
+        mode = batch_mode or VALIDATION_BATCH_MODE
+        if mode == BATCH_MODE_SINGLE_PROMPT and len(questions) > 1:
+            results = _validate_batch_single_prompt(questions, existing_stems)
+        else:
+            results = _validate_batch_concurrent(questions, existing_stems)
 
-        logger.info(f"Batch validation completed: {len(results)} questions")
+        logger.info(f"Batch validation completed: {len(results)} questions (mode={mode})")
         return results
     else:
         # Single validation
-        result = _validate_single_question(stem, question_type, choices, correct_answer)
+        result = _validate_single_question(stem, question_type, choices, correct_answer, _load_recent_stems())
         logger.info("Single question validation completed")
         return result
 
 
+def _validate_batch_concurrent(
+    questions: list[QuestionInput],
+    existing_stems: list[str] | None,
+) -> list[dict[str, Any]]:
+    """
+    Validate questions with per-question LLM checks running in parallel.
+
+    REQ: REQ-A-Mode1-Tool4-Batch, REQ-A-Mode1-Tool4-Cascade
+
+    The cheap cascade stages run first; only the survivors get an LLM check.
+    At most VALIDATION_MAX_CONCURRENCY LLM calls are in flight; results keep
+    the input order.
+
+    Args:
+        questions: (stem, question_type, choices, correct_answer) per question
+        existing_stems: Normalized stored stems (None: duplicate stage unavailable)
+
+    Returns:
+        Validation result dicts (same format as _validate_single_question)
+
+    """
+    checks = [_run_cheap_stages(question, existing_stems) for question in questions]
+    survivors = [index for index, check in enumerate(checks) if check.rejected_by is None]
+    llm_scores = _score_concurrently([questions[index] for index in survivors])
+
+    results = [_reject_early(check) if check.rejected_by else None for check in checks]
+    for index, llm_score in zip(survivors, llm_scores, strict=True):
+        results[index] = _finish_llm_stage(_build_validation_result(llm_score, checks[index]), checks[index])
+    return results
+
+
+def _validate_batch_single_prompt(
+    questions: list[QuestionInput],
+    existing_stems: list[str] | None,
+) -> list[dict[str, Any]]:
+    """
+    Validate questions with one LLM call that scores all of them.
+
+    REQ: REQ-A-Mode1-Tool4-Batch, REQ-A-Mode1-Tool4-Cascade
+
+    The cheap cascade stages run per question first; only the survivors go
+    into the prompt. Their results go through ValidationResponseParser
+    (contradiction handling, defaults). If the batch call fails, the survivors
+    are scored with concurrent per-question LLM checks.
+
+    Args:
+        questions: (stem, question_type, choices, correct_answer) per question
+        existing_stems: Normalized stored stems (None: duplicate stage unavailable)
+
+    Returns:
+        Validation result dicts (same format as _validate_single_question)
+
+    """
+    checks = [_run_cheap_stages(question, existing_stems) for question in questions]
+    survivors = [index for index, check in enumerate(checks) if check.rejected_by is None]
+    results = [_reject_early(check) if check.rejected_by else None for check in checks]
+    if not survivors:
+        return results
+
+    survivor_questions = [questions[index] for index in survivors]
+    try:
+        llm_scores = _call_llm_batch_validation(survivor_questions)
+    except Exception as e:
+        logger.warning(f"Batch LLM validation failed ({e}); validating questions concurrently")
+        llm_scores = _score_concurrently(survivor_questions)
+
+    scored = [
+        _build_validation_result(llm_score, checks[index])
+        for index, llm_score in zip(survivors, llm_scores, strict=True)
+    ]
+    parsed = ValidationResponseParser.parse_response(scored, batch=True)
+    for index, result in zip(survivors, parsed, strict=True):
+        results[index] = _finish_llm_stage(result, checks[index])
+    return results
+
+
+def _score_concurrently(questions: list[QuestionInput]) -> list[float]:
+    """Run per-question LLM checks, at most VALIDATION_MAX_CONCURRENCY at once (input order kept)."""
+    workers = max(1, min(VALIDATION_MAX_CONCURRENCY, len(questions)))
+    if workers == 1:
+        return [_call_llm_validation(*question) for question in questions]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool4-validate") as executor:
+        return list(executor.map(lambda question: _call_llm_validation(*question), questions))
+
+
 def _validate_single_question(
     stem: str,
     question_type: str,
     choices: list[str] | None,
     correct_answer: str,
+    existing_stems: list[str] | None = None,
 ) -> dict[str, Any]:
     """
-    Validate a single question.
+    Validate a single question through the cascade.
+
+    REQ: REQ-A-Mode1-Tool4-Cascade
 
     Args:
         stem: Question stem
         question_type: Question type
         choices: Answer choices
         correct_answer: Correct answer
+        existing_stems: Normalized stored stems (None: duplicate stage skipped)
 
     Returns:
         Validation result dict with:
             - is_valid: bool (True if final_score >= 0.70)
-            - score: float (LLM semantic score)
+            - score: float (LLM semantic score; the deciding score if the LLM was skipped)
             - rule_score: float (rule-based score)
             - final_score: float (min of score and rule_score)
             - feedback: str (human-readable feedback)
             - issues: list[str] (detected problems)
             - recommendation: "pass"|"revise"|"reject"
             - should_discard: bool (True if should regenerate, False if should keep)
+            - decided_by: "rules"|"content"|"duplicate"|"llm"
 
     """
-    # Rule-based validation
+    question = (stem, question_type, choices, correct_answer)
+    check = _run_cheap_stages(question, existing_stems)
+    if check.rejected_by:
+        return _reject_early(check)
+
+    # LLM semantic validation (survivors only)
+    llm_score = _call_llm_validation(*question)
+    return _finish_llm_stage(_build_validation_result(llm_score, check), check)
+
+
+def _run_cheap_stages(question: QuestionInput, existing_stems: list[str] | None) -> _CascadeCheck:
+    """
+    Run the rules, content and duplicate stages, stopping at the first rejection.
+
+    REQ: REQ-A-Mode1-Tool4-Cascade
+
+    Args:
+        question: (stem, question_type, choices, correct_answer)
+        existing_stems: Normalized stored stems (None: duplicate stage skipped)
+
+    Returns:
+        _CascadeCheck (rejected_by is None if the question needs the LLM check)
+
+    """
+    stem, question_type, choices, correct_answer = question
+
+    # Stage 1: rules - min(llm_score, rule_score) cannot reach MIN_VALID_SCORE
     rule_score, issues = _check_rule_based_quality(stem, question_type, choices, correct_answer)
+    if rule_score < MIN_VALID_SCORE:
+        return _CascadeCheck(rule_score, issues, STAGE_RULES)
+
+    # Stage 2: content filter (profanity, bias, copyright)
+    is_clean, error = QuestionContentValidator.validate_question(Question(stem=stem, choices=choices))
+    if not is_clean:
+        return _CascadeCheck(rule_score, [*issues, error], STAGE_CONTENT)
+
+    # Stage 3: near-duplicate of a stored stem
+    if existing_stems is None:
+        return _CascadeCheck(rule_score, issues, unchecked=(STAGE_DUPLICATE,))
+    similarity = _near_duplicate_similarity(stem, existing_stems)
+    if similarity >= NEAR_DUPLICATE_THRESHOLD:
+        issues = [*issues, f"Near-duplicate of an existing question (similarity {similarity:.2f})"]
+        return _CascadeCheck(rule_score, issues, STAGE_DUPLICATE)
 
-    # LLM semantic validation
-    llm_score = _call_llm_validation(stem, question_type, choices, correct_answer)
+    return _CascadeCheck(rule_score, issues)
+
+
+def _reject_early(check: _CascadeCheck) -> dict[str, Any]:
+    """Build the result of a question rejected before the LLM stage."""
+    _cascade_stats.record(check.rejected_by, check.unchecked)
+    # Rules: min() would be rule_score anyway; content/duplicate rejections score 0
+    score = check.rule_score if check.rejected_by == STAGE_RULES else 0.0
+    return _build_validation_result(score, check, decided_by=check.rejected_by)
+
+
+def _finish_llm_stage(result: dict[str, Any], check: _CascadeCheck) -> dict[str, Any]:
+    """Record an LLM-scored result in the cascade counters."""
+    _cascade_stats.record(STAGE_LLM if result["should_discard"] else None, check.unchecked)
+    result["decided_by"] = STAGE_LLM
+    return result
+
+
+def _normalize_stem(stem: str) -> str:
+    """Lowercase a stem and collapse punctuation/whitespace for duplicate matching."""
+    return _NON_WORD_RE.sub(" ", stem.lower()).strip()
+
+
+def _load_recent_stems() -> list[str] | None:
+    """
+    Load normalized stems of the most recently stored questions.
+
+    Returns:
+        Up to NEAR_DUPLICATE_WINDOW normalized stems (newest first), or None if
+        the database is unavailable (the duplicate stage is then skipped)
+
+    """
+    try:
+        db = next(get_db())
+        try:
+            rows = db.query(Question.stem).order_by(Question.created_at.desc()).limit(NEAR_DUPLICATE_WINDOW).all()
+        finally:
+            db.close()
+    except Exception as e:
+        logger.warning(f"Near-duplicate check skipped, could not load stored stems: {e}")
+        return None
+    return [_normalize_stem(stem) for (stem,) in rows]
+
+
+def _near_duplicate_similarity(stem: str, existing_stems: list[str]) -> float:
+    """
+    Return the similarity of stem to the first stored stem at or above NEAR_DUPLICATE_THRESHOLD.
+
+    real_quick_ratio/quick_ratio are cheap upper bounds of ratio, so most
+    candidates are dismissed without the full SequenceMatcher comparison.
+
+    Args:
+        stem: Question stem to check
+        existing_stems: Normalized stored stems
+
+    Returns:
+        Similarity (0.0-1.0) of the matching stem, 0.0 if there is none
+
+    """
+    matcher = SequenceMatcher(autojunk=False)
+    matcher.set_seq2(_normalize_stem(stem))
+    for candidate in existing_stems:
+        matcher.set_seq1(candidate)
+        if matcher.real_quick_ratio() < NEAR_DUPLICATE_THRESHOLD or matcher.quick_ratio() < NEAR_DUPLICATE_THRESHOLD:
+            continue
+        similarity = matcher.ratio()
+        if similarity >= NEAR_DUPLICATE_THRESHOLD:
+            return similarity
+    return 0.0
+
+
+def _build_validation_result(
+    llm_score: float,
+    check: _CascadeCheck,
+    decided_by: str = STAGE_LLM,
+) -> dict[str, Any]:
+    """
+    Combine LLM and rule-based scores into a validation result.
+
+    Args:
+        llm_score: LLM semantic score (the deciding score if the LLM was skipped)
+        check: Outcome of the cheap cascade stages (rule_score, issues)
+        decided_by: Cascade stage that decided the result
+
+    Returns:
+        Validation result dict (see _validate_single_question)
+
+    """
+    rule_score, issues = check.rule_score, check.issues
 
     # Final score is minimum of LLM and rule scores
     final_score = min(llm_score, rule_score)
@@ -420,7 +842,7 @@ def _validate_single_question(
     should_discard = _should_discard_question(final_score, recommendation)
 
     # Build feedback
-    feedback = _build_feedback(llm_score, rule_score, issues, recommendation)
+    feedback = _build_feedback(llm_score, rule_score, issues, recommendation, decided_by)
 
     logger.debug(
         f"Question validation: final_score={final_score:.2f}, "
@@ -437,6 +859,7 @@ def _validate_single_question(
         "issues": issues,
         "recommendation": recommendation,
         "should_discard": should_discard,
+        "decided_by": decided_by,
     }
 
 
@@ -452,11 +875,14 @@ def validate_question_quality(
 
     REQ: REQ-A-Mode1-Tool4
 
-    This tool performs 2-stage validation:
-    1. LLM-based semantic validation (clarity, appropriateness, correctness, bias)
-    2. Rule-based validation (length, choices count, format, duplicates)
+    This tool validates in a cost-aware cascade (each stage can reject early):
+    1. Rule-based validation (length, choices count, format, duplicates)
+    2. Content filter (profanity, bias, copyright)
+    3. Near-duplicate check against recently stored question stems
+    4. LLM-based semantic validation (clarity, appropriateness, correctness, bias)
 
-    Final score = min(LLM_score, rule_score)
+    Final score = min(LLM_score, rule_score); the LLM is skipped when stages 1-3
+    already reject the question
     should_discard = (final_score < 0.70) OR (recommendation == "reject")
 
     Args:
@@ -6,7 +6,8 @@ REQ: REQ-B-A2-Avail-1, REQ-B-A2-Avail-2, REQ-B-A2-Avail-3, REQ-B-A2-Avail-4,
      REQ-B-A2-View-1, REQ-B-A2-View-2,
      REQ-B-A2-Edit-1, REQ-B-A2-Edit-2, REQ-B-A2-Edit-3, REQ-B-A2-Edit-4,
      REQ-B-A2-Prof-1, REQ-B-A2-Prof-2, REQ-B-A2-Prof-3, REQ-B-A2-Prof-4, REQ-B-A2-Prof-5, REQ-B-A2-Prof-6,
-     REQ-B-A3-1, REQ-B-A3-2
+     REQ-B-A3-1, REQ-B-A3-2,
+     REQ-B-B4-7, REQ-B-B4-8
 """
 
 import logging
@@ -150,6 +151,16 @@ class GradeDistributionItem(BaseModel):
     percentage: float = Field(..., description="Percentage of users in this grade")
 
 
+class SegmentRankItem(BaseModel):
+    """Rank within one segment of the cohort."""
+
+    segment: str = Field(..., description="Segment type (job_role/department/interest)")
+    value: str = Field(..., description="Segment value (e.g., 'Backend Engineer', 'LLM')")
+    rank: int = Field(..., description="Rank within segment (ties share a rank)")
+    cohort_size: int = Field(..., description="Total users in segment")
+    percentile: float = Field(..., description="Percentile within segment (0-100)")
+
+
 class RankingResponse(BaseModel):
     """Response model for user ranking and grade."""
 
@@ -160,8 +171,30 @@ class RankingResponse(BaseModel):
     total_cohort_size: int = Field(..., description="Total users in cohort")
     percentile: float = Field(..., description="Percentile within cohort (0-100)")
     percentile_description: str = Field(..., description="Human-readable percentile (e.g., '상위 30%')")
-    percentile_confidence: str = Field(..., description="Confidence level (low/medium/high)")
+    percentile_confidence: str = Field(
+        ..., description="Confidence level (low/medium/high), or sketch error bound in approximate mode"
+    )
     grade_distribution: list[GradeDistributionItem] = Field(..., description="Grade distribution across all users")
+    segments: list[SegmentRankItem] = Field(
+        default_factory=list, description="Rank within the user's job_role, department and interest segments"
+    )
+
+
+class LeaderboardEntryItem(BaseModel):
+    """Leaderboard entry."""
+
+    rank: int = Field(..., description="Rank within 90-day cohort (ties share a rank)")
+    nickname: str | None = Field(..., description="User's nickname")
+    score: float = Field(..., description="Composite score (0-100)")
+    grade: str = Field(..., description="Grade tier")
+    is_me: bool = Field(..., description="Whether this entry is the current user")
+
+
+class LeaderboardResponse(BaseModel):
+    """Response model for leaderboard page."""
+
+    entries: list[LeaderboardEntryItem] = Field(..., description="Leaderboard entries in rank order")
+    next_cursor: str | None = Field(..., description="Cursor for the next page (null on last page)")
 
 
 # ============================================================================
@@ -520,24 +553,26 @@ def update_consent(
     description="Get current user's grade and ranking (requires JWT)",
 )
 def get_ranking(
+    approximate: bool | None = None,
     user: User = Depends(get_current_user),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
 ) -> dict[str, Any]:
     """
     Get current user's grade and ranking.
 
-    REQ: REQ-B-B4-1, REQ-B-B4-2, REQ-B-B4-3, REQ-B-B4-4, REQ-B-B4-5, REQ-B-B4-6
+    REQ: REQ-B-B4-1, REQ-B-B4-2, REQ-B-B4-3, REQ-B-B4-4, REQ-B-B4-5, REQ-B-B4-6, REQ-B-B4-8
     REQ: REQ-B-B4-Plus-1, REQ-B-B4-Plus-2, REQ-B-B4-Plus-3
 
     Single Responsibility: Calculate and return ranking data only.
     Triggered explicitly by Frontend (not automatic).
 
     Args:
+        approximate: Use approximate percentile mode (score sketch); defaults to server setting
         user: Current authenticated user (from JWT)
         db: Database session
 
     Returns:
-        Response with grade, score, rank, and percentile information
+        Response with grade, score, rank, percentile and per-segment rank information
 
     Raises:
         HTTPException: 400 if no completed test sessions, 401 if not authenticated
@@ -545,7 +580,7 @@ def get_ranking(
     """
     try:
         ranking_service = RankingService(db)
-        result = ranking_service.calculate_final_grade(user.id)
+        result = ranking_service.calculate_final_grade(user.id, approximate=approximate)
 
         if not result:
             raise ValueError("No completed test sessions found for user")
@@ -567,9 +602,92 @@ def get_ranking(
                 }
                 for dist in result.grade_distribution
             ],
+            "segments": [
+                {
+                    "segment": segment.segment,
+                    "value": segment.value,
+                    "rank": segment.rank,
+                    "cohort_size": segment.cohort_size,
+                    "percentile": segment.percentile,
+                }
+                for segment in result.segments
+            ],
         }
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         logger.exception("Error calculating ranking")
         raise HTTPException(status_code=500, detail="Failed to calculate ranking") from e
+
+
+@router.get(
+    "/leaderboard",
+    response_model=LeaderboardResponse,
+    status_code=200,
+    summary="Get Leaderboard",
+    description="Get top performers or the window around the current user (requires JWT)",
+)
+def get_leaderboard(
+    limit: int = 20,
+    cursor: str | None = None,
+    around_me: bool = False,
+    above: int = 5,
+    below: int = 5,
+    user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+) -> dict[str, Any]:
+    """
+    Get the 90-day cohort leaderboard.
+
+    REQ: REQ-B-B4-7
+
+    Modes:
+    - Default: top performers, `limit` per page; pass `next_cursor` back as
+      `cursor` to fetch the next page (keyset pagination, no OFFSET)
+    - around_me=true: `above` users ranked above and `below` users ranked
+      below the current user; `next_cursor` continues below the window
+
+    Args:
+        limit: Page size for top-N mode (1-100)
+        cursor: Cursor from a previous response
+        around_me: Return the window around the current user instead of top-N
+        above: Users above the current user in around_me mode (0-50)
+        below: Users below the current user in around_me mode (0-50)
+        user: Current authenticated user (from JWT)
+        db: Database session
+
+    Returns:
+        Response with leaderboard entries and next_cursor
+
+    Raises:
+        HTTPException: 400 if parameters/cursor invalid or user not ranked, 401 if not authenticated
+
+    """
+    try:
+        ranking_service = RankingService(db)
+
+        if around_me:
+            page = ranking_service.get_leaderboard_around(user.id, above=above, below=below)
+            if page is None:
+                raise ValueError("No completed test sessions in the last 90 days for user")
+        else:
+            page = ranking_service.get_leaderboard(limit=limit, cursor=cursor)
+
+        return {
+            "entries": [
+                {
+                    "rank": entry.rank,
+                    "nickname": entry.nickname,
+                    "score": entry.score,
+                    "grade": entry.grade,
+                    "is_me": entry.user_id == user.id,
+                }
+                for entry in page.entries
+            ],
+            "next_cursor": page.next_cursor,
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.exception("Error loading leaderboard")
+        raise HTTPException(status_code=500, detail="Failed to load leaderboard") from e
@@ -4,10 +4,13 @@ Questions API endpoints for generating test questions.
 REQ: REQ-B-B2-Gen-1, REQ-B-B2-Gen-2, REQ-B-B2-Gen-3, REQ-B-B2-Adapt, REQ-B-B2-Plus, REQ-B-B3-Score, REQ-B-B3-Explain
 """
 
+import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
@@ -16,6 +19,7 @@ from src.backend.models.user import User
 from src.backend.services.autosave_service import AutosaveService
 from src.backend.services.explain_service import ExplainService
 from src.backend.services.question_gen_service import QuestionGenerationService
+from src.backend.services.ranking_service import RankingService
 from src.backend.services.scoring_service import ScoringService
 from src.backend.utils.auth import get_current_user, get_current_user_id
 
@@ -45,9 +49,11 @@ def all_answers_scored(session_id: str, db: Session) -> bool:
     """
     from src.backend.models.attempt_answer import AttemptAnswer
 
-    # Count unscored answers (where score is None)
+    # Count unscored answers (scored_at is NULL; autosave defaults score to 0.0)
     unscored_count = (
-        db.query(AttemptAnswer).filter(AttemptAnswer.session_id == session_id, AttemptAnswer.score.is_(None)).count()
+        db.query(AttemptAnswer)
+        .filter(AttemptAnswer.session_id == session_id, AttemptAnswer.scored_at.is_(None))
+        .count()
     )
 
     # All scored if unscored_count == 0
@@ -306,6 +312,7 @@ class ExplanationResponse(BaseModel):
         problem_statement: Question stem with explanation type context
         is_correct: Whether this is for correct/incorrect answer
         created_at: Timestamp when explanation was generated
+        updated_at: Timestamp of the last change (changes when a draft is upgraded)
         is_fallback: Whether fallback explanation was used
         error_message: Error details if fallback used
 
@@ -324,7 +331,8 @@ class ExplanationResponse(BaseModel):
     problem_statement: str | None = Field(..., description="Question stem with 오답/정답 해설 context")
     is_correct: bool | None = Field(..., description="Answer correctness context")
     created_at: str = Field(..., description="Creation timestamp (ISO format)")
-    is_fallback: bool = Field(..., description="Fallback flag (timeout/error)")
+    updated_at: str | None = Field(None, description="Last update timestamp (ISO format)")
+    is_fallback: bool = Field(..., description="Fallback/draft flag (upgrade to LLM explanation pending)")
     error_message: str | None = Field(..., description="Error details if fallback")
 
 
@@ -566,6 +574,8 @@ def calculate_round_score(
         auto_completed = False
         if auto_complete and all_answers_scored(session_id, db):
             test_session.status = "completed"
+            db.flush()
+            RankingService(db).refresh_user_score(test_session.user_id)
             db.commit()
             db.refresh(test_session)
             auto_completed = True
@@ -870,7 +880,8 @@ def complete_session(
     REQ: REQ-B-B3-Score
 
     Single Responsibility: Only marks session as completed.
-    RankingService will be called separately via GET /profile/ranking endpoint.
+    The user's leaderboard row is refreshed here; the full grade is still
+    calculated separately via GET /profile/ranking endpoint.
 
     Design principle:
     - Each Round can be completed independently
@@ -902,6 +913,10 @@ def complete_session(
 
         # Only one responsibility: mark session as completed
         test_session.status = "completed"
+        db.flush()
+
+        # Completed sessions feed the leaderboard (REQ-B-B4-4)
+        RankingService(db).refresh_user_score(test_session.user_id)
         db.commit()
         db.refresh(test_session)
 
@@ -966,7 +981,7 @@ def check_time_status(
     summary="Get Session Explanations",
     description="Retrieve all answers and explanations for a test session (batch retrieval API)",
 )
-def get_session_explanations(
+async def get_session_explanations(
     session_id: str,
     user: User = Depends(get_current_user),  # noqa: B008
     db: Session = Depends(get_db),  # noqa: B008
@@ -977,7 +992,8 @@ def get_session_explanations(
     REQ: REQ-B-B3-Explain-2
 
     Batch retrieves explanations for all questions in a session.
-    If explanation doesn't exist, generates it on-the-fly.
+    If explanation doesn't exist, generates it on-the-fly
+    (concurrently, bounded by EXPLANATION_MAX_CONCURRENCY).
     Performance requirement: Complete within 10 seconds.
 
     Args:
@@ -995,13 +1011,10 @@ def get_session_explanations(
         HTTPException 500: If server error during explanation generation
 
     """
-    from src.backend.models.attempt_answer import AttemptAnswer
-    from src.backend.models.question import Question
-    from src.backend.models.test_session import TestSession
-
     try:
-        # Validate and retrieve session
-        test_session = db.query(TestSession).filter_by(id=session_id).first()
+        # Session, questions (in question order) and answers loaded off the event loop
+        explain_service = ExplainService(db)
+        test_session, questions, answers_list = await explain_service.aload_session_answers(session_id)
 
         if not test_session:
             raise HTTPException(status_code=404, detail=f"Test session {session_id} not found") from ValueError(
@@ -1014,70 +1027,24 @@ def get_session_explanations(
                 status_code=401, detail="Unauthorized: You can only access your own sessions"
             ) from ValueError("Unauthorized access")
 
-        # Get all questions in this session
-        questions = db.query(Question).filter_by(session_id=session_id).all()
-
-        # Get all answers in this session
-        answers_map = {}  # question_id -> answer
-        answers_list = db.query(AttemptAnswer).filter_by(session_id=session_id).all()
-        for answer in answers_list:
-            answers_map[answer.question_id] = answer
+        answers_map = {answer.question_id: answer for answer in answers_list}  # question_id -> answer
 
-        # Build explanations list with parallel processing for performance
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        # Pair each answered question with its answer, in question order
+        items = [(question, answers_map[question.id]) for question in questions if question.id in answers_map]
 
-        explanations_list: list[dict[str, Any]] = []
-        explanation_items_to_process = []
+        # Cached explanations resolved in one query; misses generated concurrently
+        explanations = await explain_service.agenerate_session_explanations(items)
 
-        # First pass: prepare items
-        for question in questions:
-            answer = answers_map.get(question.id)
-
-            if not answer:
-                # No answer for this question, skip
-                continue
-
-            # Prepare explanation item
-            explanation_item: dict[str, Any] = {
+        explanations_list: list[dict[str, Any]] = [
+            {
                 "question_id": question.id,
                 "user_answer": answer.user_answer,
                 "is_correct": answer.is_correct,
                 "score": answer.score or 0,
-                "explanation": None,
+                "explanation": explanation,
             }
-            explanation_items_to_process.append((explanation_item, question.id, answer))
-
-        # Second pass: generate explanations in parallel
-        def generate_explanation_safe(params: tuple) -> dict[str, Any]:
-            """Generate explanation for a single item (thread-safe with independent session)."""
-            from src.backend.database import SessionLocal
-
-            item, question_id, answer = params
-            # Create independent session for this thread to avoid SQLAlchemy state conflicts
-            thread_db = SessionLocal()
-            try:
-                thread_explain_service = ExplainService(thread_db)
-                explanation = thread_explain_service.generate_explanation(
-                    question_id=question_id,
-                    user_answer=answer.user_answer,
-                    is_correct=answer.is_correct,
-                    attempt_answer_id=answer.id,
-                )
-                item["explanation"] = explanation
-            except Exception as e:
-                logger.warning(f"Failed to generate explanation for question {question_id}: {e}")
-                item["explanation"] = None
-            finally:
-                thread_db.close()
-            return item
-
-        # Use thread pool for parallel processing (up to 5 concurrent requests)
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [
-                executor.submit(generate_explanation_safe, item_params) for item_params in explanation_items_to_process
-            ]
-            for future in as_completed(futures):
-                explanations_list.append(future.result())
+            for (question, answer), explanation in zip(items, explanations, strict=True)
+        ]
 
         # Count answered questions
         answered_count = len(answers_list)
@@ -1157,6 +1124,72 @@ def generate_explanation(
         raise HTTPException(status_code=500, detail="Failed to generate explanation") from e
 
 
+@router.post(
+    "/explanations/stream",
+    status_code=200,
+    summary="Stream Question Explanation",
+    description="Generate explanation and stream tokens as Server-Sent Events",
+    response_class=StreamingResponse,
+)
+async def stream_explanation(
+    request: GenerateExplanationRequest,
+    db: Session = Depends(get_db),  # noqa: B008
+) -> StreamingResponse:
+    """
+    Stream explanation generation as Server-Sent Events.
+
+    REQ: REQ-B-B3-Explain-5
+
+    Events (each `data` is JSON):
+        token : {"text": ...} explanation text as the model emits it
+        reset : {} discard streamed text (LLM failed, fallback follows)
+        done  : final explanation (ExplanationResponse shape), persisted
+        error : {"detail": ...}
+
+    Cached explanations are replayed instantly (one token + done).
+
+    Args:
+        request: GenerateExplanationRequest with question, answer, correctness
+        db: Database session
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+
+    Raises:
+        HTTPException 400: If validation fails
+        HTTPException 404: If question not found
+
+    """
+    try:
+        events = await ExplainService(db).stream_explanation(
+            question_id=request.question_id,
+            user_answer=request.user_answer,
+            is_correct=request.is_correct,
+            attempt_answer_id=request.attempt_answer_id,
+        )
+    except ValueError as e:
+        error_msg = str(e)
+        if "not found" in error_msg.lower():
+            raise HTTPException(status_code=404, detail=error_msg) from e
+        raise HTTPException(status_code=400, detail=error_msg) from e
+
+    return StreamingResponse(
+        _format_sse(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _format_sse(events: AsyncIterator[tuple[str, dict[str, Any]]]) -> AsyncIterator[str]:
+    """Serialize (event, data) pairs as SSE frames; failures become an error event."""
+    try:
+        async for event, data in events:
+            yield f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    except Exception:
+        logger.exception("Error streaming explanation")
+        yield f"event: error\ndata: {json.dumps({'detail': 'Failed to generate explanation'})}\n\n"
+
+
 # ============================================================================
 # New GET Endpoints for CLI REST API Migration
 # ============================================================================
@@ -16,6 +16,26 @@ class Settings:
         OIDC_TENANT_ID: Azure AD tenant ID
         OIDC_TOKEN_ENDPOINT: Azure AD token endpoint URL
         OIDC_JWKS_ENDPOINT: Azure AD JWKS (JSON Web Key Set) endpoint for signature verification
+        RANKING_APPROXIMATE_PERCENTILE: Serve ranking percentiles from the score sketch by default
+        EXPLANATION_MAX_CONCURRENCY: Max concurrent LLM calls when generating a session's explanations
+        EXPLANATION_TIERED_MODE: Answer explanation cache misses with an instant answer_schema draft
+            (upgraded to the LLM explanation in the background)
+        EXPLANATION_BATCH_MODE: Explain a session's uncached questions in one LLM call
+        EXPLANATION_BATCH_MAX_ITEMS: Max questions per batch-mode LLM call
+        EXPLANATION_PREFETCH_ENABLED: Generate explanations in the background when questions are saved (opt-in)
+        EXPLANATION_PREFETCH_CONCURRENCY: Max concurrent LLM calls across all prefetch jobs (low priority)
+        EXPLANATION_UPGRADE_RETRY_SECONDS: Cooldown before a question's fallback rows are upgraded again
+            (doubles per consecutive attempt)
+        EXPLANATION_CLAIM_TTL_SECONDS: Age after which another worker's generation claim is considered abandoned
+        EXPLANATION_SINGLE_FLIGHT_WAIT_SECONDS: Max time to wait for another caller generating the same explanation
+        AGENT_POOL_WARMUP: Compile the pooled ItemGenAgent at startup instead of on the first request
+        QUESTION_INVENTORY_ENABLED: Serve round-1 questions from pre-generated stock (live generation when dry)
+        QUESTION_INVENTORY_TARGET_STOCK: Questions a refill tops each inventory bucket up to
+        QUESTION_INVENTORY_REFILL_THRESHOLD: Stock level below which a bucket is refilled in the background
+        QUESTION_INVENTORY_REFILL_CONCURRENCY: Max concurrent agent runs across all refill jobs
+        SHORT_ANSWER_REUSE_THRESHOLD: Min estimated similarity (0-1) for reusing a near-duplicate short answer's grade
+        QUESTION_GEN_PIPELINE_MODE: Question generation path - "react" (agent tool loop) or
+            "parallel" (deterministic Mode1Pipeline with parallel LLM calls)
 
     """
 
@@ -31,6 +51,39 @@ class Settings:
     OIDC_TOKEN_ENDPOINT: str = ""
     OIDC_JWKS_ENDPOINT: str = ""
 
+    # Approximate percentile mode (REQ-B-B4-4): opt-in, exact ranking by default
+    RANKING_APPROXIMATE_PERCENTILE: bool = os.getenv("RANKING_APPROXIMATE_PERCENTILE", "false").lower() == "true"
+
+    # Session explanation fan-out (REQ-B-B3-Explain-2)
+    EXPLANATION_MAX_CONCURRENCY: int = int(os.getenv("EXPLANATION_MAX_CONCURRENCY", "10"))
+    EXPLANATION_TIERED_MODE: bool = os.getenv("EXPLANATION_TIERED_MODE", "false").lower() == "true"
+    EXPLANATION_BATCH_MODE: bool = os.getenv("EXPLANATION_BATCH_MODE", "false").lower() == "true"
+    EXPLANATION_BATCH_MAX_ITEMS: int = int(os.getenv("EXPLANATION_BATCH_MAX_ITEMS", "10"))
+
+    # Explanation prefetch on question save (REQ-B-B3-Explain-3)
+    EXPLANATION_PREFETCH_ENABLED: bool = os.getenv("EXPLANATION_PREFETCH_ENABLED", "false").lower() == "true"
+    EXPLANATION_PREFETCH_CONCURRENCY: int = int(os.getenv("EXPLANATION_PREFETCH_CONCURRENCY", "2"))
+    EXPLANATION_UPGRADE_RETRY_SECONDS: float = float(os.getenv("EXPLANATION_UPGRADE_RETRY_SECONDS", "30"))
+
+    # Single-flight explanation generation (REQ-B-B3-Explain-4)
+    EXPLANATION_CLAIM_TTL_SECONDS: int = int(os.getenv("EXPLANATION_CLAIM_TTL_SECONDS", "120"))
+    EXPLANATION_SINGLE_FLIGHT_WAIT_SECONDS: float = float(os.getenv("EXPLANATION_SINGLE_FLIGHT_WAIT_SECONDS", "30"))
+
+    # ItemGenAgent pool (REQ-A-AgentPool)
+    AGENT_POOL_WARMUP: bool = os.getenv("AGENT_POOL_WARMUP", "true").lower() == "true"
+
+    # Pre-generated question inventory (REQ-B-B2-Gen-4)
+    QUESTION_INVENTORY_ENABLED: bool = os.getenv("QUESTION_INVENTORY_ENABLED", "false").lower() == "true"
+    QUESTION_INVENTORY_TARGET_STOCK: int = int(os.getenv("QUESTION_INVENTORY_TARGET_STOCK", "20"))
+    QUESTION_INVENTORY_REFILL_THRESHOLD: int = int(os.getenv("QUESTION_INVENTORY_REFILL_THRESHOLD", "10"))
+    QUESTION_INVENTORY_REFILL_CONCURRENCY: int = int(os.getenv("QUESTION_INVENTORY_REFILL_CONCURRENCY", "1"))
+
+    # Short-answer grading reuse (REQ-A-Mode2-Tool6)
+    SHORT_ANSWER_REUSE_THRESHOLD: float = float(os.getenv("SHORT_ANSWER_REUSE_THRESHOLD", "0.85"))
+
+    # Question generation pipeline mode (REQ-A-Mode1-Parallel)
+    QUESTION_GEN_PIPELINE_MODE: str = os.getenv("QUESTION_GEN_PIPELINE_MODE", "react").lower()
+
     def __init__(self) -> None:
         """
         Initialize settings and construct Azure AD endpoints.
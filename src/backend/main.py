@@ -20,9 +20,15 @@ from fastapi import FastAPI  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
 from fastapi.responses import FileResponse  # noqa: E402
 from fastapi.staticfiles import StaticFiles  # noqa: E402
+from sqlalchemy.exc import SQLAlchemyError  # noqa: E402
 
+from src.agent.llm_agent import get_agent_pool  # noqa: E402
 from src.backend.api import auth, profile, questions, survey  # noqa: E402
-from src.backend.database import init_db  # noqa: E402
+from src.backend.config import settings  # noqa: E402
+from src.backend.database import SessionLocal, init_db  # noqa: E402
+from src.backend.services.ranking_service import RankingService  # noqa: E402
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="SLEA-SSEM",
@@ -40,10 +46,28 @@ app.add_middleware(
 )
 
 
+def backfill_user_scores() -> None:
+    """Fill the ranking tables from completed sessions if user_scores is still empty (REQ-B-B4-1)."""
+    db = SessionLocal()
+    try:
+        backfilled = RankingService(db).backfill_user_scores_if_empty()
+        if backfilled:
+            logger.info(f"Backfilled user_scores for {backfilled} users")
+    except SQLAlchemyError as e:
+        # e.g. another worker backfilling concurrently; scripts/backfill_user_scores.py can be rerun
+        db.rollback()
+        logger.warning(f"user_scores backfill skipped: {e}")
+    finally:
+        db.close()
+
+
 @app.on_event("startup")
 def startup_event() -> None:
-    """Initialize database on startup."""
+    """Initialize database, backfill ranking tables and warm up the ItemGenAgent pool on startup."""
     init_db()
+    backfill_user_scores()
+    if settings.AGENT_POOL_WARMUP and get_agent_pool().warm_up():
+        logger.info(f"ItemGenAgent pool warmed up: {get_agent_pool().stats()}")
 
 
 # API endpoints - defined first for priority matching
@@ -5,25 +5,35 @@ from src.backend.models.attempt import Attempt
 from src.backend.models.attempt_answer import AttemptAnswer
 from src.backend.models.attempt_round import AttemptRound
 from src.backend.models.difficulty_keyword import DifficultyKeyword
+from src.backend.models.explanation_claim import ExplanationClaim
+from src.backend.models.grade_histogram import GradeHistogram
 from src.backend.models.question import Question
+from src.backend.models.question_inventory import InventoryQuestion
 from src.backend.models.question_template import QuestionTemplate
+from src.backend.models.score_sketch_bucket import ScoreSketchBucket
 from src.backend.models.test_result import TestResult
 from src.backend.models.test_session import TestSession
 from src.backend.models.user import User
 from src.backend.models.user_badge import UserBadge
 from src.backend.models.user_profile import UserProfileSurvey
+from src.backend.models.user_score import UserScore
 
 __all__ = [
     "User",
     "UserProfileSurvey",
     "TestSession",
     "Question",
+    "InventoryQuestion",
     "TestResult",
     "AttemptAnswer",
     "AnswerExplanation",
+    "ExplanationClaim",
     "UserBadge",
     "Attempt",
     "AttemptRound",
     "DifficultyKeyword",
     "QuestionTemplate",
+    "UserScore",
+    "GradeHistogram",
+    "ScoreSketchBucket",
 ]
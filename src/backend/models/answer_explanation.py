@@ -7,7 +7,7 @@ REQ: REQ-B-B3-Explain
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String, func
+from sqlalchemy import JSON, DateTime, ForeignKey, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.backend.models.user import Base
@@ -21,6 +21,8 @@ class AnswerExplanation(Base):
 
     Design principle:
     - One explanation per question (cached and reused across users)
+    - (question_id, is_correct) is unique: concurrent generators upsert
+      against this constraint instead of storing duplicates
     - Optional: Can be linked to specific attempt_answer_id for tracking user attempts
     - Stores explanation text and reference links
     - Used for providing learning feedback after scoring
@@ -74,6 +76,8 @@ class AnswerExplanation(Base):
         server_default=func.now(),
     )
 
+    __table_args__ = (UniqueConstraint("question_id", "is_correct", name="uq_answer_explanation_variant"),)
+
     def __repr__(self) -> str:
         """Return string representation of AnswerExplanation."""
         return (
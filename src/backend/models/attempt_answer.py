@@ -25,6 +25,8 @@ class AttemptAnswer(Base):
     - Used for calculating TestResult score
     - Used for identifying weak categories (wrong answers by category)
     - Supports autosave functionality (REQ-B-B2-Plus)
+    - MC/TF answers are scored at autosave time; scored_at marks scored rows
+      explicitly, so is_correct=False/score=0.0 is never mistaken for "unscored"
 
     Attributes:
         id: Primary key (UUID)
@@ -35,6 +37,7 @@ class AttemptAnswer(Base):
         score: Score earned (0-100, for partial credit on short answer)
         response_time_ms: Time spent answering in milliseconds
         saved_at: When answer was saved (for autosave tracking)
+        scored_at: When is_correct/score were computed for the current answer (NULL = unscored)
         created_at: Initial creation timestamp
 
     """
@@ -59,6 +62,7 @@ class AttemptAnswer(Base):
     score: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)  # 0-100
     response_time_ms: Mapped[int] = mapped_column(Integer, nullable=True)  # Optional
     saved_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)  # For autosave
+    scored_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, default=None)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -0,0 +1,55 @@
+"""
+Explanation claim model for cross-worker single-flight generation.
+
+REQ: REQ-B-B3-Explain-4
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.backend.models.user import Base
+
+
+class ExplanationClaim(Base):
+    """
+    Lease on generating one (question_id, is_correct) explanation.
+
+    REQ: REQ-B-B3-Explain-4
+
+    Design principle:
+    - The composite primary key makes the claim an atomic INSERT: exactly one
+      worker wins, the others wait for the AnswerExplanation row to appear
+    - Deleted by the owner once the explanation is stored
+    - A claim older than EXPLANATION_CLAIM_TTL_SECONDS is considered
+      abandoned (crashed worker) and may be taken over
+
+    Attributes:
+        question_id: Question being explained (part of primary key)
+        is_correct: Explanation variant (part of primary key)
+        owner: Worker identifier (host:pid:nonce) holding the claim
+        claimed_at: When the claim was taken
+
+    """
+
+    __tablename__ = "explanation_claims"
+
+    question_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("questions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    is_correct: Mapped[bool] = mapped_column(Boolean, primary_key=True)
+    owner: Mapped[str] = mapped_column(String(100), nullable=False)
+    claimed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of ExplanationClaim."""
+        return (
+            f"<ExplanationClaim(question_id='{self.question_id}', is_correct={self.is_correct}, owner='{self.owner}')>"
+        )
@@ -0,0 +1,48 @@
+"""
+Grade histogram model for the maintained grade distribution.
+
+REQ: REQ-B-B4-6
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.backend.models.user import Base
+
+
+class GradeHistogram(Base):
+    """
+    One bucket of the grade distribution (number of users per grade).
+
+    REQ: REQ-B-B4-6
+
+    Design principle:
+    - Exactly five rows (Beginner, Intermediate, Inter-Advanced, Advanced, Elite)
+    - Incremented/decremented when a user's grade in user_scores changes
+      (RankingService.refresh_user_score), so reads never aggregate
+    - Fronted by a versioned in-process cache in ranking_service
+
+    Attributes:
+        grade: Grade tier name (primary key)
+        user_count: Number of users currently in this grade
+        updated_at: Last time the bucket changed
+
+    """
+
+    __tablename__ = "grade_histogram"
+
+    grade: Mapped[str] = mapped_column(String(50), primary_key=True)
+    user_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of GradeHistogram."""
+        return f"<GradeHistogram(grade='{self.grade}', user_count={self.user_count})>"
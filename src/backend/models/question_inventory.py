@@ -0,0 +1,74 @@
+"""
+Inventory question model for pre-generated, session-less question stock.
+
+REQ: REQ-B-B2-Gen-4
+"""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from sqlalchemy import JSON, DateTime, Enum, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.backend.models.user import Base
+
+
+class InventoryQuestion(Base):
+    """
+    Validated question kept in stock until it is assigned to a TestSession.
+
+    REQ: REQ-B-B2-Gen-4
+
+    Design principle:
+    - Produced in the background through the regular Item-Gen-Agent path
+      (Tool 1~5), then detached from its staging session
+    - Bucketed by (domain, difficulty_band, item_type, category) so stock
+      levels and refills are tracked per bucket
+    - Assignment copies the row into a Question of the new session and
+      deletes the stock row in the same transaction (each row is served once)
+
+    Attributes:
+        id: Primary key (UUID)
+        domain: Question domain/topic (AI, food, science, ...)
+        difficulty_band: Difficulty band derived from difficulty (low, mid, high)
+        item_type: Question type (multiple_choice, true_false, short_answer)
+        category: Category/topic of question (LLM, RAG, ...)
+        stem: Question content/text
+        choices: JSON array of choices (for multiple_choice/true_false)
+        answer_schema: Normalized answer_schema (same format as Question)
+        difficulty: Difficulty level (1~10)
+        created_at: Stocking timestamp (oldest stock is served first)
+
+    """
+
+    __tablename__ = "question_inventory"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    domain: Mapped[str] = mapped_column(String(100), nullable=False)
+    difficulty_band: Mapped[str] = mapped_column(String(10), nullable=False)
+    item_type: Mapped[str] = mapped_column(
+        Enum("multiple_choice", "true_false", "short_answer", name="item_type_enum"),
+        nullable=False,
+    )
+    category: Mapped[str] = mapped_column(String(100), nullable=False)
+    stem: Mapped[str] = mapped_column(String(2000), nullable=False)
+    choices: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+    answer_schema: Mapped[dict] = mapped_column(JSON, nullable=False)
+    difficulty: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+    )
+
+    __table_args__ = (
+        Index("ix_question_inventory_bucket", "domain", "difficulty_band", "item_type", "category", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of InventoryQuestion."""
+        return (
+            f"<InventoryQuestion(id='{self.id}', domain='{self.domain}', band='{self.difficulty_band}', "
+            f"item_type='{self.item_type}', category='{self.category}')>"
+        )
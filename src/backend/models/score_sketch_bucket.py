@@ -0,0 +1,52 @@
+"""
+Score sketch bucket model for approximate cohort percentiles.
+
+REQ: REQ-B-B4-4, REQ-B-B4-5
+"""
+
+from datetime import UTC, date, datetime
+
+from sqlalchemy import JSON, Date, DateTime, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.backend.models.user import Base
+
+
+class ScoreSketchBucket(Base):
+    """
+    Per-day quantile sketch of composite scores.
+
+    REQ: REQ-B-B4-4, REQ-B-B4-5
+
+    Design principle:
+    - One row per day, holding the ScoreSketch of users whose newest
+      completed session falls on that day
+    - Updated as results arrive (RankingService.refresh_user_score moves the
+      user out of the old day/bin and into the new one)
+    - The 90-day cohort sketch is the merge of the last 90 rows; older rows
+      simply drop out of the window
+
+    Attributes:
+        bucket_date: Day (UTC) of users' last completed session
+        bins: Serialized ScoreSketch bins {bin_index: count}
+        total: Number of users in the bucket
+        updated_at: Last update timestamp
+
+    """
+
+    __tablename__ = "score_sketch_buckets"
+
+    bucket_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    bins: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of ScoreSketchBucket."""
+        return f"<ScoreSketchBucket(bucket_date={self.bucket_date}, total={self.total})>"
@@ -0,0 +1,70 @@
+"""
+User score model for the incrementally maintained leaderboard.
+
+REQ: REQ-B-B4-1, REQ-B-B4-4
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.backend.models.user import Base
+
+
+class UserScore(Base):
+    """
+    Per-user composite score used for ranking.
+
+    REQ: REQ-B-B4-1, REQ-B-B4-4
+
+    Design principle:
+    - One row per user with at least one completed test result
+    - Updated incrementally when a round is saved or a session completes
+      (RankingService.refresh_user_score), never rebuilt per request
+    - composite_score is indexed so rank and cohort size are answered with
+      indexed COUNT queries instead of a full aggregate over test_results
+    - last_completed_at tracks the newest completed session so the 90-day
+      cohort can be filtered without touching test_sessions
+    - (composite_score, user_id) is the leaderboard keyset ordering
+
+    Attributes:
+        user_id: Primary key, foreign key to users table
+        composite_score: Weighted, difficulty-adjusted score (0-100)
+        grade: Grade tier derived from composite_score
+        result_count: Number of completed test results aggregated
+        last_completed_at: created_at of the user's newest completed session
+        updated_at: Last time the row was recalculated
+
+    """
+
+    __tablename__ = "user_scores"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    composite_score: Mapped[float] = mapped_column(Float, nullable=False)
+    grade: Mapped[str] = mapped_column(String(50), nullable=False)
+    result_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_completed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        server_default=func.now(),
+    )
+
+    # Covering index for rank (score range filtered by cohort) and cohort size count,
+    # plus the (composite_score, user_id) keyset index for leaderboard pagination
+    __table_args__ = (
+        Index("idx_user_score_score", "composite_score", "last_completed_at", "user_id"),
+        Index("idx_user_score_last_completed", "last_completed_at"),
+        Index("idx_user_score_keyset", "composite_score", "user_id"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of UserScore."""
+        return f"<UserScore(user_id={self.user_id}, composite_score={self.composite_score}, grade='{self.grade}')>"
@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 from src.backend.models.attempt_answer import AttemptAnswer
 from src.backend.models.question import Question
 from src.backend.models.test_session import TestSession
+from src.backend.services.scoring_service import ScoringService
 
 
 class AutosaveService:
@@ -49,7 +50,10 @@ class AutosaveService:
         """
         Save user's answer to a question in real-time.
 
-        REQ: REQ-B-B2-Plus-1, REQ-B-B2-Plus-4, REQ-B-B2-Plus-5
+        REQ: REQ-B-B2-Plus-1, REQ-B-B2-Plus-4, REQ-B-B2-Plus-5, REQ-B-B3-Score-2
+
+        Multiple-choice and true/false answers are scored inline (is_correct,
+        score, scored_at); short answers are scored when the round is scored.
 
         Performance requirement: Complete within 2 seconds.
 
@@ -85,14 +89,23 @@ class AutosaveService:
             test_session.started_at = datetime.now(UTC)
             self.session.commit()
 
+        # Score MC/TF inline; short answers stay unscored until round scoring
+        scored = ScoringService(self.session).score_deterministic(question, user_answer, test_session)
+        is_correct, score = scored if scored is not None else (False, 0.0)
+        now = datetime.now(UTC)
+        scored_at = now if scored is not None else None
+
         # Check if answer already exists (idempotent update)
         existing = self.session.query(AttemptAnswer).filter_by(session_id=session_id, question_id=question_id).first()
 
         if existing:
-            # Update existing answer
+            # Update existing answer (any previous score belonged to the old answer)
             existing.user_answer = user_answer
             existing.response_time_ms = response_time_ms
-            existing.saved_at = datetime.now(UTC)
+            existing.saved_at = now
+            existing.is_correct = is_correct
+            existing.score = score
+            existing.scored_at = scored_at
             self.session.commit()
             self.session.refresh(existing)
             return existing
@@ -102,10 +115,11 @@ class AutosaveService:
             session_id=session_id,
             question_id=question_id,
             user_answer=user_answer,
-            is_correct=False,  # Will be set by scoring service
-            score=0.0,  # Will be set by scoring service
+            is_correct=is_correct,
+            score=score,
+            scored_at=scored_at,
             response_time_ms=response_time_ms,
-            saved_at=datetime.now(UTC),
+            saved_at=now,
         )
         self.session.add(answer)
         self.session.commit()
@@ -1,25 +1,67 @@
 """
 Explanation generation service for generating question explanations with reference links.
 
-REQ: REQ-B-B3-Explain, REQ-B-B3-Explain-2
+REQ: REQ-B-B3-Explain, REQ-B-B3-Explain-2, REQ-B-B3-Explain-4, REQ-B-B3-Explain-5, REQ-B-B3-Explain-6,
+     REQ-B-B3-Explain-7
 
 Uses Gemini LLM to generate dynamic explanations based on problem context.
 """
 
+import asyncio
 import json
 import logging
-from datetime import UTC, datetime
+import os
+import socket
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
+from sqlalchemy import delete, insert, inspect, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.agent.config import create_llm
+from src.agent.json_repair import parse_json_tolerant
+from src.backend.config import settings
 from src.backend.models.answer_explanation import AnswerExplanation
+from src.backend.models.attempt_answer import AttemptAnswer
+from src.backend.models.explanation_claim import ExplanationClaim
 from src.backend.models.question import Question
+from src.backend.models.test_session import TestSession
+from src.backend.services.explanation_stream import ExplanationStreamParser
+from src.backend.services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Identifies this process as owner of explanation claims
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+# How often a worker waiting on another worker's claim re-checks the cache
+CLAIM_POLL_INTERVAL_SECONDS = 0.2
+
+# Dialects with INSERT ... ON CONFLICT DO NOTHING (one statement claims many keys)
+_CLAIM_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# error_message marking a deterministic draft awaiting its LLM upgrade
+DRAFT_ERROR_MESSAGE = "draft: LLM explanation pending"
+
+# In-process single-flight registry keyed by (question_id, is_correct)
+_explanation_flights = SingleFlight()
+
+
+def get_explanation_flights() -> SingleFlight:
+    """Return the process-wide explanation single-flight registry."""
+    return _explanation_flights
+
+
+def _identity(explanation: AnswerExplanation) -> str:
+    """Return an explanation's primary key without triggering a refresh."""
+    return inspect(explanation).identity[0]
+
 
 class ExplainService:
     """
@@ -29,6 +71,9 @@ class ExplainService:
 
     Methods:
         generate_explanation: Generate new explanation or retrieve cached
+        agenerate_session_explanations: Resolve a whole session's explanations (async, bounded)
+        aprefetch_explanations: Generate both explanation variants before scoring
+        stream_explanation: Stream explanation tokens while generating (SSE)
         get_explanation: Retrieve cached explanation
 
     Design:
@@ -36,6 +81,11 @@ class ExplainService:
         - Caches explanations by question_id (reused across users)
         - Separates prompts for correct vs incorrect answers
         - Supports timeout handling with graceful degradation
+        - Fallback/draft rows (is_fallback=True) are upgraded in the background
+          (tiered mode: reads never wait for the LLM)
+        - Generation claims and async-path reads/writes use short-lived worker
+          sessions (run via asyncio.to_thread), so they never block the event
+          loop, commit the caller's session or expire the rows it has loaded
 
     """
 
@@ -63,6 +113,11 @@ class ExplainService:
 
         Performance requirement: Complete within 2 seconds.
 
+        With EXPLANATION_TIERED_MODE, a cache miss stores and returns a
+        deterministic draft (REQ-B-B3-Explain-7) instead of calling the LLM.
+        Whenever the returned row is a fallback or draft, a background upgrade
+        to the LLM explanation is scheduled; clients poll until is_fallback is False.
+
         Args:
             question_id: Question ID to explain
             user_answer: User's submitted answer
@@ -85,22 +140,15 @@ class ExplainService:
             ValueError: If question not found or validation fails
 
         """
-        # Validate inputs
-        if not question_id:
-            raise ValueError("question_id cannot be empty")
-
-        if isinstance(user_answer, str) and not user_answer.strip():
-            raise ValueError("user_answer cannot be empty")
-
-        # Validate question exists
-        question = self.session.query(Question).filter_by(id=question_id).first()
-        if not question:
-            raise ValueError(f"Question not found: {question_id}")
+        # Validate inputs and question existence
+        question = self._load_question(question_id, user_answer)
 
         # Check for cached explanation (by question_id + is_correct)
         cached = self.session.query(AnswerExplanation).filter_by(question_id=question_id, is_correct=is_correct).first()
 
         if cached:
+            if cached.is_fallback:
+                self._schedule_upgrade([question_id])
             return self._format_explanation_response(
                 explanation=cached,
                 question=question,
@@ -108,44 +156,94 @@ class ExplainService:
                 attempt_answer_id=attempt_answer_id,
             )
 
-        # Generate new explanation (with fallback tracking)
-        try:
-            llm_response, is_fallback, error_message = self._generate_with_llm(
+        # Tiered mode: answer instantly with a draft, upgrade in the background
+        if settings.EXPLANATION_TIERED_MODE:
+            key = (question_id, is_correct)
+            draft = self._store_drafts({key: (question, user_answer, attempt_answer_id)})[key]
+            self._schedule_upgrade([question_id])
+            return self._format_explanation_response(
+                explanation=draft,
                 question=question,
                 user_answer=user_answer,
-                is_correct=is_correct,
+                attempt_answer_id=attempt_answer_id,
             )
+
+        # Single-flight: one generation per (question_id, is_correct) in this process,
+        # coordinated across workers by an explanation claim (see _generate_and_store)
+        key = (question_id, is_correct)
+        future, is_leader = _explanation_flights.begin(key)
+        if not is_leader:
+            joined = self._join_flight(future)
+            if joined is not None:
+                return self._format_explanation_response(
+                    explanation=joined,
+                    question=question,
+                    user_answer=user_answer,
+                    attempt_answer_id=attempt_answer_id,
+                )
+            # Leader failed or timed out: generate on our own
+
+        explanation_id: str | None = None
+        try:
+            explanation = self._generate_and_store(question, user_answer, is_correct, attempt_answer_id)
+            explanation_id = _identity(explanation)
         except TimeoutError as e:
             # Graceful degradation: return fallback explanation
             return self._create_fallback_explanation(
                 question_id=question_id,
                 error_message=str(e),
             )
+        finally:
+            if is_leader:
+                _explanation_flights.finish(key, explanation_id)
 
-        # Validate explanation meets requirements
-        self._validate_explanation(llm_response)
-
-        # Save to database
-        explanation = AnswerExplanation(
-            id=str(uuid4()),
-            question_id=question_id,
-            attempt_answer_id=attempt_answer_id,
-            explanation_text=llm_response["explanation"],
-            reference_links=llm_response["reference_links"],
-            is_correct=is_correct,
-            is_fallback=is_fallback,
-            error_message=error_message,
-        )
-        self.session.add(explanation)
-        self.session.commit()
-        self.session.refresh(explanation)
-
+        if explanation.is_fallback:
+            self._schedule_upgrade([question_id])
         return self._format_explanation_response(
             explanation=explanation,
             question=question,
             user_answer=user_answer,
+            attempt_answer_id=attempt_answer_id,
         )
 
+    async def stream_explanation(
+        self,
+        question_id: str,
+        user_answer: str | dict,
+        is_correct: bool,
+        attempt_answer_id: str | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Stream an explanation as it is generated.
+
+        REQ: REQ-B-B3-Explain-5
+
+        Inputs are validated (and the question loaded on a worker session, off
+        the event loop) before returning, so errors surface before the stream
+        starts. The returned async iterator yields (event, data) pairs:
+            token : {"text": ...} decoded explanation text as the LLM emits it
+            reset : {} previously streamed text is replaced (LLM failed mid-stream)
+            done  : formatted explanation (same shape as generate_explanation)
+            error : {"detail": ...} generation failed validation
+        Cached explanations are replayed instantly as one token plus done.
+
+        Args:
+            question_id: Question ID to explain
+            user_answer: User's submitted answer
+            is_correct: Whether answer is correct
+            attempt_answer_id: Optional FK to attempt_answers for tracking
+
+        Returns:
+            Async iterator of (event, data)
+
+        Raises:
+            ValueError: If question not found or inputs are invalid
+
+        """
+        self._validate_inputs(question_id, user_answer)
+        question = await self._aworker(self._find_question, question_id)
+        return self._astream_explanation(question, user_answer, is_correct, attempt_answer_id)
+
     def get_explanation(
         self,
         question_id: str,
@@ -164,8 +262,6 @@ class ExplainService:
             Explanation dict or None if not found
 
         """
-        from src.backend.models.attempt_answer import AttemptAnswer
-
         query = self.session.query(AnswerExplanation).filter_by(question_id=question_id)
 
         if attempt_answer_id:
@@ -190,10 +286,908 @@ class ExplainService:
             user_answer=user_answer,
         )
 
+    async def aload_session_answers(
+        self, session_id: str
+    ) -> tuple[TestSession | None, list[Question], list[AttemptAnswer]]:
+        """
+        Load a session with its questions and answers, off the event loop.
+
+        REQ: REQ-B-B3-Explain-2
+
+        Runs on a worker session in a thread (async endpoints never block the
+        loop on these queries). Questions are ordered by creation time, i.e.
+        question order; the returned rows are detached with their columns loaded.
+
+        Args:
+            session_id: TestSession ID
+
+        Returns:
+            (TestSession or None if not found, questions in order, answers)
+
+        """
+        return await self._aworker(self._load_session_answers, session_id)
+
+    async def agenerate_session_explanations(
+        self,
+        items: list[tuple[Question, AttemptAnswer]],
+        max_concurrency: int | None = None,
+        batch: bool | None = None,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Resolve explanations for a whole session without a thread pool.
+
+        REQ: REQ-B-B3-Explain-2
+
+        Cached explanations for every (question_id, is_correct) pair are loaded
+        in one query. Only the misses are generated, concurrently via ainvoke
+        (bounded by a semaphore), and saved in one commit. All database work
+        runs on worker sessions off the event loop; the caller's Question and
+        AttemptAnswer rows are never expired. Identical misses are generated once. With
+        EXPLANATION_TIERED_MODE, misses get deterministic drafts instead, and
+        every fallback/draft row is scheduled for a background LLM upgrade.
+
+        Args:
+            items: (Question, AttemptAnswer) pairs in question order
+            max_concurrency: Max concurrent LLM calls (default: settings.EXPLANATION_MAX_CONCURRENCY)
+            batch: Explain all misses in one LLM call (default: settings.EXPLANATION_BATCH_MODE);
+                items the batch response gets wrong fall back to per-question calls
+
+        Returns:
+            Formatted explanation per item, in input order (None if generation failed)
+
+        """
+        if not items:
+            return []
+
+        # 1. Cache lookup: one query for all questions in the session
+        cached = await self._aworker(self._load_cached_explanations, {question.id for question, _ in items})
+
+        # 2. Generate misses concurrently (one LLM call per distinct key)
+        misses: dict[tuple[str, bool], tuple[Question, str | dict, str | None]] = {}
+        for question, answer in items:
+            key = (question.id, bool(answer.is_correct))
+            if key not in cached:
+                misses.setdefault(key, (question, answer.user_answer, answer.id))
+
+        if misses and settings.EXPLANATION_TIERED_MODE:
+            cached.update(await self._aworker(self._store_drafts, misses))
+        elif misses:
+            semaphore = asyncio.Semaphore(max(max_concurrency or settings.EXPLANATION_MAX_CONCURRENCY, 1))
+            use_batch = settings.EXPLANATION_BATCH_MODE if batch is None else batch
+            cached.update(await self._agenerate_and_store(misses, semaphore, batch=use_batch))
+
+        upgradable = {question_id for (question_id, _), row in cached.items() if row.is_fallback}
+        if upgradable:
+            self._schedule_upgrade(sorted(upgradable))
+
+        # 3. Format in question order
+        formatted: list[dict[str, Any] | None] = []
+        for question, answer in items:
+            explanation = cached.get((question.id, bool(answer.is_correct)))
+            if explanation is None:
+                formatted.append(None)
+                continue
+            formatted.append(
+                self._format_explanation_response(
+                    explanation=explanation,
+                    question=question,
+                    user_answer=answer.user_answer,
+                    attempt_answer_id=answer.id,
+                )
+            )
+        return formatted
+
+    async def aprefetch_explanations(
+        self,
+        questions: list[Question],
+        semaphore: asyncio.Semaphore,
+    ) -> int:
+        """
+        Generate missing correct/incorrect explanation variants ahead of scoring.
+
+        REQ: REQ-B-B3-Explain-3
+
+        Cached variants are skipped (one lookup query), except fallback/draft
+        rows, which are upgraded in place (REQ-B-B3-Explain-7). Fallback (mock)
+        results are not persisted, so a failed prefetch leaves the key to the lazy path.
+
+        Args:
+            questions: Questions to prefetch explanations for
+            semaphore: Shared semaphore bounding concurrent LLM calls
+
+        Returns:
+            Number of explanations generated or upgraded and stored
+
+        """
+        if not questions:
+            return 0
+
+        cached = await self._aworker(self._load_cached_explanations, {question.id for question in questions})
+        misses: dict[tuple[str, bool], tuple[Question, str | dict, str | None]] = {}
+        upgrades: dict[tuple[str, bool], tuple[Question, AnswerExplanation]] = {}
+        for question in questions:
+            for is_correct in (True, False):
+                key = (question.id, is_correct)
+                if key not in cached:
+                    misses[key] = (question, self._representative_answer(question, is_correct), None)
+                elif cached[key].is_fallback:
+                    upgrades[key] = (question, cached[key])
+
+        generated = 0
+        if misses:
+            generated += len(await self._agenerate_and_store(misses, semaphore, store_fallback=False))
+        if upgrades:
+            generated += await self._aupgrade_explanations(upgrades, semaphore)
+        return generated
+
     # =========================================================================
     # Private Methods
     # =========================================================================
 
+    def _load_question(self, question_id: str, user_answer: str | dict) -> Question:
+        """
+        Validate explanation inputs and load the question.
+
+        Raises:
+            ValueError: If inputs are empty or the question does not exist
+
+        """
+        self._validate_inputs(question_id, user_answer)
+        return self._find_question(question_id, self.session)
+
+    @staticmethod
+    def _validate_inputs(question_id: str, user_answer: str | dict) -> None:
+        """Reject empty explanation inputs (no DB access)."""
+        if not question_id:
+            raise ValueError("question_id cannot be empty")
+
+        if isinstance(user_answer, str) and not user_answer.strip():
+            raise ValueError("user_answer cannot be empty")
+
+    @staticmethod
+    def _find_question(question_id: str, db: Session) -> Question:
+        """Load a question on the given session or raise ValueError if missing."""
+        question = db.query(Question).filter_by(id=question_id).first()
+        if not question:
+            raise ValueError(f"Question not found: {question_id}")
+        return question
+
+    async def _astream_explanation(
+        self,
+        question: Question,
+        user_answer: str | dict,
+        is_correct: bool,
+        attempt_answer_id: str | None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Event generator behind stream_explanation (single-flight, claim-guarded).
+
+        Args:
+            question: Validated question
+            user_answer: User's submitted answer
+            is_correct: Whether answer is correct
+            attempt_answer_id: Optional FK to attempt_answers for tracking
+
+        Yields:
+            (event, data) pairs (see stream_explanation)
+
+        """
+        key = (question.id, is_correct)
+        explanation = await self._aworker(self._find_cached, key)
+        is_leader = generated_live = False
+
+        if explanation is None:
+            future, is_leader = _explanation_flights.begin(key)
+            if not is_leader:
+                explanation = (await self._ajoin_flights({key: future})).get(key)
+
+        if explanation is None:
+            explanation_id: str | None = None
+            owns_claim = key in await asyncio.to_thread(self._claim_keys, [key])
+            try:
+                if not owns_claim:
+                    explanation = (await self._await_explanations([key])).get(key)
+                if explanation is None:
+                    generated_live = True
+                    events = self._astream_and_store(question, user_answer, is_correct, attempt_answer_id)
+                    async for event, data in events:
+                        if event == "done":
+                            explanation = data["explanation"]
+                        else:
+                            yield event, data
+                if explanation is not None:
+                    explanation_id = _identity(explanation)
+            finally:
+                if owns_claim:
+                    await asyncio.to_thread(self._release_claims, [key])
+                if is_leader:
+                    _explanation_flights.finish(key, explanation_id)
+            if explanation is None:
+                return
+
+        # Cached (or generated by another caller): replay the text instantly
+        if not generated_live:
+            yield "token", {"text": explanation.explanation_text}
+        yield (
+            "done",
+            self._format_explanation_response(
+                explanation=explanation,
+                question=question,
+                user_answer=user_answer,
+                attempt_answer_id=attempt_answer_id,
+            ),
+        )
+
+    async def _astream_and_store(
+        self,
+        question: Question,
+        user_answer: str | dict,
+        is_correct: bool,
+        attempt_answer_id: str | None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Stream LLM tokens, then parse, validate and persist the explanation.
+
+        Yields token/reset/error events, and finally ("done", {"explanation": row})
+        carrying the stored AnswerExplanation for the caller to format.
+
+        """
+        parser = ExplanationStreamParser()
+        chunks: list[str] = []
+        streamed = False
+        try:
+            llm = create_llm()
+            prompt = self._build_explanation_prompt(question, user_answer, is_correct)
+            async for chunk in llm.astream(prompt):
+                text = chunk.content if isinstance(chunk.content, str) else "".join(map(str, chunk.content))
+                chunks.append(text)
+                delta = parser.feed(text)
+                if delta:
+                    streamed = True
+                    yield "token", {"text": delta}
+            llm_response = self._process_llm_output("".join(chunks))
+            is_fallback, error_message = False, None
+        except Exception as e:
+            logger.error(f"✗ Gemini streaming failed - Type: {type(e).__name__}, Message: {e}")
+            llm_response = self._generate_mock_explanation(question, user_answer, is_correct)
+            is_fallback, error_message = True, str(e)
+            if streamed:
+                yield "reset", {}
+            yield "token", {"text": llm_response["explanation"]}
+
+        try:
+            self._validate_explanation(llm_response)
+        except ValueError as e:
+            yield "error", {"detail": str(e)}
+            return
+
+        explanation = AnswerExplanation(
+            id=str(uuid4()),
+            question_id=question.id,
+            attempt_answer_id=attempt_answer_id,
+            explanation_text=llm_response["explanation"],
+            reference_links=llm_response["reference_links"],
+            is_correct=is_correct,
+            is_fallback=is_fallback,
+            error_message=error_message,
+        )
+        stored = await self._aworker(self._store_explanations, [explanation])
+        yield "done", {"explanation": stored[(question.id, is_correct)]}
+
+    def _store_drafts(
+        self,
+        misses: dict[tuple[str, bool], tuple[Question, str | dict, str | None]],
+        db: Session | None = None,
+    ) -> dict[tuple[str, bool], AnswerExplanation]:
+        """
+        Store deterministic draft explanations for cache misses (no LLM call).
+
+        REQ: REQ-B-B3-Explain-7
+
+        Args:
+            misses: (question_id, is_correct) → (question, user_answer, attempt_answer_id)
+            db: Session to write with (default: the caller's session)
+
+        Returns:
+            Mapping of key to stored row (an existing row wins a concurrent insert)
+
+        """
+        drafts = []
+        for (question_id, is_correct), (question, _, attempt_answer_id) in misses.items():
+            draft = self._generate_draft_explanation(question, is_correct)
+            drafts.append(
+                AnswerExplanation(
+                    id=str(uuid4()),
+                    question_id=question_id,
+                    attempt_answer_id=attempt_answer_id,
+                    explanation_text=draft["explanation"],
+                    reference_links=draft["reference_links"],
+                    is_correct=is_correct,
+                    is_fallback=True,
+                    error_message=DRAFT_ERROR_MESSAGE,
+                )
+            )
+        return self._store_explanations(drafts, db)
+
+    def _schedule_upgrade(self, question_ids: list[str]) -> None:
+        """Queue a background LLM upgrade of fallback/draft rows (REQ-B-B3-Explain-7)."""
+        from src.backend.services.explanation_prefetch import get_explanation_prefetcher
+
+        get_explanation_prefetcher().schedule_upgrades(question_ids)
+
+    async def _aupgrade_explanations(
+        self,
+        upgrades: dict[tuple[str, bool], tuple[Question, AnswerExplanation]],
+        semaphore: asyncio.Semaphore,
+    ) -> int:
+        """
+        Replace fallback/draft rows with LLM explanations, in place.
+
+        REQ: REQ-B-B3-Explain-7
+
+        Each key is generated under the cross-worker claim, and rows another
+        worker already upgraded are skipped. Rows whose regeneration falls back
+        again are left untouched for a later attempt.
+
+        Args:
+            upgrades: (question_id, is_correct) → (question, fallback row)
+            semaphore: Bounds concurrent LLM calls
+
+        Returns:
+            Number of rows upgraded
+
+        """
+        claimed = await asyncio.to_thread(self._claim_keys, list(upgrades))
+        upgraded = 0
+        try:
+            # Another worker may have upgraded a row before we claimed it
+            fresh = await self._aworker(self._load_cached_explanations, {key[0] for key in claimed})
+            pending = [key for key in claimed if key in fresh and fresh[key].is_fallback]
+
+            async def generate(question: Question, is_correct: bool) -> tuple[Any, bool, Any]:
+                async with semaphore:
+                    return await self._agenerate_with_llm(
+                        question, self._representative_answer(question, is_correct), is_correct
+                    )
+
+            results = await asyncio.gather(
+                *(generate(upgrades[key][0], key[1]) for key in pending),
+                return_exceptions=True,
+            )
+            responses: dict[str, dict[str, Any]] = {}
+            for key, result in zip(pending, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Failed to upgrade explanation for question {key[0]}: {result}")
+                    continue
+                llm_response, is_fallback, _ = result
+                if is_fallback:
+                    continue
+                try:
+                    self._validate_explanation(llm_response)
+                except ValueError as e:
+                    logger.warning(f"Upgraded explanation for question {key[0]} is invalid: {e}")
+                    continue
+                responses[_identity(fresh[key])] = llm_response
+            if responses:
+                upgraded = await self._aworker(self._apply_upgrades, responses)
+        finally:
+            await asyncio.to_thread(self._release_claims, list(claimed))
+        return upgraded
+
+    def _apply_upgrades(self, responses: dict[str, dict[str, Any]], db: Session) -> int:
+        """
+        Overwrite fallback/draft rows with validated LLM explanations (one commit).
+
+        Args:
+            responses: AnswerExplanation id → validated LLM response
+            db: Session to write with
+
+        Returns:
+            Number of rows upgraded (rows no longer marked fallback are skipped)
+
+        """
+        upgraded = 0
+        for explanation_id, llm_response in responses.items():
+            result = db.execute(
+                update(AnswerExplanation)
+                .where(AnswerExplanation.id == explanation_id, AnswerExplanation.is_fallback.is_(True))
+                .values(
+                    explanation_text=llm_response["explanation"],
+                    reference_links=llm_response["reference_links"],
+                    is_fallback=False,
+                    error_message=None,
+                )
+            )
+            upgraded += result.rowcount
+        db.commit()
+        return upgraded
+
+    def _load_cached_explanations(
+        self, question_ids: set[str], db: Session | None = None
+    ) -> dict[tuple[str, bool], AnswerExplanation]:
+        """
+        Load cached explanations for many questions in one query.
+
+        Args:
+            question_ids: Question IDs to look up
+            db: Session to read with (default: the caller's session)
+
+        Returns:
+            Mapping of (question_id, is_correct) to the oldest cached explanation
+
+        """
+        if not question_ids:
+            return {}
+        rows = (
+            (db if db is not None else self.session)
+            .query(AnswerExplanation)
+            .filter(AnswerExplanation.question_id.in_(question_ids))
+            .order_by(AnswerExplanation.created_at)
+            .all()
+        )
+        cached: dict[tuple[str, bool], AnswerExplanation] = {}
+        for row in rows:
+            cached.setdefault((row.question_id, row.is_correct), row)
+        return cached
+
+    async def _agenerate_and_store(
+        self,
+        misses: dict[tuple[str, bool], tuple[Question, str | dict, str | None]],
+        semaphore: asyncio.Semaphore,
+        store_fallback: bool = True,
+        batch: bool = False,
+    ) -> dict[tuple[str, bool], AnswerExplanation]:
+        """
+        Generate explanations concurrently and persist them with single-flight semantics.
+
+        Keys already in flight in this process are joined; keys claimed by
+        another worker are awaited; only the remaining keys reach the LLM.
+        All keys are claimed in one statement; waiting for other workers'
+        keys runs concurrently with our own generation. Claims, polls, inserts
+        and releases run on worker sessions off the event loop.
+
+        Args:
+            misses: (question_id, is_correct) → (question, user_answer, attempt_answer_id)
+            semaphore: Bounds concurrent LLM calls
+            store_fallback: Whether mock fallback results are persisted
+            batch: Generate in one LLM call per chunk first; per-question calls only for failed items
+
+        Returns:
+            Mapping of key to stored AnswerExplanation (failed keys omitted)
+
+        """
+        led: dict[tuple[str, bool], tuple[Question, str | dict, str | None]] = {}
+        joined: dict[tuple[str, bool], Future] = {}
+        for key, miss in misses.items():
+            future, is_leader = _explanation_flights.begin(key)
+            if is_leader:
+                led[key] = miss
+            else:
+                joined[key] = future
+
+        stored: dict[tuple[str, bool], AnswerExplanation] = {}
+        claimed: set[tuple[str, bool]] = set()
+        try:
+            claimed = await asyncio.to_thread(self._claim_keys, list(led))
+
+            # Generate our claims while waiting (off-loop) for keys claimed by another worker
+            generated, awaited = await asyncio.gather(
+                self._agenerate_claimed(
+                    {key: miss for key, miss in led.items() if key in claimed}, semaphore, store_fallback, batch
+                ),
+                self._await_explanations([key for key in led if key not in claimed]),
+            )
+            stored.update(generated)
+            stored.update(awaited)
+        finally:
+            if claimed:
+                await asyncio.to_thread(self._release_claims, list(claimed))
+            for key in led:
+                _explanation_flights.finish(key, _identity(stored[key]) if key in stored else None)
+
+        # Keys led by another request in this process
+        stored.update(await self._ajoin_flights(joined))
+        return stored
+
+    async def _agenerate_claimed(
+        self,
+        misses: dict[tuple[str, bool], tuple[Question, str | dict, str | None]],
+        semaphore: asyncio.Semaphore,
+        store_fallback: bool,
+        batch: bool,
+    ) -> dict[tuple[str, bool], AnswerExplanation]:
+        """
+        Generate explanations for claimed keys and store them in one commit.
+
+        Args:
+            misses: Claimed (question_id, is_correct) → (question, user_answer, attempt_answer_id)
+            semaphore: Bounds concurrent LLM calls
+            store_fallback: Whether mock fallback results are persisted
+            batch: Generate in one LLM call per chunk first; per-question calls only for failed items
+
+        Returns:
+            Mapping of key to stored AnswerExplanation (failed keys omitted)
+
+        """
+        responses: dict[tuple[str, bool], tuple[Any, bool, Any] | BaseException] = {}
+        if batch and len(misses) > 1:
+            responses.update(await self._agenerate_batched(misses, semaphore))
+
+        async def generate(question: Question, user_answer: str | dict, is_correct: bool) -> tuple[Any, bool, Any]:
+            async with semaphore:
+                return await self._agenerate_with_llm(question, user_answer, is_correct)
+
+        # Per-question generation (all keys, or batch items that failed)
+        remaining = [key for key in misses if key not in responses]
+        results = await asyncio.gather(
+            *(generate(misses[key][0], misses[key][1], key[1]) for key in remaining),
+            return_exceptions=True,
+        )
+        responses.update(zip(remaining, results, strict=True))
+
+        explanations: list[AnswerExplanation] = []
+        for key, (_, _, attempt_answer_id) in misses.items():
+            result = responses[key]
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to generate explanation for question {key[0]}: {result}")
+                continue
+            llm_response, is_fallback, error_message = result
+            if is_fallback and not store_fallback:
+                continue
+            try:
+                self._validate_explanation(llm_response)
+            except ValueError as e:
+                logger.warning(f"Generated explanation for question {key[0]} is invalid: {e}")
+                continue
+            explanations.append(
+                AnswerExplanation(
+                    id=str(uuid4()),
+                    question_id=key[0],
+                    attempt_answer_id=attempt_answer_id,
+                    explanation_text=llm_response["explanation"],
+                    reference_links=llm_response["reference_links"],
+                    is_correct=key[1],
+                    is_fallback=is_fallback,
+                    error_message=error_message,
+                )
+            )
+        if not explanations:
+            return {}
+        return await self._aworker(self._store_explanations, explanations)
+
+    async def _agenerate_batched(
+        self,
+        misses: dict[tuple[str, bool], tuple[Question, str | dict, str | None]],
+        semaphore: asyncio.Semaphore,
+    ) -> dict[tuple[str, bool], tuple[dict[str, Any], bool, None]]:
+        """
+        Generate explanations in batch-mode LLM calls (chunks of EXPLANATION_BATCH_MAX_ITEMS).
+
+        Args:
+            misses: (question_id, is_correct) → (question, user_answer, attempt_answer_id)
+            semaphore: Bounds concurrent LLM calls (one slot per chunk)
+
+        Returns:
+            Mapping of key to (llm_response, is_fallback=False, None) for valid items only
+
+        """
+        keys = list(misses)
+        chunk_size = max(settings.EXPLANATION_BATCH_MAX_ITEMS, 1)
+        chunks = [keys[start : start + chunk_size] for start in range(0, len(keys), chunk_size)]
+
+        async def generate_chunk(chunk: list[tuple[str, bool]]) -> list[dict[str, Any] | None]:
+            async with semaphore:
+                return await self._agenerate_batch_with_llm([(misses[key][0], misses[key][1], key[1]) for key in chunk])
+
+        results = await asyncio.gather(*(generate_chunk(chunk) for chunk in chunks), return_exceptions=True)
+
+        generated: dict[tuple[str, bool], tuple[dict[str, Any], bool, None]] = {}
+        for chunk, result in zip(chunks, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(f"Batch explanation call failed for {len(chunk)} questions: {result}")
+                continue
+            for key, llm_response in zip(chunk, result, strict=True):
+                if llm_response is not None:
+                    generated[key] = (llm_response, False, None)
+        return generated
+
+    def _generate_and_store(
+        self,
+        question: Question,
+        user_answer: str | dict,
+        is_correct: bool,
+        attempt_answer_id: str | None,
+    ) -> AnswerExplanation:
+        """
+        Generate and persist one explanation under the cross-worker claim.
+
+        Args:
+            question: Question object
+            user_answer: User's submitted answer
+            is_correct: Whether answer is correct
+            attempt_answer_id: Optional FK to attempt_answers for tracking
+
+        Returns:
+            Stored AnswerExplanation (possibly the row another worker stored)
+
+        Raises:
+            TimeoutError: If LLM request times out
+            ValueError: If the generated explanation fails validation
+
+        """
+        key = (question.id, is_correct)
+        owns_claim = key in self._claim_keys([key])
+        try:
+            if not owns_claim:
+                existing = self._wait_for_explanations([key]).get(key)
+                if existing is not None:
+                    return existing
+
+            # Generate new explanation (with fallback tracking)
+            llm_response, is_fallback, error_message = self._generate_with_llm(
+                question=question,
+                user_answer=user_answer,
+                is_correct=is_correct,
+            )
+
+            # Validate explanation meets requirements
+            self._validate_explanation(llm_response)
+
+            explanation = AnswerExplanation(
+                id=str(uuid4()),
+                question_id=key[0],
+                attempt_answer_id=attempt_answer_id,
+                explanation_text=llm_response["explanation"],
+                reference_links=llm_response["reference_links"],
+                is_correct=is_correct,
+                is_fallback=is_fallback,
+                error_message=error_message,
+            )
+            return self._store_explanations([explanation])[key]
+        finally:
+            if owns_claim:
+                self._release_claims([key])
+
+    def _store_explanations(
+        self, explanations: list[AnswerExplanation], db: Session | None = None
+    ) -> dict[tuple[str, bool], AnswerExplanation]:
+        """
+        Insert explanations in one commit, resolving unique-constraint races.
+
+        If another worker stored the same (question_id, is_correct) first, the
+        batch is retried row by row and the existing row wins for that key.
+
+        Args:
+            explanations: New AnswerExplanation objects
+            db: Session to write with (default: the caller's session)
+
+        Returns:
+            Mapping of (question_id, is_correct) to the stored row
+
+        """
+        if not explanations:
+            return {}
+
+        db = db if db is not None else self.session
+        db.add_all(explanations)
+        try:
+            db.commit()
+            return {(row.question_id, row.is_correct): row for row in explanations}
+        except IntegrityError:
+            db.rollback()
+
+        stored: dict[tuple[str, bool], AnswerExplanation] = {}
+        for row in explanations:
+            key = (row.question_id, row.is_correct)
+            db.add(row)
+            try:
+                db.commit()
+                stored[key] = row
+            except IntegrityError:
+                db.rollback()
+                existing = self._find_cached(key, db)
+                if existing is None:
+                    raise
+                stored[key] = existing
+        return stored
+
+    def _find_cached(self, key: tuple[str, bool], db: Session | None = None) -> AnswerExplanation | None:
+        """Return the cached explanation for (question_id, is_correct), if any."""
+        return (
+            (db if db is not None else self.session)
+            .query(AnswerExplanation)
+            .filter_by(question_id=key[0], is_correct=key[1])
+            .first()
+        )
+
+    @staticmethod
+    def _load_session_answers(
+        session_id: str, db: Session
+    ) -> tuple[TestSession | None, list[Question], list[AttemptAnswer]]:
+        """Query a session, its questions in order and its answers (aload_session_answers)."""
+        test_session = db.get(TestSession, session_id)
+        if test_session is None:
+            return None, [], []
+        questions = db.query(Question).filter_by(session_id=session_id).order_by(Question.created_at, Question.id).all()
+        answers = db.query(AttemptAnswer).filter_by(session_id=session_id).all()
+        return test_session, questions, answers
+
+    def _worker_session(self) -> Session:
+        """Open a short-lived session on the caller's engine (rows stay loaded after commit)."""
+        return Session(bind=self.session.get_bind(), expire_on_commit=False)
+
+    def _in_worker_session(self, work: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """Call work(*args, db) on a fresh worker session and close it."""
+        with self._worker_session() as db:
+            return work(*args, db)
+
+    async def _aworker(self, work: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """Run work(*args, db) on a worker session in a thread, off the event loop."""
+        return await asyncio.to_thread(self._in_worker_session, work, *args)
+
+    def _claim_keys(self, keys: list[tuple[str, bool]]) -> set[tuple[str, bool]]:
+        """
+        Take the cross-worker generation claims for keys in one transaction.
+
+        One INSERT ... ON CONFLICT DO NOTHING for all keys, one UPDATE taking
+        over abandoned claims (owner crashed before releasing them), one SELECT
+        of the claims now owned and one commit, on a worker session (the
+        caller's session is never committed).
+
+        Args:
+            keys: (question_id, is_correct) pairs
+
+        Returns:
+            Keys this worker owns (new or taken over from a stale owner)
+
+        """
+        if not keys:
+            return set()
+
+        now = datetime.now(UTC)
+        rows = [
+            {"question_id": question_id, "is_correct": is_correct, "owner": WORKER_ID, "claimed_at": now}
+            for question_id, is_correct in keys
+        ]
+        key_match = tuple_(ExplanationClaim.question_id, ExplanationClaim.is_correct).in_(keys)
+        cutoff = now - timedelta(seconds=settings.EXPLANATION_CLAIM_TTL_SECONDS)
+
+        with self._worker_session() as db:
+            dialect = db.get_bind().dialect.name
+            if dialect in _CLAIM_INSERTS:
+                db.execute(_CLAIM_INSERTS[dialect](ExplanationClaim).values(rows).on_conflict_do_nothing())
+            else:
+                for row in rows:
+                    try:
+                        with db.begin_nested():
+                            db.execute(insert(ExplanationClaim).values(row))
+                    except IntegrityError:
+                        pass
+
+            # Take over abandoned claims
+            db.execute(
+                update(ExplanationClaim)
+                .where(key_match, ExplanationClaim.claimed_at < cutoff)
+                .values(owner=WORKER_ID, claimed_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            owned = db.execute(
+                select(ExplanationClaim.question_id, ExplanationClaim.is_correct).where(
+                    key_match, ExplanationClaim.owner == WORKER_ID, ExplanationClaim.claimed_at == now
+                )
+            ).all()
+            db.commit()
+        return {(question_id, is_correct) for question_id, is_correct in owned}
+
+    def _release_claims(self, keys: list[tuple[str, bool]]) -> None:
+        """Delete this worker's claims for keys (one statement, on a worker session)."""
+        if not keys:
+            return
+        with self._worker_session() as db:
+            try:
+                db.execute(
+                    delete(ExplanationClaim).where(
+                        tuple_(ExplanationClaim.question_id, ExplanationClaim.is_correct).in_(keys),
+                        ExplanationClaim.owner == WORKER_ID,
+                    )
+                )
+                db.commit()
+            except Exception:
+                # Claims expire after EXPLANATION_CLAIM_TTL_SECONDS anyway
+                logger.exception("Failed to release explanation claims")
+                db.rollback()
+
+    def _wait_for_explanations(
+        self, keys: list[tuple[str, bool]], db: Session | None = None
+    ) -> dict[tuple[str, bool], AnswerExplanation]:
+        """
+        Poll for rows other workers are generating, one query per interval for all keys.
+
+        Args:
+            keys: (question_id, is_correct) pairs claimed by other workers
+            db: Session to read with (default: the caller's session)
+
+        Returns:
+            Rows that appeared before EXPLANATION_SINGLE_FLIGHT_WAIT_SECONDS (timed-out keys omitted)
+
+        """
+        found: dict[tuple[str, bool], AnswerExplanation] = {}
+        pending = set(keys)
+        deadline = time.monotonic() + settings.EXPLANATION_SINGLE_FLIGHT_WAIT_SECONDS
+        while pending and time.monotonic() < deadline:
+            time.sleep(CLAIM_POLL_INTERVAL_SECONDS)
+            rows = self._load_cached_explanations({question_id for question_id, _ in pending}, db)
+            for key in pending & rows.keys():
+                found[key] = rows[key]
+            pending -= rows.keys()
+        return found
+
+    async def _await_explanations(self, keys: list[tuple[str, bool]]) -> dict[tuple[str, bool], AnswerExplanation]:
+        """Async variant of _wait_for_explanations (polls on a worker session in a thread)."""
+        if not keys:
+            return {}
+        return await self._aworker(self._wait_for_explanations, keys)
+
+    async def _ajoin_flights(
+        self, futures: dict[tuple[str, bool], Future]
+    ) -> dict[tuple[str, bool], AnswerExplanation]:
+        """
+        Wait concurrently for the in-process leaders of keys and load their rows in one query.
+
+        Args:
+            futures: Key → leader's future (resolves to the stored explanation id)
+
+        Returns:
+            Rows of keys whose leader succeeded in time (others omitted)
+
+        """
+        if not futures:
+            return {}
+
+        async def join(future: Future) -> str | None:
+            try:
+                return await asyncio.wait_for(
+                    asyncio.wrap_future(future), timeout=settings.EXPLANATION_SINGLE_FLIGHT_WAIT_SECONDS
+                )
+            except TimeoutError:
+                return None
+
+        explanation_ids = await asyncio.gather(*(join(future) for future in futures.values()))
+        by_key = {key: eid for key, eid in zip(futures, explanation_ids, strict=True) if eid}
+        if not by_key:
+            return {}
+        rows = await self._aworker(self._load_explanations_by_id, set(by_key.values()))
+        return {key: rows[eid] for key, eid in by_key.items() if eid in rows}
+
+    def _load_explanations_by_id(self, explanation_ids: set[str], db: Session) -> dict[str, AnswerExplanation]:
+        """Load explanations by primary key in one query."""
+        rows = db.query(AnswerExplanation).filter(AnswerExplanation.id.in_(explanation_ids)).all()
+        return {row.id: row for row in rows}
+
+    def _join_flight(self, future: Future) -> AnswerExplanation | None:
+        """Wait for the in-process leader of a key and load its row."""
+        try:
+            explanation_id = future.result(timeout=settings.EXPLANATION_SINGLE_FLIGHT_WAIT_SECONDS)
+        except TimeoutError:
+            return None
+        return self.session.get(AnswerExplanation, explanation_id) if explanation_id else None
+
+    def _representative_answer(self, question: Question, is_correct: bool) -> str:
+        """
+        Build the answer used in the prompt when no user answer exists yet (prefetch).
+
+        Args:
+            question: Question object
+            is_correct: Variant to prefetch
+
+        Returns:
+            Correct answer for the correct variant, a generic wrong-answer marker otherwise
+
+        """
+        if is_correct:
+            return self._extract_correct_answer_key(question.answer_schema or {}, question.item_type or "unknown")
+        return "(정답이 아닌 답변)"
+
     def _generate_with_llm(
         self,
         question: Question,
@@ -235,6 +1229,35 @@ class ExplainService:
             fallback_result = self._generate_mock_explanation(question, user_answer, is_correct)
             return fallback_result, True, error_msg
 
+    async def _agenerate_with_llm(
+        self,
+        question: Question,
+        user_answer: str | dict,
+        is_correct: bool,
+    ) -> tuple[dict[str, Any], bool, str | None]:
+        """
+        Async variant of _generate_with_llm (Gemini via ainvoke, Mock fallback).
+
+        REQ: REQ-B-B3-Explain-2
+
+        Args:
+            question: Question object
+            user_answer: User's submitted answer
+            is_correct: Whether answer is correct
+
+        Returns:
+            Tuple of (explanation_dict, is_fallback, error_message)
+
+        """
+        try:
+            result = await self._agenerate_with_gemini(question, user_answer, is_correct)
+            return result, False, None
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"✗ Gemini API failed - Type: {type(e).__name__}, Message: {error_msg}")
+            fallback_result = self._generate_mock_explanation(question, user_answer, is_correct)
+            return fallback_result, True, error_msg
+
     def _generate_with_gemini(
         self,
         question: Question,
@@ -263,8 +1286,93 @@ class ExplainService:
 
         # Call Gemini LLM
         response = llm.invoke(prompt)
-        response_text = response.content
+        return self._process_llm_output(response.content)
+
+    async def _agenerate_batch_with_llm(
+        self, entries: list[tuple[Question, str | dict, bool]]
+    ) -> list[dict[str, Any] | None]:
+        """
+        Generate explanations for several questions in a single LLM call.
+
+        REQ: REQ-B-B3-Explain-6
+
+        Each returned item is validated with _validate_explanation; items that
+        are missing, duplicated or invalid come back as None so the caller can
+        fall back to per-question generation for just those.
+
+        Args:
+            entries: (question, user_answer, is_correct) per item
+
+        Returns:
+            Validated {'explanation', 'reference_links'} per entry (None if unusable)
+
+        Raises:
+            Exception: If the LLM call fails or the response is not a JSON array
+
+        """
+        llm = create_llm()
+        response = await llm.ainvoke(self._build_batch_explanation_prompt(entries))
+        items = self._parse_batch_llm_response(response.content)
+
+        results: list[dict[str, Any] | None] = [None] * len(entries)
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            index = item.get("index")
+            if not isinstance(index, int) or not 1 <= index <= len(entries) or results[index - 1] is not None:
+                continue
+            candidate = {
+                "explanation": item.get("explanation"),
+                "reference_links": item.get("reference_links"),
+            }
+            if not isinstance(candidate["explanation"], str) or not isinstance(candidate["reference_links"], list):
+                continue
+            try:
+                self._validate_explanation(candidate)
+            except ValueError as e:
+                logger.warning(f"Batch explanation item {index} is invalid: {e}")
+                continue
+            results[index - 1] = candidate
+
+        logger.info(f"✓ Batch explanation: {sum(r is not None for r in results)}/{len(entries)} items valid")
+        return results
+
+    async def _agenerate_with_gemini(
+        self,
+        question: Question,
+        user_answer: str | dict,
+        is_correct: bool,
+    ) -> dict[str, Any]:
+        """
+        Generate explanation using Gemini LLM without blocking the event loop.
+
+        REQ: REQ-B-B3-Explain-2
+
+        Args:
+            question: Question object
+            user_answer: User's submitted answer
+            is_correct: Whether answer is correct
+
+        Returns:
+            Dictionary with 'explanation' and 'reference_links'
+
+        """
+        llm = create_llm()
+        prompt = self._build_explanation_prompt(question, user_answer, is_correct)
+        response = await llm.ainvoke(prompt)
+        return self._process_llm_output(response.content)
+
+    def _process_llm_output(self, response_text: str) -> dict[str, Any]:
+        """
+        Parse raw LLM output and log quality metrics.
 
+        Args:
+            response_text: Raw LLM response content
+
+        Returns:
+            Dictionary with 'explanation' and 'reference_links'
+
+        """
         # Log raw response for debugging
         logger.debug(f"Gemini raw response length: {len(response_text)} chars")
         logger.debug(f"Gemini response preview: {response_text[:200]}...")
@@ -299,18 +1407,7 @@ class ExplainService:
 
         """
         # Format user answer for display
-        if isinstance(user_answer, dict):
-            if "selected_key" in user_answer:
-                user_answer_str = f"선택: {user_answer['selected_key']}"
-            elif "answer" in user_answer:
-                val = user_answer["answer"]
-                user_answer_str = "참" if val else "거짓" if isinstance(val, bool) else str(val)
-            elif "text" in user_answer:
-                user_answer_str = str(user_answer["text"])
-            else:
-                user_answer_str = str(user_answer)
-        else:
-            user_answer_str = str(user_answer)
+        user_answer_str = self._format_prompt_user_answer(user_answer)
 
         # Extract correct answer
         answer_schema = question.answer_schema or {}
@@ -361,6 +1458,102 @@ class ExplainService:
 
         return prompt
 
+    def _format_prompt_user_answer(self, user_answer: str | dict) -> str:
+        """Format a user answer for display inside an LLM prompt."""
+        if isinstance(user_answer, dict):
+            if "selected_key" in user_answer:
+                return f"선택: {user_answer['selected_key']}"
+            if "answer" in user_answer:
+                val = user_answer["answer"]
+                return "참" if val else "거짓" if isinstance(val, bool) else str(val)
+            if "text" in user_answer:
+                return str(user_answer["text"])
+        return str(user_answer)
+
+    def _build_batch_explanation_prompt(self, entries: list[tuple[Question, str | dict, bool]]) -> str:
+        """
+        Build one LLM prompt covering several questions (session batch mode).
+
+        REQ: REQ-B-B3-Explain-6
+
+        Args:
+            entries: (question, user_answer, is_correct) per item; items are numbered from 1
+
+        Returns:
+            Prompt requesting a JSON array with one object per item
+
+        """
+        blocks: list[str] = []
+        for index, (question, user_answer, is_correct) in enumerate(entries, 1):
+            correct_key = self._extract_correct_answer_key(
+                question.answer_schema or {}, question.item_type or "unknown"
+            )
+            block = f"""### 문항 {index}
+문제 유형: {question.item_type}
+문제 주제: {question.category}
+<문제>
+{question.stem}
+</문제>
+"""
+            if question.choices:
+                block += "선택지:\n" + "\n".join(f"- {choice}" for choice in question.choices) + "\n"
+            block += f"""사용자 답변: {self._format_prompt_user_answer(user_answer)}
+정답: {correct_key}
+정오답: {"정답" if is_correct else "오답"}
+"""
+            blocks.append(block)
+
+        return f"""다음 {len(entries)}개 문항 각각에 대해 사용자 답변을 평가하고 맞춤형 해설을 작성해주세요.
+
+{chr(10).join(blocks)}
+다음 JSON 배열 포맷으로만 응답해주세요. 문항마다 객체 하나씩, index는 위 문항 번호입니다:
+[
+  {{
+    "index": 1,
+    "explanation": "[틀린 이유]\\n...(200-300자)\\n\\n[정답의 원리]\\n...(250-350자)\\n\\n[개념 구분]\\n...(150-250자)\\n\\n[복습 팁]\\n...(100-200자)",
+    "reference_links": [
+      {{"title": "개념 설명 자료", "url": "https://example.com/concept"}},
+      {{"title": "심화 학습 가이드", "url": "https://example.com/guide"}},
+      {{"title": "관련 문제 풀이집", "url": "https://example.com/problems"}}
+    ]
+  }}
+]
+
+매우 중요한 요구사항:
+✓ 모든 문항({len(entries)}개)에 대해 빠짐없이 객체를 작성하세요.
+✓ 각 explanation은 섹션([틀린 이유], [정답의 원리], [개념 구분], [복습 팁])을 구분하고 최소 700자 이상이어야 합니다.
+✓ 각 문항의 구체적인 내용(stem, 선택지, 정답)을 활용한 맞춤형 해설을 작성하세요.
+✓ 참고 링크는 문항마다 정확히 3개, 모두 한글 제목을 포함해야 합니다.
+✓ JSON 유효성: 문자열 내 줄바꿈은 반드시 \\n으로 이스케이프하세요.
+"""
+
+    def _parse_batch_llm_response(self, response_text: str) -> list[Any]:
+        """
+        Parse a batch-mode LLM response into a list of item objects.
+
+        REQ: REQ-B-B3-Explain-6
+
+        Args:
+            response_text: Raw LLM response (JSON array, possibly in a code block)
+
+        Returns:
+            Parsed list (items are validated by the caller)
+
+        Raises:
+            ValueError: If no JSON array can be parsed
+
+        """
+        try:
+            data = parse_json_tolerant(response_text).value
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid batch LLM response format: {e}") from e
+
+        if isinstance(data, dict):
+            data = data.get("explanations", data.get("items"))
+        if not isinstance(data, list):
+            raise ValueError("Batch LLM response is not a JSON array")
+        return data
+
     def _parse_llm_response(self, response_text: str) -> dict[str, Any]:
         """
         Parse LLM response and extract structured explanation.
@@ -378,38 +1571,13 @@ class ExplainService:
 
         """
         try:
-            # Extract JSON from response (may be wrapped in markdown code blocks)
-            if "```json" in response_text:
-                json_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                json_text = response_text.split("```")[1].split("```")[0].strip()
-            else:
-                json_text = response_text.strip()
-
-            # Log raw JSON for debugging (truncated for security)
-            json_preview = json_text[:500] + "..." if len(json_text) > 500 else json_text
-            logger.debug(f"Raw JSON before parsing: {json_preview}")
-
-            # Parse JSON with control character handling
-            try:
-                data = json.loads(json_text)
-            except json.JSONDecodeError as e:
-                # Attempt to escape unescaped control characters in the JSON string
-                # This handles cases where LLM returns actual newlines instead of \n
-                logger.debug(f"Initial JSON parse failed: {e}. Attempting recovery with escaped control characters...")
-
-                # Replace actual control characters with their escaped versions
-                # while preserving already-escaped sequences
-                escaped_json = self._escape_control_characters(json_text)
-                try:
-                    data = json.loads(escaped_json)
-                    logger.info("✓ JSON parsing succeeded after escaping control characters")
-                except json.JSONDecodeError as recovery_error:
-                    logger.error(
-                        f"Failed to parse LLM response after recovery: {type(recovery_error).__name__}: {recovery_error}"
-                    )
-                    logger.error(f"JSON text preview: {json_preview}")
-                    raise recovery_error
+            # Extract and repair JSON (markdown fences, raw newlines in strings, ...)
+            result = parse_json_tolerant(response_text)
+            if result.repaired:
+                logger.info(f"✓ LLM response JSON parsed after repairs: {', '.join(result.repairs)}")
+            data = result.value
+            if not isinstance(data, dict):
+                raise ValueError("LLM response is not a JSON object")
 
             # Validate structure
             if "explanation" not in data or "reference_links" not in data:
@@ -440,54 +1608,46 @@ class ExplainService:
             logger.error(f"Failed to parse LLM response: {type(e).__name__}: {e}")
             raise ValueError(f"Invalid LLM response format: {e}") from e
 
-    def _escape_control_characters(self, json_text: str) -> str:
-        r"""
-        Escape unescaped control characters in JSON text.
+    def _generate_draft_explanation(self, question: Question, is_correct: bool) -> dict[str, Any]:
+        """
+        Build an instant explanation from the question's answer_schema.
+
+        REQ: REQ-B-B3-Explain-7
 
-        Handles cases where LLM returns actual newlines/tabs in string values
-        instead of escaped sequences. Converts:
-        - Actual newlines → \n
-        - Actual tabs → \t
-        - Actual carriage returns → \r
+        Deterministic (no LLM): uses the correct answer, keywords and the
+        explanation stored at generation time. Served until the background
+        upgrade replaces it.
 
         Args:
-            json_text: JSON string potentially with unescaped control characters
+            question: Question object
+            is_correct: Whether the draft is for the correct variant
 
         Returns:
-            JSON string with control characters properly escaped
+            Dictionary with explanation and reference_links
 
         """
-        import re
-
-        # Pattern to find string values in JSON (simple approach)
-        # This won't handle all edge cases but works for most LLM output
-        def escape_string_contents(match: re.Match) -> str:
-            quote_char = match.group(1)  # The quote character (" or ')
-            content = match.group(2)  # The string content
-
-            # Only process if not already escaped
-            # Replace actual control characters with their escape sequences
-            content = content.replace("\r\n", "\\n")  # Windows line endings
-            content = content.replace("\r", "\\r")  # Mac line endings
-            content = content.replace("\n", "\\n")  # Unix line endings
-            content = content.replace("\t", "\\t")  # Tabs
-
-            return f"{quote_char}{content}{quote_char}"
+        answer_schema = question.answer_schema or {}
+        correct_answer = self._format_correct_answer_for_display(answer_schema, question.item_type or "unknown")
+        verdict = "선택하신 답변이 정답입니다." if is_correct else "선택하신 답변은 정답이 아닙니다."
+
+        sections = [f"[정답 확인]\n{verdict} {correct_answer}"]
+        stored_explanation = answer_schema.get("explanation")
+        if isinstance(stored_explanation, str) and stored_explanation.strip():
+            sections.append(f"[해설]\n{stored_explanation.strip()}")
+        keywords = answer_schema.get("correct_keywords") or answer_schema.get("keywords") or []
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        if keywords:
+            sections.append("[핵심 키워드]\n" + ", ".join(str(keyword) for keyword in keywords))
+        sections.append(
+            f"[복습 팁]\n'{question.category}' 분야의 관련 개념과 위 키워드를 다시 정리해 보세요. "
+            "문항별 맞춤 해설은 생성이 끝나는 대로 이 해설을 대체합니다."
+        )
 
-        try:
-            # Match JSON strings (simplified - handles most cases)
-            # Matches "..." or '...' patterns
-            escaped_text = re.sub(
-                r'"((?:[^"\\]|\\.)*)"',  # Double-quoted strings
-                lambda m: '"'
-                + m.group(1).replace("\r\n", "\\n").replace("\r", "\\r").replace("\n", "\\n").replace("\t", "\\t")
-                + '"',
-                json_text,
-            )
-            return escaped_text
-        except Exception as e:
-            logger.warning(f"Control character escaping failed: {e}. Returning original text.")
-            return json_text
+        return {
+            "explanation": "\n\n".join(sections),
+            "reference_links": self._generate_mock_references(question.category, is_correct),
+        }
 
     def _generate_mock_explanation(
         self,
@@ -871,6 +2031,7 @@ class ExplainService:
             "problem_statement": problem_statement,
             "is_correct": explanation.is_correct,
             "created_at": explanation.created_at.isoformat(),
+            "updated_at": explanation.updated_at.isoformat() if explanation.updated_at else None,
             "is_fallback": explanation.is_fallback,
             "error_message": explanation.error_message,
         }
@@ -0,0 +1,322 @@
+"""
+Background explanation prefetch for newly saved and historical questions.
+
+REQ: REQ-B-B3-Explain-3
+
+Explanations used to be generated lazily, so the first user to finish a
+test paid the LLM latency for every question. Once questions are saved,
+both the correct and incorrect AnswerExplanation variants are generated in
+the background, so scoring-time lookups are cache hits.
+
+The same jobs upgrade fallback and draft rows (is_fallback=True) to LLM
+explanations in place (REQ-B-B3-Explain-7), so they never stay permanent.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import anyio.from_thread
+from sqlalchemy import case, distinct, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from src.backend.config import settings
+from src.backend.models.answer_explanation import AnswerExplanation
+from src.backend.models.question import Question
+from src.backend.services.explain_service import ExplainService
+
+logger = logging.getLogger(__name__)
+
+# Questions per prefetch job (one DB session + one cache query per batch)
+PREFETCH_BATCH_SIZE = 20
+
+# Cap of the per-question upgrade cooldown (EXPLANATION_UPGRADE_RETRY_SECONDS doubles up to this)
+UPGRADE_RETRY_MAX_SECONDS = 600.0
+
+
+@dataclass
+class PrefetchStats:
+    """Prefetch counters (exposed via ExplanationPrefetcher.stats)."""
+
+    enqueued: int = 0
+    generated: int = 0
+    failed_jobs: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters as a dict."""
+        return {"enqueued": self.enqueued, "generated": self.generated, "failed_jobs": self.failed_jobs}
+
+
+class ExplanationPrefetcher:
+    """
+    Low-priority background generator of AnswerExplanation variants.
+
+    REQ: REQ-B-B3-Explain-3
+
+    Design principle:
+    - Opt-in: prefetch on question save runs only with EXPLANATION_PREFETCH_ENABLED
+      (default false), since it spends two LLM calls per saved question;
+      fallback/draft upgrades (REQ-B-B3-Explain-7) are always scheduled
+    - enqueue() is fire-and-forget: it schedules a task on the running event
+      loop and returns immediately, so question generation is never delayed;
+      from sync endpoints (AnyIO worker threads) it schedules on the server loop
+    - Low priority: all prefetch jobs share one semaphore sized by
+      EXPLANATION_PREFETCH_CONCURRENCY (default 2), independent of the
+      interactive EXPLANATION_MAX_CONCURRENCY budget
+    - Each job opens one SessionLocal for its batch (not one per question);
+      its queries run in worker threads (asyncio.to_thread), never on the loop
+    - Fallback (mock) results are never stored, so an LLM outage leaves the
+      keys to the lazy path instead of caching placeholder text
+    - schedule_upgrades() runs at most one upgrade per question at a time and
+      puts each attempted question on a cooldown (doubling per consecutive
+      attempt), so repeated reads of a fallback row during an LLM outage don't
+      start a new job per read
+
+    Attributes:
+        max_concurrency: Max concurrent LLM calls across all prefetch jobs
+        stats: Prefetch counters
+
+    """
+
+    def __init__(self, max_concurrency: int | None = None) -> None:
+        """
+        Initialize ExplanationPrefetcher.
+
+        Args:
+            max_concurrency: Max concurrent LLM calls (default: settings.EXPLANATION_PREFETCH_CONCURRENCY)
+
+        """
+        self.max_concurrency = max(max_concurrency or settings.EXPLANATION_PREFETCH_CONCURRENCY, 1)
+        self.stats = PrefetchStats()
+        self._tasks: set[asyncio.Task] = set()
+        self._semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+        # Upgrade tracking (event loop thread only): queued/in-flight ids and id → (attempts, retry_at)
+        self._upgrading: set[str] = set()
+        self._upgrade_backoff: dict[str, tuple[int, float]] = {}
+
+    def enqueue(self, question_ids: list[str], required: bool = False) -> asyncio.Task | None:
+        """
+        Schedule explanation prefetch (and fallback/draft upgrade) for saved questions.
+
+        Args:
+            question_ids: IDs of questions already committed to the database
+            required: Schedule even if EXPLANATION_PREFETCH_ENABLED is off
+                (upgrades of fallback/draft rows)
+
+        Returns:
+            The scheduled task, or None if prefetch is disabled or no loop is running
+
+        """
+        if not question_ids or not (required or settings.EXPLANATION_PREFETCH_ENABLED):
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Sync endpoint running in an AnyIO worker thread: schedule on the server's loop
+            try:
+                return anyio.from_thread.run_sync(self.enqueue, question_ids, required)
+            except RuntimeError:
+                logger.debug("No running event loop; skipping explanation prefetch")
+                return None
+
+        self.stats.enqueued += len(question_ids)
+        task = loop.create_task(self.prefetch(list(question_ids)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def schedule_upgrades(self, question_ids: list[str]) -> asyncio.Task | None:
+        """
+        Schedule an LLM upgrade of fallback/draft rows, deduplicated per question.
+
+        REQ: REQ-B-B3-Explain-7
+
+        Questions already queued or being upgraded are skipped. After each
+        attempt a question waits EXPLANATION_UPGRADE_RETRY_SECONDS, doubled per
+        consecutive attempt up to UPGRADE_RETRY_MAX_SECONDS, before it can be
+        scheduled again.
+
+        Args:
+            question_ids: IDs of questions with fallback/draft rows
+
+        Returns:
+            The scheduled task, or None if every question is queued or cooling down
+
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Sync endpoint running in an AnyIO worker thread: track and schedule on the server's loop
+            try:
+                return anyio.from_thread.run_sync(self.schedule_upgrades, question_ids)
+            except RuntimeError:
+                logger.debug("No running event loop; skipping explanation upgrade")
+                return None
+
+        now = time.monotonic()
+        self._prune_upgrade_backoff(now)
+        due = [
+            question_id
+            for question_id in dict.fromkeys(question_ids)
+            if question_id not in self._upgrading and self._upgrade_backoff.get(question_id, (0, now))[1] <= now
+        ]
+        task = self.enqueue(due, required=True)
+        if task is None:
+            return None
+
+        self._upgrading.update(due)
+        task.add_done_callback(lambda _: self._finish_upgrades(due))
+        return task
+
+    async def prefetch(self, question_ids: list[str]) -> int:
+        """
+        Generate missing explanation variants for questions, in batches.
+
+        Args:
+            question_ids: Question IDs to prefetch
+
+        Returns:
+            Number of explanations generated
+
+        """
+        from src.backend import database
+
+        generated = 0
+        for start in range(0, len(question_ids), PREFETCH_BATCH_SIZE):
+            batch = question_ids[start : start + PREFETCH_BATCH_SIZE]
+            db = database.SessionLocal()
+            try:
+                questions = await asyncio.to_thread(_load_questions, db, batch)
+                count = await ExplainService(db).aprefetch_explanations(questions, self._semaphore())
+                generated += count
+                self.stats.generated += count
+            except Exception:
+                self.stats.failed_jobs += 1
+                logger.exception(f"Explanation prefetch failed for {len(batch)} questions")
+                db.rollback()
+            finally:
+                db.close()
+        return generated
+
+    async def backfill(self, limit: int | None = None, batch_size: int = PREFETCH_BATCH_SIZE) -> int:
+        """
+        Prefetch explanations for historical questions missing a variant.
+
+        Questions are walked newest first with a (created_at, id) keyset, so
+        questions whose generation failed are not selected again.
+
+        Args:
+            limit: Max number of questions to process (None = all)
+            batch_size: Questions selected per round
+
+        Returns:
+            Number of explanations generated
+
+        """
+        from src.backend import database
+
+        generated = 0
+        processed = 0
+        after: tuple[datetime, str] | None = None
+        while limit is None or processed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - processed)
+            db = database.SessionLocal()
+            try:
+                rows = await asyncio.to_thread(find_questions_missing_explanations, db, size, after)
+            finally:
+                db.close()
+            if not rows:
+                break
+
+            after = rows[-1]
+            processed += len(rows)
+            generated += await self.prefetch([question_id for _, question_id in rows])
+            logger.info(f"Explanation backfill: {processed} questions processed, {generated} explanations generated")
+        return generated
+
+    async def wait(self) -> None:
+        """Wait for all scheduled prefetch tasks (e.g. on shutdown or in tests)."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def _finish_upgrades(self, question_ids: list[str]) -> None:
+        """Release finished upgrades and start their cooldown (upgraded rows are no longer scheduled)."""
+        now = time.monotonic()
+        for question_id in question_ids:
+            self._upgrading.discard(question_id)
+            attempts = self._upgrade_backoff.get(question_id, (0, now))[0] + 1
+            delay = min(settings.EXPLANATION_UPGRADE_RETRY_SECONDS * 2 ** (attempts - 1), UPGRADE_RETRY_MAX_SECONDS)
+            self._upgrade_backoff[question_id] = (attempts, now + delay)
+
+    def _prune_upgrade_backoff(self, now: float) -> None:
+        """Forget questions idle for longer than the max cooldown (their attempt count restarts)."""
+        expired = [
+            question_id
+            for question_id, (_, retry_at) in self._upgrade_backoff.items()
+            if retry_at + UPGRADE_RETRY_MAX_SECONDS <= now
+        ]
+        for question_id in expired:
+            del self._upgrade_backoff[question_id]
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Return the shared semaphore for the running loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            self._semaphores = {loop: asyncio.Semaphore(self.max_concurrency)}
+            semaphore = self._semaphores[loop]
+        return semaphore
+
+
+def _load_questions(db: Session, question_ids: list[str]) -> list[Question]:
+    """Load questions by id and detach them (the session's connection is released)."""
+    questions = db.query(Question).filter(Question.id.in_(question_ids)).all()
+    db.expunge_all()
+    db.rollback()
+    return questions
+
+
+def find_questions_missing_explanations(
+    db: Session,
+    limit: int,
+    after: tuple[datetime, str] | None = None,
+) -> list[tuple[datetime, str]]:
+    """
+    Find questions lacking a correct or incorrect LLM explanation variant.
+
+    Fallback/draft rows do not count, so backfill also upgrades them.
+
+    Args:
+        db: SQLAlchemy session
+        limit: Max number of questions
+        after: Keyset cursor (created_at, id) of the last question of the previous page
+
+    Returns:
+        (created_at, question_id) tuples, newest first
+
+    """
+    stmt = (
+        select(Question.created_at, Question.id)
+        .outerjoin(AnswerExplanation, AnswerExplanation.question_id == Question.id)
+        .group_by(Question.created_at, Question.id)
+        .having(
+            func.count(distinct(case((AnswerExplanation.is_fallback.is_(False), AnswerExplanation.is_correct)))) < 2
+        )
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(Question.created_at, Question.id) < after)
+    stmt = stmt.order_by(Question.created_at.desc(), Question.id.desc()).limit(limit)
+    return [(created_at, question_id) for created_at, question_id in db.execute(stmt).all()]
+
+
+# Process-wide prefetcher used by QuestionGenerationService
+_explanation_prefetcher = ExplanationPrefetcher()
+
+
+def get_explanation_prefetcher() -> ExplanationPrefetcher:
+    """Return the process-wide explanation prefetcher."""
+    return _explanation_prefetcher
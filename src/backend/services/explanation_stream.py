@@ -0,0 +1,95 @@
+"""
+Incremental extraction of the explanation text from a streamed LLM JSON response.
+
+REQ: REQ-B-B3-Explain-5
+"""
+
+import re
+
+# Opening of the explanation value: "explanation": "
+_EXPLANATION_KEY = re.compile(r'"explanation"\s*:\s*"')
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class ExplanationStreamParser:
+    """
+    Decode the "explanation" string of a JSON object as its chunks arrive.
+
+    REQ: REQ-B-B3-Explain-5
+
+    Design principle:
+    - The LLM answers with {"explanation": "...", "reference_links": [...]},
+      but only the explanation text is worth showing while streaming
+    - feed() returns the newly decoded explanation characters; escape
+      sequences split across chunks are held back until complete
+    - Text before the key (markdown fences, preamble) and after the closing
+      quote is ignored; the full response is still parsed and validated
+      once the stream ends
+
+    Attributes:
+        done: Whether the closing quote of the explanation was seen
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize ExplanationStreamParser."""
+        self._buffer = ""
+        self._pos = 0
+        self._in_value = False
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        """
+        Consume a chunk of raw LLM output.
+
+        Args:
+            chunk: Next piece of the raw response text
+
+        Returns:
+            Newly decoded explanation text (may be empty)
+
+        """
+        if self.done:
+            return ""
+
+        self._buffer += chunk
+        if not self._in_value:
+            match = _EXPLANATION_KEY.search(self._buffer, self._pos)
+            if match is None:
+                return ""
+            self._pos = match.end()
+            self._in_value = True
+
+        decoded: list[str] = []
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char == '"':
+                self.done = True
+                pos += 1
+                break
+            if char != "\\":
+                decoded.append(char)
+                pos += 1
+                continue
+
+            # Escape sequence: wait until it is complete
+            if pos + 1 >= len(buffer):
+                break
+            escape = buffer[pos + 1]
+            if escape == "u":
+                if pos + 6 > len(buffer):
+                    break
+                hex_digits = buffer[pos + 2 : pos + 6]
+                try:
+                    decoded.append(chr(int(hex_digits, 16)))
+                except ValueError:
+                    decoded.append(buffer[pos : pos + 6])
+                pos += 6
+            else:
+                decoded.append(_ESCAPES.get(escape, escape))
+                pos += 2
+
+        self._pos = pos
+        return "".join(decoded)
@@ -105,8 +105,9 @@ class HistoryService:
             .all()
         )
 
-        # Calculate final grade and rank using RankingService
+        # Calculate final grade and rank using RankingService (refresh first: this is a write path)
         ranking_service = RankingService(self.session)
+        ranking_service.refresh_user_score(user_id)
         grade_result = ranking_service.calculate_final_grade(user_id)
 
         # Create Attempt record
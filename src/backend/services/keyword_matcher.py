@@ -0,0 +1,225 @@
+"""
+Compiled short-answer keyword matcher shared by backend scoring and agent tools.
+
+REQ: REQ-B-B3-Score-2, REQ-A-Mode2-Tool6
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# Compiled matchers are cached per question id (LRU-bounded)
+MATCHER_CACHE_MAX_ENTRIES = 10_000
+
+_matcher_cache: "OrderedDict[str, KeywordMatcher]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+@dataclass
+class KeywordMatchResult:
+    """
+    Result of matching one answer against a question's keywords.
+
+    Attributes:
+        matched_keywords: Keywords found verbatim (case-insensitive) in the answer, in keyword order
+        total_credit: Sum of per-keyword credit (1.0 exact, words_matched/words partial)
+        exact_matches: Number of keywords found verbatim
+        total_keywords: Number of keywords in answer_schema (blank entries included)
+
+    """
+
+    matched_keywords: list[str]
+    total_credit: float
+    exact_matches: int
+    total_keywords: int
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern keyword matcher compiled once per question.
+
+    REQ: REQ-B-B3-Score-2, REQ-A-Mode2-Tool6
+
+    Design principle:
+    - Keywords are lowercased once and compiled into an Aho-Corasick automaton,
+      so every verbatim (substring) match is found in a single pass over the
+      answer, independent of the number of keywords
+    - Each keyword's words are precomputed for word-level partial credit,
+      checked against the answer's token set
+    - Scoring cost is linear in answer length (plus keyword word count for
+      keywords that did not match verbatim)
+
+    Attributes:
+        keywords: Original keywords (as given in answer_schema)
+
+    """
+
+    def __init__(self, keywords: list[Any]) -> None:
+        """
+        Compile keywords into the automaton.
+
+        Args:
+            keywords: answer_schema["keywords"] (non-strings are str()-ed, blanks skipped)
+
+        """
+        self.keywords: list[Any] = list(keywords)
+        self._normalized: list[str] = [str(keyword).lower().strip() for keyword in self.keywords]
+        self._keyword_words: list[list[str]] = [normalized.split() for normalized in self._normalized]
+
+        # Aho-Corasick trie: goto transitions, failure links, output keyword indices per state
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+
+        for index, normalized in enumerate(self._normalized):
+            if normalized:
+                self._insert(normalized, index)
+        self._build_failure_links()
+
+    def _insert(self, pattern: str, index: int) -> None:
+        """Add one lowercased keyword to the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(index)
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue: list[int] = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_exact(self, answer_lower: str) -> set[int]:
+        """
+        Return indices of keywords occurring verbatim in the (lowercased) answer.
+
+        Args:
+            answer_lower: Lowercased answer text
+
+        Returns:
+            Set of keyword indices found
+
+        """
+        found: set[int] = set()
+        state = 0
+        for char in answer_lower:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found.update(self._output[state])
+        return found
+
+    def match(self, answer_text: str) -> KeywordMatchResult:
+        """
+        Match an answer against the compiled keywords in a single pass.
+
+        Exact match: keyword appears in answer → 1.0 credit.
+        Partial match: some of the keyword's words appear as answer tokens →
+        words_matched / words_in_keyword credit.
+
+        Args:
+            answer_text: User's answer text
+
+        Returns:
+            KeywordMatchResult
+
+        """
+        answer_lower = answer_text.lower()
+        exact: set[int] = self.find_exact(answer_lower)
+        answer_words: set[str] | None = None
+
+        total_credit = 0.0
+        for index, words in enumerate(self._keyword_words):
+            if not words or index in exact:
+                continue
+            if answer_words is None:
+                answer_words = set(answer_lower.split())
+            matched_words = sum(1 for word in words if word in answer_words)
+            if matched_words:
+                total_credit += matched_words / len(words)
+
+        return KeywordMatchResult(
+            matched_keywords=[self.keywords[index] for index in sorted(exact)],
+            total_credit=total_credit + len(exact),
+            exact_matches=len(exact),
+            total_keywords=len(self.keywords),
+        )
+
+    def score(self, answer_text: str) -> tuple[bool, float]:
+        """
+        Score an answer (0-100) with partial credit.
+
+        is_correct is True only if every keyword matched verbatim.
+
+        Args:
+            answer_text: User's answer text
+
+        Returns:
+            Tuple of (is_correct: bool, score: float 0-100)
+
+        """
+        result = self.match(answer_text)
+        if result.total_keywords == 0:
+            return False, 0.0
+
+        score = result.total_credit / result.total_keywords * 100.0
+        return result.exact_matches == result.total_keywords, score
+
+
+def get_keyword_matcher(question_id: str | None, keywords: list[Any]) -> KeywordMatcher:
+    """
+    Return the compiled matcher for a question, compiling it on first use.
+
+    The cached matcher is reused only while the keywords are unchanged, so an
+    edited answer_schema is recompiled transparently.
+
+    Args:
+        question_id: Question ID used as cache key (None compiles without caching)
+        keywords: answer_schema["keywords"]
+
+    Returns:
+        KeywordMatcher for the keywords
+
+    """
+    if question_id is None:
+        return KeywordMatcher(keywords)
+
+    with _cache_lock:
+        matcher = _matcher_cache.get(question_id)
+        if matcher is not None and matcher.keywords == list(keywords):
+            _matcher_cache.move_to_end(question_id)
+            return matcher
+
+    matcher = KeywordMatcher(keywords)
+
+    with _cache_lock:
+        _matcher_cache[question_id] = matcher
+        _matcher_cache.move_to_end(question_id)
+        while len(_matcher_cache) > MATCHER_CACHE_MAX_ENTRIES:
+            _matcher_cache.popitem(last=False)
+
+    return matcher
+
+
+def clear_keyword_matcher_cache() -> None:
+    """Drop all compiled matchers (e.g. after bulk question edits)."""
+    with _cache_lock:
+        _matcher_cache.clear()
@@ -15,13 +15,18 @@ from uuid import uuid4
 
 from sqlalchemy.orm import Session
 
-from src.agent.llm_agent import GenerateQuestionsRequest, create_agent
+from src.agent.llm_agent import GeneratedItem, GenerateQuestionsRequest, create_agent
+from src.agent.pipeline.mode1_pipeline import Mode1Pipeline
+from src.backend.config import settings
 from src.backend.models.answer_schema import TransformerFactory, ValidationError
 from src.backend.models.question import Question
 from src.backend.models.test_result import TestResult
 from src.backend.models.test_session import TestSession
 from src.backend.models.user_profile import UserProfileSurvey
 from src.backend.services.adaptive_difficulty_service import AdaptiveDifficultyService
+from src.backend.services.explanation_prefetch import get_explanation_prefetcher
+from src.backend.services.question_inventory import QuestionInventoryService, get_inventory_refiller
+from src.backend.services.question_persistence import QUESTION_COLUMNS, QuestionPersistenceService
 
 logger = logging.getLogger(__name__)
 
@@ -250,7 +255,7 @@ class QuestionGenerationService:
         self.session = session
         self.transformer_factory = TransformerFactory()
 
-    def _normalize_answer_schema(self, raw_schema: dict[str, Any] | str | None, item_type: str) -> dict[str, Any]:
+    def normalize_answer_schema(self, raw_schema: dict[str, Any] | str | None, item_type: str) -> dict[str, Any]:
         """
         Normalize answer_schema from various formats to standard format.
 
@@ -354,7 +359,7 @@ class QuestionGenerationService:
         # Fallback
         return {"type": "exact_match", "keywords": None, "correct_answer": None}
 
-    def _validate_answer_schema_before_save(self, normalized_schema: dict[str, Any], item_type: str) -> None:
+    def validate_answer_schema_before_save(self, normalized_schema: dict[str, Any], item_type: str) -> None:
         r"""
         Validate answer_schema before saving to database (fail-fast pattern).
 
@@ -419,11 +424,18 @@ class QuestionGenerationService:
 
         Workflow:
         1. Validate survey exists and retrieve context
+           - Round 1 with QUESTION_INVENTORY_ENABLED: serve pre-generated stock in one
+             transaction and schedule bucket refills (REQ-B-B2-Gen-4); continue with
+             live generation only when stock runs dry
         2. Create TestSession with in_progress status
         3. Retrieve previous round answers (for adaptive difficulty)
         4. Call Real Agent (ItemGenAgent) via GenerateQuestionsRequest with automatic retry
-           - Max 3 attempts with exponential backoff (1s, 2s, 4s)
-           - Retries on: no tool results extracted, agent execution failure
+           - Max 3 attempts; the agent run is checkpointed per session (REQ-A-Mode1-Resume)
+           - Agent failure: backoff (1s, 2s, 4s), then resume from the last good step
+           - Fewer than question_count items: immediately top up only the missing
+             N-k questions in the same thread (Tool 1-3 and saved questions are kept)
+           - QUESTION_GEN_PIPELINE_MODE="parallel": deterministic Mode1Pipeline instead
+             of the ReAct loop (REQ-A-Mode1-Parallel)
         5. Save generated items to DB as Question records
         6. Return backwards-compatible dict response
 
@@ -447,7 +459,6 @@ class QuestionGenerationService:
         """
         # Auto-retry configuration
         max_retries = 3
-        retry_delays = [1, 2, 4]  # Exponential backoff in seconds
 
         try:
             # Step 1: Validate survey and get context
@@ -457,6 +468,12 @@ class QuestionGenerationService:
 
             logger.debug(f"✓ Survey found: interests={survey.interests}")
 
+            # Step 1b: Serve from pre-generated inventory (REQ-B-B2-Gen-4)
+            if round_num == 1 and settings.QUESTION_INVENTORY_ENABLED:
+                served = self._assign_from_inventory(user_id, survey, question_count, question_types, domain)
+                if served is not None:
+                    return served
+
             # Step 2: Create TestSession
             session_id = str(uuid4())
             test_session = TestSession(
@@ -484,68 +501,23 @@ class QuestionGenerationService:
                 prev_answers = self._get_previous_answers(user_id, round_num - 1)
                 logger.debug(f"✓ Previous answers retrieved: count={len(prev_answers) if prev_answers else 0}")
 
-            # Step 4: Call Real Agent with automatic retry
-            agent_response = None
-            last_error = None
-
-            for attempt in range(max_retries):
-                try:
-                    logger.debug(f"Question generation attempt {attempt + 1}/{max_retries}")
-
-                    agent = await create_agent()
-                    logger.debug("✓ Agent created successfully")
-
-                    agent_request = GenerateQuestionsRequest(
-                        session_id=session_id,
-                        survey_id=survey_id,
-                        round_idx=round_num,
-                        prev_answers=prev_answers,
-                        question_count=question_count,
-                        question_types=question_types,
-                        domain=domain,
-                    )
-                    logger.debug(f"✓ GenerateQuestionsRequest created: session_id={session_id}, count={question_count}")
-
-                    agent_response = await agent.generate_questions(agent_request)
-                    logger.debug(
-                        f"Agent response received: {len(agent_response.items)} items, tokens={agent_response.total_tokens}"
-                    )
-
-                    # Check if agent generated any questions
-                    if agent_response.items:
-                        logger.debug(
-                            f"✓ Agent generated {len(agent_response.items)} questions on attempt {attempt + 1}"
-                        )
-                        break  # Success, exit retry loop
-                    else:
-                        # No tool results extracted, retry
-                        last_error = f"No tool results extracted (attempt {attempt + 1}/{max_retries})"
-                        if attempt < max_retries - 1:
-                            logger.warning(
-                                f"⚠️  Attempt {attempt + 1}: No results. Retrying in {retry_delays[attempt]}s..."
-                            )
-                            await asyncio.sleep(retry_delays[attempt])
-                            continue
-                        else:
-                            logger.error(f"❌ Final attempt {attempt + 1}: No results after {max_retries} attempts")
-                            raise Exception(last_error)
+            # Step 4 (parallel mode): deterministic pipeline, no ReAct loop
+            if settings.QUESTION_GEN_PIPELINE_MODE == "parallel":
+                return await self._generate_with_parallel_pipeline(
+                    user_id, survey, session_id, round_num, question_count, question_types, domain
+                )
 
-                except Exception as e:
-                    last_error = str(e)
-                    if attempt == max_retries - 1:
-                        logger.error(f"❌ Final attempt {attempt + 1} failed: {e}")
-                        raise
-                    logger.warning(f"⚠️  Attempt {attempt + 1} failed: {e}. Retrying in {retry_delays[attempt]}s...")
-                    await asyncio.sleep(retry_delays[attempt])
+            # Step 4: Call Real Agent with automatic retry (resume / top-up, REQ-A-Mode1-Resume)
+            items_by_id, attempt, total_tokens = await self._run_agent_with_resume(
+                session_id, survey_id, round_num, prev_answers, question_count, question_types, domain, max_retries
+            )
 
-            # Step 5: Save generated items to DB
+            # Step 5: Save generated items to DB (one multi-row upsert, REQ-B-B2-Gen-5)
             questions_list = []
-            if agent_response and agent_response.items:
+            if items_by_id:
                 # Limit items to requested question_count (safety filter)
-                items_to_save = agent_response.items[:question_count]
-                logger.debug(
-                    f"Agent returned {len(agent_response.items)} items, limiting to {question_count} as requested"
-                )
+                items_to_save = list(items_by_id.values())[:question_count]
+                logger.debug(f"Agent returned {len(items_by_id)} items, limiting to {question_count} as requested")
                 for item in items_to_save:
                     # Handle both Pydantic model and dict for answer_schema
                     answer_schema_value = (
@@ -555,51 +527,39 @@ class QuestionGenerationService:
                     )
                     # Normalize answer_schema to standard format (fixes agent response format)
                     # Type: answer_schema_value is dict[str, Any] after model_dump() call
-                    normalized_schema = self._normalize_answer_schema(
+                    normalized_schema = self.normalize_answer_schema(
                         answer_schema_value,  # type: ignore[arg-type]
                         item.type,
                     )
 
                     # Validate answer_schema before saving (fail-fast pattern)
-                    self._validate_answer_schema_before_save(normalized_schema, item.type)
-
-                    question = Question(
-                        id=item.id,
-                        session_id=session_id,
-                        item_type=item.type,
-                        stem=item.stem,
-                        choices=item.choices,
-                        answer_schema=normalized_schema,
-                        difficulty=item.difficulty,
-                        category=item.category,
-                        round=round_num,
+                    self.validate_answer_schema_before_save(normalized_schema, item.type)
+
+                    questions_list.append(
+                        Question(
+                            id=item.id,
+                            session_id=session_id,
+                            item_type=item.type,
+                            stem=item.stem,
+                            choices=item.choices,
+                            answer_schema=normalized_schema,
+                            difficulty=item.difficulty,
+                            category=item.category,
+                            round=round_num,
+                        )
                     )
-                    self.session.add(question)
-                    questions_list.append(question)
-                    logger.debug(f"Saved question: id={item.id}, type={item.type}")
 
-                self.session.commit()
+                # upsert: Tool 5 may already have inserted these ids during the agent run
+                QuestionPersistenceService(self.session).save_questions_bulk(
+                    [self._question_row(question) for question in questions_list], upsert=True
+                )
+                get_explanation_prefetcher().enqueue([q.id for q in questions_list])
 
             # Step 6: Format and return response (backwards compatible dict format)
-            response = {
-                "session_id": session_id,
-                "questions": [
-                    {
-                        "id": q.id,
-                        "item_type": q.item_type,
-                        "stem": q.stem,
-                        "choices": q.choices,
-                        "answer_schema": q.answer_schema,
-                        "difficulty": q.difficulty,
-                        "category": q.category,
-                    }
-                    for q in questions_list
-                ],
-                "attempt": attempt + 1,  # Include attempt count in response
-            }
+            response = self._format_generation_response(session_id, questions_list, attempt + 1)
             logger.info(
                 f"✅ Generated {len(questions_list)} questions "
-                f"(tokens: {agent_response.total_tokens if agent_response else 0}, attempt: {attempt + 1}/{max_retries})"
+                f"(tokens: {total_tokens}, attempt: {attempt + 1}/{max_retries})"
             )
             return response
 
@@ -613,6 +573,258 @@ class QuestionGenerationService:
                 "attempt": max_retries,
             }
 
+    async def _run_agent_with_resume(
+        self,
+        session_id: str,
+        survey_id: str,
+        round_num: int,
+        prev_answers: list[dict] | None,
+        question_count: int,
+        question_types: list[str] | None,
+        domain: str,
+        max_retries: int,
+    ) -> tuple[dict[str, GeneratedItem], int, int]:
+        """
+        Run the ReAct agent until question_count items exist, resuming instead of restarting.
+
+        REQ: REQ-A-Mode1-Resume
+
+        The agent checkpoints every step of the session's thread. A retry after a
+        failure resumes from the last checkpoint (after backoff); a run that saved
+        only k of N questions is topped up right away with a request for N-k more.
+        Items are collected by id, so questions already saved are never redone.
+
+        Args:
+            session_id: TestSession ID (also the agent thread ID)
+            survey_id: Survey ID
+            round_num: Round number
+            prev_answers: Previous round answers (round 2+)
+            question_count: Number of questions requested
+            question_types: Requested item types
+            domain: Question domain/topic
+            max_retries: Maximum number of agent runs
+
+        Returns:
+            (items by id, index of the last attempt, total tokens)
+
+        Raises:
+            Exception: If no item was generated after max_retries attempts
+
+        """
+        retry_delays = [1, 2, 4]  # Backoff after failed runs, in seconds
+        items_by_id: dict[str, GeneratedItem] = {}
+        total_tokens = 0
+        last_error = None
+        agent = None
+        attempt = 0
+
+        try:
+            for attempt in range(max_retries):
+                missing = question_count - len(items_by_id)
+                logger.debug(f"Question generation attempt {attempt + 1}/{max_retries} (missing {missing})")
+                try:
+                    agent = await create_agent()
+                    agent_request = GenerateQuestionsRequest(
+                        session_id=session_id,
+                        survey_id=survey_id,
+                        round_idx=round_num,
+                        prev_answers=prev_answers,
+                        question_count=missing,
+                        question_types=question_types,
+                        domain=domain,
+                        resume=attempt > 0,
+                    )
+                    agent_response = await agent.generate_questions(agent_request)
+                    total_tokens += agent_response.total_tokens
+                    for item in agent_response.items:
+                        items_by_id.setdefault(item.id, item)
+                    logger.debug(
+                        f"Agent response received: {len(agent_response.items)} items, "
+                        f"{len(items_by_id)}/{question_count} collected"
+                    )
+                    if len(items_by_id) >= question_count:
+                        break
+                    last_error = agent_response.error_message or (
+                        f"No tool results extracted (attempt {attempt + 1}/{max_retries})"
+                    )
+                    if not agent_response.error_message:
+                        # Run finished short: top up the missing questions right away
+                        logger.warning(f"⚠️  Attempt {attempt + 1}: {len(items_by_id)}/{question_count} questions")
+                        continue
+                except Exception as e:
+                    last_error = str(e)
+                    if attempt == max_retries - 1 and not items_by_id:
+                        logger.error(f"❌ Final attempt {attempt + 1} failed: {e}")
+                        raise
+
+                if attempt < max_retries - 1:
+                    logger.warning(
+                        f"⚠️  Attempt {attempt + 1} failed: {last_error}. Resuming in {retry_delays[attempt]}s..."
+                    )
+                    await asyncio.sleep(retry_delays[attempt])
+        finally:
+            if agent is not None:
+                try:
+                    await agent.discard_checkpoint(session_id)
+                except Exception as e:
+                    logger.debug(f"Agent checkpoint cleanup skipped: {e}")
+
+        if not items_by_id:
+            logger.error(f"❌ Final attempt {attempt + 1}: No results after {max_retries} attempts")
+            raise Exception(last_error)
+        return items_by_id, attempt, total_tokens
+
+    async def _generate_with_parallel_pipeline(
+        self,
+        user_id: int,
+        survey: UserProfileSurvey,
+        session_id: str,
+        round_num: int,
+        question_count: int,
+        question_types: list[str] | None,
+        domain: str,
+    ) -> dict[str, Any]:
+        """
+        Generate and save questions with the deterministic parallel Mode1Pipeline.
+
+        REQ: REQ-A-Mode1-Parallel
+
+        The pipeline saves the validated questions itself (one transaction); their
+        answer_schema is then normalized and validated like the ReAct path before
+        responding. If any schema fails validation the saved round is deleted, so
+        no unvalidated questions stay in the session.
+
+        Args:
+            user_id: User ID
+            survey: Validated survey (its self_level/interests let Tools 1-3 start together)
+            session_id: Created TestSession ID
+            round_num: Round number
+            question_count: Number of questions
+            question_types: Requested item types (None = all)
+            domain: Question domain/topic
+
+        Returns:
+            Response dict (same format as the ReAct path, attempt=1)
+
+        Raises:
+            Exception: If the pipeline saved no questions
+            ValueError: If a saved question's answer_schema is invalid (the round is deleted)
+
+        """
+        previous_score = None
+        if round_num > 1:
+            previous = (
+                self.session.query(TestResult)
+                .join(TestSession, TestSession.id == TestResult.session_id)
+                .filter(TestSession.user_id == user_id, TestResult.round == round_num - 1)
+                .order_by(TestResult.created_at.desc())
+                .first()
+            )
+            previous_score = int(previous.score) if previous else None
+
+        result = await Mode1Pipeline(session_id=session_id).agenerate_questions(
+            str(user_id),
+            round_num,
+            count=question_count,
+            previous_score=previous_score,
+            profile_hint={
+                "self_level": survey.self_level,
+                "interests": survey.interests,
+                "years_experience": survey.years_experience,
+                "job_role": survey.job_role,
+                "duty": survey.duty,
+            },
+            question_types=question_types,
+            domain=domain,
+        )
+        question_ids = [q["question_id"] for q in result["questions"]]
+        if not question_ids:
+            raise Exception(f"Parallel pipeline generated no valid questions ({result['total_attempted']} attempted)")
+
+        rows = {q.id: q for q in self.session.query(Question).filter(Question.id.in_(question_ids))}
+        questions_list = [rows[question_id] for question_id in question_ids if question_id in rows]
+        try:
+            for question in questions_list:
+                normalized_schema = self.normalize_answer_schema(question.answer_schema, question.item_type)
+                self.validate_answer_schema_before_save(normalized_schema, question.item_type)
+                question.answer_schema = normalized_schema
+            self.session.commit()
+        except ValueError:
+            # The pipeline already committed the round; don't leave unvalidated rows behind
+            self.session.rollback()
+            self.session.query(Question).filter(Question.id.in_(question_ids)).delete(synchronize_session=False)
+            self.session.commit()
+            raise
+        get_explanation_prefetcher().enqueue(question_ids)
+
+        logger.info(f"✅ Generated {len(questions_list)} questions (parallel pipeline, {result['status']})")
+        return self._format_generation_response(session_id, questions_list, 1)
+
+    @staticmethod
+    def _question_row(question: Question) -> dict[str, Any]:
+        """Column values of an unsaved Question for QuestionPersistenceService."""
+        return {column: getattr(question, column) for column in QUESTION_COLUMNS}
+
+    @staticmethod
+    def _format_generation_response(session_id: str, questions: list[Question], attempt: int) -> dict[str, Any]:
+        """Build the backwards compatible generate_questions response dict."""
+        return {
+            "session_id": session_id,
+            "questions": [
+                {
+                    "id": q.id,
+                    "item_type": q.item_type,
+                    "stem": q.stem,
+                    "choices": q.choices,
+                    "answer_schema": q.answer_schema,
+                    "difficulty": q.difficulty,
+                    "category": q.category,
+                }
+                for q in questions
+            ],
+            "attempt": attempt,  # Include attempt count in response
+        }
+
+    def _assign_from_inventory(
+        self,
+        user_id: int,
+        survey: UserProfileSurvey,
+        question_count: int,
+        question_types: list[str] | None,
+        domain: str,
+    ) -> dict[str, Any] | None:
+        """
+        Serve a round-1 session from the question inventory and schedule refills.
+
+        REQ: REQ-B-B2-Gen-4
+
+        Args:
+            user_id: User ID
+            survey: Validated survey
+            question_count: Number of questions
+            question_types: Requested item types (None = all)
+            domain: Question domain/topic
+
+        Returns:
+            Response dict (same format as live generation), or None to generate live
+
+        """
+        try:
+            served = QuestionInventoryService(self.session).assign_session(
+                user_id, survey, question_count, question_types, domain
+            )
+        except Exception as e:
+            logger.warning(f"Inventory assignment failed, generating live: {e}")
+            self.session.rollback()
+            served = None
+
+        refiller = get_inventory_refiller()
+        refiller.record_assignment(served)
+        refiller.enqueue(self.session, survey, domain, question_types)
+        if served is not None:
+            get_explanation_prefetcher().enqueue([q["id"] for q in served["questions"]])
+        return served
+
     def _get_previous_answers(self, user_id: int, round_num: int) -> list[dict[str, Any]] | None:
         """
         Retrieve previous round answers for adaptive difficulty.
@@ -772,7 +984,14 @@ class QuestionGenerationService:
         )
         logger.debug(f"✓ Created adaptive GenerateQuestionsRequest for {domain}, count={question_count}")
 
-        agent_response = await agent.generate_questions(agent_request)
+        try:
+            agent_response = await agent.generate_questions(agent_request)
+        finally:
+            # Single-shot run: drop its InMemorySaver checkpoint (pooled agents outlive the request)
+            try:
+                await agent.discard_checkpoint(new_session_id)
+            except Exception as e:
+                logger.debug(f"Agent checkpoint cleanup skipped: {e}")
         logger.debug(f"Agent response: {len(agent_response.items) if agent_response.items else 0} items")
 
         # Save generated items to DB
@@ -785,22 +1004,25 @@ class QuestionGenerationService:
                     item.answer_schema.model_dump() if hasattr(item.answer_schema, "model_dump") else item.answer_schema
                 )
 
-                question = Question(
-                    id=str(uuid4()),
-                    session_id=new_session_id,
-                    item_type=item.type,
-                    stem=item.stem,
-                    choices=item.choices,
-                    answer_schema=answer_schema_value,
-                    difficulty=item.difficulty,
-                    category=item.category,
-                    round=round_num,
+                questions_list.append(
+                    Question(
+                        id=str(uuid4()),
+                        session_id=new_session_id,
+                        item_type=item.type,
+                        stem=item.stem,
+                        choices=item.choices,
+                        answer_schema=answer_schema_value,
+                        difficulty=item.difficulty,
+                        category=item.category,
+                        round=round_num,
+                    )
                 )
-                self.session.add(question)
-                questions_list.append(question)
 
-        self.session.commit()
+        QuestionPersistenceService(self.session).save_questions_bulk(
+            [self._question_row(question) for question in questions_list]
+        )
         logger.debug(f"✓ Saved {len(questions_list)} adaptive questions to DB")
+        get_explanation_prefetcher().enqueue([q.id for q in questions_list])
 
         # Format response (backward compatible with existing clients)
         return {
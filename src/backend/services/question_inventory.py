@@ -0,0 +1,585 @@
+"""
+Pre-generated question inventory served instantly by question generation.
+
+REQ: REQ-B-B2-Gen-4
+
+Every round-1 generation used to run the full ReAct tool loop, so users
+waited for several LLM round-trips before their first question. Background
+refill jobs keep a stock of validated questions per (domain, difficulty band,
+item_type, category), produced through the regular Item-Gen-Agent path
+(Tool 1~5) and stored without a session. QuestionGenerationService assigns
+stock to a new TestSession in one transaction and only falls back to live
+generation when the stock runs dry.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import anyio.from_thread
+from sqlalchemy import Select, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.agent.llm_agent import GeneratedItem, GenerateQuestionsRequest, create_agent
+from src.backend.config import settings
+from src.backend.models.question import Question
+from src.backend.models.question_inventory import InventoryQuestion
+from src.backend.models.test_session import TestSession
+from src.backend.models.user import User
+from src.backend.models.user_profile import UserProfileSurvey
+
+if TYPE_CHECKING:
+    from src.backend.services.question_gen_service import QuestionGenerationService
+
+logger = logging.getLogger(__name__)
+
+ITEM_TYPES = ("multiple_choice", "true_false", "short_answer")
+
+# Difficulty bands follow the self_level → difficulty guide of the generation prompt
+DIFFICULTY_BANDS = {"low": (1, 4), "mid": (5, 6), "high": (7, 10)}
+LEVEL_BANDS = {
+    "Beginner": "low",
+    "Intermediate": "low",
+    "Inter-Advanced": "mid",
+    "Advanced": "high",
+    "Elite": "high",
+}
+DEFAULT_BAND = "mid"
+
+# GenerateQuestionsRequest accepts at most 20 questions per agent run
+MAX_REFILL_BATCH = 20
+
+# System user owning the staging sessions refills generate into (never a real user's history)
+INVENTORY_OWNER_KNOX_ID = "system:question-inventory"
+
+# Staging sessions older than this were left behind by an interrupted refill
+STAGING_SESSION_TTL = timedelta(hours=1)
+
+
+def difficulty_band(difficulty: int) -> str:
+    """
+    Map a difficulty (1~10) to its inventory band.
+
+    Args:
+        difficulty: Question difficulty
+
+    Returns:
+        Band name (low, mid, high)
+
+    """
+    for band, (low, high) in DIFFICULTY_BANDS.items():
+        if low <= difficulty <= high:
+            return band
+    return "high" if difficulty > 10 else "low"
+
+
+def survey_band(survey: UserProfileSurvey) -> str:
+    """Return the difficulty band requested by a survey's self_level."""
+    return LEVEL_BANDS.get(survey.self_level or "", DEFAULT_BAND)
+
+
+def inventory_owner_id(db: Session) -> int:
+    """
+    Return the system user owning refill staging sessions, creating it on first use.
+
+    Args:
+        db: SQLAlchemy session (committed when the user is created)
+
+    Returns:
+        User ID of the inventory system user
+
+    """
+    owner_query = select(User.id).where(User.knox_id == INVENTORY_OWNER_KNOX_ID)
+    owner_id = db.scalar(owner_query)
+    if owner_id is not None:
+        return owner_id
+
+    owner = User(
+        knox_id=INVENTORY_OWNER_KNOX_ID,
+        name="Question Inventory",
+        dept="system",
+        business_unit="system",
+        email="question-inventory@system.local",
+    )
+    db.add(owner)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Created by a concurrent refill
+        db.rollback()
+        return db.scalar(owner_query)
+    return owner.id
+
+
+def purge_stale_staging_sessions(db: Session, owner_id: int) -> int:
+    """
+    Delete staging sessions (and their questions) left behind by interrupted refills.
+
+    Args:
+        db: SQLAlchemy session (committed)
+        owner_id: Inventory system user ID
+
+    Returns:
+        Number of staging sessions deleted
+
+    """
+    cutoff = datetime.now(UTC) - STAGING_SESSION_TTL
+    stale_ids = list(
+        db.scalars(select(TestSession.id).where(TestSession.user_id == owner_id, TestSession.created_at < cutoff))
+    )
+    if not stale_ids:
+        return 0
+    db.query(Question).filter(Question.session_id.in_(stale_ids)).delete(synchronize_session=False)
+    db.query(TestSession).filter(TestSession.id.in_(stale_ids)).delete(synchronize_session=False)
+    db.commit()
+    logger.info(f"Purged {len(stale_ids)} stale inventory staging sessions")
+    return len(stale_ids)
+
+
+@dataclass
+class InventoryStats:
+    """Inventory counters (exposed via QuestionInventoryRefiller.stats)."""
+
+    served_sessions: int = 0
+    served_questions: int = 0
+    misses: int = 0
+    refills: int = 0
+    stocked: int = 0
+    failed_refills: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters as a dict."""
+        return {
+            "served_sessions": self.served_sessions,
+            "served_questions": self.served_questions,
+            "misses": self.misses,
+            "refills": self.refills,
+            "stocked": self.stocked,
+            "failed_refills": self.failed_refills,
+        }
+
+
+class QuestionInventoryService:
+    """
+    Stock, count and assign pre-generated questions.
+
+    REQ: REQ-B-B2-Gen-4
+
+    Design principle:
+    - A request draws from the buckets matching its domain, the survey's
+      difficulty band, the requested item types and (if any) the survey's
+      interests as categories
+    - assign_session() is all-or-nothing: the TestSession, its Question rows
+      and the removal of the consumed stock are committed together, and
+      nothing is written when the stock cannot cover the whole request
+    - Stock rows are locked with SKIP LOCKED, so concurrent assignments on
+      PostgreSQL never hand out the same question twice
+
+    """
+
+    def __init__(self, session: Session) -> None:
+        """
+        Initialize QuestionInventoryService.
+
+        Args:
+            session: SQLAlchemy database session
+
+        """
+        self.session = session
+
+    def assign_session(
+        self,
+        user_id: int,
+        survey: UserProfileSurvey,
+        question_count: int,
+        question_types: list[str] | None = None,
+        domain: str = "AI",
+    ) -> dict[str, Any] | None:
+        """
+        Create a round-1 TestSession served entirely from stock.
+
+        Requested item types are interleaved (oldest stock first per type),
+        so a mixed request gets a mix of types like a live generation.
+
+        Args:
+            user_id: User ID
+            survey: Survey the session is created for
+            question_count: Number of questions
+            question_types: Requested item types (None = all)
+            domain: Question domain/topic
+
+        Returns:
+            Response dict in the generate_questions format, or None if stock is insufficient
+
+        """
+        band = survey_band(survey)
+        candidates: list[list[InventoryQuestion]] = []
+        for item_type in question_types or ITEM_TYPES:
+            stmt = (
+                self._bucket_query(select(InventoryQuestion), domain, band, item_type, survey.interests)
+                .order_by(InventoryQuestion.created_at, InventoryQuestion.id)
+                .limit(question_count)
+                .with_for_update(skip_locked=True)
+            )
+            candidates.append(list(self.session.scalars(stmt)))
+
+        stock = [row for group in zip_longest(*candidates) for row in group if row is not None][:question_count]
+        if len(stock) < question_count:
+            self.session.rollback()  # release row locks
+            logger.debug(f"Inventory miss: {len(stock)}/{question_count} in stock (domain={domain}, band={band})")
+            return None
+
+        session_id = str(uuid4())
+        self.session.add(
+            TestSession(id=session_id, user_id=user_id, survey_id=survey.id, round=1, status="in_progress")
+        )
+        questions = [
+            Question(
+                id=str(uuid4()),
+                session_id=session_id,
+                item_type=row.item_type,
+                stem=row.stem,
+                choices=row.choices,
+                answer_schema=row.answer_schema,
+                difficulty=row.difficulty,
+                category=row.category,
+                round=1,
+            )
+            for row in stock
+        ]
+        self.session.add_all(questions)
+        for row in stock:
+            self.session.delete(row)
+        self.session.commit()
+
+        logger.info(f"✅ Served {len(questions)} questions from inventory (session_id={session_id})")
+        return {
+            "session_id": session_id,
+            "questions": [
+                {
+                    "id": q.id,
+                    "item_type": q.item_type,
+                    "stem": q.stem,
+                    "choices": q.choices,
+                    "answer_schema": q.answer_schema,
+                    "difficulty": q.difficulty,
+                    "category": q.category,
+                }
+                for q in questions
+            ],
+            "attempt": 0,  # no agent run
+        }
+
+    def stock_items(self, domain: str, items: list[dict[str, Any]]) -> int:
+        """
+        Add validated questions to the inventory.
+
+        Args:
+            domain: Domain the questions were generated for
+            items: Dicts with item_type, stem, choices, answer_schema (normalized), difficulty, category
+
+        Returns:
+            Number of questions stocked
+
+        """
+        self.session.add_all(
+            InventoryQuestion(
+                domain=domain,
+                difficulty_band=difficulty_band(item["difficulty"]),
+                item_type=item["item_type"],
+                category=item["category"],
+                stem=item["stem"],
+                choices=item.get("choices"),
+                answer_schema=item["answer_schema"],
+                difficulty=item["difficulty"],
+            )
+            for item in items
+        )
+        self.session.commit()
+        return len(items)
+
+    def count_stock(
+        self,
+        domain: str,
+        band: str,
+        item_type: str,
+        categories: list[str] | None = None,
+    ) -> int:
+        """
+        Count the stock a request could draw for one item type.
+
+        Args:
+            domain: Question domain/topic
+            band: Difficulty band
+            item_type: Item type
+            categories: Allowed categories (None/empty = any)
+
+        Returns:
+            Number of questions in stock
+
+        """
+        stmt = self._bucket_query(select(func.count(InventoryQuestion.id)), domain, band, item_type, categories)
+        return self.session.scalar(stmt) or 0
+
+    def stock_levels(self) -> list[dict[str, Any]]:
+        """
+        Return the stock of every non-empty bucket (metrics).
+
+        Returns:
+            List of {domain, difficulty_band, item_type, category, stock}, ordered by bucket
+
+        """
+        bucket = (
+            InventoryQuestion.domain,
+            InventoryQuestion.difficulty_band,
+            InventoryQuestion.item_type,
+            InventoryQuestion.category,
+        )
+        stmt = select(*bucket, func.count(InventoryQuestion.id)).group_by(*bucket).order_by(*bucket)
+        return [
+            {"domain": domain, "difficulty_band": band, "item_type": item_type, "category": category, "stock": stock}
+            for domain, band, item_type, category, stock in self.session.execute(stmt).all()
+        ]
+
+    @staticmethod
+    def _bucket_query(stmt: Select, domain: str, band: str, item_type: str, categories: list[str] | None) -> Select:
+        """Restrict a select to the buckets a request can draw from."""
+        stmt = stmt.where(
+            InventoryQuestion.domain == domain,
+            InventoryQuestion.difficulty_band == band,
+            InventoryQuestion.item_type == item_type,
+        )
+        if categories:
+            stmt = stmt.where(InventoryQuestion.category.in_(categories))
+        return stmt
+
+
+class QuestionInventoryRefiller:
+    """
+    Background producer keeping inventory buckets above the refill threshold.
+
+    REQ: REQ-B-B2-Gen-4
+
+    Design principle:
+    - enqueue() is fire-and-forget and called on every inventory-enabled
+      generation (hit or miss): each requested item type whose stock is below
+      QUESTION_INVENTORY_REFILL_THRESHOLD is topped up to
+      QUESTION_INVENTORY_TARGET_STOCK
+    - Questions are produced by the regular agent run (Tool 1~5) for the
+      requesting survey into a staging TestSession owned by a system user, so
+      it never shows up in the user's session history; the validated items are
+      moved into the inventory and the staging session is deleted. Staging
+      sessions left by an interrupted refill are purged by the next refill
+    - At most one refill per (domain, band, item_type) is in flight, and all
+      jobs share one semaphore (QUESTION_INVENTORY_REFILL_CONCURRENCY)
+
+    Attributes:
+        max_concurrency: Max concurrent agent runs across all refill jobs
+        stats: Inventory counters
+
+    """
+
+    def __init__(self, max_concurrency: int | None = None) -> None:
+        """
+        Initialize QuestionInventoryRefiller.
+
+        Args:
+            max_concurrency: Max concurrent agent runs (default: settings.QUESTION_INVENTORY_REFILL_CONCURRENCY)
+
+        """
+        self.max_concurrency = max(max_concurrency or settings.QUESTION_INVENTORY_REFILL_CONCURRENCY, 1)
+        self.stats = InventoryStats()
+        self._tasks: set[asyncio.Task] = set()
+        self._inflight: set[tuple[str, str, str]] = set()
+        self._semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def enqueue(
+        self,
+        db: Session,
+        survey: UserProfileSurvey,
+        domain: str = "AI",
+        question_types: list[str] | None = None,
+    ) -> list[asyncio.Task]:
+        """
+        Schedule refills for the request's buckets that fell below the threshold.
+
+        Args:
+            db: Session used to count the current stock
+            survey: Survey whose profile drives the agent run
+            domain: Question domain/topic
+            question_types: Requested item types (None = all)
+
+        Returns:
+            Scheduled tasks (empty if the inventory is disabled or stock is sufficient)
+
+        """
+        if not settings.QUESTION_INVENTORY_ENABLED:
+            return []
+
+        inventory = QuestionInventoryService(db)
+        band = survey_band(survey)
+        refills = []
+        for item_type in question_types or ITEM_TYPES:
+            key = (domain, band, item_type)
+            if key in self._inflight:
+                continue
+            stock = inventory.count_stock(domain, band, item_type, survey.interests)
+            if stock < settings.QUESTION_INVENTORY_REFILL_THRESHOLD:
+                count = min(settings.QUESTION_INVENTORY_TARGET_STOCK - stock, MAX_REFILL_BATCH)
+                refills.append((key, max(count, 1)))
+        if not refills:
+            return []
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Sync caller in an AnyIO worker thread: schedule on the server's loop
+            try:
+                return anyio.from_thread.run_sync(self._schedule, survey.id, refills)
+            except RuntimeError:
+                logger.debug("No running event loop; skipping inventory refill")
+                return []
+        return self._schedule(survey.id, refills, loop)
+
+    async def refill(self, survey_id: str, domain: str, item_type: str, count: int) -> int:
+        """
+        Generate questions through the agent and move them into the inventory.
+
+        Args:
+            survey_id: Survey whose profile drives Tool 1 (user profile)
+            domain: Question domain/topic
+            item_type: Item type to generate
+            count: Number of questions to request
+
+        Returns:
+            Number of questions stocked
+
+        """
+        from src.backend import database
+        from src.backend.services.question_gen_service import QuestionGenerationService
+
+        db = database.SessionLocal()
+        staging_id = str(uuid4())
+        agent = None
+        try:
+            survey = db.get(UserProfileSurvey, survey_id)
+            if survey is None:
+                raise ValueError(f"Survey {survey_id} not found")
+            owner_id = inventory_owner_id(db)
+            purge_stale_staging_sessions(db, owner_id)
+            db.add(TestSession(id=staging_id, user_id=owner_id, survey_id=survey_id, round=1, status="paused"))
+            db.commit()
+
+            async with self._semaphore():
+                agent = await create_agent()
+                response = await agent.generate_questions(
+                    GenerateQuestionsRequest(
+                        session_id=staging_id,
+                        survey_id=survey_id,
+                        round_idx=1,
+                        question_count=count,
+                        question_types=[item_type],
+                        domain=domain,
+                    )
+                )
+
+            generator = QuestionGenerationService(db)
+            items = [
+                item
+                for item in (self._to_stock_item(generator, generated) for generated in response.items[:count])
+                if item is not None
+            ]
+            stocked = QuestionInventoryService(db).stock_items(domain, items)
+            self.stats.refills += 1
+            self.stats.stocked += stocked
+            logger.info(f"Inventory refill stocked {stocked}/{count} questions (domain={domain}, type={item_type})")
+            return stocked
+        except Exception:
+            self.stats.failed_refills += 1
+            logger.exception(f"Inventory refill failed (domain={domain}, type={item_type})")
+            db.rollback()
+            return 0
+        finally:
+            if agent is not None:
+                try:
+                    await agent.discard_checkpoint(staging_id)
+                except Exception as e:
+                    logger.debug(f"Agent checkpoint cleanup skipped: {e}")
+            # Detach the produced questions: drop the staging session and what Tool 5 saved into it
+            db.query(Question).filter(Question.session_id == staging_id).delete(synchronize_session=False)
+            db.query(TestSession).filter(TestSession.id == staging_id).delete(synchronize_session=False)
+            db.commit()
+            db.close()
+
+    async def wait(self) -> None:
+        """Wait for all scheduled refill tasks (e.g. on shutdown or in tests)."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def record_assignment(self, served: dict[str, Any] | None) -> None:
+        """Count an inventory hit (served response) or miss (None)."""
+        if served is None:
+            self.stats.misses += 1
+        else:
+            self.stats.served_sessions += 1
+            self.stats.served_questions += len(served["questions"])
+
+    def _schedule(
+        self,
+        survey_id: str,
+        refills: list[tuple[tuple[str, str, str], int]],
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> list[asyncio.Task]:
+        """Create one refill task per bucket key on the running loop."""
+        loop = loop or asyncio.get_running_loop()
+        tasks = []
+        for key, count in refills:
+            domain, _, item_type = key
+            self._inflight.add(key)
+            task = loop.create_task(self.refill(survey_id, domain, item_type, count))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(lambda _, key=key: self._inflight.discard(key))
+            tasks.append(task)
+        return tasks
+
+    @staticmethod
+    def _to_stock_item(generator: "QuestionGenerationService", item: GeneratedItem) -> dict[str, Any] | None:
+        """Normalize and validate a generated item like the live save path; None if invalid."""
+        try:
+            schema = generator.normalize_answer_schema(item.answer_schema.model_dump(), item.type)
+            generator.validate_answer_schema_before_save(schema, item.type)
+        except ValueError as e:
+            logger.warning(f"Skipping invalid generated question for inventory: {e}")
+            return None
+        return {
+            "item_type": item.type,
+            "stem": item.stem,
+            "choices": item.choices,
+            "answer_schema": schema,
+            "difficulty": item.difficulty,
+            "category": item.category,
+        }
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Return the shared semaphore for the running loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            self._semaphores = {loop: asyncio.Semaphore(self.max_concurrency)}
+            semaphore = self._semaphores[loop]
+        return semaphore
+
+
+# Process-wide refiller used by QuestionGenerationService
+_inventory_refiller = QuestionInventoryRefiller()
+
+
+def get_inventory_refiller() -> QuestionInventoryRefiller:
+    """Return the process-wide question inventory refiller."""
+    return _inventory_refiller
@@ -0,0 +1,128 @@
+"""
+Bulk persistence of generated questions.
+
+REQ: REQ-B-B2-Gen-5
+"""
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.backend.models.question import Question
+
+logger = logging.getLogger(__name__)
+
+# Columns written per row (multi-row VALUES needs the same keys in every row)
+QUESTION_COLUMNS = (
+    "id",
+    "session_id",
+    "item_type",
+    "stem",
+    "choices",
+    "answer_schema",
+    "difficulty",
+    "category",
+    "round",
+    "created_at",
+)
+
+# Columns refreshed when an upserted id already exists
+_UPSERT_COLUMNS = ("session_id", "item_type", "stem", "choices", "answer_schema", "difficulty", "category", "round")
+
+# Dialects with INSERT ... ON CONFLICT support
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class QuestionPersistenceService:
+    """
+    Persist a batch of generated questions in one round-trip.
+
+    REQ: REQ-B-B2-Gen-5
+
+    Design principle:
+    - One multi-row INSERT (VALUES list) and one commit per batch, instead of
+      insert + commit + refresh per question
+    - id and created_at are assigned client-side, so the ids are known without
+      RETURNING or a refresh; created_at increases by 1µs per row, so ordering
+      by created_at keeps the batch in row (question) order
+    - upsert=True renders INSERT ... ON CONFLICT (id) DO UPDATE (PostgreSQL,
+      SQLite) for rows that may already exist, e.g. saved by Tool 5 during the
+      agent run; other dialects fall back to session.merge per row
+    """
+
+    def __init__(self, session: Session) -> None:
+        """
+        Initialize with database session.
+
+        Args:
+            session: SQLAlchemy session
+
+        """
+        self.session = session
+
+    def save_questions_bulk(
+        self,
+        rows: list[dict[str, Any]],
+        upsert: bool = False,
+        commit: bool = True,
+    ) -> list[str]:
+        """
+        Insert question rows with a single statement.
+
+        Args:
+            rows: Question column values (session_id, item_type, stem, choices,
+                answer_schema, difficulty, category; id, round optional)
+            upsert: Update rows whose id already exists instead of failing
+            commit: Commit the transaction (False: the caller commits)
+
+        Returns:
+            Question ids in row order
+
+        Raises:
+            SQLAlchemyError: If the insert fails (the transaction is rolled back)
+
+        """
+        if not rows:
+            return []
+
+        created_at = datetime.now(UTC)
+        values = [
+            {
+                **{column: row.get(column) for column in QUESTION_COLUMNS},
+                "id": row.get("id") or str(uuid4()),
+                "round": row.get("round") or 1,
+                "created_at": row.get("created_at") or created_at + timedelta(microseconds=index),
+            }
+            for index, row in enumerate(rows)
+        ]
+
+        dialect = self.session.get_bind().dialect.name
+        try:
+            if not upsert:
+                self.session.execute(insert(Question).values(values))
+            elif dialect in _UPSERT_INSERTS:
+                statement = _UPSERT_INSERTS[dialect](Question).values(values)
+                statement = statement.on_conflict_do_update(
+                    index_elements=[Question.id],
+                    set_={column: statement.excluded[column] for column in _UPSERT_COLUMNS},
+                )
+                self.session.execute(statement)
+            else:
+                for value in values:
+                    self.session.merge(Question(**value))
+
+            if commit:
+                self.session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Bulk question save failed ({len(values)} rows): {e}")
+            self.session.rollback()
+            raise
+
+        logger.debug(f"✓ Bulk-saved {len(values)} questions (upsert={upsert}, dialect={dialect})")
+        return [value["id"] for value in values]
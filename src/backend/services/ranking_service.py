@@ -1,17 +1,37 @@
 """
 Ranking and grading service for calculating final grades and rankings.
 
-REQ: REQ-B-B4-1, REQ-B-B4-2, REQ-B-B4-3, REQ-B-B4-4, REQ-B-B4-5
+REQ: REQ-B-B4-1, REQ-B-B4-2, REQ-B-B4-3, REQ-B-B4-4, REQ-B-B4-5, REQ-B-B4-8
 REQ: REQ-B-B4-Plus-1, REQ-B-B4-Plus-2, REQ-B-B4-Plus-3
 """
 
-from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
-
-from sqlalchemy import and_, func
+import base64
+import bisect
+import json
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, case, event, func, insert, literal, select, true, tuple_, union_all, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from src.backend.models import TestResult, TestSession, User, UserBadge
+from src.backend.config import settings
+from src.backend.models import (
+    GradeHistogram,
+    ScoreSketchBucket,
+    TestResult,
+    TestSession,
+    User,
+    UserBadge,
+    UserProfileSurvey,
+    UserScore,
+)
+from src.backend.services.score_sketch import ScoreSketch
 
 # Grade cutoff thresholds (REQ-B-B4-2)
 GRADE_CUTOFFS = {
@@ -32,6 +52,131 @@ GRADE_BADGES = {
 }
 
 
+# Dialects with INSERT ... ON CONFLICT DO NOTHING (race-free creation of shared rows)
+_INSERT_IGNORE = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Grade distribution cache (REQ-B-B4-6)
+# Versioned: every committed grade histogram change bumps the version, which
+# invalidates the cached counts in this process. The TTL bounds staleness for
+# changes made by other worker processes.
+GRADE_DISTRIBUTION_CACHE_TTL_SECONDS = 60
+
+_grade_distribution_cache: dict[str, Any] = {}
+_grade_distribution_version = 0
+_cache_lock = threading.Lock()
+
+
+def _bump_grade_distribution_version() -> None:
+    """Invalidate cached grade distribution after a histogram change."""
+    global _grade_distribution_version  # noqa: PLW0603
+    with _cache_lock:
+        _grade_distribution_version += 1
+
+
+def _run_cache_bumps(session: Session) -> None:
+    """after_commit hook: bump the cache versions queued by _bump_after_commit."""
+    for bump in session.info.pop("cache_bumps_after_commit", set()):
+        bump()
+
+
+def _bump_after_commit(session: Session, bump: Callable[[], None]) -> None:
+    """
+    Bump a cache version once the session's transaction commits.
+
+    Bumping before the commit would let a concurrent reader cache the
+    pre-commit counts under the new version (stale until the TTL expires).
+    A bump left over by a rolled-back transaction only invalidates the cache.
+
+    Args:
+        session: Session whose commit publishes the change
+        bump: Version bump function (_bump_grade_distribution_version, _bump_segment_version)
+
+    """
+    session.info.setdefault("cache_bumps_after_commit", set()).add(bump)
+    if not event.contains(session, "after_commit", _run_cache_bumps):
+        event.listen(session, "after_commit", _run_cache_bumps)
+
+
+def _get_cached_grade_counts() -> tuple[int, dict[str, int] | None]:
+    """Return (current version, cached counts or None if stale/missing)."""
+    with _cache_lock:
+        version = _grade_distribution_version
+        if (
+            _grade_distribution_cache.get("version") == version
+            and _grade_distribution_cache.get("expires_at", 0.0) > time.monotonic()
+        ):
+            return version, dict(_grade_distribution_cache["counts"])
+        return version, None
+
+
+def _set_cached_grade_counts(version: int, counts: dict[str, int]) -> None:
+    """Cache counts loaded for the given version (ignored if already superseded)."""
+    with _cache_lock:
+        if version != _grade_distribution_version:
+            return
+        _grade_distribution_cache["version"] = version
+        _grade_distribution_cache["counts"] = dict(counts)
+        _grade_distribution_cache["expires_at"] = time.monotonic() + GRADE_DISTRIBUTION_CACHE_TTL_SECONDS
+
+
+# Segment cohort cache (REQ-B-B4-8)
+# Per-segment score histograms for the 90-day cohort, loaded for every segment
+# in one grouped pass. Versioned like the grade distribution cache: a changed
+# user_scores row bumps the version; the TTL bounds staleness for survey edits
+# and for changes made by other worker processes.
+SEGMENT_CACHE_TTL_SECONDS = 60
+SEGMENT_TYPES = ("job_role", "department", "interest")
+
+_segment_cache: dict[str, Any] = {}
+_segment_version = 0
+
+
+def _bump_segment_version() -> None:
+    """Invalidate cached segment cohorts after a user_scores change."""
+    global _segment_version  # noqa: PLW0603
+    with _cache_lock:
+        _segment_version += 1
+
+
+def _get_cached_segments() -> tuple[int, dict[tuple[str, str], "SegmentCohort"] | None]:
+    """Return (current version, cached segment cohorts or None if stale/missing)."""
+    with _cache_lock:
+        version = _segment_version
+        if _segment_cache.get("version") == version and _segment_cache.get("expires_at", 0.0) > time.monotonic():
+            return version, _segment_cache["segments"]
+        return version, None
+
+
+def _set_cached_segments(version: int, segments: dict[tuple[str, str], "SegmentCohort"]) -> None:
+    """Cache segment cohorts loaded for the given version (ignored if already superseded)."""
+    with _cache_lock:
+        if version != _segment_version:
+            return
+        _segment_cache["version"] = version
+        _segment_cache["segments"] = segments
+        _segment_cache["expires_at"] = time.monotonic() + SEGMENT_CACHE_TTL_SECONDS
+
+
+@dataclass
+class SegmentCohort:
+    """
+    Score histogram of one segment within the 90-day cohort.
+
+    scores holds the distinct composite scores in ascending order and
+    cumulative[i] the number of users scoring below scores[i] (with a trailing
+    entry equal to size), so a rank is a single bisect.
+    """
+
+    scores: list[float]
+    cumulative: list[int]
+    size: int
+
+    def rank(self, score: float) -> int:
+        """Return the 1-indexed rank of a score in this segment (ties share a rank)."""
+        index: int = bisect.bisect_right(self.scores, score)
+        return self.size - self.cumulative[index] + 1
+
+
 @dataclass
 class GradeDistribution:
     """Distribution data for a single grade tier."""
@@ -54,6 +199,42 @@ class GradeResult:
     percentile_confidence: str
     percentile_description: str
     grade_distribution: list[GradeDistribution]
+    segments: list["SegmentRank"] = field(default_factory=list)
+
+
+@dataclass
+class SegmentRank:
+    """Rank and percentile within one segment (job_role / department / interest)."""
+
+    segment: str
+    value: str
+    rank: int
+    cohort_size: int
+    percentile: float
+
+
+@dataclass
+class LeaderboardEntry:
+    """Single leaderboard row."""
+
+    rank: int
+    user_id: int
+    nickname: str | None
+    score: float
+    grade: str
+
+
+@dataclass
+class LeaderboardPage:
+    """One page of the leaderboard plus the keyset cursor for the next page."""
+
+    entries: list[LeaderboardEntry]
+    next_cursor: str | None
+
+
+# Leaderboard page size limits (REQ-B-B4-7)
+LEADERBOARD_MAX_LIMIT = 100
+LEADERBOARD_MAX_WINDOW = 50
 
 
 class RankingService:
@@ -65,7 +246,11 @@ class RankingService:
     Design principle:
     - Aggregates all test results for a user
     - Calculates final grade based on composite score
-    - Computes rank and percentile within 90-day cohort
+    - Maintains per-user composite scores in user_scores (refresh_user_score)
+    - Computes rank and percentile within 90-day cohort from user_scores
+    - Maintains grade histogram incrementally; distribution served from cache
+    - Maintains per-day score sketches for opt-in approximate percentiles
+    - Serves leaderboard pages with keyset pagination over user_scores
     - Auto-assigns badges based on grade
     """
 
@@ -79,17 +264,25 @@ class RankingService:
         """
         self.session = session
 
-    def calculate_final_grade(self, user_id: int) -> GradeResult | None:
+    def calculate_final_grade(self, user_id: int, approximate: bool | None = None) -> GradeResult | None:
         """
         Calculate final grade and ranking for a user.
 
-        REQ: REQ-B-B4-1, REQ-B-B4-3, REQ-B-B4-4, REQ-B-B4-5
+        REQ: REQ-B-B4-1, REQ-B-B4-3, REQ-B-B4-4, REQ-B-B4-5, REQ-B-B4-8
+
+        Read-only: the composite score and grade come from the user's
+        user_scores row, which the write paths (save_round_result, session
+        completion) keep current via refresh_user_score. Nothing is flushed
+        or committed, so GET /profile/ranking never writes.
 
         Args:
             user_id: User ID to calculate grade for
+            approximate: Use the score sketch for rank/percentile instead of the
+                exact window query (None = settings.RANKING_APPROXIMATE_PERCENTILE).
+                percentile_confidence then reports the sketch's error bound.
 
         Returns:
-            GradeResult with grade, rank, percentile, confidence
+            GradeResult with grade, rank, percentile, confidence and segment ranks
             Returns None if user not found or no test results
 
         Raises:
@@ -101,37 +294,31 @@ class RankingService:
         if not user:
             raise ValueError(f"User with id {user_id} not found")
 
-        # Get all completed test results for this user
-        test_results: list[TestResult] = (
-            self.session.query(TestResult)
-            .join(TestSession, TestResult.session_id == TestSession.id)
-            .filter(
-                and_(
-                    TestSession.user_id == user_id,
-                    TestSession.status == "completed",
-                )
-            )
-            .all()
-        )
+        # Leaderboard row maintained on the write paths (REQ-B-B4-1, REQ-B-B4-3)
+        user_score: UserScore | None = self.session.get(UserScore, user_id)
 
-        # If no test results, return None
-        if not test_results:
+        # If no completed results, return None
+        if user_score is None:
             return None
 
-        # Calculate composite score (REQ-B-B4-1, REQ-B-B4-3)
-        composite_score: float = self._calculate_composite_score(test_results)
+        composite_score: float = user_score.composite_score
 
-        # Determine grade tier (REQ-B-B4-2)
-        grade: str = self._determine_grade(composite_score)
+        # Grade tier was determined when the row was refreshed (REQ-B-B4-2)
+        grade: str = user_score.grade
 
-        # Calculate rank and percentile within 90-day cohort (REQ-B-B4-4)
-        rank, total_cohort_size = self._calculate_rank(user_id, composite_score)
+        if approximate is None:
+            approximate = settings.RANKING_APPROXIMATE_PERCENTILE
 
-        # Calculate percentile
-        percentile: float = self._calculate_percentile(rank, total_cohort_size)
+        if approximate:
+            # Constant-time estimate from the merged 90-day sketch (REQ-B-B4-4)
+            rank, total_cohort_size, percentile, percentile_error = self._estimate_rank(composite_score)
+            percentile_confidence: str = f"approximate ±{percentile_error:.2f}%p"
+        else:
+            # Calculate rank and percentile within 90-day cohort in the database (REQ-B-B4-4)
+            rank, total_cohort_size, percentile = self._calculate_rank(user_id, composite_score)
 
-        # Determine percentile confidence (REQ-B-B4-5)
-        percentile_confidence: str = "medium" if total_cohort_size < 100 else "high"
+            # Determine percentile confidence (REQ-B-B4-5)
+            percentile_confidence = "medium" if total_cohort_size < 100 else "high"
 
         # Generate percentile description
         percentile_description: str = f"상위 {100 - percentile:.1f}%"
@@ -139,6 +326,9 @@ class RankingService:
         # Calculate grade distribution (REQ-B-B4-6)
         grade_dist: list[GradeDistribution] = self._calculate_grade_distribution()
 
+        # Rank within the caller's job_role / department / interest segments (REQ-B-B4-8)
+        segments: list[SegmentRank] = self._calculate_segment_ranks(user, composite_score)
+
         return GradeResult(
             user_id=user_id,
             grade=grade,
@@ -149,7 +339,308 @@ class RankingService:
             percentile_confidence=percentile_confidence,
             percentile_description=percentile_description,
             grade_distribution=grade_dist,
+            segments=segments,
+        )
+
+    def refresh_user_score(self, user_id: int) -> UserScore | None:
+        """
+        Recalculate and upsert the leaderboard row for a single user.
+
+        REQ: REQ-B-B4-1, REQ-B-B4-3, REQ-B-B4-4
+
+        Called whenever a user's completed results change (round result saved,
+        session completed). Only this user's results are read, so the cost does
+        not depend on cohort size. The row is flushed but not committed; the
+        caller owns the transaction.
+
+        Args:
+            user_id: User ID to refresh
+
+        Returns:
+            Updated UserScore row, or None if the user has no completed results
+            (any stale row is removed)
+
+        """
+        rows: list[tuple[TestResult, datetime]] = (
+            self.session.query(TestResult, TestSession.created_at)
+            .join(TestSession, TestResult.session_id == TestSession.id)
+            .filter(
+                and_(
+                    TestSession.user_id == user_id,
+                    TestSession.status == "completed",
+                )
+            )
+            .all()
+        )
+
+        user_score: UserScore | None = self.session.get(UserScore, user_id)
+
+        if not rows:
+            if user_score is not None:
+                self._update_grade_histogram(user_score.grade, None)
+                self._update_score_sketch(user_score.composite_score, user_score.last_completed_at, -1)
+                self.session.delete(user_score)
+                self.session.flush()
+                _bump_after_commit(self.session, _bump_segment_version)
+            return None
+
+        test_results: list[TestResult] = [result for result, _ in rows]
+        composite_score: float = self._calculate_composite_score(test_results)
+        last_completed_at: datetime = max(created_at for _, created_at in rows)
+        grade: str = self._determine_grade(composite_score)
+
+        # Move the user between histogram buckets before the row changes (REQ-B-B4-6)
+        self._update_grade_histogram(user_score.grade if user_score else None, grade)
+
+        # Move the user between score sketch bins/days (REQ-B-B4-4)
+        score_changed: bool = user_score is None or (user_score.composite_score, user_score.last_completed_at) != (
+            composite_score,
+            last_completed_at,
         )
+        if user_score is None:
+            self._update_score_sketch(composite_score, last_completed_at, 1)
+        elif score_changed:
+            self._update_score_sketch(user_score.composite_score, user_score.last_completed_at, -1)
+            self._update_score_sketch(composite_score, last_completed_at, 1)
+
+        if user_score is None:
+            user_score = UserScore(user_id=user_id)
+            self.session.add(user_score)
+
+        user_score.composite_score = composite_score
+        user_score.grade = grade
+        user_score.result_count = len(test_results)
+        user_score.last_completed_at = last_completed_at
+        self.session.flush()
+
+        # Segment cohorts hold this user's score (REQ-B-B4-8)
+        if score_changed:
+            _bump_after_commit(self.session, _bump_segment_version)
+
+        return user_score
+
+    def rebuild_user_scores(self) -> int:
+        """
+        Backfill user_scores for every user with completed sessions.
+
+        Maintenance for data written before user_scores existed: run on
+        startup while the table is empty (backfill_user_scores_if_empty) and
+        by scripts/backfill_user_scores.py. Request paths never call this.
+
+        Returns:
+            Number of user_scores rows written
+
+        """
+        user_ids: list[int] = [
+            user_id
+            for (user_id,) in self.session.query(TestSession.user_id)
+            .filter(TestSession.status == "completed")
+            .distinct()
+            .all()
+        ]
+
+        refreshed: int = sum(1 for user_id in user_ids if self.refresh_user_score(user_id) is not None)
+        self._rebuild_grade_histogram()
+        self._rebuild_score_sketch()
+        self.session.commit()
+
+        return refreshed
+
+    def backfill_user_scores_if_empty(self) -> int:
+        """
+        Run rebuild_user_scores once on databases that predate user_scores.
+
+        Called on startup: create_all adds user_scores, grade_histogram and
+        score_sketch_buckets empty to existing databases, and ranking reads
+        only these tables. Once user_scores has rows the write paths keep it
+        current, so this is a no-op.
+
+        Returns:
+            Number of user_scores rows written (0 if the table already had rows)
+
+        """
+        if self.session.query(UserScore.user_id).first() is not None:
+            return 0
+        return self.rebuild_user_scores()
+
+    def _update_score_sketch(self, score: float, completed_at: datetime, count: int) -> None:
+        """
+        Add (count=1) or remove (count=-1) a score in its day's sketch bucket.
+
+        REQ-B-B4-4: Sketch is updated as results arrive
+
+        The bucket row is locked (SELECT ... FOR UPDATE on PostgreSQL) for the
+        read-modify-write of its JSON bins. A missing day bucket is created
+        with INSERT ... ON CONFLICT DO NOTHING first, so concurrent first
+        writers of a day share one row instead of failing or double counting.
+
+        Args:
+            score: Composite score
+            completed_at: User's last completed session time (selects the day bucket)
+            count: +1 to add, -1 to remove
+
+        """
+        bucket_date = self._sketch_bucket_date(completed_at)
+        bucket_query = self.session.query(ScoreSketchBucket).filter_by(bucket_date=bucket_date).with_for_update()
+        bucket: ScoreSketchBucket | None = bucket_query.first()
+        if bucket is None:
+            if count < 0:
+                return
+            self._insert_missing(ScoreSketchBucket, [{"bucket_date": bucket_date, "bins": {}, "total": 0}])
+            bucket = bucket_query.populate_existing().one()
+
+        sketch = ScoreSketch.from_dict(bucket.bins)
+        sketch.add(score, count)
+        bucket.bins = sketch.to_dict()
+        bucket.total = sketch.total
+        self.session.flush()
+
+    def _rebuild_score_sketch(self) -> None:
+        """Recreate every sketch bucket from user_scores (backfill only)."""
+        sketches: dict[date, ScoreSketch] = {}
+        for score, completed_at in self.session.query(UserScore.composite_score, UserScore.last_completed_at).all():
+            sketches.setdefault(self._sketch_bucket_date(completed_at), ScoreSketch()).add(score)
+
+        self.session.query(ScoreSketchBucket).delete()
+        for bucket_date, sketch in sketches.items():
+            self.session.add(ScoreSketchBucket(bucket_date=bucket_date, bins=sketch.to_dict(), total=sketch.total))
+        self.session.flush()
+
+    def _estimate_rank(self, user_score: float) -> tuple[int, int, float, float]:
+        """
+        Estimate rank and percentile from the merged 90-day score sketch.
+
+        REQ-B-B4-4: Approximate percentile mode
+
+        Merges the per-day buckets inside the window (older days are dropped)
+        and ranks the score against the result. Cost is bounded by the number
+        of days and bins, not by cohort size. The window is day-aligned, so
+        users on the cutoff day are included for the whole day.
+
+        Args:
+            user_score: User's composite score
+
+        Returns:
+            Tuple of (rank, total_cohort_size, percentile, percentile_error)
+            percentile_error: Maximum error in percentage points
+
+        """
+        cutoff_day = self._sketch_bucket_date(datetime.now(UTC) - timedelta(days=90))
+
+        sketch = ScoreSketch()
+        for (bins,) in self.session.query(ScoreSketchBucket.bins).filter(ScoreSketchBucket.bucket_date >= cutoff_day):
+            sketch.merge(ScoreSketch.from_dict(bins))
+
+        total_cohort_size: int = sketch.total
+        if total_cohort_size == 0:
+            return 1, 0, 0.0, 0.0
+
+        rank, _rank_error = sketch.rank(user_score)
+        percentile, percentile_error = sketch.percentile(user_score)
+
+        return round(rank), total_cohort_size, percentile, percentile_error
+
+    @staticmethod
+    def _sketch_bucket_date(completed_at: datetime) -> date:
+        """Return the UTC day used as sketch bucket key."""
+        if completed_at.tzinfo is not None:
+            completed_at = completed_at.astimezone(UTC)
+        return completed_at.date()
+
+    def _update_grade_histogram(self, old_grade: str | None, new_grade: str | None) -> None:
+        """
+        Move one user between grade histogram buckets.
+
+        REQ-B-B4-6: Keep grade distribution up to date without aggregating
+
+        Buckets are adjusted with atomic ``user_count = user_count ± 1`` updates so
+        concurrent writers do not lose increments. Must be called before the
+        user's user_scores row is changed (seeding reads the current rows).
+        The cached distribution is invalidated once the transaction commits.
+
+        Args:
+            old_grade: Previous grade (None if user had no row)
+            new_grade: New grade (None if user's row is being removed)
+
+        """
+        if old_grade == new_grade:
+            return
+
+        # First use on an existing database: seed buckets from user_scores
+        if self.session.query(GradeHistogram.grade).first() is None:
+            self._seed_grade_histogram()
+
+        if old_grade is not None:
+            self.session.execute(
+                update(GradeHistogram)
+                .where(GradeHistogram.grade == old_grade)
+                .values(user_count=GradeHistogram.user_count - 1)
+            )
+        if new_grade is not None:
+            self.session.execute(
+                update(GradeHistogram)
+                .where(GradeHistogram.grade == new_grade)
+                .values(user_count=GradeHistogram.user_count + 1)
+            )
+
+        _bump_after_commit(self.session, _bump_grade_distribution_version)
+
+    def _insert_missing(self, model: type, rows: list[dict[str, Any]]) -> None:
+        """
+        Insert rows whose primary key does not exist yet; existing rows win.
+
+        INSERT ... ON CONFLICT DO NOTHING on PostgreSQL/SQLite (a concurrent
+        creator's row is kept instead of failing the transaction); other
+        dialects insert row by row in savepoints.
+
+        Args:
+            model: Mapped class (GradeHistogram, ScoreSketchBucket)
+            rows: Column values per row
+
+        """
+        dialect = self.session.get_bind().dialect.name
+        if dialect in _INSERT_IGNORE:
+            self.session.execute(_INSERT_IGNORE[dialect](model).values(rows).on_conflict_do_nothing())
+            return
+        for row in rows:
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(insert(model).values(row))
+            except IntegrityError:
+                pass
+
+    def _seed_grade_histogram(self) -> None:
+        """
+        Create the grade buckets from user_scores on first use.
+
+        Concurrent first writers race here: whoever inserts first wins and the
+        others keep its counts (no double counting), then each applies its own
+        atomic ±1.
+        """
+        counts: dict[str, int] = dict.fromkeys(GRADE_CUTOFFS, 0)
+        for grade, count in (
+            self.session.query(UserScore.grade, func.count(UserScore.user_id)).group_by(UserScore.grade).all()
+        ):
+            counts[grade] = count
+        self._insert_missing(GradeHistogram, [{"grade": grade, "user_count": count} for grade, count in counts.items()])
+
+    def _rebuild_grade_histogram(self) -> None:
+        """Recount every grade bucket from user_scores (seeding and backfill only)."""
+        counts: dict[str, int] = dict.fromkeys(GRADE_CUTOFFS, 0)
+        for grade, count in (
+            self.session.query(UserScore.grade, func.count(UserScore.user_id)).group_by(UserScore.grade).all()
+        ):
+            counts[grade] = count
+
+        for grade, count in counts.items():
+            bucket: GradeHistogram | None = self.session.get(GradeHistogram, grade)
+            if bucket is None:
+                self.session.add(GradeHistogram(grade=grade, user_count=count))
+            else:
+                bucket.user_count = count
+        self.session.flush()
+
+        _bump_after_commit(self.session, _bump_grade_distribution_version)
 
     def _calculate_composite_score(self, test_results: list[TestResult]) -> float:
         """
@@ -221,51 +712,68 @@ class RankingService:
         else:
             return "Beginner"
 
-    def _calculate_rank(self, user_id: int, user_score: float) -> tuple[int, int]:
+    def _calculate_rank(self, user_id: int, user_score: float) -> tuple[int, int, float]:
         """
-        Calculate relative rank within 90-day cohort.
+        Calculate relative rank and percentile within 90-day cohort.
 
         REQ-B-B4-4: RANK() OVER within 90-day period
 
+        Ranking runs in the database as a window function over user_scores.
+        Filters are pushed down so the window only sees cohort rows scoring at
+        least as high as the caller (an index range on composite_score); the
+        caller's RANK() in that slice equals their rank in the whole cohort.
+        Only the caller's row and the cohort size are returned.
+
+        Works on both PostgreSQL and SQLite (3.25+ window functions).
+
         Args:
             user_id: User ID
-            user_score: User's composite score
+            user_score: User's composite score (as stored in user_scores)
 
         Returns:
-            Tuple of (rank, total_cohort_size)
-            rank: 1-indexed position (1 is highest)
+            Tuple of (rank, total_cohort_size, percentile)
+            rank: 1-indexed position (1 is highest, ties share a rank)
 
         """
         # Define 90-day window
         cutoff_date: datetime = datetime.now(UTC) - timedelta(days=90)
+        in_cohort = UserScore.last_completed_at >= cutoff_date
 
-        # Get all users in 90-day cohort with their scores
-        # Subquery: get composite scores for all users in cohort
-        cohort_query = (
-            self.session.query(
-                TestSession.user_id,
-                func.avg(TestResult.score).label("avg_score"),
-            )
-            .join(TestResult, TestResult.session_id == TestSession.id)
-            .filter(
-                and_(
-                    TestSession.status == "completed",
-                    TestSession.created_at >= cutoff_date,
-                )
+        cohort = select(func.count(UserScore.user_id).label("cohort_size")).where(in_cohort).subquery("cohort")
+        ranked = (
+            select(
+                UserScore.user_id,
+                func.rank().over(order_by=UserScore.composite_score.desc()).label("rank"),
             )
-            .group_by(TestSession.user_id)
-            .all()
+            .where(in_cohort, UserScore.composite_score >= user_score)
+            .subquery("ranked")
         )
 
-        # Count users with score >= user_score
-        rank: int = 1
-        total_cohort_size: int = len(cohort_query)
-
-        for _cohort_user_id, avg_score in cohort_query:
-            if avg_score > user_score:
-                rank += 1
+        # Percentile = (total - rank + 1) / total * 100, computed alongside the rank
+        row = self.session.execute(
+            select(
+                ranked.c.rank,
+                cohort.c.cohort_size,
+                ((cohort.c.cohort_size - ranked.c.rank + 1) * 100.0 / cohort.c.cohort_size).label("percentile"),
+            )
+            .select_from(ranked.join(cohort, true()))
+            .where(ranked.c.user_id == user_id)
+        ).first()
+
+        if row is not None:
+            return int(row.rank), int(row.cohort_size), float(row.percentile)
+
+        # Caller is outside the 90-day window: rank against the cohort without them
+        total_cohort_size: int = self.session.query(func.count(UserScore.user_id)).filter(in_cohort).scalar() or 0
+        higher_count: int = (
+            self.session.query(func.count(UserScore.user_id))
+            .filter(in_cohort, UserScore.composite_score > user_score)
+            .scalar()
+            or 0
+        )
+        rank: int = higher_count + 1
 
-        return rank, total_cohort_size
+        return rank, total_cohort_size, self._calculate_percentile(rank, total_cohort_size)
 
     def _calculate_percentile(self, rank: int, total_cohort_size: int) -> float:
         """
@@ -290,43 +798,29 @@ class RankingService:
 
     def _calculate_grade_distribution(self) -> list[GradeDistribution]:
         """
-        Calculate grade distribution across all users with completed test sessions.
+        Return grade distribution across all users with completed test sessions.
 
         REQ-B-B4-6: Return all grades with count and percentage
 
+        Counts come from the maintained grade_histogram buckets and are cached
+        in-process until the histogram version changes (or the TTL expires), so
+        the common path touches no database at all.
+
         Returns:
             List of GradeDistribution objects for each grade (Beginner~Elite)
 
         """
-        # Get all completed test results and calculate composite scores for all users
-        cohort_query = (
-            self.session.query(
-                TestSession.user_id,
-                func.avg(TestResult.score).label("avg_score"),
-                func.count(TestResult.id).label("result_count"),
-            )
-            .join(TestResult, TestResult.session_id == TestSession.id)
-            .filter(TestSession.status == "completed")
-            .group_by(TestSession.user_id)
-            .all()
-        )
+        version, grade_counts = _get_cached_grade_counts()
 
-        # Count users in each grade
-        grade_counts: dict[str, int] = {
-            "Beginner": 0,
-            "Intermediate": 0,
-            "Inter-Advanced": 0,
-            "Advanced": 0,
-            "Elite": 0,
-        }
-
-        # Classify each user into a grade
-        for _user_id, avg_score, _result_count in cohort_query:
-            grade: str = self._determine_grade(avg_score)
-            grade_counts[grade] += 1
+        if grade_counts is None:
+            grade_counts = dict.fromkeys(GRADE_CUTOFFS, 0)
+            for grade, user_count in self.session.query(GradeHistogram.grade, GradeHistogram.user_count).all():
+                if grade in grade_counts:
+                    grade_counts[grade] = max(user_count, 0)
+            _set_cached_grade_counts(version, grade_counts)
 
         # Calculate total and percentages
-        total_users: int = len(cohort_query)
+        total_users: int = sum(grade_counts.values())
         distribution: list[GradeDistribution] = []
 
         for grade in ["Beginner", "Intermediate", "Inter-Advanced", "Advanced", "Elite"]:
@@ -342,6 +836,362 @@ class RankingService:
 
         return distribution
 
+    def _calculate_segment_ranks(self, user: User, user_score: float) -> list[SegmentRank]:
+        """
+        Calculate rank and percentile within each segment the user belongs to.
+
+        REQ-B-B4-8: Segmented ranking by job_role, department and interest
+
+        Segments come from User.dept and the latest UserProfileSurvey
+        (job_role, interests). Segment cohorts are read from the in-process
+        cache, so a warm call costs one survey lookup plus a bisect per segment.
+
+        Args:
+            user: User to rank
+            user_score: User's composite score (as stored in user_scores)
+
+        Returns:
+            List of SegmentRank (job_role, department, then each interest)
+
+        """
+        survey: UserProfileSurvey | None = (
+            self.session.query(UserProfileSurvey)
+            .filter(UserProfileSurvey.user_id == user.id)
+            .order_by(UserProfileSurvey.submitted_at.desc())
+            .first()
+        )
+
+        memberships: list[tuple[str, str]] = []
+        if survey is not None and survey.job_role:
+            memberships.append(("job_role", survey.job_role))
+        if user.dept:
+            memberships.append(("department", user.dept))
+        if survey is not None and isinstance(survey.interests, list):
+            memberships.extend(("interest", interest) for interest in dict.fromkeys(survey.interests) if interest)
+
+        if not memberships:
+            return []
+
+        cohorts: dict[tuple[str, str], SegmentCohort] = self._load_segment_cohorts()
+        segment_ranks: list[SegmentRank] = []
+
+        for segment, value in memberships:
+            cohort: SegmentCohort | None = cohorts.get((segment, value))
+            if cohort is None:
+                # Caller is outside the 90-day window and alone in this segment
+                cohort = SegmentCohort(scores=[], cumulative=[0], size=0)
+
+            rank: int = cohort.rank(user_score)
+            segment_ranks.append(
+                SegmentRank(
+                    segment=segment,
+                    value=value,
+                    rank=rank,
+                    cohort_size=cohort.size,
+                    percentile=round(self._calculate_percentile(rank, cohort.size), 2),
+                )
+            )
+
+        return segment_ranks
+
+    def _load_segment_cohorts(self) -> dict[tuple[str, str], SegmentCohort]:
+        """
+        Return per-segment score histograms of the 90-day cohort (cached).
+
+        REQ-B-B4-8: All segment cohorts in a single grouped aggregate pass
+
+        On a cache miss one statement groups the cohort by (segment value,
+        composite_score) for every segment type at once: GROUPING SETS on
+        PostgreSQL, the equivalent UNION ALL of grouped selects on SQLite
+        (which has no GROUPING SETS). Interests are expanded from the survey's
+        JSON array in the same statement.
+
+        Returns:
+            Mapping of (segment, value) to SegmentCohort
+
+        """
+        version, cohorts = _get_cached_segments()
+        if cohorts is not None:
+            return cohorts
+
+        histograms: dict[tuple[str, str], dict[float, int]] = {}
+        for segment, value, score, user_count in self._segment_histogram_rows():
+            if value is None:
+                continue
+            histograms.setdefault((segment, value), {})[score] = user_count
+
+        cohorts = {}
+        for key, counts in histograms.items():
+            scores: list[float] = sorted(counts)
+            cumulative: list[int] = [0]
+            for score in scores:
+                cumulative.append(cumulative[-1] + counts[score])
+            cohorts[key] = SegmentCohort(scores=scores, cumulative=cumulative, size=cumulative[-1])
+
+        _set_cached_segments(version, cohorts)
+        return cohorts
+
+    def _segment_histogram_rows(self) -> list[tuple[str, str | None, float, int]]:
+        """
+        Run the grouped aggregate pass behind _load_segment_cohorts.
+
+        Returns:
+            Rows of (segment, value, composite_score, user_count)
+
+        """
+        cutoff_date: datetime = datetime.now(UTC) - timedelta(days=90)
+        dialect: str = self.session.get_bind().dialect.name
+
+        # Latest survey per user supplies job_role and interests
+        latest_survey = select(
+            UserProfileSurvey.user_id,
+            UserProfileSurvey.job_role,
+            UserProfileSurvey.interests,
+            func.row_number()
+            .over(partition_by=UserProfileSurvey.user_id, order_by=UserProfileSurvey.submitted_at.desc())
+            .label("survey_rank"),
+        ).subquery("latest_survey")
+
+        if dialect == "postgresql":
+            # json_array_elements_text rejects non-array JSON (e.g. 'null'), so only arrays are expanded
+            interests_array = case(
+                (func.json_typeof(latest_survey.c.interests) == "array", latest_survey.c.interests),
+            )
+            interest = func.json_array_elements_text(interests_array).table_valued("value").lateral("interest")
+        else:
+            interest = func.json_each(latest_survey.c.interests).table_valued("value").alias("interest")
+
+        source = (
+            select(UserScore.user_id)
+            .join(User, User.id == UserScore.user_id)
+            .outerjoin(
+                latest_survey,
+                and_(latest_survey.c.user_id == UserScore.user_id, latest_survey.c.survey_rank == 1),
+            )
+            .outerjoin(interest, true())
+            .where(UserScore.last_completed_at >= cutoff_date)
+        )
+        # Interests fan out one row per interest, so users are counted DISTINCT
+        user_count = func.count(func.distinct(UserScore.user_id))
+
+        if dialect == "postgresql":
+            grouped = source.with_only_columns(
+                User.dept,
+                latest_survey.c.job_role,
+                interest.c.value,
+                UserScore.composite_score,
+                user_count,
+            ).group_by(
+                func.grouping_sets(
+                    tuple_(latest_survey.c.job_role, UserScore.composite_score),
+                    tuple_(User.dept, UserScore.composite_score),
+                    tuple_(interest.c.value, UserScore.composite_score),
+                )
+            )
+            rows: list[tuple[str, str | None, float, int]] = []
+            for dept, job_role, interest_value, score, count in self.session.execute(grouped).all():
+                # Exactly one grouping column is set per grouping set (job_role/interest may be NULL)
+                if job_role is not None:
+                    rows.append(("job_role", job_role, score, count))
+                elif interest_value is not None:
+                    rows.append(("interest", interest_value, score, count))
+                elif dept is not None:
+                    rows.append(("department", dept, score, count))
+            return rows
+
+        parts = [
+            source.with_only_columns(
+                literal(segment).label("segment"),
+                column.label("value"),
+                UserScore.composite_score.label("score"),
+                user_count.label("user_count"),
+            ).group_by(column, UserScore.composite_score)
+            for segment, column in (
+                ("job_role", latest_survey.c.job_role),
+                ("department", User.dept),
+                ("interest", interest.c.value),
+            )
+        ]
+        return [tuple(row) for row in self.session.execute(union_all(*parts)).all()]
+
+    def get_leaderboard(self, limit: int = 20, cursor: str | None = None) -> LeaderboardPage:
+        """
+        Get one page of the 90-day cohort leaderboard (top performers first).
+
+        REQ: REQ-B-B4-7
+
+        Keyset pagination over idx_user_score_keyset: each page seeks past the
+        (composite_score, user_id) of the previous page's last row instead of
+        using OFFSET, so page N costs the same as page 1. The cursor also
+        carries the last rank and position so ranks need no counting.
+
+        Args:
+            limit: Page size (1-100)
+            cursor: Opaque cursor from the previous page's next_cursor (None for first page)
+
+        Returns:
+            LeaderboardPage with entries and next_cursor (None on the last page)
+
+        Raises:
+            ValueError: If limit is out of range or cursor is malformed
+
+        """
+        if not 1 <= limit <= LEADERBOARD_MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {LEADERBOARD_MAX_LIMIT}")
+
+        query = self._leaderboard_query()
+        prev_score: float | None = None
+        prev_rank: int = 0
+        position: int = 0
+
+        if cursor is not None:
+            last_score, last_user_id, prev_rank, position = self._decode_leaderboard_cursor(cursor)
+            prev_score = last_score
+            query = query.where(tuple_(UserScore.composite_score, UserScore.user_id) < (last_score, last_user_id))
+
+        rows = self.session.execute(
+            query.order_by(UserScore.composite_score.desc(), UserScore.user_id.desc()).limit(limit + 1)
+        ).all()
+
+        has_more: bool = len(rows) > limit
+        rows = rows[:limit]
+        entries = self._build_leaderboard_entries(rows, prev_score, prev_rank, position)
+
+        next_cursor: str | None = None
+        if has_more:
+            next_cursor = self._encode_leaderboard_cursor(rows[-1], entries[-1].rank, position + len(entries))
+
+        return LeaderboardPage(entries=entries, next_cursor=next_cursor)
+
+    def get_leaderboard_around(self, user_id: int, above: int = 5, below: int = 5) -> LeaderboardPage | None:
+        """
+        Get the leaderboard window around a user ("N above, M below me").
+
+        REQ: REQ-B-B4-7
+
+        Neighbours are fetched with two keyset seeks in opposite directions from
+        the user's (composite_score, user_id). Ranks are derived from a single
+        count of rows ahead of the first entry. next_cursor continues below the
+        window via get_leaderboard.
+
+        Args:
+            user_id: User at the centre of the window
+            above: Number of higher-ranked users to include (0-50)
+            below: Number of lower-ranked users to include (0-50)
+
+        Returns:
+            LeaderboardPage, or None if the user is not in the 90-day cohort
+
+        Raises:
+            ValueError: If above/below are out of range
+
+        """
+        if not (0 <= above <= LEADERBOARD_MAX_WINDOW and 0 <= below <= LEADERBOARD_MAX_WINDOW):
+            raise ValueError(f"above and below must be between 0 and {LEADERBOARD_MAX_WINDOW}")
+
+        query = self._leaderboard_query()
+        me = self.session.execute(query.where(UserScore.user_id == user_id)).first()
+        if me is None:
+            return None
+
+        key = tuple_(UserScore.composite_score, UserScore.user_id)
+        my_key = (me.composite_score, me.user_id)
+
+        above_rows = self.session.execute(
+            query.where(key > my_key).order_by(UserScore.composite_score.asc(), UserScore.user_id.asc()).limit(above)
+        ).all()
+        below_rows = self.session.execute(
+            query.where(key < my_key)
+            .order_by(UserScore.composite_score.desc(), UserScore.user_id.desc())
+            .limit(below + 1)
+        ).all()
+
+        has_more: bool = len(below_rows) > below
+        rows = list(reversed(above_rows)) + [me] + below_rows[:below]
+
+        # Position and rank of the first row in the window
+        first = rows[0]
+        cutoff_date: datetime = datetime.now(UTC) - timedelta(days=90)
+        in_cohort = UserScore.last_completed_at >= cutoff_date
+        ahead_count, higher_count = self.session.execute(
+            select(
+                select(func.count(UserScore.user_id))
+                .where(in_cohort, key > (first.composite_score, first.user_id))
+                .scalar_subquery(),
+                select(func.count(UserScore.user_id))
+                .where(in_cohort, UserScore.composite_score > first.composite_score)
+                .scalar_subquery(),
+            )
+        ).one()
+
+        # Seed as if the row just before the window had the first row's score when it is tied
+        prev_score: float | None = first.composite_score if higher_count < ahead_count else None
+        entries = self._build_leaderboard_entries(rows, prev_score, higher_count + 1, ahead_count)
+
+        next_cursor: str | None = None
+        if has_more:
+            next_cursor = self._encode_leaderboard_cursor(rows[-1], entries[-1].rank, ahead_count + len(entries))
+
+        return LeaderboardPage(entries=entries, next_cursor=next_cursor)
+
+    def _leaderboard_query(self):  # noqa: ANN202
+        """Select leaderboard columns for the 90-day cohort."""
+        cutoff_date: datetime = datetime.now(UTC) - timedelta(days=90)
+        return (
+            select(UserScore.user_id, UserScore.composite_score, UserScore.grade, User.nickname)
+            .join(User, User.id == UserScore.user_id)
+            .where(UserScore.last_completed_at >= cutoff_date)
+        )
+
+    def _build_leaderboard_entries(
+        self,
+        rows: list[Any],
+        prev_score: float | None,
+        prev_rank: int,
+        position: int,
+    ) -> list[LeaderboardEntry]:
+        """
+        Assign RANK() semantics to rows already in leaderboard order.
+
+        Args:
+            rows: Rows ordered by (composite_score DESC, user_id DESC)
+            prev_score: Score of the row before the first one (None if none/different)
+            prev_rank: Rank of the row before the first one
+            position: 1-indexed position of the row before the first one (0 if none)
+
+        Returns:
+            List of LeaderboardEntry
+
+        """
+        entries: list[LeaderboardEntry] = []
+        for row in rows:
+            position += 1
+            rank: int = prev_rank if row.composite_score == prev_score else position
+            entries.append(
+                LeaderboardEntry(
+                    rank=rank,
+                    user_id=row.user_id,
+                    nickname=row.nickname,
+                    score=round(row.composite_score, 2),
+                    grade=row.grade,
+                )
+            )
+            prev_score, prev_rank = row.composite_score, rank
+        return entries
+
+    def _encode_leaderboard_cursor(self, last_row: Any, last_rank: int, position: int) -> str:  # noqa: ANN401
+        """Encode keyset cursor (exact score, user_id, rank, position) as URL-safe text."""
+        payload = json.dumps([last_row.composite_score, last_row.user_id, last_rank, position])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _decode_leaderboard_cursor(self, cursor: str) -> tuple[float, int, int, int]:
+        """Decode cursor produced by _encode_leaderboard_cursor."""
+        try:
+            score, user_id, rank, position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return float(score), int(user_id), int(rank), int(position)
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid leaderboard cursor") from e
+
     def assign_badges(self, user_id: int, grade: str) -> list[UserBadge]:
         """
         Assign badges to user based on grade.
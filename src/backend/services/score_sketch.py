@@ -0,0 +1,138 @@
+"""
+Mergeable quantile sketch over composite scores for approximate percentiles.
+
+REQ: REQ-B-B4-4, REQ-B-B4-5
+"""
+
+from typing import Any
+
+# Composite scores are bounded to 0-100, so a fixed-resolution histogram is a
+# mergeable quantile sketch with a known error: ranks are exact up to the other
+# users sharing the caller's bin.
+SCORE_MIN = 0.0
+SCORE_MAX = 100.0
+BIN_WIDTH = 0.1
+BIN_COUNT = int((SCORE_MAX - SCORE_MIN) / BIN_WIDTH) + 1
+
+
+class ScoreSketch:
+    """
+    Fixed-resolution, mergeable score histogram.
+
+    REQ: REQ-B-B4-4, REQ-B-B4-5
+
+    Design principle:
+    - Sparse {bin_index: count} over 0.1-point bins (at most 1001 entries)
+    - Supports add and remove, so a user's score can move between bins
+    - merge() is exact: merging per-day sketches equals one sketch over all days
+    - rank() is O(bins) regardless of how many scores were added
+
+    Attributes:
+        bins: Mapping of bin index to number of scores in that bin
+
+    """
+
+    def __init__(self, bins: dict[int, int] | None = None) -> None:
+        """
+        Initialize ScoreSketch.
+
+        Args:
+            bins: Optional initial bin counts
+
+        """
+        self.bins: dict[int, int] = {index: count for index, count in (bins or {}).items() if count > 0}
+
+    @staticmethod
+    def bin_index(score: float) -> int:
+        """Return the bin index for a score (clamped to 0-100)."""
+        clamped: float = min(max(score, SCORE_MIN), SCORE_MAX)
+        return min(int((clamped - SCORE_MIN) / BIN_WIDTH), BIN_COUNT - 1)
+
+    @property
+    def total(self) -> int:
+        """Total number of scores in the sketch."""
+        return sum(self.bins.values())
+
+    def add(self, score: float, count: int = 1) -> None:
+        """
+        Add (or, with a negative count, remove) scores.
+
+        Args:
+            score: Composite score (0-100)
+            count: Number of scores to add; negative removes
+
+        """
+        index: int = self.bin_index(score)
+        updated: int = self.bins.get(index, 0) + count
+        if updated > 0:
+            self.bins[index] = updated
+        else:
+            self.bins.pop(index, None)
+
+    def merge(self, other: "ScoreSketch") -> "ScoreSketch":
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other: Sketch to merge
+
+        Returns:
+            self, for chaining
+
+        """
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        return self
+
+    def rank(self, score: float) -> tuple[float, float]:
+        """
+        Estimate the 1-indexed rank of a score (1 is highest).
+
+        The exact rank lies between 1 + (scores in higher bins) and
+        (scores in higher bins) + (scores in the same bin). The midpoint is
+        returned together with the half-width of that interval.
+
+        Args:
+            score: Score to rank
+
+        Returns:
+            Tuple of (estimated rank, maximum absolute rank error)
+
+        """
+        index: int = self.bin_index(score)
+        higher: int = sum(count for bin_index, count in self.bins.items() if bin_index > index)
+        same: int = max(self.bins.get(index, 0), 1)
+
+        low: int = higher + 1
+        high: int = higher + same
+        return (low + high) / 2, (high - low) / 2
+
+    def percentile(self, score: float) -> tuple[float, float]:
+        """
+        Estimate percentile (0-100, 100 = top performer) with its error bound.
+
+        Uses the same formula as RankingService: (total - rank + 1) / total * 100.
+
+        Args:
+            score: Score to evaluate
+
+        Returns:
+            Tuple of (percentile, maximum error in percentage points)
+
+        """
+        total: int = self.total
+        if total == 0:
+            return 0.0, 0.0
+
+        rank, rank_error = self.rank(score)
+        percentile: float = (total - rank + 1) / total * 100
+        return min(max(percentile, 0.0), 100.0), rank_error / total * 100
+
+    def to_dict(self) -> dict[str, int]:
+        """Serialize bins for JSON storage (keys as strings)."""
+        return {str(index): count for index, count in sorted(self.bins.items())}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "ScoreSketch":
+        """Deserialize bins produced by to_dict."""
+        return cls({int(index): int(count) for index, count in (data or {}).items()})
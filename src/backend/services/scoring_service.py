@@ -7,12 +7,20 @@ REQ: REQ-B-B3-Score, REQ-B-B2-Adapt
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.backend.models.attempt_answer import AttemptAnswer
 from src.backend.models.question import Question
 from src.backend.models.test_result import TestResult
 from src.backend.models.test_session import TestSession
+from src.backend.services.keyword_matcher import get_keyword_matcher
+from src.backend.services.ranking_service import RankingService
+
+# Item types scored inline at autosave time (pure function of answer + answer_schema)
+DETERMINISTIC_ITEM_TYPES = {"multiple_choice", "true_false"}
+SCORABLE_ITEM_TYPES = {"multiple_choice", "true_false", "short_answer"}
 
 
 class ScoringService:
@@ -23,6 +31,7 @@ class ScoringService:
 
     Methods:
         score_answer: Score individual answer in real-time
+        score_deterministic: Score MC/TF answer inline at autosave time
         calculate_round_score: Calculate score for completed round
         get_wrong_categories: Identify wrong answer categories
 
@@ -88,14 +97,7 @@ class ScoringService:
             raise ValueError(f"Answer for question {question_id} not found (not yet saved)")
 
         # Score based on item type
-        if question.item_type == "multiple_choice":
-            is_correct, base_score = self._score_multiple_choice(attempt_answer.user_answer, question.answer_schema)
-        elif question.item_type == "true_false":
-            is_correct, base_score = self._score_true_false(attempt_answer.user_answer, question.answer_schema)
-        elif question.item_type == "short_answer":
-            is_correct, base_score = self._score_short_answer(attempt_answer.user_answer, question.answer_schema)
-        else:
-            raise ValueError(f"Unknown item type: {question.item_type}")
+        is_correct, base_score = self._score_by_item_type(question, attempt_answer.user_answer)
 
         # Apply time penalty
         time_penalty_applied, final_score = self._apply_time_penalty(base_score, test_session)
@@ -103,6 +105,7 @@ class ScoringService:
         # Update attempt answer in DB
         attempt_answer.is_correct = is_correct
         attempt_answer.score = final_score
+        attempt_answer.scored_at = datetime.now(UTC)
         self.session.commit()
         self.session.refresh(attempt_answer)
 
@@ -123,6 +126,66 @@ class ScoringService:
             "scored_at": scored_at.isoformat(),
         }
 
+    def _score_by_item_type(self, question: Question, user_answer: Any) -> tuple[bool, float]:  # noqa: ANN401
+        """
+        Score an answer with the scorer for the question's item type.
+
+        Args:
+            question: Question being answered
+            user_answer: User's answer
+
+        Returns:
+            Tuple of (is_correct: bool, base score 0-100 before time penalty)
+
+        Raises:
+            ValueError: If item type is unknown or the answer format is invalid
+
+        """
+        if question.item_type == "multiple_choice":
+            return self._score_multiple_choice(user_answer, question.answer_schema)
+        if question.item_type == "true_false":
+            return self._score_true_false(user_answer, question.answer_schema)
+        if question.item_type == "short_answer":
+            return self._score_short_answer(user_answer, question.answer_schema, question.id)
+        raise ValueError(f"Unknown item type: {question.item_type}")
+
+    def score_deterministic(
+        self,
+        question: Question,
+        user_answer: Any,  # noqa: ANN401
+        test_session: TestSession,
+    ) -> tuple[bool, float] | None:
+        """
+        Score an MC/TF answer inline (used by autosave).
+
+        REQ: REQ-B-B3-Score-2, REQ-B-B2-Plus-1
+
+        MC/TF results are a pure function of the answer and answer_schema, so
+        they are computed when the answer is saved and round completion only
+        aggregates. Short answers are left for the round scoring pass.
+
+        Args:
+            question: Question being answered
+            user_answer: User's answer
+            test_session: Session (for time penalty)
+
+        Returns:
+            Tuple of (is_correct, final_score), or None if the item type is not
+            deterministic or the answer format is invalid (scored later, where
+            the format error surfaces)
+
+        """
+        if question.item_type not in DETERMINISTIC_ITEM_TYPES:
+            return None
+
+        try:
+            is_correct, base_score = self._score_by_item_type(question, user_answer)
+        except ValueError:
+            return None
+
+        _, final_score = self._apply_time_penalty(base_score, test_session)
+        return is_correct, final_score
+
     def _score_multiple_choice(
         self,
         user_answer: Any,  # noqa: ANN401
@@ -243,6 +306,7 @@ class ScoringService:
         self,
         user_answer: Any,  # noqa: ANN401
         answer_schema: dict[str, Any],  # noqa: ANN401
+        question_id: str | None = None,
     ) -> tuple[bool, float]:
         """
         Score short answer (keyword matching with partial credit).
@@ -262,9 +326,13 @@ class ScoringService:
           * "natural language processing": "natural" + "language" match → 2/3 = 0.67 credit
           * Total: (0.5 + 0.5 + 0.67) / 3 = 0.56 → 56 points (instead of 0)
 
+        Keywords are compiled once per question (KeywordMatcher, cached by
+        question_id), so scoring is a single pass over the answer.
+
         Args:
             user_answer: User's answer (string or dict)
             answer_schema: Answer schema with "keywords" list
+            question_id: Question ID for the compiled matcher cache (None = compile uncached)
 
         Returns:
             Tuple of (is_correct: bool, score: 0-100)
@@ -282,41 +350,8 @@ class ScoringService:
             # If no keywords specified, treat empty answer as 0 score, non-empty as 100
             return len(answer_text) > 0, 100.0 if len(answer_text) > 0 else 0.0
 
-        # Prepare answer for matching
-        answer_lower = answer_text.lower()
-        answer_words = set(answer_lower.split())
-
-        # Calculate score with partial credit for each keyword
-        total_credit = 0.0
-        exact_matches = 0
-
-        for keyword in keywords:
-            keyword_lower = str(keyword).lower().strip()
-            if not keyword_lower:
-                continue
-
-            # First, check for exact match (full keyword in answer)
-            if keyword_lower in answer_lower:
-                total_credit += 1.0
-                exact_matches += 1
-            else:
-                # Check for partial word-level match
-                keyword_words = keyword_lower.split()
-                matched_words = sum(1 for word in keyword_words if word in answer_words)
-
-                if matched_words > 0:
-                    # Partial credit: (matched_words / total_words_in_keyword)
-                    partial_credit = matched_words / len(keyword_words)
-                    total_credit += partial_credit
-
-        # Calculate final score
-        total_keywords = len(keywords)
-        score = (total_credit / total_keywords * 100.0) if total_keywords > 0 else 0.0
-
-        # is_correct: True only if all keywords matched exactly
-        is_correct = exact_matches == total_keywords
-
-        return is_correct, score
+        # Single pass over the answer with the question's compiled matcher
+        return get_keyword_matcher(question_id, keywords).score(answer_text)
 
     def _apply_time_penalty(self, base_score: float, test_session: TestSession) -> tuple[bool, float]:
         """
@@ -365,67 +400,137 @@ class ScoringService:
 
         return True, final_score
 
-    def _score_all_unscored_answers(self, session_id: str) -> None:
+    def _load_round(self, session_id: str) -> tuple[TestSession | None, list[tuple[AttemptAnswer, Question | None]]]:
         """
-        Score all unscored answers in a session.
-
-        This is called before calculating round score to ensure all answers are scored.
-        Processes answers that:
-        - Have NULL is_correct (truly unscored), OR
-        - Have is_correct=false with score=0 (default autosave values, not yet actually scored)
+        Load a session with all its answers and their questions in one query.
 
         Args:
             session_id: TestSession ID
 
+        Returns:
+            Tuple of (test_session or None, list of (attempt, question or None))
+
+        """
+        rows = self.session.execute(
+            select(TestSession, AttemptAnswer, Question)
+            .outerjoin(AttemptAnswer, AttemptAnswer.session_id == TestSession.id)
+            .outerjoin(Question, Question.id == AttemptAnswer.question_id)
+            .where(TestSession.id == session_id)
+        ).all()
+
+        if not rows:
+            return None, []
+
+        test_session: TestSession = rows[0][0]
+        answers = [(attempt, question) for _, attempt, question in rows if attempt is not None]
+        return test_session, answers
+
+    def _score_unscored_in_memory(
+        self,
+        test_session: TestSession,
+        answers: list[tuple[AttemptAnswer, Question | None]],
+    ) -> None:
+        """
+        Score all unscored answers of a loaded round and persist them in one bulk UPDATE.
+
+        Processes answers whose scored_at is NULL (short answers and any
+        MC/TF answer autosave could not score), and answers scored before the
+        session was paused: autosave scores while in_progress, i.e. without
+        the REQ-B-B3-Score-3 overtime penalty, so they are re-scored here.
+
+        The loaded AttemptAnswer objects are updated in place (as committed
+        values) so callers can aggregate without reloading. Does not commit.
+
+        Args:
+            test_session: Loaded TestSession (for time penalty)
+            answers: List of (attempt, question) from _load_round
+
         Raises:
-            ValueError: If session/question/answer not found
+            ValueError: If an answer has an invalid format for its item type
 
         """
-        # Get all unscored attempt answers for this session
-        # Include both truly unscored (NULL) and default-marked (false/0) answers
-        from sqlalchemy import and_, or_
-
-        unscored = (
-            self.session.query(AttemptAnswer)
-            .filter(
-                AttemptAnswer.session_id == session_id,
-                or_(
-                    AttemptAnswer.is_correct.is_(None),
-                    and_(AttemptAnswer.is_correct.is_(False), AttemptAnswer.score == 0.0),
-                ),
-            )
-            .all()
-        )
+        updates: list[dict[str, Any]] = []
+        scored_at = datetime.now(UTC)
 
-        for attempt in unscored:
-            # Get the question to determine item type
-            question = self.session.query(Question).filter_by(id=attempt.question_id).first()
-            if not question:
+        for attempt, question in answers:
+            if question is None or not self._needs_scoring(attempt, test_session):
                 continue
 
-            # Score based on item type
-            if question.item_type == "multiple_choice":
-                is_correct, base_score = self._score_multiple_choice(attempt.user_answer, question.answer_schema)
-            elif question.item_type == "true_false":
-                is_correct, base_score = self._score_true_false(attempt.user_answer, question.answer_schema)
-            elif question.item_type == "short_answer":
-                is_correct, base_score = self._score_short_answer(attempt.user_answer, question.answer_schema)
-            else:
+            if question.item_type not in SCORABLE_ITEM_TYPES:
                 continue
 
+            # Score based on item type
+            is_correct, base_score = self._score_by_item_type(question, attempt.user_answer)
+
             # Apply time penalty
-            test_session = self.session.query(TestSession).filter_by(id=session_id).first()
-            if test_session:
-                _, final_score = self._apply_time_penalty(base_score, test_session)
-            else:
-                final_score = base_score
+            _, final_score = self._apply_time_penalty(base_score, test_session)
 
-            # Update the attempt answer
-            attempt.is_correct = is_correct
-            attempt.score = final_score
-            self.session.commit()
+            updates.append({"id": attempt.id, "is_correct": is_correct, "score": final_score, "scored_at": scored_at})
+
+        if not updates:
+            return
+
+        # One executemany UPDATE by primary key for the whole round
+        self.session.execute(update(AttemptAnswer), updates)
 
-    def calculate_round_score(self, session_id: str, round_num: int) -> dict:
+        # Mirror the written values on the loaded objects without marking them dirty
+        by_id = {attempt.id: attempt for attempt, _ in answers}
+        for values in updates:
+            attempt = by_id[values["id"]]
+            set_committed_value(attempt, "is_correct", values["is_correct"])
+            set_committed_value(attempt, "score", values["score"])
+            set_committed_value(attempt, "scored_at", scored_at)
+
+    @staticmethod
+    def _needs_scoring(attempt: AttemptAnswer, test_session: TestSession) -> bool:
+        """
+        Check whether an answer must be (re-)scored by the round scoring pass.
+
+        REQ: REQ-B-B3-Score-2, REQ-B-B3-Score-3
+
+        Args:
+            attempt: Loaded AttemptAnswer
+            test_session: Loaded TestSession
+
+        Returns:
+            True if unscored, or scored before the session was paused (time
+            penalty not yet applied)
+
+        """
+        if attempt.scored_at is None:
+            return True
+        if test_session.status != "paused" or test_session.paused_at is None:
+            return False
+
+        scored_at, paused_at = attempt.scored_at, test_session.paused_at
+        if scored_at.tzinfo is None:
+            scored_at = scored_at.replace(tzinfo=UTC)
+        if paused_at.tzinfo is None:
+            paused_at = paused_at.replace(tzinfo=UTC)
+        return scored_at < paused_at
+
+    def _score_all_unscored_answers(self, session_id: str) -> None:
+        """
+        Score all unscored answers in a session.
+
+        Loads the round in one joined query, scores in memory and writes all
+        updates with one bulk UPDATE and one commit.
+
+        Args:
+            session_id: TestSession ID
+
+        Raises:
+            ValueError: If an answer has an invalid format for its item type
+
+        """
+        test_session, answers = self._load_round(session_id)
+        if test_session is None:
+            return
+
+        self._score_unscored_in_memory(test_session, answers)
+        self.session.commit()
+
+    def calculate_round_score(self, session_id: str, round_num: int, commit: bool = True) -> dict:
         """
         Calculate score for a completed test round.
 
@@ -438,9 +543,17 @@ class ScoringService:
         - Short answer: 0-100 based on keyword matching (partial credit)
         - Final score: Average of all question scores
 
+        Batched: the session, answers and questions are loaded with one joined
+        query, unscored answers are written with one bulk UPDATE, and wrong
+        categories come from the same in-memory rows (~3 round-trips per round
+        instead of ~3 per question). MC/TF answers are already scored at
+        autosave time, so for them this is a pure aggregate unless the
+        session is paused (overtime penalty applied here).
+
         Args:
             session_id: TestSession ID
             round_num: Round number (1, 2, or 3)
+            commit: Commit the scored answers (False when the caller owns the transaction)
 
         Returns:
             Dictionary with:
@@ -451,15 +564,16 @@ class ScoringService:
                 - wrong_categories (dict): Category -> wrong count mapping
 
         """
-        # First, score all unscored answers
-        self._score_all_unscored_answers(session_id)
+        test_session, answers = self._load_round(session_id)
 
-        # Get all attempt answers for this session
-        attempts = self.session.query(AttemptAnswer).filter_by(session_id=session_id).all()
-
-        if not attempts:
+        if test_session is None or not answers:
             raise ValueError(f"No attempt answers found for session {session_id}")
 
+        # First, score all unscored answers
+        self._score_unscored_in_memory(test_session, answers)
+
+        attempts = [attempt for attempt, _ in answers]
+
         total_count = len(attempts)
         correct_count = sum(1 for a in attempts if a.is_correct)
         total_points = sum(a.score for a in attempts)
@@ -468,8 +582,13 @@ class ScoringService:
         # Final score = (sum of all scores) / number of questions
         average_score = (total_points / total_count) if total_count > 0 else 0
 
-        # Get wrong categories
-        wrong_categories = self._get_wrong_categories(attempts)
+        # Get wrong categories from the already-loaded questions
+        questions = {question.id: question for _, question in answers if question is not None}
+        wrong_categories = self._get_wrong_categories(attempts, questions)
+
+        # Commit last: commit expires the loaded rows, which would reload them one by one
+        if commit:
+            self.session.commit()
 
         return {
             "score": round(average_score, 2),
@@ -479,7 +598,11 @@ class ScoringService:
             "wrong_categories": wrong_categories,
         }
 
-    def _get_wrong_categories(self, attempts: list[AttemptAnswer]) -> dict:
+    def _get_wrong_categories(
+        self,
+        attempts: list[AttemptAnswer],
+        questions: dict[str, Question] | None = None,
+    ) -> dict:
         """
         Identify categories where user got wrong answers.
 
@@ -487,21 +610,30 @@ class ScoringService:
 
         Args:
             attempts: List of AttemptAnswer records
+            questions: Questions by id, already loaded (otherwise fetched in one IN query)
 
         Returns:
             Dictionary mapping category -> number of wrong answers
             Example: {"LLM": 1, "RAG": 2}
 
         """
+        wrong_attempts = [attempt for attempt in attempts if not attempt.is_correct]
+
+        if questions is None:
+            question_ids = {attempt.question_id for attempt in wrong_attempts}
+            questions = (
+                {q.id: q for q in self.session.query(Question).filter(Question.id.in_(question_ids)).all()}
+                if question_ids
+                else {}
+            )
+
         wrong_categories = {}
 
-        for attempt in attempts:
-            if not attempt.is_correct:
-                # Get question to find category
-                question = self.session.query(Question).filter_by(id=attempt.question_id).first()
-                if question:
-                    category = question.category
-                    wrong_categories[category] = wrong_categories.get(category, 0) + 1
+        for attempt in wrong_attempts:
+            question = questions.get(attempt.question_id)
+            if question:
+                category = question.category
+                wrong_categories[category] = wrong_categories.get(category, 0) + 1
 
         return wrong_categories
 
@@ -509,6 +641,9 @@ class ScoringService:
         """
         Calculate and persist round result to database.
 
+        Also refreshes the user's leaderboard row (user_scores) in the same
+        transaction so ranking never has to re-aggregate the cohort.
+
         Args:
             session_id: TestSession ID
             round_num: Round number
@@ -517,7 +652,8 @@ class ScoringService:
             TestResult record created
 
         """
-        score_data = self.calculate_round_score(session_id, round_num)
+        # Scored answers, result and leaderboard row are committed together
+        score_data = self.calculate_round_score(session_id, round_num, commit=False)
 
         result = TestResult(
             session_id=session_id,
@@ -530,5 +666,12 @@ class ScoringService:
         )
 
         self.session.add(result)
+        self.session.flush()
+
+        # Keep leaderboard incrementally up to date (REQ-B-B4-4)
+        test_session = self.session.get(TestSession, session_id)
+        if test_session:
+            RankingService(self.session).refresh_user_score(test_session.user_id)
+
         self.session.commit()
         return result
@@ -0,0 +1,82 @@
+"""
+In-process single-flight registry: one leader per key, followers share its result.
+
+REQ: REQ-B-B3-Explain-4
+"""
+
+import threading
+from collections.abc import Hashable
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent work on the same key within one process.
+
+    REQ: REQ-B-B3-Explain-4
+
+    Design principle:
+    - begin(key) returns (future, is_leader); the first caller for a key is
+      the leader and must call finish(key, result) exactly once
+    - Followers wait on the shared concurrent.futures.Future, so both
+      threads (future.result) and coroutines (asyncio.wrap_future) can join
+    - The key is released on finish, so a later call starts a new flight
+    - Thread-safe (single lock around the in-flight map)
+
+    Attributes:
+        leaders: Number of flights started
+        followers: Number of callers that joined an existing flight
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize SingleFlight."""
+        self._inflight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.followers = 0
+
+    def begin(self, key: Hashable) -> tuple[Future, bool]:
+        """
+        Join the flight for a key, starting one if none is running.
+
+        Args:
+            key: Work key
+
+        Returns:
+            Tuple of (shared future, True if the caller is the leader)
+
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.followers += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            self.leaders += 1
+            return future, True
+
+    def finish(self, key: Hashable, result: object) -> None:
+        """
+        Publish the leader's result and release the key.
+
+        Args:
+            key: Work key passed to begin
+            result: Value delivered to followers
+
+        """
+        with self._lock:
+            future = self._inflight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently being worked on."""
+        with self._lock:
+            return len(self._inflight)
+
+    def stats(self) -> dict[str, int]:
+        """Return leader/follower counters and current in-flight count."""
+        with self._lock:
+            return {"leaders": self.leaders, "followers": self.followers, "in_flight": len(self._inflight)}
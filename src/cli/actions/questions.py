@@ -1504,8 +1504,8 @@ def calculate_round_score(context: CLIContext, *args: str) -> None:
         context.logger.info("Round score calculated. Session not auto-completed.")
 
 
-def _display_explanation(context: CLIContext, response: dict, question_id: str) -> None:
-    """Display explanation for a single question."""
+def _display_explanation(context: CLIContext, response: dict, question_id: str, show_sections: bool = True) -> None:
+    """Display explanation for a single question (sections can be skipped if already streamed)."""
     # Display user answer summary if available
     user_answer_summary = response.get("user_answer_summary")
     if user_answer_summary:
@@ -1520,7 +1520,7 @@ def _display_explanation(context: CLIContext, response: dict, question_id: str)
         context.console.print()
 
     # Display explanation sections in a clean, readable format
-    explanation_sections = response.get("explanation_sections", [])
+    explanation_sections = response.get("explanation_sections", []) if show_sections else []
     if explanation_sections:
         for section in explanation_sections:
             title = section.get("title", "[설명]")
@@ -1696,26 +1696,47 @@ def generate_explanation(context: CLIContext, *args: str) -> None:
         if is_correct is not None:
             json_data["is_correct"] = is_correct
 
-        # API 호출
-        status_code, response, error = context.client.make_request(
+        # API 호출 (SSE): render explanation text live as the model generates it
+        explanation = None
+        streamed = False
+        for event, data in context.client.stream_request(
             "POST",
-            "/questions/explanations",
+            "/questions/explanations/stream",
             json_data=json_data,
-        )
+        ):
+            if event == "token":
+                if not streamed:
+                    context.console.print()
+                    streamed = True
+                context.console.print(data.get("text", ""), end="", markup=False, highlight=False)
+            elif event == "reset":
+                context.console.print()
+                context.console.print("[yellow]⚠️  Generation interrupted, showing fallback explanation[/yellow]")
+            elif event == "done":
+                explanation = data
+            elif event == "error":
+                if streamed:
+                    context.console.print()
+                status_code = data.get("status_code")
+                context.console.print(
+                    f"[bold red]✗ Generation failed{f' (HTTP {status_code})' if status_code else ''}[/bold red]"
+                )
+                context.console.print(f"[red]  Error: {data.get('detail')}[/red]")
+                return
 
-        if error:
-            context.console.print("[bold red]✗ Generation failed[/bold red]")
-            context.console.print(f"[red]  Error: {error}[/red]")
-            return
+        if streamed:
+            context.console.print()
+            context.console.print()
 
-        if status_code not in (200, 201):
-            context.console.print(f"[bold red]✗ Generation failed (HTTP {status_code})[/bold red]")
+        if explanation is None:
+            context.console.print("[bold red]✗ Generation failed: stream ended without a result[/bold red]")
             return
 
         context.console.print("[bold green]✓ Explanation generated[/bold green]")
         context.console.print()
 
-        _display_explanation(context, response, question_id)
+        # Explanation text was already rendered live; show summary and references only
+        _display_explanation(context, explanation, question_id, show_sections=not streamed)
 
         context.logger.info(f"Explanation generated for question {question_id}.")
 
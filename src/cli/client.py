@@ -1,6 +1,7 @@
 """HTTP API client for CLI communication with FastAPI backend."""
 
 import json
+from collections.abc import Iterator
 from types import TracebackType
 from typing import Any
 
@@ -111,6 +112,59 @@ class APIClient:
         except httpx.RequestError as e:
             return 0, None, f"Request failed: {str(e)}"
 
+    def stream_request(
+        self,
+        method: str,
+        path: str,
+        json_data: dict[str, Any] | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Make a request to a Server-Sent Events endpoint and yield its events.
+
+        Args:
+            method: HTTP method (GET, POST, ...)
+            path: API path (e.g., '/questions/explanations/stream')
+            json_data: JSON request body
+
+        Yields:
+            (event, data) pairs; HTTP and connection failures are yielded as
+            ("error", {"detail": ..., "status_code": ...})
+
+        """
+        cookies = {"auth_token": self.token} if self.token else {}
+        try:
+            with self.client.stream(
+                method,
+                path,
+                headers={**self._get_headers(), "Accept": "text/event-stream"},
+                json=json_data,
+                cookies=cookies,
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    try:
+                        detail = response.json().get("detail", response.text)
+                    except json.JSONDecodeError:
+                        detail = response.text
+                    yield "error", {"detail": detail, "status_code": response.status_code}
+                    return
+
+                event = "message"
+                data_lines: list[str] = []
+                for line in response.iter_lines():
+                    if line.startswith("event:"):
+                        event = line[len("event:") :].strip()
+                    elif line.startswith("data:"):
+                        data_lines.append(line[len("data:") :].strip())
+                    elif not line and data_lines:
+                        yield event, json.loads("\n".join(data_lines))
+                        event, data_lines = "message", []
+
+        except httpx.ConnectError as e:
+            yield "error", {"detail": f"Failed to connect to {self.base_url}: {str(e)}", "status_code": 0}
+        except httpx.RequestError as e:
+            yield "error", {"detail": f"Request failed: {str(e)}", "status_code": 0}
+
     def close(self) -> None:
         """Close the HTTP client."""
         self.client.close()
@@ -15,6 +15,30 @@ import pytest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 
+@pytest.fixture(autouse=True)
+def _reset_grading_reuse_index() -> None:
+    """Fixture: Isolate tests from short-answer grades reused by earlier tests."""
+    from src.agent.tools.grading_reuse import get_grading_reuse_index
+
+    get_grading_reuse_index().clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_llm_registry() -> None:
+    """Fixture: Isolate tests from LLM clients pooled by earlier tests."""
+    from src.agent.config import get_llm_registry
+
+    get_llm_registry().clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_agent_pool() -> None:
+    """Fixture: Isolate tests from ItemGenAgents pooled by earlier tests."""
+    from src.agent.llm_agent import get_agent_pool
+
+    get_agent_pool().clear()
+
+
 @pytest.fixture
 async def mock_executor() -> AsyncMock:
     """Fixture: Mock AgentExecutor for testing."""
@@ -4,6 +4,7 @@ Tests for agent configuration module.
 REQ: REQ-A-LiteLLM (LiteLLM support for create_llm())
 """
 
+import asyncio
 import os
 from unittest.mock import patch
 
@@ -17,6 +18,7 @@ from src.agent.config import (
     LLMFactory,
     LLMProvider,
     create_llm,
+    get_llm_registry,
 )
 
 
@@ -289,3 +291,77 @@ class TestCreateLLMFunction:
         with patch.dict(os.environ, env_vars, clear=True):
             llm = create_llm()
             assert isinstance(llm, ChatGoogleGenerativeAI)
+
+
+class TestLLMClientRegistry:
+    """Tests for the process-wide pooled LLM client registry."""
+
+    def test_create_llm_reuses_pooled_client(self) -> None:
+        """
+        Test create_llm() returns the same client for unchanged settings.
+
+        Acceptance Criteria:
+        - Second call reuses the first instance
+        - Counters report one creation and one reuse
+        """
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key-12345"}, clear=True):
+            first = create_llm()
+            second = create_llm()
+
+        assert first is second
+        assert get_llm_registry().stats() == {"clients": 1, "creations": 1, "reuses": 1}
+
+    def test_changed_settings_create_new_client(self) -> None:
+        """
+        Test a different provider/model/key yields a separate pooled client.
+
+        Acceptance Criteria:
+        - Different API key → new client
+        - Switching to LiteLLM → new client
+        """
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "key-a"}, clear=True):
+            gemini_a = create_llm()
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "key-b"}, clear=True):
+            gemini_b = create_llm()
+        with patch.dict(
+            os.environ, {"USE_LITE_LLM": "True", "LITELLM_BASE_URL": "http://localhost:4444/v1"}, clear=True
+        ):
+            litellm = create_llm()
+
+        assert gemini_a is not gemini_b
+        assert isinstance(litellm, ChatOpenAI)
+        assert get_llm_registry().stats()["creations"] == 3
+
+    def test_clients_are_scoped_per_event_loop(self) -> None:
+        """
+        Test each asyncio.run() gets its own client (the async HTTP pool is loop-bound).
+
+        Acceptance Criteria:
+        - Calls within one loop reuse the client
+        - A new loop gets a new client instead of one bound to a closed loop
+        - Entries of closed loops are pruned
+        """
+
+        async def create_twice() -> tuple:
+            return create_llm(), create_llm()
+
+        env = {"USE_LITE_LLM": "True", "LITELLM_BASE_URL": "http://localhost:4444/v1"}
+        with patch.dict(os.environ, env, clear=True):
+            first_a, first_b = asyncio.run(create_twice())
+            second_a, _ = asyncio.run(create_twice())
+
+        assert first_a is first_b
+        assert second_a is not first_a
+        assert get_llm_registry().stats() == {"clients": 1, "creations": 2, "reuses": 2}
+
+    def test_client_key_hides_api_key(self) -> None:
+        """
+        Test the registry key never contains the raw API key.
+
+        Acceptance Criteria:
+        - API key is fingerprinted in client_key()
+        """
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "secret-key-value"}, clear=True):
+            key = GoogleGenerativeAIProvider().client_key()
+
+        assert "secret-key-value" not in repr(key)
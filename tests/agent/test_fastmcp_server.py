@@ -22,10 +22,10 @@ class TestToolRegistration:
     """Test tool registration."""
 
     def test_tools_list_exists(self):
-        """AC8: TOOLS list exists and has 6 tools."""
+        """AC8: TOOLS list exists and has 6 tools plus the Tool 5 batch save."""
         assert TOOLS is not None
         assert isinstance(TOOLS, list)
-        assert len(TOOLS) == 6
+        assert len(TOOLS) == 7
 
     def test_all_tools_have_invoke_method(self):
         """AC8: All tools can be invoked (LangChain StructuredTool)."""
@@ -42,6 +42,7 @@ class TestToolRegistration:
             "validate_question_quality",
             "save_generated_question",
             "score_and_explain",
+            "save_generated_questions_batch",
         ]
         assert tool_names == expected_names
 
@@ -241,7 +242,7 @@ class TestLangChainIntegration:
 
     def test_tools_compatible_with_langchain(self):
         """AC8: Tools are compatible with LangChain agent execution."""
-        assert len(TOOLS) == 6
+        assert len(TOOLS) == 7
         for tool in TOOLS:
             # LangChain StructuredTool has these attributes
             assert hasattr(tool, "invoke")
@@ -348,13 +349,13 @@ class TestAcceptanceCriteria:
 
     def test_ac7_tools_registered(self):
         """AC7: Tools are registered and available."""
-        assert len(TOOLS) == 6
+        assert len(TOOLS) == 7
         for tool in TOOLS:
             assert hasattr(tool, "invoke")
 
     def test_ac8_tools_invocation_interface(self):
         """AC8: Standard interface for LangChain agent."""
-        assert len(TOOLS) == 6
+        assert len(TOOLS) == 7
         for tool in TOOLS:
             assert hasattr(tool, "invoke")
             assert hasattr(tool, "name")
@@ -0,0 +1,99 @@
+"""
+Tests for single-pass tolerant JSON parsing.
+
+REQ: REQ-A-JsonRepair
+
+테스트 대상:
+- parse_json_tolerant(): fast path, 결함 수리, 수리 목록 보고
+- repair_json(): 문자열 내부 보존
+"""
+
+import json
+
+import pytest
+
+from src.agent.json_repair import (
+    CONTROL_CHARACTER,
+    INVALID_ESCAPE,
+    MARKDOWN_FENCE,
+    PYTHON_LITERAL,
+    SURROUNDING_TEXT,
+    TRAILING_COMMA,
+    parse_json_tolerant,
+    repair_json,
+)
+
+
+class TestParseJsonTolerant:
+    """parse_json_tolerant() 테스트."""
+
+    def test_valid_json_needs_no_repair(self) -> None:
+        """유효한 JSON은 수리 없이 파싱된다."""
+        result = parse_json_tolerant('{"a": [1, 2], "b": "x\\ny"}')
+
+        assert result.value == {"a": [1, 2], "b": "x\ny"}
+        assert result.repairs == []
+        assert result.repaired is False
+
+    def test_markdown_fence_and_surrounding_text(self) -> None:
+        """코드블록과 앞뒤 설명 문장을 제거한다."""
+        fenced = parse_json_tolerant('결과입니다:\n```json\n[{"id": 1}]\n```\n끝.')
+        prose = parse_json_tolerant('Here is the answer: {"id": 1} Hope this helps.')
+
+        assert fenced.value == [{"id": 1}]
+        assert fenced.repairs == [MARKDOWN_FENCE]
+        assert prose.value == {"id": 1}
+        assert prose.repairs == [SURROUNDING_TEXT]
+
+    def test_all_defects_repaired_in_one_pass(self) -> None:
+        """Python literal, trailing comma, 잘못된 escape, 제어 문자를 함께 수리한다."""
+        text = '{"ok": True, "missing": None, "path": "C:\\dir\\xyz", "text": "줄1\n줄2\t탭", "items": [1, 2,],}'
+
+        result = parse_json_tolerant(text)
+
+        assert result.value == {
+            "ok": True,
+            "missing": None,
+            "path": "C:\\dir\\xyz",
+            "text": "줄1\n줄2\t탭",
+            "items": [1, 2],
+        }
+        assert set(result.repairs) == {PYTHON_LITERAL, TRAILING_COMMA, INVALID_ESCAPE, CONTROL_CHARACTER}
+
+    def test_string_contents_are_preserved(self) -> None:
+        """문자열 내부의 True/None/쉼표와 유효한 escape는 바꾸지 않는다."""
+        text = '{"stem": "True or None, [a,]?", "quote": "say \\"hi\\" \\u00e9", "flag": False}'
+
+        result = parse_json_tolerant(text)
+
+        assert result.value == {"stem": "True or None, [a,]?", "quote": 'say "hi" é', "flag": False}
+        assert result.repairs == [PYTHON_LITERAL]
+
+    def test_unrepairable_json_raises_decode_error(self) -> None:
+        """수리할 수 없는 JSON은 JSONDecodeError를 발생시킨다."""
+        with pytest.raises(json.JSONDecodeError):
+            parse_json_tolerant('{"a": 1, "b": }')
+
+    def test_empty_input_raises_value_error(self) -> None:
+        """빈 입력은 ValueError."""
+        with pytest.raises(ValueError):
+            parse_json_tolerant("")
+
+
+class TestRepairJson:
+    """repair_json() 테스트."""
+
+    def test_valid_text_is_unchanged(self) -> None:
+        """결함이 없으면 원문 그대로 반환하고 수리 목록은 비어 있다."""
+        repairs: list[str] = []
+        text = '{"a": "b\\\\c", "n": [null, true]}'
+
+        assert repair_json(text, repairs) == text
+        assert repairs == []
+
+    def test_control_characters_outside_strings_removed(self) -> None:
+        """문자열 밖의 제어 문자는 제거된다."""
+        repairs: list[str] = []
+
+        assert json.loads(repair_json('{"a":\x0b 1}', repairs)) == {"a": 1}
+        assert repairs == [CONTROL_CHARACTER]
@@ -15,6 +15,10 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
 
 from src.agent.llm_agent import (
     AnswerSchema,
@@ -640,6 +644,183 @@ class TestCreateAgentFactory:
             assert result is not None
 
 
+class TestItemGenAgentPool:
+    """Test process-wide ItemGenAgent pool (REQ-A-AgentPool)"""
+
+    @staticmethod
+    def _provider(model: str) -> MagicMock:
+        provider = MagicMock()
+        provider.client_key.return_value = ("GoogleGenerativeAIProvider", (("model", model),))
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_agent_compiled_once_per_configuration(self):
+        """
+        REQ: REQ-A-AgentPool
+        Repeated create_agent() calls reuse the compiled agent until the configuration changes
+        """
+        from src.agent.llm_agent import get_agent_pool
+
+        with (
+            patch("src.agent.llm_agent.LLMFactory.get_provider", return_value=self._provider("gemini-a")) as provider,
+            patch("src.agent.llm_agent.ItemGenAgent", side_effect=lambda: MagicMock(spec=ItemGenAgent)) as MockAgent,
+        ):
+            first = await create_agent()
+            second = await create_agent()
+            assert first is second
+            assert MockAgent.call_count == 1
+
+            provider.return_value = self._provider("gemini-b")
+            third = await create_agent()
+            assert third is not first
+            assert MockAgent.call_count == 2
+
+        stats = get_agent_pool().stats()
+        assert stats["agents"] == 2
+        assert stats["builds"] == 2
+        assert stats["reuses"] == 1
+        assert stats["seconds_saved"] >= 0
+
+    def test_agents_are_scoped_per_event_loop(self):
+        """
+        REQ: REQ-A-AgentPool
+        Each asyncio.run() (e.g. each CLI command) gets its own agent; agents of closed loops are dropped
+        """
+        import asyncio
+
+        from src.agent.llm_agent import get_agent_pool
+
+        async def create_twice() -> tuple:
+            return await create_agent(), await create_agent()
+
+        with (
+            patch("src.agent.llm_agent.LLMFactory.get_provider", return_value=self._provider("gemini-a")),
+            patch("src.agent.llm_agent.ItemGenAgent", side_effect=lambda: MagicMock(spec=ItemGenAgent)),
+        ):
+            first_a, first_b = asyncio.run(create_twice())
+            second_a, _ = asyncio.run(create_twice())
+
+        assert first_a is first_b
+        assert second_a is not first_a
+        stats = get_agent_pool().stats()
+        assert (stats["agents"], stats["builds"], stats["reuses"]) == (1, 2, 2)
+
+    def test_failed_construction_is_not_cached(self):
+        """
+        REQ: REQ-A-AgentPool
+        A failing build is retried on the next request; warm_up() reports failure without raising
+        """
+        from src.agent.llm_agent import get_agent_pool
+
+        pool = get_agent_pool()
+        with (
+            patch("src.agent.llm_agent.LLMFactory.get_provider", return_value=self._provider("gemini-a")),
+            patch("src.agent.llm_agent.ItemGenAgent", side_effect=RuntimeError("boom")),
+        ):
+            assert pool.warm_up() is False
+
+        with (
+            patch("src.agent.llm_agent.LLMFactory.get_provider", return_value=self._provider("gemini-a")),
+            patch("src.agent.llm_agent.ItemGenAgent", return_value=MagicMock(spec=ItemGenAgent)),
+        ):
+            assert pool.warm_up() is True
+
+        assert pool.stats()["builds"] == 1
+
+
+class _ScriptedToolModel(BaseChatModel):
+    """Chat model that drives the ReAct loop from the last message; fails once after Tool 1."""
+
+    fail_after_profile: bool = True
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools: list, **kwargs: object) -> "_ScriptedToolModel":
+        return self
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: object = None, run_manager: object = None, **kwargs: object
+    ) -> ChatResult:
+        self.calls += 1
+        last = messages[-1]
+        if isinstance(last, ToolMessage) and last.name == "get_user_profile" and self.fail_after_profile:
+            self.fail_after_profile = False
+            raise RuntimeError("LLM API timeout")
+        if isinstance(last, ToolMessage) and last.name == "save_generated_question":
+            message = AIMessage(content="All questions saved.")
+        elif isinstance(last, ToolMessage) or "more question" in last.content:
+            message = AIMessage(content="", tool_calls=[{"name": "save_generated_question", "args": {}, "id": f"s{self.calls}"}])
+        else:
+            message = AIMessage(content="", tool_calls=[{"name": "get_user_profile", "args": {}, "id": "p"}])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class TestGenerateQuestionsResume:
+    """Test checkpointed resume and top-up of generation threads (REQ-A-Mode1-Resume)"""
+
+    @pytest.mark.asyncio
+    async def test_resume_reruns_failed_step_and_tops_up_without_redoing_tools(self):
+        """
+        REQ: REQ-A-Mode1-Resume
+        A failed run resumes after Tool 1; a top-up run only generates the missing question
+        """
+        profile_calls = []
+        saved_ids = []
+
+        @tool
+        def get_user_profile() -> str:
+            """Return the user profile."""
+            profile_calls.append(1)
+            return json.dumps({"self_level": "beginner"})
+
+        @tool
+        def save_generated_question() -> str:
+            """Save one question."""
+            saved_ids.append(f"q{len(saved_ids) + 1}")
+            return json.dumps(
+                {
+                    "question_id": saved_ids[-1],
+                    "item_type": "multiple_choice",
+                    "stem": f"Question {saved_ids[-1]}?",
+                    "choices": ["A", "B"],
+                    "answer_schema": {"correct_key": "A"},
+                    "difficulty": 3,
+                    "category": "LLM",
+                    "success": True,
+                }
+            )
+
+        model = _ScriptedToolModel()
+        with (
+            patch("src.agent.llm_agent.create_llm", return_value=model),
+            patch("src.agent.llm_agent.TOOLS", [get_user_profile, save_generated_question]),
+            patch("src.agent.llm_agent.get_react_prompt", return_value="You are a test agent."),
+        ):
+            agent = ItemGenAgent()
+
+        request = GenerateQuestionsRequest(session_id="session_resume", survey_id="survey_1", round_idx=1)
+        failed = await agent.generate_questions(request)
+        assert failed.items == []
+        assert failed.error_message == "LLM API timeout"
+
+        resumed = await agent.generate_questions(request.model_copy(update={"resume": True}))
+        assert [item.id for item in resumed.items] == ["q1"]
+
+        topped_up = await agent.generate_questions(request.model_copy(update={"resume": True, "question_count": 1}))
+        assert [item.id for item in topped_up.items] == ["q1", "q2"]
+
+        # Tool 1 ran once; the LLM was called 1 (fail) + 2 (resume) + 2 (top-up) times after it
+        assert len(profile_calls) == 1
+        assert model.calls == 6
+
+        config = agent._thread_config("session_resume")
+        await agent.discard_checkpoint("session_resume")
+        assert (await agent.executor.aget_state(config)).values == {}
+
+
 # ============================================================================
 # Phase 5: Test Parsing Logic
 # ============================================================================
@@ -715,6 +896,39 @@ class TestParseAgentOutputGenerate:
 
         assert len(response.items) == 3
 
+    @pytest.mark.asyncio
+    async def test_parse_batch_saved_questions(self, agent_instance):
+        """
+        REQ: REQ-A-Mode1-Tool5-Batch
+        Parse save_generated_questions_batch output together with single saves
+
+        Given:
+            - One single save and one batch save with 2 saved questions
+        When:
+            - _parse_agent_output_generate() is called
+        Then:
+            - All 3 items extracted, batch entries in their saved order
+        """
+        batch_output = {
+            "saved": [
+                {"index": 0, "question_id": "q2", "stem": "Q2", "success": True},
+                {"index": 2, "question_id": "q3", "stem": "Q3", "success": True},
+            ],
+            "failed": [{"index": 1, "error": "stem cannot be empty"}],
+            "success": True,
+        }
+        result = {
+            "output": "Generated 3",
+            "intermediate_steps": [
+                ("save_generated_question", json.dumps({"question_id": "q1", "stem": "Q1", "success": True})),
+                ("save_generated_questions_batch", json.dumps(batch_output)),
+            ]
+        }
+
+        response = agent_instance._parse_agent_output_generate(result, "round_batch")
+
+        assert [item.id for item in response.items] == ["q1", "q2", "q3"]
+
     @pytest.mark.asyncio
     async def test_parse_malformed_json_in_intermediate_steps(self, agent_instance):
         """
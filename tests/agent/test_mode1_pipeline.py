@@ -4,11 +4,19 @@ REQ: REQ-A-Mode1-Pipeline
 Tests for generate_questions() orchestrator that coordinates Tools 1-5.
 """
 
+import asyncio
+import json
+import re
+import threading
+import time
+from collections.abc import Callable
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.backend.models.test_session import TestSession
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -568,7 +576,6 @@ class TestCompletePipeline:
             patch("src.agent.pipeline.mode1_pipeline.validate_question_quality") as mock_tool4,
             patch("src.agent.pipeline.mode1_pipeline.save_generated_question") as mock_tool5,
         ):
-
             # Setup mocks
             mock_tool1.return_value = mock_user_profile
             mock_tool2.return_value = mock_question_templates
@@ -620,7 +627,6 @@ class TestCompletePipeline:
             patch("src.agent.pipeline.mode1_pipeline.validate_question_quality") as mock_tool4,
             patch("src.agent.pipeline.mode1_pipeline.save_generated_question") as mock_tool5,
         ):
-
             mock_tool1.return_value = mock_user_profile
             mock_tool3.return_value = mock_difficulty_keywords
             mock_llm.return_value = mock_generated_questions
@@ -648,3 +654,119 @@ class TestCompletePipeline:
                 assert "difficulty" in question
                 assert "category" in question
                 assert "validation_score" in question
+
+
+# ============================================================================
+# Parallel Pipeline Tests (REQ-A-Mode1-Parallel)
+# ============================================================================
+
+
+class _ConcurrencyProbe:
+    """Track the maximum number of overlapping calls."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def __exit__(self, *exc: object) -> None:
+        with self.lock:
+            self.active -= 1
+
+
+class _FakeLLM:
+    """Async chat model answering each question prompt with a JSON draft."""
+
+    model = "gpt-4o"
+
+    def __init__(self) -> None:
+        self.probe = _ConcurrencyProbe()
+        self.prompts: list[str] = []
+
+    async def ainvoke(self, prompt: str) -> MagicMock:
+        self.prompts.append(prompt)
+        with self.probe:
+            await asyncio.sleep(0.05)
+        item_type = re.search(r"Question type: (\w+)", prompt).group(1)
+        draft = {"stem": f"What does an LLM predict? ({len(self.prompts)})", "category": "LLM"}
+        if item_type == "short_answer":
+            draft["correct_keywords"] = ["next token", "probability"]
+        elif item_type == "true_false":
+            draft["correct_answer"] = "True"
+        else:
+            draft["choices"] = ["Next token", "Image", "Sound", "Table"]
+            draft["correct_answer"] = "Next token"
+        return MagicMock(content=f"```json\n{json.dumps(draft)}\n```")
+
+
+class TestParallelPipeline:
+    """REQ-A-Mode1-Parallel: deterministic parallel mode without the ReAct loop."""
+
+    @pytest.mark.asyncio
+    async def test_agenerate_questions_runs_tools_and_llm_calls_concurrently(
+        self, test_session_round1_fixture: TestSession, mock_user_profile: dict[str, Any]
+    ) -> None:
+        """Tools 1-3 overlap, LLM calls are bounded by max_concurrent, accepted questions are saved."""
+        from src.agent.pipeline.mode1_pipeline import Mode1Pipeline
+        from src.backend.models.question import Question
+
+        tools = _ConcurrencyProbe()
+
+        def slow(result: object) -> Callable[..., object]:
+            def call(*args: object, **kwargs: object) -> object:
+                with tools:
+                    time.sleep(0.1)
+                return result
+
+            return call
+
+        def validate(stem: list[str], **kwargs: object) -> list[dict[str, Any]]:
+            # Reject the second question only
+            return [
+                {"final_score": 0.5 if index == 1 else 0.9, "should_discard": index == 1} for index in range(len(stem))
+            ]
+
+        llm = _FakeLLM()
+        with (
+            patch("src.agent.pipeline.mode1_pipeline._get_user_profile_impl", side_effect=slow(mock_user_profile)),
+            patch("src.agent.pipeline.mode1_pipeline._search_question_templates_impl", side_effect=slow([])),
+            patch(
+                "src.agent.pipeline.mode1_pipeline._get_difficulty_keywords_impl",
+                side_effect=slow({"keywords": ["Transformer", "Tokenizer"]}),
+            ),
+            patch("src.agent.pipeline.mode1_pipeline.create_llm", return_value=llm),
+            patch("src.agent.pipeline.mode1_pipeline._validate_question_quality_impl", side_effect=validate),
+        ):
+            pipeline = Mode1Pipeline(session_id=test_session_round1_fixture.id, max_concurrent=2)
+            result = await pipeline.agenerate_questions(
+                "user_1", round_number=1, count=5, profile_hint={"self_level": "intermediate", "interests": ["LLM"]}
+            )
+
+        assert tools.max_active == 3
+        assert llm.probe.max_active == 2
+        assert [re.search(r"Question type: (\w+)", p).group(1) for p in sorted(llm.prompts)] == [
+            "multiple_choice",
+            "true_false",
+            "short_answer",
+            "multiple_choice",
+            "true_false",
+        ]
+
+        assert result["status"] == "partial"
+        assert result["generated_count"] == 4
+        assert result["round_id"].startswith(f"{test_session_round1_fixture.id}_1_")
+
+        from src.backend.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            saved = db.query(Question).filter_by(session_id=test_session_round1_fixture.id).all()
+            assert {q.id for q in saved} == {q["question_id"] for q in result["questions"]}
+            assert all(q.round == 1 and q.difficulty == 4 for q in saved)
+        finally:
+            db.close()
@@ -0,0 +1,132 @@
+"""
+Test suite for short-answer grading reuse (exact and near-duplicate clustering).
+
+REQ: REQ-A-Mode2-Tool6
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.agent.tools.grading_reuse import (
+    GradingReuseIndex,
+    estimated_similarity,
+    get_grading_reuse_stats,
+    minhash_signature,
+    negation_markers,
+    normalize_answer,
+)
+from src.agent.tools.score_and_explain_tool import LLM_UNAVAILABLE_REASON, _score_short_answer
+from src.backend.config import settings
+
+KEYWORDS = ["retrieval", "generation", "vector database"]
+ANSWER = "RAG combines retrieval from a vector database with LLM generation of the final answer."
+
+
+class TestGradingReuseIndex:
+    """Exact hash and MinHash/LSH near-duplicate lookups."""
+
+    def test_exact_hit_after_normalization(self) -> None:
+        """Case, punctuation and spacing differences are exact hits."""
+        index = GradingReuseIndex()
+        context = index.context_key("q1", KEYWORDS, 5)
+        index.store(context, ANSWER, 90, "good")
+
+        reused = index.lookup(
+            context, "  rag combines RETRIEVAL from a vector database with llm generation of the final answer "
+        )
+
+        assert reused is not None
+        assert (reused.score, reused.match) == (90, "exact")
+        assert normalize_answer("A,  b!") == "a b"
+
+    def test_near_duplicate_hit(self) -> None:
+        """A one-word edit of a long answer reuses the representative's grade."""
+        index = GradingReuseIndex(threshold=0.7)
+        context = index.context_key("q1", KEYWORDS, 5)
+        index.store(context, ANSWER, 85, "good")
+
+        reused = index.lookup(context, ANSWER.replace("final", "whole"))
+
+        assert reused is not None
+        assert reused.match == "near"
+        assert 0.7 <= reused.similarity < 1.0
+
+    def test_negated_answer_misses(self) -> None:
+        """'X is not Y' never reuses the grade of 'X is Y', even above the similarity threshold."""
+        index = GradingReuseIndex()
+        context = index.context_key("q1", KEYWORDS, 5)
+        index.store(context, ANSWER, 90, "good")
+        korean = "RAG는 벡터 데이터베이스에서 검색한 문서를 LLM 생성에 활용합니다"
+        index.store(context, korean, 90, "good")
+
+        # One inserted "never" keeps the estimated similarity above the default threshold
+        negated = ANSWER.replace("combines", "never combines")
+        assert (
+            estimated_similarity(
+                minhash_signature(normalize_answer(ANSWER)), minhash_signature(normalize_answer(negated))
+            )
+            >= index.threshold
+        )
+
+        assert index.lookup(context, negated) is None
+        assert index.lookup(context, ANSWER.replace("combines", "doesn't combine")) is None
+        assert index.lookup(context, korean.replace("활용합니다", "활용하지 않습니다")) is None
+        assert negation_markers(normalize_answer("It isn't, and 없다")) == ("t", "없")
+
+    def test_threshold_defaults_to_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The near-duplicate threshold comes from settings.SHORT_ANSWER_REUSE_THRESHOLD."""
+        monkeypatch.setattr(settings, "SHORT_ANSWER_REUSE_THRESHOLD", 0.95)
+
+        assert GradingReuseIndex().threshold == 0.95
+        assert GradingReuseIndex(threshold=0.7).threshold == 0.7
+
+    def test_dissimilar_answer_misses(self) -> None:
+        """Unrelated answers and other grading contexts are misses."""
+        index = GradingReuseIndex()
+        context = index.context_key("q1", KEYWORDS, 5)
+        index.store(context, ANSWER, 85, "good")
+
+        assert index.lookup(context, "I do not know.") is None
+        assert index.lookup(index.context_key("q2", KEYWORDS, 5), ANSWER) is None
+        assert index.lookup(index.context_key("q1", ["other"], 5), ANSWER) is None
+
+        stats = index.stats_snapshot()
+        assert (stats["lookups"], stats["misses"], stats["hit_rate"]) == (3, 3, 0.0)
+
+
+class TestShortAnswerScoringReuse:
+    """_score_short_answer grades one representative per cluster."""
+
+    def test_identical_answers_call_llm_once(self) -> None:
+        """Only the first of several identical answers reaches the LLM."""
+        with patch(
+            "src.agent.tools.score_and_explain_tool._call_llm_score_short_answer", return_value=(88, "ok")
+        ) as mock_llm:
+            results = [_score_short_answer(ANSWER, KEYWORDS, 5, question_id="q-reuse") for _ in range(5)]
+
+        assert mock_llm.call_count == 1
+        assert all(result[:2] == (True, 88) for result in results)
+        stats = get_grading_reuse_stats()
+        assert (stats["exact_hits"], stats["misses"]) == (4, 1)
+
+    def test_fallback_grades_are_not_reused(self) -> None:
+        """LLM failures are retried on the next answer instead of fanning out."""
+        with patch(
+            "src.agent.tools.score_and_explain_tool._call_llm_score_short_answer",
+            return_value=(50, LLM_UNAVAILABLE_REASON),
+        ) as mock_llm:
+            _score_short_answer(ANSWER, KEYWORDS, 5, question_id="q-fallback")
+            _score_short_answer(ANSWER, KEYWORDS, 5, question_id="q-fallback")
+
+        assert mock_llm.call_count == 2
+
+    def test_no_question_id_skips_reuse(self) -> None:
+        """Without a question id every answer is graded."""
+        with patch(
+            "src.agent.tools.score_and_explain_tool._call_llm_score_short_answer", return_value=(88, "ok")
+        ) as mock_llm:
+            _score_short_answer(ANSWER, KEYWORDS, 5)
+            _score_short_answer(ANSWER, KEYWORDS, 5)
+
+        assert mock_llm.call_count == 2
@@ -9,8 +9,12 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import Engine, event
 from sqlalchemy.orm import Session
 
+from src.backend.models.question import Question
+from src.backend.models.test_session import TestSession
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -638,3 +642,91 @@ class TestMetadataStorage:
                 call_kwargs = mock_question_class.call_args[1]
                 answer_schema = call_kwargs["answer_schema"]
                 assert "explanation" in answer_schema
+
+
+# ============================================================================
+# Batch Save Tests
+# ============================================================================
+
+
+class TestBatchSave:
+    """Tests for save_generated_questions_batch (REQ-A-Mode1-Tool5-Batch)."""
+
+    def test_batch_saves_round_with_one_insert_and_commit(
+        self,
+        valid_multiple_choice_question: dict[str, Any],
+        valid_short_answer_question: dict[str, Any],
+        db_engine: Engine,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Test that valid questions are written with one INSERT and invalid ones are reported.
+
+        REQ: REQ-A-Mode1-Tool5-Batch
+
+        Given: Two valid questions and one with an empty stem
+        When: save_generated_questions_batch() is called
+        Then: One INSERT statement, one commit; failed lists the invalid question by index
+        """
+        from src.agent.tools.save_question_tool import _save_generated_questions_batch_impl
+
+        statements: list[str] = []
+        commits: list[bool] = []
+
+        def record_statement(conn: object, cursor: object, statement: str, *args: object) -> None:
+            statements.append(statement)
+
+        def record_commit(conn: object) -> None:
+            commits.append(True)
+
+        round_id = valid_multiple_choice_question["round_id"]
+        questions = [
+            valid_multiple_choice_question,
+            {**valid_multiple_choice_question, "stem": " "},
+            valid_short_answer_question,
+        ]
+        event.listen(db_engine, "before_cursor_execute", record_statement)
+        event.listen(db_engine, "commit", record_commit)
+        try:
+            result = _save_generated_questions_batch_impl(questions, round_id, test_session_round1_fixture.id)
+        finally:
+            event.remove(db_engine, "before_cursor_execute", record_statement)
+            event.remove(db_engine, "commit", record_commit)
+
+        assert result["success"] is True
+        assert [s for s in statements if s.lstrip().upper().startswith("INSERT")] == [statements[0]]
+        assert len(commits) == 1
+        assert result["failed"] == [{"index": 1, "error": "stem cannot be empty"}]
+        assert [saved["index"] for saved in result["saved"]] == [0, 2]
+        assert result["saved"][0]["correct_answer"] == valid_multiple_choice_question["correct_key"]
+        assert result["saved"][1]["correct_keywords"] == valid_short_answer_question["correct_keywords"]
+
+        stored = {q.id: q for q in db_session.query(Question).all()}
+        assert set(stored) == {saved["question_id"] for saved in result["saved"]}
+        first = stored[result["saved"][0]["question_id"]]
+        assert first.session_id == test_session_round1_fixture.id
+        assert first.category == "LLM"
+        assert first.answer_schema["validation_score"] == 0.92
+
+    def test_batch_database_error_queues_questions(self, valid_true_false_question: dict[str, Any]) -> None:
+        """Test that a failed batch transaction queues every valid question for retry.
+
+        REQ: REQ-A-Mode1-Tool5-Batch
+        """
+        from src.agent.tools import save_question_tool
+
+        with (
+            patch.object(save_question_tool, "SAVE_RETRY_QUEUE", []) as retry_queue,
+            patch(
+                "src.agent.tools.save_question_tool.QuestionPersistenceService.save_questions_bulk",
+                side_effect=Exception("Database connection error"),
+            ),
+        ):
+            result = save_question_tool._save_generated_questions_batch_impl(
+                [valid_true_false_question, valid_true_false_question], valid_true_false_question["round_id"]
+            )
+
+        assert result["success"] is False
+        assert result["queued_for_retry"] is True
+        assert result["saved"] == []
+        assert len(retry_queue) == 2
@@ -4,11 +4,15 @@ REQ: REQ-A-Mode1-Tool4
 Tests for validate_question_quality() function that validates generated questions.
 """
 
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.agent.tools.validate_question_tool import ValidationCascadeStats
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -608,6 +612,127 @@ class TestBatchValidation:
             assert "issues" in result
 
 
+class TestConcurrentBatchValidation:
+    """Tests for the batch validation engine (REQ-A-Mode1-Tool4-Batch)."""
+
+    def test_concurrent_mode_bounds_parallel_llm_calls(self, batch_questions: list[dict[str, Any]]) -> None:
+        """Test that per-question LLM checks overlap up to the concurrency limit.
+
+        REQ: REQ-A-Mode1-Tool4-Batch
+
+        Given: 10 questions and VALIDATION_MAX_CONCURRENCY=5
+        When: validate_question_quality() is called with batch=True (concurrent mode)
+        Then: At most 5 LLM checks run at once and results keep the input order
+        """
+        from src.agent.tools.validate_question_tool import (
+            _validate_question_quality_impl,
+        )
+
+        questions = batch_questions * 2
+        scores = {q["stem"]: 0.9 if q["question_type"] == "true_false" else 0.6 for q in questions}
+        lock = threading.Lock()
+        in_flight = {"active": 0, "max": 0}
+
+        def slow_llm(stem: str, *args: object) -> float:
+            with lock:
+                in_flight["active"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["active"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["active"] -= 1
+            return scores[stem]
+
+        with (
+            patch("src.agent.tools.validate_question_tool.VALIDATION_MAX_CONCURRENCY", 5),
+            patch("src.agent.tools.validate_question_tool._call_llm_validation", side_effect=slow_llm),
+        ):
+            results = _validate_question_quality_impl(
+                stem=[q["stem"] for q in questions],
+                question_type=[q["question_type"] for q in questions],
+                choices=[q.get("choices") for q in questions],
+                correct_answer=[q["correct_answer"] for q in questions],
+                batch=True,
+                batch_mode="concurrent",
+            )
+
+        assert in_flight["max"] == 5
+        assert [r["score"] for r in results] == [scores[q["stem"]] for q in questions]
+        assert [r["should_discard"] for r in results] == [q["question_type"] != "true_false" for q in questions]
+
+    def test_single_prompt_mode_scores_all_questions_in_one_call(self, batch_questions: list[dict[str, Any]]) -> None:
+        """Test that single-prompt mode makes one LLM call and parses the JSON array.
+
+        REQ: REQ-A-Mode1-Tool4-Batch
+
+        Given: 5 questions; the LLM answers with a fenced JSON array (one entry missing)
+        When: validate_question_quality() is called with batch_mode="single_prompt"
+        Then: One LLM call; scores are mapped by index, the missing one gets the default
+        """
+        from src.agent.tools.validate_question_tool import (
+            DEFAULT_LLM_SCORE,
+            _validate_question_quality_impl,
+        )
+
+        content = (
+            '```json\n[{"index": 2, "score": 0.4}, {"index": 1, "score": 0.95}, 0.9, {"index": 5, "score": 1.2}]\n```'
+        )
+        mock_llm_instance = MagicMock()
+        mock_llm_instance.invoke.return_value = MagicMock(content=content)
+
+        with (
+            patch("src.agent.tools.validate_question_tool.create_llm", return_value=mock_llm_instance),
+            patch("src.agent.tools.validate_question_tool._call_llm_validation") as mock_single,
+        ):
+            results = _validate_question_quality_impl(
+                stem=[q["stem"] for q in batch_questions],
+                question_type=[q["question_type"] for q in batch_questions],
+                choices=[q.get("choices") for q in batch_questions],
+                correct_answer=[q["correct_answer"] for q in batch_questions],
+                batch=True,
+                batch_mode="single_prompt",
+            )
+
+        mock_llm_instance.invoke.assert_called_once()
+        mock_single.assert_not_called()
+        prompt = mock_llm_instance.invoke.call_args.args[0]
+        assert all(q["stem"] in prompt for q in batch_questions)
+        assert [r["score"] for r in results] == [0.95, 0.4, 0.9, DEFAULT_LLM_SCORE, 1.0]
+        assert [r["recommendation"] for r in results] == ["pass", "reject", "pass", "reject", "pass"]
+        assert [r["should_discard"] for r in results] == [False, True, False, True, False]
+
+    def test_single_prompt_mode_falls_back_to_concurrent(self, batch_questions: list[dict[str, Any]]) -> None:
+        """Test that an unparseable batch response falls back to per-question checks.
+
+        REQ: REQ-A-Mode1-Tool4-Batch
+
+        Given: The batch LLM call returns no JSON array
+        When: validate_question_quality() is called with batch_mode="single_prompt"
+        Then: Every question is validated with its own LLM check
+        """
+        from src.agent.tools.validate_question_tool import (
+            _validate_question_quality_impl,
+        )
+
+        mock_llm_instance = MagicMock()
+        mock_llm_instance.invoke.return_value = MagicMock(content="0.9")
+
+        with (
+            patch("src.agent.tools.validate_question_tool.create_llm", return_value=mock_llm_instance),
+            patch("src.agent.tools.validate_question_tool._call_llm_validation", return_value=0.8) as mock_single,
+        ):
+            results = _validate_question_quality_impl(
+                stem=[q["stem"] for q in batch_questions],
+                question_type=[q["question_type"] for q in batch_questions],
+                choices=[q.get("choices") for q in batch_questions],
+                correct_answer=[q["correct_answer"] for q in batch_questions],
+                batch=True,
+                batch_mode="single_prompt",
+            )
+
+        assert mock_single.call_count == 5
+        assert [r["score"] for r in results] == [0.8] * 5
+
+
 # ============================================================================
 # Edge Cases & Error Handling Tests
 # ============================================================================
@@ -781,3 +906,174 @@ class TestResponseStructure:
         # final_score should be min of LLM and rule scores
         expected_final = min(result["score"], result["rule_score"])
         assert result["final_score"] == expected_final
+
+
+# ============================================================================
+# Validation Cascade Tests
+# ============================================================================
+
+
+@pytest.fixture
+def cascade_stats(monkeypatch: pytest.MonkeyPatch) -> ValidationCascadeStats:
+    """Give each test fresh process-wide cascade counters."""
+    from src.agent.tools import validate_question_tool
+
+    stats = ValidationCascadeStats()
+    monkeypatch.setattr(validate_question_tool, "_cascade_stats", stats)
+    return stats
+
+
+class TestValidationCascade:
+    """Tests for the cost-aware validation cascade (REQ-A-Mode1-Tool4-Cascade)."""
+
+    def test_rule_rejection_skips_llm(
+        self, invalid_few_choices_question: dict[str, Any], cascade_stats: ValidationCascadeStats
+    ) -> None:
+        """Test that a question failing the rule checks never reaches the LLM.
+
+        REQ: REQ-A-Mode1-Tool4-Cascade
+
+        Given: Too few choices and a correct answer missing from them (rule_score 0.5)
+        When: validate_question_quality() is called
+        Then: No LLM call; rejected by the rules stage, later stages counted as skipped
+        """
+        from src.agent.tools.validate_question_tool import (
+            _validate_question_quality_impl,
+            get_validation_cascade_stats,
+        )
+
+        with patch("src.agent.tools.validate_question_tool._call_llm_validation") as mock_llm:
+            result = _validate_question_quality_impl(**{**invalid_few_choices_question, "correct_answer": "Z"})
+
+        mock_llm.assert_not_called()
+        assert result["decided_by"] == "rules"
+        assert result["final_score"] == result["rule_score"] < 0.70
+        assert result["should_discard"] is True
+        stats = get_validation_cascade_stats()
+        assert stats["rules"] == {"checked": 1, "rejected": 1, "skipped": 0}
+        assert stats["content"] == {"checked": 0, "rejected": 0, "skipped": 1}
+        assert stats["llm_calls_saved"] == 1
+
+    def test_content_rejection_skips_llm(self, cascade_stats: ValidationCascadeStats) -> None:
+        """Test that profanity is rejected by the content stage without an LLM call.
+
+        REQ: REQ-A-Mode1-Tool4-Cascade
+        """
+        from src.agent.tools.validate_question_tool import _validate_question_quality_impl
+
+        with patch("src.agent.tools.validate_question_tool._call_llm_validation") as mock_llm:
+            result = _validate_question_quality_impl(
+                stem="What the hell is a vector database?",
+                question_type="short_answer",
+                correct_answer="A store for embeddings",
+            )
+
+        mock_llm.assert_not_called()
+        assert result["decided_by"] == "content"
+        assert result["final_score"] == 0.0
+        assert result["recommendation"] == "reject"
+        assert "inappropriate language" in result["issues"][-1]
+        assert cascade_stats.as_dict()["content"]["rejected"] == 1
+
+    def test_near_duplicate_of_stored_question_skips_llm(
+        self,
+        valid_multiple_choice_question: dict[str, Any],
+        question_factory: callable,
+        cascade_stats: ValidationCascadeStats,
+    ) -> None:
+        """Test that a near-duplicate of a stored stem is rejected without an LLM call.
+
+        REQ: REQ-A-Mode1-Tool4-Cascade
+
+        Given: A stored question whose stem differs only in case/punctuation
+        When: validate_question_quality() is called
+        Then: Rejected by the duplicate stage
+        """
+        from src.agent.tools.validate_question_tool import _validate_question_quality_impl
+
+        question_factory(stem="what is the main advantage of using RAG in LLM applications")
+
+        with patch("src.agent.tools.validate_question_tool._call_llm_validation") as mock_llm:
+            result = _validate_question_quality_impl(**valid_multiple_choice_question)
+
+        mock_llm.assert_not_called()
+        assert result["decided_by"] == "duplicate"
+        assert result["should_discard"] is True
+        assert result["issues"][-1].startswith("Near-duplicate of an existing question")
+        assert cascade_stats.as_dict()["duplicate"] == {"checked": 1, "rejected": 1, "skipped": 0}
+
+    def test_unavailable_database_skips_duplicate_stage(
+        self, valid_multiple_choice_question: dict[str, Any], cascade_stats: ValidationCascadeStats
+    ) -> None:
+        """Test that a failing stem lookup only skips the duplicate stage.
+
+        REQ: REQ-A-Mode1-Tool4-Cascade
+        """
+        from src.agent.tools.validate_question_tool import _validate_question_quality_impl
+
+        with (
+            patch("src.agent.tools.validate_question_tool.get_db", side_effect=RuntimeError("db down")),
+            patch("src.agent.tools.validate_question_tool._call_llm_validation", return_value=0.9) as mock_llm,
+        ):
+            result = _validate_question_quality_impl(**valid_multiple_choice_question)
+
+        mock_llm.assert_called_once()
+        assert result["decided_by"] == "llm"
+        assert result["recommendation"] == "pass"
+        stats = cascade_stats.as_dict()
+        assert stats["duplicate"] == {"checked": 0, "rejected": 0, "skipped": 1}
+        assert stats["llm"] == {"checked": 1, "rejected": 0, "skipped": 0}
+
+    @pytest.mark.parametrize("batch_mode", ["concurrent", "single_prompt"])
+    def test_batch_sends_only_survivors_to_llm(
+        self, batch_questions: list[dict[str, Any]], batch_mode: str, cascade_stats: ValidationCascadeStats
+    ) -> None:
+        """Test that batch validation LLM-scores only questions passing the cheap stages.
+
+        REQ: REQ-A-Mode1-Tool4-Cascade
+
+        Given: 5 valid questions plus one rule failure and one profane question
+        When: validate_question_quality() is called with batch=True
+        Then: Only the 5 valid questions reach the LLM; results keep the input order
+        """
+        from src.agent.tools.validate_question_tool import _validate_question_quality_impl
+
+        questions = [
+            *batch_questions[:2],
+            {"stem": "Pick one", "question_type": "multiple_choice", "choices": ["A", "B"], "correct_answer": "Z"},
+            *batch_questions[2:],
+            {
+                "stem": "Is this crap?",
+                "question_type": "true_false",
+                "choices": ["True", "False"],
+                "correct_answer": "True",
+            },
+        ]
+        mock_llm_instance = MagicMock()
+        mock_llm_instance.invoke.return_value = MagicMock(content="[0.9, 0.9, 0.9, 0.9, 0.9]")
+
+        with (
+            patch("src.agent.tools.validate_question_tool.create_llm", return_value=mock_llm_instance),
+            patch("src.agent.tools.validate_question_tool._call_llm_validation", return_value=0.9) as mock_single,
+        ):
+            results = _validate_question_quality_impl(
+                stem=[q["stem"] for q in questions],
+                question_type=[q["question_type"] for q in questions],
+                choices=[q.get("choices") for q in questions],
+                correct_answer=[q["correct_answer"] for q in questions],
+                batch=True,
+                batch_mode=batch_mode,
+            )
+
+        llm_stems = (
+            [call.args[0] for call in mock_single.call_args_list]
+            if batch_mode == "concurrent"
+            else [q["stem"] for q in batch_questions if q["stem"] in mock_llm_instance.invoke.call_args.args[0]]
+        )
+        assert sorted(llm_stems) == sorted(q["stem"] for q in batch_questions)
+        if batch_mode == "single_prompt":
+            assert "Pick one" not in mock_llm_instance.invoke.call_args.args[0]
+            mock_single.assert_not_called()
+        assert [r["decided_by"] for r in results] == ["llm", "llm", "rules", "llm", "llm", "llm", "content"]
+        assert [r["should_discard"] for r in results] == [False, False, True, False, False, False, True]
+        assert cascade_stats.as_dict()["llm_calls_saved"] == 2
@@ -128,6 +128,69 @@ class TestSaveAnswer:
         count = db_session.query(AttemptAnswer).filter_by(session_id=test_session_in_progress.id).count()
         assert count == 1
 
+    def test_save_scores_multiple_choice_inline(
+        self, db_session: Session, test_session_in_progress: TestSession
+    ) -> None:
+        """MC answers are scored at save time and re-scored when changed."""
+        service = AutosaveService(db_session)
+
+        question = Question(
+            session_id=test_session_in_progress.id,
+            item_type="multiple_choice",
+            stem="Test",
+            choices=["A", "B"],
+            answer_schema={"correct_key": "A", "explanation": "Test"},
+            difficulty=5,
+            category="LLM",
+            round=1,
+        )
+        db_session.add(question)
+        db_session.commit()
+
+        answer = service.save_answer(
+            session_id=test_session_in_progress.id,
+            question_id=question.id,
+            user_answer={"selected_key": "A"},
+            response_time_ms=3000,
+        )
+        assert (answer.is_correct, answer.score) == (True, 100.0)
+        assert answer.scored_at is not None
+
+        answer = service.save_answer(
+            session_id=test_session_in_progress.id,
+            question_id=question.id,
+            user_answer={"selected_key": "B"},
+            response_time_ms=4000,
+        )
+        assert (answer.is_correct, answer.score) == (False, 0.0)
+        assert answer.scored_at is not None
+
+    def test_save_short_answer_left_unscored(self, db_session: Session, test_session_in_progress: TestSession) -> None:
+        """Short answers stay unscored (scored_at NULL) until round scoring."""
+        service = AutosaveService(db_session)
+
+        question = Question(
+            session_id=test_session_in_progress.id,
+            item_type="short_answer",
+            stem="Explain RAG",
+            answer_schema={"keywords": ["retrieval"], "explanation": "Test"},
+            difficulty=5,
+            category="RAG",
+            round=1,
+        )
+        db_session.add(question)
+        db_session.commit()
+
+        answer = service.save_answer(
+            session_id=test_session_in_progress.id,
+            question_id=question.id,
+            user_answer={"text": "retrieval augmented generation"},
+            response_time_ms=3000,
+        )
+
+        assert answer.scored_at is None
+        assert (answer.is_correct, answer.score) == (False, 0.0)
+
     def test_save_invalid_session_raises_error(self, db_session: Session) -> None:
         """Saving to non-existent session raises ValueError."""
         service = AutosaveService(db_session)
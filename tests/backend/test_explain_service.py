@@ -4,6 +4,7 @@ Tests for explanation generation service.
 REQ: REQ-B-B3-Explain
 """
 
+import asyncio
 import time
 from typing import Any, NoReturn
 from unittest.mock import patch
@@ -12,6 +13,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.orm import Session
 
+from src.backend.models.attempt_answer import AttemptAnswer
 from src.backend.models.question import Question
 from src.backend.models.test_session import TestSession
 
@@ -75,9 +77,7 @@ class TestExplanationGeneration:
             ],
         }
 
-        with patch.object(
-            ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)
-        ):
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)):
             service = ExplainService(db_session)
             start_time = time.time()
             result = service.generate_explanation(
@@ -119,9 +119,7 @@ class TestExplanationGeneration:
             ],
         }
 
-        with patch.object(
-            ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)
-        ):
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)):
             service = ExplainService(db_session)
             result = service.generate_explanation(
                 question_id=question.id,
@@ -159,9 +157,7 @@ class TestExplanationGeneration:
             ],
         }
 
-        with patch.object(
-            ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)
-        ):
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)):
             service = ExplainService(db_session)
             with pytest.raises(ValueError, match="Explanation must be at least 200 characters"):
                 service.generate_explanation(
@@ -195,9 +191,7 @@ class TestExplanationGeneration:
             ],  # Only 2 links
         }
 
-        with patch.object(
-            ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)
-        ):
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)):
             service = ExplainService(db_session)
             with pytest.raises(ValueError, match="at least 3 reference links"):
                 service.generate_explanation(
@@ -231,9 +225,7 @@ class TestExplanationGeneration:
             ],
         }
 
-        with patch.object(
-            ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)
-        ):
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)):
             service = ExplainService(db_session)
             start_time = time.time()
             service.generate_explanation(
@@ -275,9 +267,7 @@ class TestExplanationRetrieval:
             ],
         }
 
-        with patch.object(
-            ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)
-        ):
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)):
             service = ExplainService(db_session)
             service.generate_explanation(
                 question_id=question.id,
@@ -422,9 +412,7 @@ class TestExplanationPersistence:
             ],
         }
 
-        with patch.object(
-            ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)
-        ):
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)):
             service = ExplainService(db_session)
             result = service.generate_explanation(
                 question_id=question.id,
@@ -513,9 +501,7 @@ class TestExplanationPersistence:
             ],
         }
 
-        with patch.object(
-            ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)
-        ):
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)):
             service = ExplainService(db_session)
             result = service.generate_explanation(
                 question_id=attempt_answer.question_id,
@@ -556,9 +542,7 @@ class TestLLMIntegration:
             ],
         }
 
-        with patch.object(
-            ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)
-        ):
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)):
             service = ExplainService(db_session)
             result = service.generate_explanation(
                 question_id=question.id,
@@ -598,9 +582,7 @@ class TestLLMIntegration:
             ],
         }
 
-        with patch.object(
-            ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)
-        ):
+        with patch.object(ExplainService, "_generate_with_llm", return_value=(mock_llm_response, False, None)):
             service = ExplainService(db_session)
             result = service.generate_explanation(
                 question_id=question.id,
@@ -641,35 +623,303 @@ class TestLLMIntegration:
         assert result == "[정답]", "Multiple choice should show clear marker"
 
         # Test with boolean correct_key
-        result = service._extract_correct_answer_key(
-            {"correct_key": True}, "true_false"
-        )
+        result = service._extract_correct_answer_key({"correct_key": True}, "true_false")
         assert result == "참"
 
-        result = service._extract_correct_answer_key(
-            {"correct_key": False}, "true_false"
-        )
+        result = service._extract_correct_answer_key({"correct_key": False}, "true_false")
         assert result == "거짓"
 
         # Test with string correct_key
-        result = service._extract_correct_answer_key(
-            {"correct_key": "true"}, "true_false"
-        )
+        result = service._extract_correct_answer_key({"correct_key": "true"}, "true_false")
         assert result == "참"
 
-        result = service._extract_correct_answer_key(
-            {"correct_key": "false"}, "true_false"
-        )
+        result = service._extract_correct_answer_key({"correct_key": "false"}, "true_false")
         assert result == "거짓"
 
         # Test with regular correct_key
-        result = service._extract_correct_answer_key(
-            {"correct_key": "B"}, "multiple_choice"
-        )
+        result = service._extract_correct_answer_key({"correct_key": "B"}, "multiple_choice")
         assert result == "B"
 
         # Test with correct_answer fallback
-        result = service._extract_correct_answer_key(
-            {"correct_answer": "Expected answer"}, "short_answer"
-        )
+        result = service._extract_correct_answer_key({"correct_answer": "Expected answer"}, "short_answer")
         assert result == "Expected answer"
+
+
+class TestSessionExplanationsAsync:
+    """REQ-B-B3-Explain-2: Async session explanation fan-out."""
+
+    @staticmethod
+    def _llm_response(tag: str) -> dict[str, Any]:
+        return {
+            "explanation": f"{tag} 해설입니다. " * 40,
+            "reference_links": [
+                {"title": "Link 1", "url": "https://example.com/1"},
+                {"title": "Link 2", "url": "https://example.com/2"},
+                {"title": "Link 3", "url": "https://example.com/3"},
+            ],
+        }
+
+    @staticmethod
+    def _answered_questions(
+        db_session: Session, test_session: TestSession, count: int, is_correct: bool = False
+    ) -> list[tuple[Question, AttemptAnswer]]:
+        items = []
+        for _ in range(count):
+            question = create_test_question(db_session, test_session)
+            answer = AttemptAnswer(
+                id=str(uuid4()),
+                session_id=test_session.id,
+                question_id=question.id,
+                user_answer={"selected_key": "B"},
+                is_correct=is_correct,
+                score=0.0,
+            )
+            db_session.add(answer)
+            items.append((question, answer))
+        db_session.commit()
+        return items
+
+    @pytest.mark.asyncio
+    async def test_only_misses_generated_in_question_order(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Cached pairs come from one lookup; only misses reach the LLM; order is preserved."""
+        from src.backend.models.answer_explanation import AnswerExplanation
+        from src.backend.services.explain_service import ExplainService
+
+        items = self._answered_questions(db_session, test_session_round1_fixture, 3)
+        cached_question = items[1][0]
+        db_session.add(
+            AnswerExplanation(
+                id=str(uuid4()),
+                question_id=cached_question.id,
+                explanation_text="캐시된 해설. " * 40,
+                reference_links=self._llm_response("cached")["reference_links"],
+                is_correct=False,
+            )
+        )
+        db_session.commit()
+
+        generated: list[str] = []
+
+        async def fake_generate(
+            self: ExplainService, question: Question, user_answer: str | dict, is_correct: bool
+        ) -> tuple[dict[str, Any], bool, None]:
+            generated.append(question.id)
+            return TestSessionExplanationsAsync._llm_response(question.id), False, None
+
+        with patch.object(ExplainService, "_agenerate_with_llm", fake_generate):
+            results = await ExplainService(db_session).agenerate_session_explanations(items)
+
+        assert sorted(generated) == sorted([items[0][0].id, items[2][0].id])
+        assert [result["question_id"] for result in results] == [question.id for question, _ in items]
+        assert results[1]["explanation_text"].startswith("캐시된 해설")
+        assert [result["attempt_answer_id"] for result in results] == [answer.id for _, answer in items]
+        assert db_session.query(AnswerExplanation).count() == 3
+
+    @pytest.mark.asyncio
+    async def test_misses_do_not_commit_or_expire_caller_session(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Claims and inserts run on worker sessions: preloaded rows stay loaded, no claim is left behind."""
+        from sqlalchemy import event, inspect
+
+        from src.backend.models.explanation_claim import ExplanationClaim
+        from src.backend.services.explain_service import ExplainService
+
+        items = self._answered_questions(db_session, test_session_round1_fixture, 3)
+        for question, answer in items:
+            db_session.refresh(question)
+            db_session.refresh(answer)
+        commits: list[Session] = []
+        event.listen(db_session, "after_commit", commits.append)
+
+        async def fake_generate(
+            self: ExplainService, question: Question, user_answer: str | dict, is_correct: bool
+        ) -> tuple[dict[str, Any], bool, None]:
+            return TestSessionExplanationsAsync._llm_response(question.id), False, None
+
+        with patch.object(ExplainService, "_agenerate_with_llm", fake_generate):
+            results = await ExplainService(db_session).agenerate_session_explanations(items)
+
+        assert all(result is not None for result in results)
+        assert commits == []
+        assert all(not inspect(row).expired_attributes for item in items for row in item)
+        assert db_session.query(ExplanationClaim).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_session_answers_load_in_question_order_off_loop(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """The session's rows come from a worker thread; questions are ordered by creation time."""
+        import threading
+        from datetime import UTC, datetime, timedelta
+
+        from src.backend.services.explain_service import ExplainService
+
+        items = self._answered_questions(db_session, test_session_round1_fixture, 3)
+        base = datetime(2025, 1, 1, tzinfo=UTC)
+        for offset, (question, _) in zip([2, 0, 1], items, strict=True):
+            question.created_at = base + timedelta(seconds=offset)
+        db_session.commit()
+
+        service = ExplainService(db_session)
+        threads: list[threading.Thread] = []
+        load = service._load_session_answers
+
+        def record_thread(session_id: str, db: Session) -> Any:  # noqa: ANN401
+            threads.append(threading.current_thread())
+            return load(session_id, db)
+
+        with patch.object(service, "_load_session_answers", record_thread):
+            test_session, questions, answers = await service.aload_session_answers(test_session_round1_fixture.id)
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert test_session.id == test_session_round1_fixture.id
+        assert [q.id for q in questions] == [items[1][0].id, items[2][0].id, items[0][0].id]
+        assert {a.id for a in answers} == {answer.id for _, answer in items}
+        assert await service.aload_session_answers("missing") == (None, [], [])
+
+    @pytest.mark.asyncio
+    async def test_generation_concurrency_is_bounded(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Misses run concurrently but never exceed max_concurrency in flight."""
+        from src.backend.services.explain_service import ExplainService
+
+        items = self._answered_questions(db_session, test_session_round1_fixture, 6)
+        in_flight = 0
+        peak = 0
+
+        async def fake_generate(
+            self: ExplainService, question: Question, user_answer: str | dict, is_correct: bool
+        ) -> tuple[dict[str, Any], bool, None]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return TestSessionExplanationsAsync._llm_response(question.id), False, None
+
+        with patch.object(ExplainService, "_agenerate_with_llm", fake_generate):
+            results = await ExplainService(db_session).agenerate_session_explanations(items, max_concurrency=2)
+
+        assert peak == 2
+        assert all(result is not None for result in results)
+
+    @pytest.mark.asyncio
+    async def test_invalid_generation_yields_none(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """An explanation failing validation is reported as None and not cached."""
+        from src.backend.models.answer_explanation import AnswerExplanation
+        from src.backend.services.explain_service import ExplainService
+
+        items = self._answered_questions(db_session, test_session_round1_fixture, 2)
+
+        async def fake_generate(
+            self: ExplainService, question: Question, user_answer: str | dict, is_correct: bool
+        ) -> tuple[dict[str, Any], bool, None]:
+            if question.id == items[0][0].id:
+                return {"explanation": "짧음", "reference_links": []}, False, None
+            return TestSessionExplanationsAsync._llm_response(question.id), False, None
+
+        with patch.object(ExplainService, "_agenerate_with_llm", fake_generate):
+            results = await ExplainService(db_session).agenerate_session_explanations(items)
+
+        assert results[0] is None
+        assert results[1] is not None
+        assert db_session.query(AnswerExplanation).filter_by(question_id=items[0][0].id).count() == 0
+
+
+class TestSessionExplanationsBatch:
+    """REQ-B-B3-Explain-6: One LLM call for a session's uncached explanations."""
+
+    class _FakeBatchLLM:
+        """LLM stub answering every prompt with a fixed response."""
+
+        def __init__(self, content: str) -> None:
+            """Store the canned response."""
+            self.content = content
+            self.calls = 0
+
+        async def ainvoke(self, prompt: str) -> "TestSessionExplanationsBatch._FakeBatchLLM":
+            """Return self as the response object (has .content)."""
+            self.calls += 1
+            return self
+
+    @staticmethod
+    def _item(index: int, explanation: str | None = None) -> dict[str, Any]:
+        item = TestSessionExplanationsAsync._llm_response(f"batch-{index}")
+        if explanation is not None:
+            item["explanation"] = explanation
+        return {"index": index, **item}
+
+    @pytest.mark.asyncio
+    async def test_batch_mode_uses_single_llm_call(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """All misses are explained by one LLM call; no per-question calls are made."""
+        import json
+
+        from src.backend.models.answer_explanation import AnswerExplanation
+        from src.backend.services.explain_service import ExplainService
+
+        items = TestSessionExplanationsAsync._answered_questions(db_session, test_session_round1_fixture, 3)
+        llm = self._FakeBatchLLM("```json\n" + json.dumps([self._item(i) for i in (1, 2, 3)]) + "\n```")
+
+        with (
+            patch("src.backend.services.explain_service.create_llm", return_value=llm),
+            patch.object(ExplainService, "_agenerate_with_llm") as per_question,
+        ):
+            results = await ExplainService(db_session).agenerate_session_explanations(items, batch=True)
+
+        assert llm.calls == 1
+        per_question.assert_not_called()
+        assert [result["explanation_text"].split()[0] for result in results] == ["batch-1", "batch-2", "batch-3"]
+        assert db_session.query(AnswerExplanation).count() == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_mode_falls_back_only_for_failed_items(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Items that are invalid or missing in the batch response are generated per question."""
+        import json
+
+        from src.backend.services.explain_service import ExplainService
+
+        items = TestSessionExplanationsAsync._answered_questions(db_session, test_session_round1_fixture, 3)
+        # Item 2 is too short, item 3 is missing
+        llm = self._FakeBatchLLM(json.dumps([self._item(1), self._item(2, explanation="짧음")]))
+        fallback_ids: list[str] = []
+
+        async def fake_generate(
+            self: ExplainService, question: Question, user_answer: str | dict, is_correct: bool
+        ) -> tuple[dict[str, Any], bool, None]:
+            fallback_ids.append(question.id)
+            return TestSessionExplanationsAsync._llm_response("single"), False, None
+
+        with (
+            patch("src.backend.services.explain_service.create_llm", return_value=llm),
+            patch.object(ExplainService, "_agenerate_with_llm", fake_generate),
+        ):
+            results = await ExplainService(db_session).agenerate_session_explanations(items, batch=True)
+
+        assert llm.calls == 1
+        assert sorted(fallback_ids) == sorted([items[1][0].id, items[2][0].id])
+        assert results[0]["explanation_text"].startswith("batch-1")
+        assert all(result["explanation_text"].startswith("single") for result in results[1:])
@@ -0,0 +1,205 @@
+"""
+Tests for background explanation prefetch.
+
+REQ: REQ-B-B3-Explain-3
+"""
+
+from typing import Any
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.backend.config import settings
+from src.backend.models.answer_explanation import AnswerExplanation
+from src.backend.models.question import Question
+from src.backend.models.test_session import TestSession
+from src.backend.services.explain_service import ExplainService
+from src.backend.services.explanation_prefetch import (
+    ExplanationPrefetcher,
+    find_questions_missing_explanations,
+)
+
+LINKS = [
+    {"title": "Link 1", "url": "https://example.com/1"},
+    {"title": "Link 2", "url": "https://example.com/2"},
+    {"title": "Link 3", "url": "https://example.com/3"},
+]
+
+
+def _create_questions(db_session: Session, test_session: TestSession, count: int) -> list[Question]:
+    questions = [
+        Question(
+            id=str(uuid4()),
+            session_id=test_session.id,
+            item_type="multiple_choice",
+            stem=f"Question {index}?",
+            choices=["A", "B", "C", "D"],
+            answer_schema={"correct_key": "A"},
+            difficulty=5,
+            category="LLM",
+            round=1,
+        )
+        for index in range(count)
+    ]
+    db_session.add_all(questions)
+    db_session.commit()
+    return questions
+
+
+async def _fake_generate(
+    self: ExplainService, question: Question, user_answer: str | dict, is_correct: bool
+) -> tuple[dict[str, Any], bool, None]:
+    return {"explanation": f"{question.id} {is_correct} 해설. " * 20, "reference_links": LINKS}, False, None
+
+
+async def _fake_fallback(
+    self: ExplainService, question: Question, user_answer: str | dict, is_correct: bool
+) -> tuple[dict[str, Any], bool, str]:
+    return {"explanation": "대체 해설. " * 50, "reference_links": LINKS}, True, "LLM unavailable"
+
+
+class TestExplanationPrefetch:
+    """REQ-B-B3-Explain-3: Prefetch explanation variants before scoring."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_generates_both_variants(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Both correct and incorrect variants are stored; later lookups are cache hits."""
+        questions = _create_questions(db_session, test_session_round1_fixture, 3)
+
+        with patch.object(ExplainService, "_agenerate_with_llm", _fake_generate):
+            generated = await ExplanationPrefetcher(max_concurrency=2).prefetch([q.id for q in questions])
+
+        assert generated == 6
+        db_session.expire_all()
+        assert db_session.query(AnswerExplanation).count() == 6
+
+        with patch.object(ExplainService, "_generate_with_llm") as mock_llm:
+            result = ExplainService(db_session).generate_explanation(
+                question_id=questions[0].id, user_answer="B", is_correct=False
+            )
+        mock_llm.assert_not_called()
+        assert result["is_correct"] is False
+
+    @pytest.mark.asyncio
+    async def test_prefetch_skips_cached_and_fallback_results(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Cached variants are not regenerated and fallback text is never persisted."""
+        questions = _create_questions(db_session, test_session_round1_fixture, 1)
+        db_session.add(
+            AnswerExplanation(
+                id=str(uuid4()),
+                question_id=questions[0].id,
+                explanation_text="기존 해설. " * 40,
+                reference_links=LINKS,
+                is_correct=True,
+            )
+        )
+        db_session.commit()
+
+        with patch.object(ExplainService, "_agenerate_with_llm", _fake_fallback):
+            generated = await ExplanationPrefetcher().prefetch([questions[0].id])
+
+        assert generated == 0
+        db_session.expire_all()
+        assert db_session.query(AnswerExplanation).count() == 1
+
+    @pytest.mark.asyncio
+    async def test_enqueue_respects_setting(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """enqueue() is a no-op when disabled and a background task when enabled."""
+        questions = _create_questions(db_session, test_session_round1_fixture, 1)
+        prefetcher = ExplanationPrefetcher()
+
+        assert prefetcher.enqueue([questions[0].id]) is None
+
+        monkeypatch.setattr(settings, "EXPLANATION_PREFETCH_ENABLED", True)
+        with patch.object(ExplainService, "_agenerate_with_llm", _fake_generate):
+            task = prefetcher.enqueue([questions[0].id])
+            assert task is not None
+            await prefetcher.wait()
+
+        assert task.result() == 2
+        assert prefetcher.stats.as_dict() == {"enqueued": 1, "generated": 2, "failed_jobs": 0}
+
+    @pytest.mark.asyncio
+    async def test_required_enqueue_runs_when_disabled(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Fallback/draft upgrades (required=True) are scheduled even though prefetch is opt-in."""
+        questions = _create_questions(db_session, test_session_round1_fixture, 1)
+        prefetcher = ExplanationPrefetcher()
+
+        with patch.object(ExplainService, "_agenerate_with_llm", _fake_generate):
+            task = prefetcher.enqueue([questions[0].id], required=True)
+            assert task is not None
+            await prefetcher.wait()
+
+        assert task.result() == 2
+
+    @pytest.mark.asyncio
+    async def test_schedule_upgrades_dedupes_and_backs_off(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """One upgrade per question at a time; a failed attempt puts the question on a growing cooldown."""
+        questions = _create_questions(db_session, test_session_round1_fixture, 2)
+        prefetcher = ExplanationPrefetcher()
+        clock = [1000.0]
+        monkeypatch.setattr("src.backend.services.explanation_prefetch.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr(settings, "EXPLANATION_UPGRADE_RETRY_SECONDS", 30.0)
+
+        with patch.object(ExplainService, "_agenerate_with_llm", _fake_fallback):
+            task = prefetcher.schedule_upgrades([questions[0].id, questions[0].id])
+            assert task is not None
+            # Already queued: hot reads of the same fallback row don't start another job
+            assert prefetcher.schedule_upgrades([questions[0].id]) is None
+            await prefetcher.wait()
+
+            # Cooling down after the failed attempt; other questions are unaffected
+            clock[0] += 29
+            assert prefetcher.schedule_upgrades([questions[0].id]) is None
+            assert prefetcher.schedule_upgrades([questions[1].id]) is not None
+            await prefetcher.wait()
+
+            clock[0] += 1
+            assert prefetcher.schedule_upgrades([questions[0].id]) is not None
+            await prefetcher.wait()
+
+        # Second consecutive attempt doubles the cooldown
+        clock[0] += 59
+        assert prefetcher.schedule_upgrades([questions[0].id]) is None
+        assert prefetcher.stats.enqueued == 3
+
+    @pytest.mark.asyncio
+    async def test_backfill_fills_only_missing_questions(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Backfill walks questions missing a variant until none remain."""
+        questions = _create_questions(db_session, test_session_round1_fixture, 5)
+        assert len(find_questions_missing_explanations(db_session, 10)) == 5
+
+        with patch.object(ExplainService, "_agenerate_with_llm", _fake_generate):
+            generated = await ExplanationPrefetcher().backfill(batch_size=2)
+
+        assert generated == 10
+        assert find_questions_missing_explanations(db_session, 10) == []
+        assert {row.question_id for row in db_session.query(AnswerExplanation)} == {q.id for q in questions}
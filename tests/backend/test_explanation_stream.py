@@ -0,0 +1,216 @@
+"""
+Tests for streaming explanation generation (SSE).
+
+REQ: REQ-B-B3-Explain-5
+"""
+
+import json
+import threading
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.backend.models.answer_explanation import AnswerExplanation
+from src.backend.models.question import Question
+from src.backend.models.test_session import TestSession
+from src.backend.services.explain_service import ExplainService
+from src.backend.services.explanation_stream import ExplanationStreamParser
+
+EXPLANATION = '[정답의 원리]\n"A"가 정답입니다. ' + "자세한 설명입니다. " * 30
+RESPONSE_TEXT = json.dumps(
+    {
+        "explanation": EXPLANATION,
+        "reference_links": [
+            {"title": "Link 1", "url": "https://example.com/1"},
+            {"title": "Link 2", "url": "https://example.com/2"},
+            {"title": "Link 3", "url": "https://example.com/3"},
+        ],
+    },
+    ensure_ascii=True,
+)
+
+
+class FakeStreamingLLM:
+    """Chat model stub streaming a fixed response in small chunks."""
+
+    def __init__(self, text: str, chunk_size: int = 7, fail_after: int | None = None) -> None:
+        """Stream text in chunk_size pieces, raising after fail_after chunks if set."""
+        self.text = text
+        self.chunk_size = chunk_size
+        self.fail_after = fail_after
+
+    async def astream(self, prompt: str) -> AsyncIterator[SimpleNamespace]:
+        """Yield message-like chunks."""
+        for index, start in enumerate(range(0, len(self.text), self.chunk_size)):
+            if self.fail_after is not None and index >= self.fail_after:
+                raise RuntimeError("stream interrupted")
+            yield SimpleNamespace(content=self.text[start : start + self.chunk_size])
+
+
+def _create_question(db_session: Session, test_session: TestSession) -> Question:
+    question = Question(
+        id=str(uuid4()),
+        session_id=test_session.id,
+        item_type="multiple_choice",
+        stem="Which is correct?",
+        choices=["A", "B", "C", "D"],
+        answer_schema={"correct_key": "A"},
+        difficulty=5,
+        category="LLM",
+        round=1,
+    )
+    db_session.add(question)
+    db_session.commit()
+    return question
+
+
+async def _collect(events: AsyncIterator[tuple[str, dict]]) -> list[tuple[str, dict]]:
+    return [event async for event in events]
+
+
+class TestExplanationStreamParser:
+    """REQ-B-B3-Explain-5: Incremental explanation extraction."""
+
+    def test_decodes_explanation_across_arbitrary_chunk_boundaries(self) -> None:
+        """Concatenated deltas equal the decoded explanation for any chunking."""
+        raw = "```json\n" + RESPONSE_TEXT + "\n```"
+        for chunk_size in (1, 2, 5, 64):
+            parser = ExplanationStreamParser()
+            decoded = "".join(parser.feed(raw[i : i + chunk_size]) for i in range(0, len(raw), chunk_size))
+            assert decoded == EXPLANATION
+            assert parser.done is True
+
+    def test_holds_back_incomplete_escape(self) -> None:
+        """A split escape sequence is emitted only once complete."""
+        parser = ExplanationStreamParser()
+        assert parser.feed('{"explanation": "a\\') == "a"
+        assert parser.feed("u00") == ""
+        assert parser.feed('e9b"') == "éb"
+        assert parser.feed(', "x": "ignored"}') == ""
+
+
+class TestStreamExplanation:
+    """REQ-B-B3-Explain-5: Streaming generation, persistence and replay."""
+
+    @pytest.mark.asyncio
+    async def test_streams_tokens_then_persists(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Tokens arrive before done; the final explanation is stored and replayed from cache."""
+        question = _create_question(db_session, test_session_round1_fixture)
+        service = ExplainService(db_session)
+
+        with patch("src.backend.services.explain_service.create_llm", return_value=FakeStreamingLLM(RESPONSE_TEXT)):
+            events = await _collect(await service.stream_explanation(question.id, "B", is_correct=False))
+
+        tokens = [data["text"] for event, data in events if event == "token"]
+        assert len(tokens) > 10
+        assert "".join(tokens) == EXPLANATION
+        assert events[-1][0] == "done"
+        assert events[-1][1]["explanation_text"] == EXPLANATION
+        assert events[-1][1]["is_fallback"] is False
+        assert db_session.query(AnswerExplanation).filter_by(question_id=question.id).count() == 1
+
+        with patch("src.backend.services.explain_service.create_llm") as mock_create_llm:
+            replay = await _collect(await service.stream_explanation(question.id, "C", is_correct=False))
+        mock_create_llm.assert_not_called()
+        assert [event for event, _ in replay] == ["token", "done"]
+        assert replay[-1][1]["id"] == events[-1][1]["id"]
+
+    @pytest.mark.asyncio
+    async def test_mid_stream_failure_resets_to_fallback(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """An interrupted stream emits reset and the fallback explanation."""
+        question = _create_question(db_session, test_session_round1_fixture)
+        llm = FakeStreamingLLM(RESPONSE_TEXT, fail_after=10)
+
+        with patch("src.backend.services.explain_service.create_llm", return_value=llm):
+            events = await _collect(
+                await ExplainService(db_session).stream_explanation(question.id, "B", is_correct=False)
+            )
+
+        names = [event for event, _ in events]
+        assert "reset" in names
+        assert names[-1] == "done"
+        assert events[-1][1]["is_fallback"] is True
+
+    @pytest.mark.asyncio
+    async def test_validation_errors_raise_before_stream(self, db_session: Session) -> None:
+        """Invalid inputs and unknown questions fail eagerly with ValueError."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            await ExplainService(db_session).stream_explanation("missing-question", " ", is_correct=True)
+        with pytest.raises(ValueError, match="not found"):
+            await ExplainService(db_session).stream_explanation("missing-question", "A", is_correct=True)
+
+    @pytest.mark.asyncio
+    async def test_question_lookup_runs_off_event_loop(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """The question is loaded on a worker thread, never on the loop's request session."""
+        question = _create_question(db_session, test_session_round1_fixture)
+        service = ExplainService(db_session)
+        threads: list[threading.Thread] = []
+        find = service._find_question
+
+        def record_thread(question_id: str, db: Session) -> Question:
+            threads.append(threading.current_thread())
+            assert db is not db_session
+            return find(question_id, db)
+
+        with (
+            patch.object(service, "_find_question", record_thread),
+            patch("src.backend.services.explain_service.create_llm", return_value=FakeStreamingLLM(RESPONSE_TEXT)),
+        ):
+            events = await _collect(await service.stream_explanation(question.id, "B", is_correct=False))
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert events[-1][0] == "done"
+        assert events[-1][1]["question_id"] == question.id
+
+
+class TestStreamExplanationEndpoint:
+    """REQ-B-B3-Explain-5: POST /questions/explanations/stream."""
+
+    def test_endpoint_emits_server_sent_events(
+        self,
+        client: TestClient,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Response is text/event-stream with token frames and a final done frame."""
+        question = _create_question(db_session, test_session_round1_fixture)
+
+        with patch("src.backend.services.explain_service.create_llm", return_value=FakeStreamingLLM(RESPONSE_TEXT)):
+            response = client.post(
+                "/questions/explanations/stream",
+                json={"question_id": question.id, "user_answer": "B", "is_correct": False},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [frame for frame in response.text.split("\n\n") if frame]
+        events = [frame.split("\n")[0].removeprefix("event: ") for frame in frames]
+        assert events[0] == "token"
+        assert events[-1] == "done"
+        done = json.loads(frames[-1].split("\n", 1)[1].removeprefix("data: "))
+        assert done["question_id"] == question.id
+
+    def test_endpoint_unknown_question_returns_404(self, client: TestClient) -> None:
+        """Validation errors are plain HTTP errors, not streams."""
+        response = client.post(
+            "/questions/explanations/stream",
+            json={"question_id": "missing", "user_answer": "B", "is_correct": False},
+        )
+        assert response.status_code == 404
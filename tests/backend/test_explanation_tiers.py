@@ -0,0 +1,151 @@
+"""
+Tests for tiered explanations (instant draft, background LLM upgrade).
+
+REQ: REQ-B-B3-Explain-7
+"""
+
+from typing import Any
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.backend.config import settings
+from src.backend.models.answer_explanation import AnswerExplanation
+from src.backend.models.question import Question
+from src.backend.models.test_session import TestSession
+from src.backend.services.explain_service import DRAFT_ERROR_MESSAGE, ExplainService
+from src.backend.services.explanation_prefetch import (
+    ExplanationPrefetcher,
+    find_questions_missing_explanations,
+    get_explanation_prefetcher,
+)
+
+LINKS = [
+    {"title": "Link 1", "url": "https://example.com/1"},
+    {"title": "Link 2", "url": "https://example.com/2"},
+    {"title": "Link 3", "url": "https://example.com/3"},
+]
+
+
+def _create_question(db_session: Session, test_session: TestSession) -> Question:
+    question = Question(
+        id=str(uuid4()),
+        session_id=test_session.id,
+        item_type="multiple_choice",
+        stem="Which component retrieves documents in RAG?",
+        choices=["Retriever", "Tokenizer", "Optimizer", "Scheduler"],
+        answer_schema={
+            "correct_key": "Retriever",
+            "explanation": "RAG의 retriever는 질의와 관련된 문서를 검색해 생성기에 전달합니다.",
+            "correct_keywords": ["retriever", "vector search"],
+        },
+        difficulty=5,
+        category="RAG",
+        round=1,
+    )
+    db_session.add(question)
+    db_session.commit()
+    return question
+
+
+async def _fake_generate(
+    self: ExplainService, question: Question, user_answer: str | dict, is_correct: bool
+) -> tuple[dict[str, Any], bool, None]:
+    return {"explanation": "LLM 맞춤 해설입니다. " * 30, "reference_links": LINKS}, False, None
+
+
+async def _fake_fallback(
+    self: ExplainService, question: Question, user_answer: str | dict, is_correct: bool
+) -> tuple[dict[str, Any], bool, str]:
+    return {"explanation": "대체 해설. " * 50, "reference_links": LINKS}, True, "LLM unavailable"
+
+
+class TestTieredExplanations:
+    """REQ-B-B3-Explain-7: Draft first, LLM explanation later."""
+
+    def test_tiered_miss_returns_draft_without_llm(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A cache miss in tiered mode is answered from answer_schema and stored as a draft."""
+        monkeypatch.setattr(settings, "EXPLANATION_TIERED_MODE", True)
+        question = _create_question(db_session, test_session_round1_fixture)
+
+        with patch.object(ExplainService, "_generate_with_llm") as mock_llm:
+            result = ExplainService(db_session).generate_explanation(
+                question_id=question.id, user_answer={"selected_key": "Tokenizer"}, is_correct=False
+            )
+
+        mock_llm.assert_not_called()
+        assert result["is_fallback"] is True
+        assert result["error_message"] == DRAFT_ERROR_MESSAGE
+        assert "정답: Retriever" in result["explanation_text"]
+        assert "retriever는 질의와 관련된 문서" in result["explanation_text"]
+        assert "vector search" in result["explanation_text"]
+        assert len(result["reference_links"]) >= 3
+        assert db_session.query(AnswerExplanation).filter_by(question_id=question.id, is_fallback=True).count() == 1
+
+    @pytest.mark.asyncio
+    async def test_draft_is_upgraded_in_background(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The background job replaces the draft row in place; later reads return the LLM text."""
+        monkeypatch.setattr(settings, "EXPLANATION_TIERED_MODE", True)
+        monkeypatch.setattr(settings, "EXPLANATION_PREFETCH_ENABLED", True)
+        question = _create_question(db_session, test_session_round1_fixture)
+
+        with patch.object(ExplainService, "_agenerate_with_llm", _fake_generate):
+            draft = ExplainService(db_session).generate_explanation(
+                question_id=question.id, user_answer="Tokenizer", is_correct=False
+            )
+            await get_explanation_prefetcher().wait()
+
+        db_session.expire_all()
+        upgraded = ExplainService(db_session).generate_explanation(
+            question_id=question.id, user_answer="Tokenizer", is_correct=False
+        )
+        assert upgraded["id"] == draft["id"]
+        assert upgraded["is_fallback"] is False
+        assert upgraded["error_message"] is None
+        assert upgraded["explanation_text"].startswith("LLM 맞춤 해설")
+        # Both variants now hold LLM explanations
+        assert db_session.query(AnswerExplanation).filter_by(question_id=question.id, is_fallback=False).count() == 2
+
+    @pytest.mark.asyncio
+    async def test_upgrade_keeps_row_when_llm_falls_back_again(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """A failed upgrade leaves the fallback row for a later attempt."""
+        question = _create_question(db_session, test_session_round1_fixture)
+        for is_correct in (True, False):
+            db_session.add(
+                AnswerExplanation(
+                    id=str(uuid4()),
+                    question_id=question.id,
+                    explanation_text="대체 해설. " * 50,
+                    reference_links=LINKS,
+                    is_correct=is_correct,
+                    is_fallback=True,
+                    error_message="LLM unavailable",
+                )
+            )
+        db_session.commit()
+        assert len(find_questions_missing_explanations(db_session, 10)) == 1
+
+        with patch.object(ExplainService, "_agenerate_with_llm", _fake_fallback):
+            assert await ExplanationPrefetcher().prefetch([question.id]) == 0
+        db_session.expire_all()
+        assert db_session.query(AnswerExplanation).filter_by(is_fallback=True).count() == 2
+
+        with patch.object(ExplainService, "_agenerate_with_llm", _fake_generate):
+            assert await ExplanationPrefetcher().backfill() == 2
+        assert find_questions_missing_explanations(db_session, 10) == []
@@ -0,0 +1,88 @@
+"""
+Tests for the compiled short-answer keyword matcher.
+
+REQ: REQ-B-B3-Score-2, REQ-A-Mode2-Tool6
+"""
+
+import random
+
+from src.backend.services.keyword_matcher import (
+    KeywordMatcher,
+    clear_keyword_matcher_cache,
+    get_keyword_matcher,
+)
+
+
+def _reference_score(answer_text: str, keywords: list[str]) -> tuple[bool, float]:
+    """Per-keyword substring scan the matcher replaces."""
+    answer_lower = answer_text.lower()
+    answer_words = set(answer_lower.split())
+    total_credit = 0.0
+    exact_matches = 0
+    for keyword in keywords:
+        keyword_lower = str(keyword).lower().strip()
+        if not keyword_lower:
+            continue
+        if keyword_lower in answer_lower:
+            total_credit += 1.0
+            exact_matches += 1
+        else:
+            keyword_words = keyword_lower.split()
+            matched_words = sum(1 for word in keyword_words if word in answer_words)
+            if matched_words > 0:
+                total_credit += matched_words / len(keyword_words)
+    return exact_matches == len(keywords), total_credit / len(keywords) * 100.0
+
+
+class TestKeywordMatcher:
+    """Aho-Corasick matching with word-level partial credit."""
+
+    def test_overlapping_and_nested_keywords(self) -> None:
+        """Overlapping/nested keywords are all found in one pass."""
+        matcher = KeywordMatcher(["he", "she", "his", "hers", "RAG"])
+
+        result = matcher.match("Ushers use rag")
+
+        assert result.matched_keywords == ["he", "she", "hers", "RAG"]
+        assert result.exact_matches == 4
+
+    def test_partial_credit(self) -> None:
+        """Word-level partial credit matches the documented example."""
+        matcher = KeywordMatcher(["conversational AI", "dialogue system", "natural language processing"])
+
+        is_correct, score = matcher.score("conversational dialogue natural language")
+
+        assert is_correct is False
+        assert round(score, 2) == round((0.5 + 0.5 + 2 / 3) / 3 * 100, 2)
+
+    def test_matches_reference_implementation(self) -> None:
+        """Random answers score identically to the per-keyword scan."""
+        rng = random.Random(3)
+        vocabulary = ["llm", "rag", "vector", "db", "prompt", "token", "agent", "graph", "retrieval", "ab"]
+        for _ in range(200):
+            keywords = [
+                " ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 3))) for _ in range(rng.randint(1, 6))
+            ]
+            answer = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 12)))
+
+            expected = _reference_score(answer, keywords)
+            actual = KeywordMatcher(keywords).score(answer)
+
+            assert actual[0] == expected[0]
+            assert abs(actual[1] - expected[1]) < 1e-9
+
+    def test_blank_keyword_counts_but_never_matches(self) -> None:
+        """Blank keywords keep counting toward the total, as before."""
+        is_correct, score = KeywordMatcher(["LLM", "  "]).score("LLM")
+
+        assert is_correct is False
+        assert score == 50.0
+
+    def test_cache_per_question_id(self) -> None:
+        """Matcher is compiled once per question and recompiled if keywords change."""
+        clear_keyword_matcher_cache()
+
+        first = get_keyword_matcher("q-1", ["LLM", "RAG"])
+        assert get_keyword_matcher("q-1", ["LLM", "RAG"]) is first
+        assert get_keyword_matcher("q-1", ["LLM"]) is not first
+        assert get_keyword_matcher(None, ["LLM"]) is not get_keyword_matcher(None, ["LLM"])
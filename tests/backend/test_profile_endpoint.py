@@ -95,3 +95,31 @@ class TestProfileEndpoint:
 
         assert response.status_code == 400
         assert "already taken" in response.json()["detail"]
+
+
+class TestLeaderboardEndpoint:
+    """REQ-B-B4-7: GET /profile/leaderboard."""
+
+    def test_leaderboard_around_me_marks_current_user(
+        self,
+        client: TestClient,
+        authenticated_user: User,
+        user_profile_survey_fixture,  # noqa: ANN001
+        create_test_session_with_result,  # noqa: ANN001
+    ) -> None:
+        """around_me=true includes the caller flagged with is_me."""
+        create_test_session_with_result(authenticated_user.id, user_profile_survey_fixture.id, 80.0)
+
+        response = client.get("/profile/leaderboard", params={"around_me": True})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [entry["is_me"] for entry in data["entries"]] == [True]
+        assert data["entries"][0]["rank"] == 1
+        assert data["next_cursor"] is None
+
+    def test_leaderboard_invalid_limit_returns_400(self, client: TestClient) -> None:
+        """Out-of-range limit is rejected."""
+        response = client.get("/profile/leaderboard", params={"limit": 0})
+
+        assert response.status_code == 400
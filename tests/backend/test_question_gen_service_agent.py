@@ -13,13 +13,15 @@ Tests validate:
 7. Backwards compatibility with dict response format
 """
 
-from unittest.mock import AsyncMock, patch
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 from sqlalchemy.orm import Session
 
 from src.agent.llm_agent import AnswerSchema, GeneratedItem, GenerateQuestionsRequest, GenerateQuestionsResponse
+from src.backend.config import settings
 from src.backend.models.question import Question
 from src.backend.models.test_result import TestResult
 from src.backend.models.test_session import TestSession
@@ -129,6 +131,7 @@ class TestQuestionGenerationAgentIntegration:
                 user_id=authenticated_user.id,
                 survey_id=user_profile_survey_fixture.id,
                 round_num=1,
+                question_count=1,
             )
 
             # Verify create_agent was called
@@ -427,9 +430,10 @@ class TestQuestionGenerationAgentIntegration:
         mock_agent.generate_questions = AsyncMock(return_value=mock_response)
 
         # Mock DB session.add to raise error
-        with patch(
-            "src.backend.services.question_gen_service.create_agent", return_value=mock_agent
-        ), patch.object(db_session, "add", side_effect=Exception("DB connection error")):
+        with (
+            patch("src.backend.services.question_gen_service.create_agent", return_value=mock_agent),
+            patch.object(db_session, "add", side_effect=Exception("DB connection error")),
+        ):
             result = await service.generate_questions(
                 user_id=authenticated_user.id,
                 survey_id=user_profile_survey_fixture.id,
@@ -578,6 +582,31 @@ class TestQuestionGenerationAgentIntegration:
             assert captured_request is not None
             assert captured_request.round_idx == 2
 
+    @pytest.mark.asyncio
+    async def test_adaptive_run_discards_agent_checkpoint(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        test_result_low_score: TestResult,
+    ) -> None:
+        """The pooled agent's checkpoint for the adaptive run is dropped even when the run fails."""
+        service = QuestionGenerationService(db_session)
+        mock_agent = AsyncMock()
+        mock_agent.generate_questions = AsyncMock(side_effect=RuntimeError("LLM down"))
+
+        with (
+            patch("src.backend.services.question_gen_service.create_agent", return_value=mock_agent),
+            pytest.raises(RuntimeError, match="LLM down"),
+        ):
+            await service.generate_questions_adaptive(
+                user_id=test_session_round1_fixture.user_id,
+                session_id=test_session_round1_fixture.id,
+                round_num=2,
+            )
+
+        new_session = db_session.query(TestSession).filter_by(round=2).one()
+        mock_agent.discard_checkpoint.assert_awaited_once_with(new_session.id)
+
     # ====================================================================
     # TC-12: Test Session Created with Correct Metadata
     # ====================================================================
@@ -615,6 +644,141 @@ class TestQuestionGenerationAgentIntegration:
             assert test_session.round == 1
             assert test_session.status == "in_progress"
 
+    # ====================================================================
+    # TC-13: Parallel Pipeline Mode (REQ-A-Mode1-Parallel)
+    # ====================================================================
+
+    @pytest.mark.asyncio
+    async def test_parallel_pipeline_mode_bypasses_react_agent(
+        self,
+        db_session: Session,
+        authenticated_user: User,
+        user_profile_survey_fixture: UserProfileSurvey,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """TC-13: QUESTION_GEN_PIPELINE_MODE=parallel generates without the ReAct agent."""
+        monkeypatch.setattr(settings, "QUESTION_GEN_PIPELINE_MODE", "parallel")
+        draft = {
+            "stem": "Which component predicts the next token?",
+            "choices": ["Decoder", "Tokenizer", "Scheduler", "Indexer"],
+            "correct_answer": "Decoder",
+            "category": "LLM",
+            "explanation": "The decoder produces the next-token distribution.",
+        }
+        llm = AsyncMock()
+        llm.model = "gpt-4o"
+        llm.ainvoke = AsyncMock(return_value=MagicMock(content=json.dumps(draft)))
+
+        with (
+            patch("src.backend.services.question_gen_service.create_agent") as mock_create,
+            patch("src.agent.pipeline.mode1_pipeline.create_llm", return_value=llm),
+            patch(
+                "src.agent.pipeline.mode1_pipeline._validate_question_quality_impl",
+                side_effect=lambda stem, **kwargs: [{"final_score": 0.9, "should_discard": False} for _ in stem],
+            ),
+        ):
+            result = await QuestionGenerationService(db_session).generate_questions(
+                user_id=authenticated_user.id,
+                survey_id=user_profile_survey_fixture.id,
+                question_count=3,
+                question_types=["multiple_choice"],
+            )
+
+        mock_create.assert_not_called()
+        assert llm.ainvoke.await_count == 3
+        assert len(result["questions"]) == 3
+        assert result["questions"][0]["answer_schema"]["correct_answer"] == "Decoder"
+        saved = db_session.query(Question).filter_by(session_id=result["session_id"]).all()
+        assert len(saved) == 3
+        assert all(q.answer_schema["type"] == "exact_match" for q in saved)
+
+    @pytest.mark.asyncio
+    async def test_parallel_pipeline_invalid_schema_deletes_saved_round(
+        self,
+        db_session: Session,
+        authenticated_user: User,
+        user_profile_survey_fixture: UserProfileSurvey,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """TC-13: An answer_schema failing validation removes the round the pipeline already saved."""
+        monkeypatch.setattr(settings, "QUESTION_GEN_PIPELINE_MODE", "parallel")
+        draft = {
+            "stem": "Which component predicts the next token?",
+            "choices": ["Decoder", "Tokenizer", "Scheduler", "Indexer"],
+            "correct_answer": "Decoder",
+            "category": "LLM",
+            "explanation": "The decoder produces the next-token distribution.",
+        }
+        llm = AsyncMock()
+        llm.model = "gpt-4o"
+        llm.ainvoke = AsyncMock(return_value=MagicMock(content=json.dumps(draft)))
+
+        with (
+            patch("src.agent.pipeline.mode1_pipeline.create_llm", return_value=llm),
+            patch(
+                "src.agent.pipeline.mode1_pipeline._validate_question_quality_impl",
+                side_effect=lambda stem, **kwargs: [{"final_score": 0.9, "should_discard": False} for _ in stem],
+            ),
+            patch.object(
+                QuestionGenerationService,
+                "validate_answer_schema_before_save",
+                side_effect=[None, ValueError("answer_schema missing required field: type")],
+            ),
+        ):
+            result = await QuestionGenerationService(db_session).generate_questions(
+                user_id=authenticated_user.id,
+                survey_id=user_profile_survey_fixture.id,
+                question_count=3,
+                question_types=["multiple_choice"],
+            )
+
+        assert result["questions"] == []
+        assert "answer_schema" in result["error"]
+        db_session.expire_all()
+        assert db_session.query(Question).count() == 0
+
+    # ====================================================================
+    # TC-14: Resume and Partial Top-up (REQ-A-Mode1-Resume)
+    # ====================================================================
+
+    @pytest.mark.asyncio
+    async def test_retry_resumes_and_tops_up_missing_questions(
+        self, db_session: Session, authenticated_user: User, user_profile_survey_fixture: UserProfileSurvey
+    ) -> None:
+        """TC-14: A failed run is resumed after backoff; a short run is topped up with only N-k questions."""
+        requests: list[GenerateQuestionsRequest] = []
+        responses = [
+            GenerateQuestionsResponse(round_id="r", items=[], error_message="LLM API timeout"),
+            # Resumed thread: 2 of 5 saved
+            GenerateQuestionsResponse(round_id="r", items=[create_mock_item(f"q_{i}") for i in range(2)]),
+            # Top-up: the thread's items, including the 2 already collected
+            GenerateQuestionsResponse(round_id="r", items=[create_mock_item(f"q_{i}") for i in range(5)]),
+        ]
+
+        async def generate(request: GenerateQuestionsRequest) -> GenerateQuestionsResponse:
+            requests.append(request)
+            return responses[len(requests) - 1]
+
+        mock_agent = AsyncMock()
+        mock_agent.generate_questions = AsyncMock(side_effect=generate)
+
+        with (
+            patch("src.backend.services.question_gen_service.create_agent", return_value=mock_agent),
+            patch("src.backend.services.question_gen_service.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        ):
+            result = await QuestionGenerationService(db_session).generate_questions(
+                user_id=authenticated_user.id,
+                survey_id=user_profile_survey_fixture.id,
+                question_count=5,
+            )
+
+        assert [(r.question_count, r.resume) for r in requests] == [(5, False), (5, True), (3, True)]
+        assert len({r.session_id for r in requests}) == 1
+        mock_sleep.assert_awaited_once_with(1)  # backoff only after the failed run
+        mock_agent.discard_checkpoint.assert_awaited_once_with(result["session_id"])
+        assert result["attempt"] == 3
+        assert [q["id"] for q in result["questions"]] == [f"q_{i}" for i in range(5)]
+
 
 # ======================================================================
 # Test Summary Document (for Phase 2 Approval)
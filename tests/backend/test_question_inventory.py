@@ -0,0 +1,222 @@
+"""
+Tests for the pre-generated question inventory.
+
+REQ: REQ-B-B2-Gen-4
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.agent.llm_agent import AnswerSchema, GeneratedItem, GenerateQuestionsRequest, GenerateQuestionsResponse
+from src.backend.config import settings
+from src.backend.models.question import Question
+from src.backend.models.question_inventory import InventoryQuestion
+from src.backend.models.test_session import TestSession
+from src.backend.models.user import User
+from src.backend.models.user_profile import UserProfileSurvey
+from src.backend.services import question_inventory
+from src.backend.services.question_gen_service import QuestionGenerationService
+from src.backend.services.question_inventory import QuestionInventoryRefiller, QuestionInventoryService
+
+
+def _stock_item(index: int, item_type: str = "multiple_choice", category: str = "LLM") -> dict:
+    return {
+        "item_type": item_type,
+        "stem": f"Stocked question {index}?",
+        "choices": ["A", "B", "C", "D"] if item_type == "multiple_choice" else None,
+        "answer_schema": {"type": "exact_match", "correct_answer": "A", "keywords": None},
+        "difficulty": 3,
+        "category": category,
+    }
+
+
+def _mock_agent(count: int) -> AsyncMock:
+    agent = AsyncMock()
+    agent.generate_questions = AsyncMock(
+        return_value=GenerateQuestionsResponse(
+            round_id="round_inventory",
+            items=[
+                GeneratedItem(
+                    id=f"generated_{index}",
+                    type="multiple_choice",
+                    stem=f"Generated question {index}?",
+                    choices=["A", "B", "C", "D"],
+                    answer_schema=AnswerSchema(type="exact_match", correct_answer="B"),
+                    difficulty=3,
+                    category="LLM",
+                )
+                for index in range(count)
+            ],
+            time_limit_seconds=1200,
+        )
+    )
+    return agent
+
+
+@pytest.fixture
+def refiller(monkeypatch: pytest.MonkeyPatch) -> QuestionInventoryRefiller:
+    """Enable the inventory with a fresh process-wide refiller."""
+    refiller = QuestionInventoryRefiller()
+    monkeypatch.setattr(question_inventory, "_inventory_refiller", refiller)
+    monkeypatch.setattr(settings, "QUESTION_INVENTORY_ENABLED", True)
+    return refiller
+
+
+class TestQuestionInventory:
+    """REQ-B-B2-Gen-4: Serve round-1 questions from pre-generated stock."""
+
+    @pytest.mark.asyncio
+    async def test_generate_serves_stock_without_agent(
+        self,
+        db_session: Session,
+        authenticated_user: User,
+        user_profile_survey_fixture: UserProfileSurvey,
+        refiller: QuestionInventoryRefiller,
+    ) -> None:
+        """A stocked request is served in one transaction; refills are scheduled below threshold."""
+        inventory = QuestionInventoryService(db_session)
+        inventory.stock_items("AI", [_stock_item(index) for index in range(4)] + [_stock_item(9, category="Food")])
+
+        live_agent = AsyncMock()
+        with (
+            patch("src.backend.services.question_gen_service.create_agent", live_agent),
+            patch("src.backend.services.question_inventory.create_agent", return_value=_mock_agent(5)),
+        ):
+            result = await QuestionGenerationService(db_session).generate_questions(
+                user_id=authenticated_user.id,
+                survey_id=user_profile_survey_fixture.id,
+                question_count=3,
+                question_types=["multiple_choice"],
+            )
+            await refiller.wait()
+
+        live_agent.assert_not_called()
+        assert result["attempt"] == 0
+        assert [q["stem"] for q in result["questions"]] == [f"Stocked question {index}?" for index in range(3)]
+        assert db_session.query(Question).filter_by(session_id=result["session_id"]).count() == 3
+        assert db_session.get(TestSession, result["session_id"]).status == "in_progress"
+
+        # 1 LLM question left (< threshold): topped up by one refill through the agent
+        assert refiller.stats.as_dict() == {
+            "served_sessions": 1,
+            "served_questions": 3,
+            "misses": 0,
+            "refills": 1,
+            "stocked": 5,
+            "failed_refills": 0,
+        }
+        assert inventory.stock_levels() == [
+            {"domain": "AI", "difficulty_band": "low", "item_type": "multiple_choice", "category": "Food", "stock": 1},
+            {"domain": "AI", "difficulty_band": "low", "item_type": "multiple_choice", "category": "LLM", "stock": 6},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_generate_falls_back_to_live_when_stock_runs_dry(
+        self,
+        db_session: Session,
+        authenticated_user: User,
+        user_profile_survey_fixture: UserProfileSurvey,
+        refiller: QuestionInventoryRefiller,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Insufficient stock is left untouched and the live agent path is used."""
+        monkeypatch.setattr(settings, "QUESTION_INVENTORY_REFILL_THRESHOLD", 0)
+        QuestionInventoryService(db_session).stock_items("AI", [_stock_item(0)])
+
+        with patch("src.backend.services.question_gen_service.create_agent", return_value=_mock_agent(2)):
+            result = await QuestionGenerationService(db_session).generate_questions(
+                user_id=authenticated_user.id,
+                survey_id=user_profile_survey_fixture.id,
+                question_count=2,
+                question_types=["multiple_choice"],
+            )
+
+        assert result["attempt"] == 1
+        assert [q["stem"] for q in result["questions"]] == ["Generated question 0?", "Generated question 1?"]
+        assert db_session.query(InventoryQuestion).count() == 1
+        assert refiller.stats.misses == 1
+        assert refiller.stats.refills == 0
+
+    @pytest.mark.asyncio
+    async def test_refill_detaches_generated_questions(
+        self,
+        db_session: Session,
+        user_profile_survey_fixture: UserProfileSurvey,
+    ) -> None:
+        """Refilled questions end up in stock only; the staging session is removed."""
+        agent = _mock_agent(3)
+        with patch("src.backend.services.question_inventory.create_agent", return_value=agent):
+            stocked = await QuestionInventoryRefiller().refill(
+                user_profile_survey_fixture.id, "AI", "multiple_choice", 3
+            )
+
+        assert stocked == 3
+        request = agent.generate_questions.call_args.args[0]
+        assert request.question_types == ["multiple_choice"]
+        assert request.question_count == 3
+        db_session.expire_all()
+        assert db_session.query(TestSession).filter_by(id=request.session_id).count() == 0
+        assert db_session.query(Question).count() == 0
+        assert QuestionInventoryService(db_session).count_stock("AI", "low", "multiple_choice", ["LLM"]) == 3
+        agent.discard_checkpoint.assert_awaited_once_with(request.session_id)
+
+    @pytest.mark.asyncio
+    async def test_staging_session_is_owned_by_system_user(
+        self,
+        db_session: Session,
+        user_profile_survey_fixture: UserProfileSurvey,
+    ) -> None:
+        """The staging session never appears in the requesting user's history; stale leftovers are purged."""
+        owner_id = question_inventory.inventory_owner_id(db_session)
+        stale = TestSession(
+            user_id=owner_id,
+            survey_id=user_profile_survey_fixture.id,
+            round=1,
+            status="paused",
+            created_at=datetime.now(UTC) - question_inventory.STAGING_SESSION_TTL - timedelta(minutes=1),
+        )
+        db_session.add(stale)
+        db_session.commit()
+        stale_id = stale.id
+
+        owners: list[int] = []
+
+        async def generate(request: GenerateQuestionsRequest) -> GenerateQuestionsResponse:
+            db_session.expire_all()
+            owners.append(db_session.get(TestSession, request.session_id).user_id)
+            return GenerateQuestionsResponse(round_id="round_inventory", items=[])
+
+        agent = _mock_agent(0)
+        agent.generate_questions.side_effect = generate
+        with patch("src.backend.services.question_inventory.create_agent", return_value=agent):
+            await QuestionInventoryRefiller().refill(user_profile_survey_fixture.id, "AI", "multiple_choice", 3)
+
+        assert owners == [owner_id]
+        assert owner_id != user_profile_survey_fixture.user_id
+        assert question_inventory.inventory_owner_id(db_session) == owner_id
+        db_session.expire_all()
+        assert db_session.get(TestSession, stale_id) is None
+        assert db_session.query(TestSession).filter_by(user_id=user_profile_survey_fixture.user_id).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_refill_discards_agent_checkpoint(
+        self,
+        db_session: Session,
+        user_profile_survey_fixture: UserProfileSurvey,
+    ) -> None:
+        """A failing agent run still drops its checkpoint and staging session."""
+        agent = _mock_agent(0)
+        agent.generate_questions.side_effect = RuntimeError("LLM down")
+        with patch("src.backend.services.question_inventory.create_agent", return_value=agent):
+            stocked = await QuestionInventoryRefiller().refill(
+                user_profile_survey_fixture.id, "AI", "multiple_choice", 3
+            )
+
+        assert stocked == 0
+        request = agent.generate_questions.call_args.args[0]
+        agent.discard_checkpoint.assert_awaited_once_with(request.session_id)
+        db_session.expire_all()
+        assert db_session.query(TestSession).filter_by(id=request.session_id).count() == 0
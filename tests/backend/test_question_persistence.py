@@ -0,0 +1,74 @@
+"""
+Tests for bulk persistence of generated questions.
+
+REQ: REQ-B-B2-Gen-5
+"""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.backend.models.question import Question
+from src.backend.models.test_session import TestSession
+from src.backend.services.question_persistence import QuestionPersistenceService
+
+
+def _row(session_id: str, index: int, **overrides: object) -> dict:
+    return {
+        "session_id": session_id,
+        "item_type": "multiple_choice",
+        "stem": f"Bulk question {index}?",
+        "choices": ["A", "B", "C", "D"],
+        "answer_schema": {"correct_key": "A"},
+        "difficulty": 4,
+        "category": "LLM",
+        **overrides,
+    }
+
+
+class TestQuestionPersistence:
+    """REQ-B-B2-Gen-5: Save a round of questions with one INSERT and one commit."""
+
+    def test_save_bulk_returns_ids_in_row_order(
+        self, db_session: Session, test_session_round1_fixture: TestSession
+    ) -> None:
+        """Generated and given ids are returned in order; defaults are filled in."""
+        session_id = test_session_round1_fixture.id
+        rows = [_row(session_id, 0), _row(session_id, 1, id="given-id", round=2, choices=None)]
+
+        ids = QuestionPersistenceService(db_session).save_questions_bulk(rows)
+
+        assert len(ids) == 2
+        assert ids[1] == "given-id"
+        first, second = db_session.get(Question, ids[0]), db_session.get(Question, ids[1])
+        assert (first.stem, first.round, first.choices) == ("Bulk question 0?", 1, ["A", "B", "C", "D"])
+        assert (second.round, second.choices) == (2, None)
+        assert first.created_at is not None
+
+    def test_upsert_updates_existing_rows(self, db_session: Session, test_session_round1_fixture: TestSession) -> None:
+        """Rows already saved (e.g. by Tool 5) are updated instead of failing."""
+        service = QuestionPersistenceService(db_session)
+        session_id = test_session_round1_fixture.id
+        [question_id] = service.save_questions_bulk([_row(session_id, 0)])
+
+        service.save_questions_bulk(
+            [_row(session_id, 0, id=question_id, answer_schema={"correct_key": "B"}), _row(session_id, 1)],
+            upsert=True,
+        )
+
+        db_session.expire_all()
+        assert db_session.query(Question).count() == 2
+        assert db_session.get(Question, question_id).answer_schema == {"correct_key": "B"}
+
+    def test_duplicate_id_without_upsert_rolls_back(
+        self, db_session: Session, test_session_round1_fixture: TestSession
+    ) -> None:
+        """A failing batch raises and leaves no partial rows behind."""
+        service = QuestionPersistenceService(db_session)
+        session_id = test_session_round1_fixture.id
+        [question_id] = service.save_questions_bulk([_row(session_id, 0)])
+
+        with pytest.raises(IntegrityError):
+            service.save_questions_bulk([_row(session_id, 1), _row(session_id, 2, id=question_id)])
+
+        assert db_session.query(Question).count() == 1
@@ -36,8 +36,9 @@ class TestGradeCalculation:
         test_session = db_session.query(TestSession).filter(TestSession.id == test_result_low_score.session_id).first()
         user_id = test_session.user_id
 
-        # Call RankingService
+        # Call RankingService (the fixture inserts the result directly, so refresh as a write path would)
         service = RankingService(db_session)
+        service.refresh_user_score(user_id)
         result = service.calculate_final_grade(user_id)
 
         # Assert
@@ -58,8 +59,9 @@ class TestGradeCalculation:
         test_session = db_session.query(TestSession).filter(TestSession.id == test_result_high_score.session_id).first()
         user_id = test_session.user_id
 
-        # Call RankingService
+        # Call RankingService (the fixture inserts the result directly, so refresh as a write path would)
         service = RankingService(db_session)
+        service.refresh_user_score(user_id)
         result = service.calculate_final_grade(user_id)
 
         # Assert
@@ -157,6 +159,7 @@ class TestGradeCalculation:
 
         # Call RankingService
         service = RankingService(db_session)
+        service.refresh_user_score(user_fixture.id)
         grade_result = service.calculate_final_grade(user_fixture.id)
 
         # Assert: score should be boosted due to difficulty adjustment
@@ -774,6 +777,507 @@ class TestGradeDistribution:
             assert dist[grade] == (0, 0.0)
 
 
+class TestUserScoreLeaderboard:
+    """REQ-B-B4-4: Incrementally maintained user_scores table backs ranking."""
+
+    def test_refresh_user_score_upserts_row(
+        self,
+        db_session: Session,
+        user_fixture,  # noqa: ANN001
+        user_profile_survey_fixture,  # noqa: ANN001
+        create_test_session_with_result,  # noqa: ANN001
+    ):
+        """refresh_user_score creates the row, then recalculates it when results change."""
+        from src.backend.models import UserScore
+        from src.backend.services.ranking_service import RankingService
+
+        create_test_session_with_result(user_fixture.id, user_profile_survey_fixture.id, 60.0, round_num=1)
+        row = db_session.get(UserScore, user_fixture.id)
+        assert row is not None
+        assert row.result_count == 1
+        first_score = row.composite_score
+
+        create_test_session_with_result(user_fixture.id, user_profile_survey_fixture.id, 90.0, round_num=2)
+        row = RankingService(db_session).refresh_user_score(user_fixture.id)
+
+        assert row is not None
+        assert row.result_count == 2
+        assert row.composite_score > first_score
+        assert row.grade == RankingService(db_session)._determine_grade(row.composite_score)
+
+    def test_refresh_user_score_without_results_returns_none(self, db_session: Session, user_fixture):  # noqa: ANN001
+        """Users without completed results get no leaderboard row."""
+        from src.backend.models import UserScore
+        from src.backend.services.ranking_service import RankingService
+
+        assert RankingService(db_session).refresh_user_score(user_fixture.id) is None
+        assert db_session.get(UserScore, user_fixture.id) is None
+
+    def test_calculate_final_grade_is_read_only(
+        self,
+        db_session: Session,
+        user_fixture,
+        user_profile_survey_fixture,
+        create_test_session_with_result,  # noqa: ANN001
+    ):
+        """calculate_final_grade reads the stored row and never flushes or commits."""
+        from sqlalchemy import event
+
+        from src.backend.services.ranking_service import RankingService
+
+        create_test_session_with_result(user_fixture.id, user_profile_survey_fixture.id, 60.0, round_num=1)
+        service = RankingService(db_session)
+        stored_score = service.calculate_final_grade(user_fixture.id).score
+
+        # A result added without going through a write path is not picked up here
+        session = TestSession(
+            user_id=user_fixture.id, survey_id=user_profile_survey_fixture.id, round=2, status="completed"
+        )
+        db_session.add(session)
+        db_session.flush()
+        db_session.add(
+            TestResult(session_id=session.id, round=2, score=95.0, total_points=95, correct_count=5, total_count=5)
+        )
+        db_session.flush()
+
+        writes: list[str] = []
+        event.listen(db_session, "after_flush", lambda *_: writes.append("flush"))
+        event.listen(db_session, "after_commit", lambda *_: writes.append("commit"))
+
+        result = service.calculate_final_grade(user_fixture.id)
+
+        assert result.score == stored_score
+        assert writes == []
+
+    def test_save_round_result_refreshes_leaderboard(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session,  # noqa: ANN001
+    ):
+        """ScoringService.save_round_result keeps the user's row current."""
+        from src.backend.models import UserScore
+        from src.backend.services.scoring_service import ScoringService
+
+        ScoringService(db_session).save_round_result(test_session_round1_fixture.id, 1)
+
+        row = db_session.get(UserScore, test_session_round1_fixture.user_id)
+        assert row is not None
+        assert row.result_count == 1
+
+    def test_rank_reads_user_scores_not_test_results(
+        self, db_session: Session, create_multiple_users, create_survey_for_user
+    ):  # noqa: ANN001
+        """Rank counts user_scores rows; rebuild_user_scores backfills legacy data."""
+        from src.backend.services.ranking_service import RankingService
+
+        users = create_multiple_users(3)
+        for user, score in zip(users, [90.0, 70.0, 50.0], strict=False):
+            survey = create_survey_for_user(user.id)
+            session = TestSession(user_id=user.id, survey_id=survey.id, round=1, status="completed")
+            db_session.add(session)
+            db_session.flush()
+            db_session.add(
+                TestResult(
+                    session_id=session.id,
+                    round=1,
+                    score=score,
+                    total_points=int(score),
+                    correct_count=0,
+                    total_count=5,
+                )
+            )
+        db_session.commit()
+
+        service = RankingService(db_session)
+
+        # No row until a write path refreshes it
+        assert service.calculate_final_grade(users[1].id) is None
+
+        # Only the caller's row exists yet: rank is computed against the table alone
+        service.refresh_user_score(users[1].id)
+        result = service.calculate_final_grade(users[1].id)
+        assert result is not None
+        assert (result.rank, result.total_cohort_size) == (1, 1)
+
+        assert service.rebuild_user_scores() == 3
+
+        result = service.calculate_final_grade(users[1].id)
+        assert result is not None
+        assert (result.rank, result.total_cohort_size) == (2, 3)
+
+    def test_startup_backfill_runs_only_while_user_scores_is_empty(
+        self, db_session: Session, create_multiple_users, create_survey_for_user
+    ):  # noqa: ANN001
+        """Existing completed sessions get user_scores on first startup; later startups leave the table alone."""
+        from src.backend.models import UserScore
+        from src.backend.services.ranking_service import RankingService
+
+        users = create_multiple_users(2)
+        for user, score in zip(users, [80.0, 40.0], strict=False):
+            survey = create_survey_for_user(user.id)
+            session = TestSession(user_id=user.id, survey_id=survey.id, round=1, status="completed")
+            db_session.add(session)
+            db_session.flush()
+            db_session.add(
+                TestResult(
+                    session_id=session.id,
+                    round=1,
+                    score=score,
+                    total_points=int(score),
+                    correct_count=0,
+                    total_count=5,
+                )
+            )
+        db_session.commit()
+
+        service = RankingService(db_session)
+        assert service.backfill_user_scores_if_empty() == 2
+        result = service.calculate_final_grade(users[1].id)
+        assert result is not None
+        assert (result.rank, result.total_cohort_size) == (2, 2)
+
+        db_session.delete(db_session.get(UserScore, users[0].id))
+        db_session.commit()
+        assert service.backfill_user_scores_if_empty() == 0
+        assert db_session.get(UserScore, users[0].id) is None
+
+
+class TestWindowRankEngine:
+    """REQ-B-B4-4: RANK() OVER engine computes rank and percentile in the database."""
+
+    def test_ties_share_rank(
+        self, db_session: Session, create_multiple_users, create_survey_for_user, create_test_session_with_result
+    ):  # noqa: ANN001
+        """Users with equal composite scores get the same RANK() value."""
+        from src.backend.services.ranking_service import RankingService
+
+        users = create_multiple_users(4)
+        for user, score in zip(users, [90.0, 70.0, 70.0, 50.0], strict=False):
+            survey = create_survey_for_user(user.id)
+            create_test_session_with_result(user.id, survey.id, score)
+
+        service = RankingService(db_session)
+        tied = [service.calculate_final_grade(user.id) for user in users[1:3]]
+
+        assert [r.rank for r in tied] == [2, 2]
+        assert all(r.total_cohort_size == 4 for r in tied)
+        assert all(r.percentile == 75.0 for r in tied)
+
+    def test_caller_outside_cohort_ranked_against_cohort(
+        self, db_session: Session, create_multiple_users, create_survey_for_user, create_test_session_with_result
+    ):  # noqa: ANN001
+        """A caller whose last session is older than 90 days is not counted in the cohort."""
+        from src.backend.services.ranking_service import RankingService
+
+        users = create_multiple_users(3)
+        for user, score, days_ago in zip(users, [90.0, 60.0, 80.0], [0, 0, 120], strict=False):
+            survey = create_survey_for_user(user.id)
+            create_test_session_with_result(user.id, survey.id, score, days_ago=days_ago)
+
+        rank, cohort_size, percentile = RankingService(db_session)._calculate_rank(users[2].id, 84.0)
+
+        assert (rank, cohort_size) == (2, 2)
+        assert percentile == 50.0
+
+
+class TestLeaderboard:
+    """REQ-B-B4-7: Keyset-paginated leaderboard and around-me window."""
+
+    def _seed(self, create_multiple_users, create_survey_for_user, create_test_session_with_result, scores):  # noqa: ANN001, ANN202
+        users = create_multiple_users(len(scores))
+        for user, score in zip(users, scores, strict=False):
+            survey = create_survey_for_user(user.id)
+            create_test_session_with_result(user.id, survey.id, score)
+        return users
+
+    def test_pages_follow_rank_order_with_ties_across_pages(
+        self, db_session: Session, create_multiple_users, create_survey_for_user, create_test_session_with_result
+    ):  # noqa: ANN001
+        """Walking every page yields RANK() order; ties split across pages keep their rank."""
+        from src.backend.services.ranking_service import RankingService
+
+        self._seed(
+            create_multiple_users,
+            create_survey_for_user,
+            create_test_session_with_result,
+            [95.0, 80.0, 80.0, 80.0, 60.0, 40.0, 20.0],
+        )
+        service = RankingService(db_session)
+
+        ranks: list[int] = []
+        cursor = None
+        pages = 0
+        while True:
+            page = service.get_leaderboard(limit=2, cursor=cursor)
+            ranks.extend(entry.rank for entry in page.entries)
+            pages += 1
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert pages == 4
+        assert ranks == [1, 2, 2, 2, 5, 6, 7]
+
+    def test_around_me_window(
+        self, db_session: Session, create_multiple_users, create_survey_for_user, create_test_session_with_result
+    ):  # noqa: ANN001
+        """around-me returns neighbours in rank order with the caller's rank matching calculate_final_grade."""
+        from src.backend.services.ranking_service import RankingService
+
+        users = self._seed(
+            create_multiple_users,
+            create_survey_for_user,
+            create_test_session_with_result,
+            [95.0, 90.0, 85.0, 80.0, 75.0, 70.0, 65.0],
+        )
+        service = RankingService(db_session)
+
+        page = service.get_leaderboard_around(users[3].id, above=2, below=2)
+
+        assert page is not None
+        assert [entry.user_id for entry in page.entries] == [u.id for u in users[1:6]]
+        assert [entry.rank for entry in page.entries] == [2, 3, 4, 5, 6]
+        assert page.entries[2].rank == service.calculate_final_grade(users[3].id).rank
+
+        # Cursor continues below the window
+        rest = service.get_leaderboard(limit=10, cursor=page.next_cursor)
+        assert [entry.rank for entry in rest.entries] == [7]
+
+    def test_invalid_cursor_raises(self, db_session: Session):
+        """Malformed cursors are rejected."""
+        from src.backend.services.ranking_service import RankingService
+
+        with pytest.raises(ValueError, match="cursor"):
+            RankingService(db_session).get_leaderboard(cursor="not-a-cursor")
+
+
+class TestApproximatePercentile:
+    """REQ-B-B4-4, REQ-B-B4-5: Opt-in approximate percentile from the score sketch."""
+
+    def test_approximate_matches_exact_for_distinct_scores(
+        self, db_session: Session, create_multiple_users, create_survey_for_user, create_test_session_with_result
+    ):  # noqa: ANN001
+        """Distinct bins give the exact rank, with a zero error bound reported."""
+        from src.backend.services.ranking_service import RankingService
+
+        users = create_multiple_users(10)
+        for user, score in zip(users, [90, 85, 80, 75, 70, 65, 60, 55, 50, 45], strict=False):
+            survey = create_survey_for_user(user.id)
+            create_test_session_with_result(user.id, survey.id, float(score))
+
+        service = RankingService(db_session)
+        exact = service.calculate_final_grade(users[2].id, approximate=False)
+        approx = service.calculate_final_grade(users[2].id, approximate=True)
+
+        assert (approx.rank, approx.total_cohort_size, approx.percentile) == (
+            exact.rank,
+            exact.total_cohort_size,
+            exact.percentile,
+        )
+        assert approx.percentile_confidence == "approximate ±0.00%p"
+
+    def test_old_buckets_drop_out_of_window(
+        self, db_session: Session, create_multiple_users, create_survey_for_user, create_test_session_with_result
+    ):  # noqa: ANN001
+        """Day buckets older than 90 days are not merged into the cohort sketch."""
+        from src.backend.services.ranking_service import RankingService
+
+        users = create_multiple_users(4)
+        for user, days_ago in zip(users, [0, 10, 200, 300], strict=False):
+            survey = create_survey_for_user(user.id)
+            create_test_session_with_result(user.id, survey.id, 70.0, days_ago=days_ago)
+
+        result = RankingService(db_session).calculate_final_grade(users[0].id, approximate=True)
+
+        assert result.total_cohort_size == 2
+        assert result.rank == 2  # midpoint of tied ranks 1..2, rounded
+        assert result.percentile_confidence == "approximate ±25.00%p"
+
+
+class TestSegmentRanking:
+    """REQ-B-B4-8: Rank within job_role / department / interest segments."""
+
+    def test_segment_ranks_for_each_membership(
+        self, db_session: Session, create_multiple_users, create_test_session_with_result
+    ):  # noqa: ANN001
+        """Each segment ranks the caller only against users sharing that segment."""
+        from src.backend.models.user_profile import UserProfileSurvey
+        from src.backend.services.ranking_service import RankingService
+
+        users = create_multiple_users(4)
+        profiles = [
+            ("Dept A", "Engineer", ["LLM", "RAG"], 90.0),
+            ("Dept A", "Researcher", ["LLM"], 80.0),
+            ("Dept B", "Engineer", ["RAG"], 70.0),
+            ("Dept B", "Engineer", None, 60.0),
+        ]
+        for user, (dept, job_role, interests, score) in zip(users, profiles, strict=False):
+            user.dept = dept
+            survey = UserProfileSurvey(user_id=user.id, job_role=job_role, interests=interests)
+            db_session.add(survey)
+            db_session.commit()
+            create_test_session_with_result(user.id, survey.id, score)
+
+        result = RankingService(db_session).calculate_final_grade(users[2].id)
+
+        segments = {(seg.segment, seg.value): (seg.rank, seg.cohort_size) for seg in result.segments}
+        assert segments == {
+            ("job_role", "Engineer"): (2, 3),
+            ("department", "Dept B"): (1, 2),
+            ("interest", "RAG"): (2, 2),
+        }
+
+    def test_segment_cache_invalidated_on_score_change(
+        self, db_session: Session, create_multiple_users, create_survey_for_user, create_test_session_with_result
+    ):  # noqa: ANN001
+        """A new result in the segment is reflected on the next call."""
+        from src.backend.services.ranking_service import RankingService
+
+        users = create_multiple_users(2)
+        survey = create_survey_for_user(users[0].id)
+        create_test_session_with_result(users[0].id, survey.id, 70.0)
+
+        service = RankingService(db_session)
+        before = service.calculate_final_grade(users[0].id)
+        assert all(seg.rank == 1 and seg.cohort_size == 1 for seg in before.segments)
+
+        other_survey = create_survey_for_user(users[1].id)
+        create_test_session_with_result(users[1].id, other_survey.id, 95.0)
+
+        after = service.calculate_final_grade(users[0].id)
+        assert [seg.segment for seg in after.segments] == ["job_role", "department", "interest", "interest"]
+        assert all(seg.rank == 2 and seg.cohort_size == 2 for seg in after.segments)
+
+
+class TestGradeHistogramCache:
+    """REQ-B-B4-6: Grade distribution served from maintained histogram + versioned cache."""
+
+    def test_histogram_follows_grade_changes(
+        self,
+        db_session: Session,
+        user_fixture,  # noqa: ANN001
+        user_profile_survey_fixture,  # noqa: ANN001
+        create_test_session_with_result,  # noqa: ANN001
+    ):
+        """Moving a user to a new grade decrements the old bucket and increments the new one."""
+        from src.backend.models import GradeHistogram
+
+        create_test_session_with_result(user_fixture.id, user_profile_survey_fixture.id, 20.0, round_num=1)
+        counts = {row.grade: row.user_count for row in db_session.query(GradeHistogram).all()}
+        assert counts["Beginner"] == 1
+        assert sum(counts.values()) == 1
+
+        # Round 2 at 100 weighs double: composite leaves Beginner
+        create_test_session_with_result(user_fixture.id, user_profile_survey_fixture.id, 100.0, round_num=2)
+        db_session.expire_all()
+        counts = {row.grade: row.user_count for row in db_session.query(GradeHistogram).all()}
+        assert counts["Beginner"] == 0
+        assert sum(counts.values()) == 1
+
+    def test_distribution_cached_until_version_changes(
+        self, db_session: Session, create_multiple_users, create_survey_for_user, create_test_session_with_result
+    ):  # noqa: ANN001
+        """Cached counts are served without reading the DB until the histogram changes."""
+        from src.backend.models import GradeHistogram
+        from src.backend.services.ranking_service import RankingService
+
+        users = create_multiple_users(2)
+        survey = create_survey_for_user(users[0].id)
+        create_test_session_with_result(users[0].id, survey.id, 25.0)
+
+        service = RankingService(db_session)
+        first = {d.grade: d.count for d in service._calculate_grade_distribution()}
+        assert first["Beginner"] == 1
+
+        # Tamper with the bucket directly: cache must still serve the old value
+        db_session.query(GradeHistogram).filter_by(grade="Beginner").update({"user_count": 99})
+        db_session.commit()
+        cached = {d.grade: d.count for d in service._calculate_grade_distribution()}
+        assert cached["Beginner"] == 1
+
+        # A real grade change bumps the version and forces a reload
+        survey = create_survey_for_user(users[1].id)
+        create_test_session_with_result(users[1].id, survey.id, 95.0)
+        reloaded = {d.grade: d.count for d in service._calculate_grade_distribution()}
+        assert reloaded["Beginner"] == 99
+        assert reloaded["Elite"] == 1
+
+    def test_version_bumped_only_after_commit(
+        self,
+        db_session: Session,
+        user_fixture,  # noqa: ANN001
+        user_profile_survey_fixture,  # noqa: ANN001
+        create_test_session_with_result,  # noqa: ANN001
+    ):
+        """An uncommitted histogram change must not invalidate the cache (readers would re-cache old counts)."""
+        from src.backend.models import TestSession
+        from src.backend.services import ranking_service
+        from src.backend.services.ranking_service import RankingService
+
+        create_test_session_with_result(user_fixture.id, user_profile_survey_fixture.id, 20.0, round_num=1)
+        session = db_session.query(TestSession).filter_by(user_id=user_fixture.id).one()
+        session.status = "in_progress"
+        db_session.flush()
+        version = ranking_service._grade_distribution_version
+
+        RankingService(db_session).refresh_user_score(user_fixture.id)
+        assert ranking_service._grade_distribution_version == version
+
+        db_session.commit()
+        assert ranking_service._grade_distribution_version == version + 1
+
+    def test_segment_version_bumped_only_after_commit(
+        self,
+        db_session: Session,
+        user_fixture,  # noqa: ANN001
+        user_profile_survey_fixture,  # noqa: ANN001
+        create_test_session_with_result,  # noqa: ANN001
+    ):
+        """A changed score invalidates segment cohorts only once it is committed (REQ-B-B4-8)."""
+        from src.backend.services import ranking_service
+        from src.backend.services.ranking_service import RankingService
+
+        create_test_session_with_result(user_fixture.id, user_profile_survey_fixture.id, 40.0, round_num=1)
+        session = TestSession(
+            user_id=user_fixture.id, survey_id=user_profile_survey_fixture.id, round=2, status="completed"
+        )
+        db_session.add(session)
+        db_session.flush()
+        db_session.add(
+            TestResult(session_id=session.id, round=2, score=90.0, total_points=90, correct_count=5, total_count=5)
+        )
+        db_session.flush()
+        version = ranking_service._segment_version
+
+        RankingService(db_session).refresh_user_score(user_fixture.id)
+        assert ranking_service._segment_version == version
+
+        db_session.commit()
+        assert ranking_service._segment_version == version + 1
+
+    def test_concurrent_first_creation_keeps_existing_rows(self, db_session: Session):
+        """Seeding the histogram or creating a sketch bucket another writer just created neither fails nor double counts."""
+        from datetime import date
+
+        from src.backend.models import GradeHistogram, ScoreSketchBucket
+        from src.backend.services.ranking_service import RankingService
+
+        db_session.add(GradeHistogram(grade="Beginner", user_count=3))
+        db_session.add(ScoreSketchBucket(bucket_date=date(2025, 1, 1), bins={"10": 2}, total=2))
+        db_session.commit()
+
+        service = RankingService(db_session)
+        service._seed_grade_histogram()
+        service._insert_missing(ScoreSketchBucket, [{"bucket_date": date(2025, 1, 1), "bins": {}, "total": 0}])
+        db_session.commit()
+
+        counts = {row.grade: row.user_count for row in db_session.query(GradeHistogram).all()}
+        assert counts["Beginner"] == 3
+        assert len(counts) == 5
+        assert db_session.get(ScoreSketchBucket, date(2025, 1, 1)).total == 2
+
+
 # =============================================================================
 # SUMMARY OF TEST CASES
 # =============================================================================
@@ -7,10 +7,13 @@ Tests verify that the /questions/score endpoint automatically completes
 the session when all answers have been scored.
 """
 
+from datetime import UTC, datetime
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from src.backend.api.questions import all_answers_scored
 from src.backend.models.attempt_answer import AttemptAnswer
 from src.backend.models.question import Question
 from src.backend.models.test_session import TestSession
@@ -419,3 +422,66 @@ class TestScoreAutoComplete:
         assert "total_count" in data
         assert "wrong_categories" in data
         assert "auto_completed" in data  # NEW field
+
+    def test_pending_text_answer_is_not_scored(
+        self,
+        db_session: Session,
+        user_profile_survey_fixture: UserProfileSurvey,
+    ) -> None:
+        """
+        Test that an autosaved short answer with default score 0.0 still counts as unscored.
+
+        REQ: REQ-B-B3-Score (Auto-Complete)
+
+        Scenario:
+            1. MC answer scored at autosave (scored_at set)
+            2. Short answer autosaved with default score 0.0 (scored_at NULL)
+            3. all_answers_scored is False until the short answer is scored
+        """
+        test_session = TestSession(
+            user_id=1,
+            survey_id=user_profile_survey_fixture.id,
+            round=1,
+            status="in_progress",
+        )
+        db_session.add(test_session)
+        db_session.flush()
+
+        mc_question = self._create_question(db_session, test_session.id, 1)
+        text_question = Question(
+            session_id=test_session.id,
+            item_type="short_answer",
+            stem="Explain RAG",
+            answer_schema={"keywords": ["retrieval"]},
+            difficulty=3,
+            category="AI",
+        )
+        db_session.add(text_question)
+        db_session.flush()
+
+        db_session.add(
+            AttemptAnswer(
+                session_id=test_session.id,
+                question_id=mc_question.id,
+                user_answer={"selected_key": "B"},
+                is_correct=True,
+                score=100.0,
+                scored_at=datetime.now(UTC),
+            )
+        )
+        pending = AttemptAnswer(
+            session_id=test_session.id,
+            question_id=text_question.id,
+            user_answer={"text": "retrieval"},
+            is_correct=False,
+            score=0.0,
+        )
+        db_session.add(pending)
+        db_session.commit()
+
+        assert all_answers_scored(test_session.id, db_session) is False
+
+        pending.scored_at = datetime.now(UTC)
+        db_session.commit()
+
+        assert all_answers_scored(test_session.id, db_session) is True
@@ -0,0 +1,60 @@
+"""
+Tests for ScoreSketch (approximate percentile mode).
+
+REQ: REQ-B-B4-4, REQ-B-B4-5
+"""
+
+import random
+
+from src.backend.services.score_sketch import ScoreSketch
+
+
+class TestScoreSketch:
+    """Mergeable fixed-resolution score sketch."""
+
+    def test_add_and_remove(self) -> None:
+        """Removing a score undoes adding it."""
+        sketch = ScoreSketch()
+        sketch.add(72.34)
+        sketch.add(72.31)
+        sketch.add(10.0)
+        assert sketch.total == 3
+
+        sketch.add(72.34, -1)
+        assert sketch.total == 2
+        assert sketch.bins[ScoreSketch.bin_index(72.31)] == 1
+
+    def test_merge_equals_single_sketch(self) -> None:
+        """Merging per-bucket sketches equals one sketch over all scores."""
+        rng = random.Random(7)
+        scores = [rng.uniform(0, 100) for _ in range(500)]
+
+        combined = ScoreSketch()
+        parts = [ScoreSketch() for _ in range(5)]
+        for idx, score in enumerate(scores):
+            combined.add(score)
+            parts[idx % 5].add(score)
+
+        merged = ScoreSketch()
+        for part in parts:
+            merged.merge(part)
+
+        assert merged.bins == combined.bins
+        assert ScoreSketch.from_dict(merged.to_dict()).bins == combined.bins
+
+    def test_rank_error_bound_contains_exact_rank(self) -> None:
+        """Exact rank always lies within estimate ± reported error."""
+        rng = random.Random(11)
+        scores = [round(rng.uniform(40, 60), 2) for _ in range(2000)]
+        sketch = ScoreSketch()
+        for score in scores:
+            sketch.add(score)
+
+        for score in scores[:50]:
+            exact_rank = 1 + sum(1 for other in scores if other > score)
+            estimate, error = sketch.rank(score)
+            assert estimate - error <= exact_rank <= estimate + error
+
+    def test_percentile_empty_sketch(self) -> None:
+        """Empty sketch yields zero percentile and error."""
+        assert ScoreSketch().percentile(50.0) == (0.0, 0.0)
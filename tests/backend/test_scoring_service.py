@@ -33,6 +33,7 @@ class TestScoreCalculation:
         for answer in answers:
             answer.is_correct = True
             answer.score = 100.0
+            answer.scored_at = datetime.now(UTC)  # Already scored (e.g. at autosave)
 
         db_session.commit()
 
@@ -93,6 +94,38 @@ class TestScoreCalculation:
         with pytest.raises(ValueError, match="No attempt answers found"):
             service.calculate_round_score(test_session_round1_fixture.id, 1)
 
+    def test_calculate_round_score_batched_round_trips(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        attempt_answers_for_session: list[AttemptAnswer],
+    ) -> None:
+        """Round scoring uses one load and one bulk UPDATE regardless of question count."""
+        from sqlalchemy import event
+
+        session_id = test_session_round1_fixture.id
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+            statements.append(statement.split()[0].upper())
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            score_data = ScoringService(db_session).calculate_round_score(session_id, 1)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert statements.count("SELECT") == 1
+        assert statements.count("UPDATE") == 1
+        assert score_data["score"] == 20.0
+        assert score_data["wrong_categories"] == {"RAG": 2, "Robotics": 1, "LLM": 1}
+
+        # Scores were persisted
+        db_session.expire_all()
+        persisted = db_session.query(AttemptAnswer).filter_by(session_id=session_id).all()
+        assert sum(1 for answer in persisted if answer.is_correct) == 1
+
 
 class TestWeakCategoryIdentification:
     """REQ-B-B2-Adapt-3: Identify weak categories from wrong answers."""
@@ -143,6 +176,7 @@ class TestWeakCategoryIdentification:
 
         for answer in answers:
             answer.is_correct = True
+            answer.scored_at = datetime.now(UTC)  # Already scored (e.g. at autosave)
 
         db_session.commit()
 
@@ -860,6 +894,39 @@ class TestTimePenalty:
         # MC score = 100.0, penalty = (25-20)/20 * 100.0 = 25.0, final = 100.0 - 25.0 = 75.0
         assert result["final_score"] == pytest.approx(75.0, abs=0.01)
 
+    def test_overtime_penalty_applied_to_autosaved_answers(
+        self, db_session: Session, test_session_in_progress: TestSession
+    ) -> None:
+        """MC answers scored at autosave (no penalty) are re-scored with the penalty once the session pauses."""
+        from src.backend.services.autosave_service import AutosaveService
+
+        test_session_in_progress.started_at = datetime.now(UTC) - timedelta(minutes=25)
+        test_session_in_progress.time_limit_ms = 1200000  # 20 minutes
+        question = Question(
+            session_id=test_session_in_progress.id,
+            item_type="multiple_choice",
+            stem="Test",
+            choices=["A", "B"],
+            answer_schema={"correct_key": "A"},
+            difficulty=1,
+            category="Test",
+            round=1,
+        )
+        db_session.add(question)
+        db_session.commit()
+
+        autosave = AutosaveService(db_session)
+        answer = autosave.save_answer(test_session_in_progress.id, question.id, {"selected_key": "A"}, 1000)
+        assert answer.score == 100.0
+        autosave.pause_session(test_session_in_progress.id)
+
+        score_data = ScoringService(db_session).calculate_round_score(test_session_in_progress.id, 1)
+
+        # penalty = (25-20)/20 * 100.0 = 25.0
+        assert score_data["score"] == pytest.approx(75.0, abs=0.1)
+        db_session.refresh(answer)
+        assert answer.score == pytest.approx(75.0, abs=0.1)
+
     def test_apply_penalty_score_not_below_zero(
         self, db_session: Session, test_session_in_progress: TestSession
     ) -> None:
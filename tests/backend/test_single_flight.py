@@ -0,0 +1,287 @@
+"""
+Tests for single-flight explanation generation.
+
+REQ: REQ-B-B3-Explain-4
+"""
+
+import asyncio
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.backend.models.answer_explanation import AnswerExplanation
+from src.backend.models.attempt_answer import AttemptAnswer
+from src.backend.models.explanation_claim import ExplanationClaim
+from src.backend.models.question import Question
+from src.backend.models.test_session import TestSession
+from src.backend.services import explain_service as explain_module
+from src.backend.services.explain_service import ExplainService
+from src.backend.services.single_flight import SingleFlight
+
+LLM_RESPONSE = {
+    "explanation": "단일 생성 해설입니다. " * 30,
+    "reference_links": [
+        {"title": "Link 1", "url": "https://example.com/1"},
+        {"title": "Link 2", "url": "https://example.com/2"},
+        {"title": "Link 3", "url": "https://example.com/3"},
+    ],
+}
+
+
+def _create_question(db_session: Session, test_session: TestSession) -> Question:
+    question = Question(
+        id=str(uuid4()),
+        session_id=test_session.id,
+        item_type="multiple_choice",
+        stem="Which is correct?",
+        choices=["A", "B", "C", "D"],
+        answer_schema={"correct_key": "A"},
+        difficulty=5,
+        category="LLM",
+        round=1,
+    )
+    db_session.add(question)
+    db_session.commit()
+    return question
+
+
+class TestSingleFlight:
+    """REQ-B-B3-Explain-4: In-process single-flight registry."""
+
+    def test_first_caller_leads_and_followers_share_result(self) -> None:
+        """Followers get the leader's future; finish resolves it and releases the key."""
+        flights = SingleFlight()
+
+        leader_future, is_leader = flights.begin("key")
+        follower_future, is_follower_leader = flights.begin("key")
+
+        assert is_leader is True
+        assert is_follower_leader is False
+        assert follower_future is leader_future
+
+        flights.finish("key", "result")
+        assert follower_future.result(timeout=1) == "result"
+        assert flights.stats() == {"leaders": 1, "followers": 1, "in_flight": 0}
+
+        _, is_new_leader = flights.begin("key")
+        assert is_new_leader is True
+
+
+class TestSingleFlightExplanations:
+    """REQ-B-B3-Explain-4: One LLM generation per (question_id, is_correct)."""
+
+    def test_concurrent_requests_generate_once(
+        self,
+        db_engine: Engine,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Concurrent callers in one process share a single LLM call and row."""
+        question = _create_question(db_session, test_session_round1_fixture)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+        calls = 0
+
+        def slow_generate(self: ExplainService, **kwargs: object) -> tuple[dict[str, Any], bool, None]:
+            nonlocal calls
+            calls += 1
+            time.sleep(0.3)
+            return LLM_RESPONSE, False, None
+
+        monkeypatch.setattr(ExplainService, "_generate_with_llm", slow_generate)
+
+        results: list[str] = []
+
+        def request() -> None:
+            db = session_factory()
+            try:
+                result = ExplainService(db).generate_explanation(
+                    question_id=question.id, user_answer="B", is_correct=False
+                )
+                results.append(result["id"])
+            finally:
+                db.close()
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert calls == 1
+        assert len(results) == 5
+        assert len(set(results)) == 1
+        db_session.expire_all()
+        assert db_session.query(AnswerExplanation).filter_by(question_id=question.id).count() == 1
+        assert db_session.query(ExplanationClaim).count() == 0
+
+    def test_waits_for_row_claimed_by_other_worker(
+        self,
+        db_engine: Engine,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A fresh claim held by another worker is awaited instead of calling the LLM."""
+        question = _create_question(db_session, test_session_round1_fixture)
+        db_session.add(ExplanationClaim(question_id=question.id, is_correct=True, owner="other-worker"))
+        db_session.commit()
+        monkeypatch.setattr(explain_module, "CLAIM_POLL_INTERVAL_SECONDS", 0.05)
+
+        def fail_generate(self: ExplainService, **kwargs: object) -> None:
+            raise AssertionError("LLM must not be called while another worker holds the claim")
+
+        monkeypatch.setattr(ExplainService, "_generate_with_llm", fail_generate)
+
+        def other_worker_stores() -> None:
+            time.sleep(0.2)
+            db = sessionmaker(bind=db_engine)()
+            db.add(
+                AnswerExplanation(
+                    id="other-worker-row",
+                    question_id=question.id,
+                    explanation_text=LLM_RESPONSE["explanation"],
+                    reference_links=LLM_RESPONSE["reference_links"],
+                    is_correct=True,
+                )
+            )
+            db.commit()
+            db.close()
+
+        writer = threading.Thread(target=other_worker_stores)
+        writer.start()
+        result = ExplainService(db_session).generate_explanation(
+            question_id=question.id, user_answer="A", is_correct=True
+        )
+        writer.join()
+
+        assert result["id"] == "other-worker-row"
+
+    @pytest.mark.asyncio
+    async def test_async_waits_are_batched_and_off_loop(
+        self,
+        db_engine: Engine,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Keys claimed by another worker are polled together in a thread while the event loop keeps running."""
+        questions = [_create_question(db_session, test_session_round1_fixture) for _ in range(3)]
+        items = []
+        for question in questions:
+            db_session.add(ExplanationClaim(question_id=question.id, is_correct=False, owner="other-worker"))
+            answer = AttemptAnswer(
+                session_id=test_session_round1_fixture.id,
+                question_id=question.id,
+                user_answer={"selected_key": "B"},
+                is_correct=False,
+                score=0.0,
+            )
+            db_session.add(answer)
+            items.append((question, answer))
+        db_session.commit()
+        monkeypatch.setattr(explain_module, "CLAIM_POLL_INTERVAL_SECONDS", 0.05)
+
+        async def fail_generate(self: ExplainService, *args: object) -> None:
+            raise AssertionError("LLM must not be called while another worker holds the claim")
+
+        monkeypatch.setattr(ExplainService, "_agenerate_with_llm", fail_generate)
+
+        def other_worker_stores() -> None:
+            time.sleep(0.3)
+            db = sessionmaker(bind=db_engine)()
+            for question in questions:
+                db.add(
+                    AnswerExplanation(
+                        id=f"other-{question.id}",
+                        question_id=question.id,
+                        explanation_text=LLM_RESPONSE["explanation"],
+                        reference_links=LLM_RESPONSE["reference_links"],
+                        is_correct=False,
+                    )
+                )
+            db.commit()
+            db.close()
+
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        writer = threading.Thread(target=other_worker_stores)
+        writer.start()
+        ticking = asyncio.create_task(ticker())
+        started = time.monotonic()
+        results = await ExplainService(db_session).agenerate_session_explanations(items)
+        elapsed = time.monotonic() - started
+        ticking.cancel()
+        writer.join()
+
+        assert [result["id"] for result in results] == [f"other-{question.id}" for question in questions]
+        assert elapsed < 1.0
+        assert ticks >= 10
+
+    def test_stale_claim_is_taken_over(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A claim older than the TTL (crashed worker) no longer blocks generation."""
+        question = _create_question(db_session, test_session_round1_fixture)
+        db_session.add(
+            ExplanationClaim(
+                question_id=question.id,
+                is_correct=True,
+                owner="crashed-worker",
+                claimed_at=datetime.now(UTC) - timedelta(hours=1),
+            )
+        )
+        db_session.commit()
+        monkeypatch.setattr(ExplainService, "_generate_with_llm", lambda self, **kwargs: (LLM_RESPONSE, False, None))
+
+        result = ExplainService(db_session).generate_explanation(
+            question_id=question.id, user_answer="A", is_correct=True
+        )
+
+        assert result["explanation_text"] == LLM_RESPONSE["explanation"]
+        assert db_session.query(ExplanationClaim).count() == 0
+
+    def test_unique_race_returns_existing_row(
+        self,
+        db_session: Session,
+        test_session_round1_fixture: TestSession,
+    ) -> None:
+        """Losing the unique (question_id, is_correct) race yields the winner's row."""
+        question = _create_question(db_session, test_session_round1_fixture)
+        db_session.add(
+            AnswerExplanation(
+                id="winner",
+                question_id=question.id,
+                explanation_text=LLM_RESPONSE["explanation"],
+                reference_links=LLM_RESPONSE["reference_links"],
+                is_correct=False,
+            )
+        )
+        db_session.commit()
+
+        loser = AnswerExplanation(
+            id="loser",
+            question_id=question.id,
+            explanation_text=LLM_RESPONSE["explanation"],
+            reference_links=LLM_RESPONSE["reference_links"],
+            is_correct=False,
+        )
+        stored = ExplainService(db_session)._store_explanations([loser])
+
+        assert stored[(question.id, False)].id == "winner"
+        assert db_session.query(AnswerExplanation).count() == 1
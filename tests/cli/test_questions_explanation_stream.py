@@ -0,0 +1,79 @@
+"""
+Tests for live-rendered explanation generation in the questions CLI.
+
+REQ: REQ-B-B3-Explain-5
+"""
+
+import re
+from io import StringIO
+from unittest.mock import MagicMock
+
+import pytest
+from rich.console import Console
+
+from src.cli.actions import questions
+from src.cli.context import CLIContext
+
+
+def strip_ansi(text: str) -> str:
+    """Remove ANSI escape codes from text."""
+    return re.compile(r"\x1b\[[0-9;]*m").sub("", text)
+
+
+@pytest.fixture
+def mock_context() -> CLIContext:
+    """Create CLIContext with buffered console and authenticated user."""
+    buffer = StringIO()
+    console = Console(file=buffer, force_terminal=True, width=120)
+    context = CLIContext(console=console, logger=MagicMock())
+    context._buffer = buffer
+    context.session.token = "test-token"
+    context.client = MagicMock()
+    return context
+
+
+class TestGenerateExplanationStream:
+    """questions explanation generate --question-id renders the SSE stream."""
+
+    def test_tokens_rendered_live_then_references(self, mock_context: CLIContext) -> None:
+        """Streamed text is printed as it arrives; sections are not printed twice."""
+        mock_context.client.stream_request.return_value = iter(
+            [
+                ("token", {"text": "[정답의 원리] 스트리밍 "}),
+                ("token", {"text": "해설입니다."}),
+                (
+                    "done",
+                    {
+                        "explanation_sections": [{"title": "[정답의 원리]", "content": "스트리밍 해설입니다."}],
+                        "reference_links": [{"title": "참고 자료", "url": "https://example.com/ref"}],
+                    },
+                ),
+            ]
+        )
+
+        questions.generate_explanation(
+            mock_context, "--question-id", "q1", "--user-answer", "A", "--is-correct", "true"
+        )
+
+        output = strip_ansi(mock_context._buffer.getvalue())
+        mock_context.client.stream_request.assert_called_once_with(
+            "POST",
+            "/questions/explanations/stream",
+            json_data={"question_id": "q1", "user_answer": "A", "is_correct": True},
+        )
+        assert "[정답의 원리] 스트리밍 해설입니다." in output
+        assert output.count("스트리밍 해설입니다.") == 1
+        assert "✓ Explanation generated" in output
+        assert "참고 자료: https://example.com/ref" in output
+
+    def test_error_event_reported(self, mock_context: CLIContext) -> None:
+        """HTTP errors surfaced by the stream are printed and stop rendering."""
+        mock_context.client.stream_request.return_value = iter(
+            [("error", {"detail": "Question not found: q1", "status_code": 404})]
+        )
+
+        questions.generate_explanation(mock_context, "--question-id", "q1", "--user-answer", "A")
+
+        output = strip_ansi(mock_context._buffer.getvalue())
+        assert "✗ Generation failed (HTTP 404)" in output
+        assert "Question not found: q1" in output
@@ -81,6 +81,19 @@ def patch_database_for_tools(db_engine: Engine, request) -> Generator[None, None
         yield
 
 
+@pytest.fixture(autouse=True)
+def disable_explanation_prefetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Disable background explanation prefetch on question save.
+
+    Prefetch tasks would otherwise call the real LLM after a test finishes.
+    Tests exercising prefetch re-enable it explicitly.
+    """
+    from src.backend.config import settings
+
+    monkeypatch.setattr(settings, "EXPLANATION_PREFETCH_ENABLED", False)
+
+
 @pytest.fixture(scope="function")
 def db_engine() -> Generator[Engine, None, None]:
     """
@@ -543,6 +556,12 @@ def create_test_session_with_result(db_session: Session) -> callable:
             created_at=session_created_at,
         )
         db_session.add(result)
+        db_session.flush()
+
+        # Mirror ScoringService/complete_session: keep user_scores leaderboard in sync
+        from src.backend.services.ranking_service import RankingService
+
+        RankingService(db_session).refresh_user_score(user_id)
         db_session.commit()
 
         return session, result